@@ -4,24 +4,41 @@ from __future__ import annotations
 
 import os
 
-from app.jobs.queue import queue
+from app.jobs.queue import get_queue, queue
 
 DEFAULT_PROCESSING_JOB_TIMEOUT_SECONDS = 4 * 60 * 60
+DEFAULT_NOTES_JOB_TIMEOUT_SECONDS = 30 * 60
+DEFAULT_POLISH_JOB_TIMEOUT_SECONDS = 15 * 60
 
+DEFAULT_TRANSCRIBE_QUEUE = "transcribe"
+DEFAULT_NOTES_QUEUE = "notes"
+DEFAULT_POLISH_QUEUE = "polish"
 
-def processing_job_timeout_seconds() -> int:
-    raw_value = os.getenv("MEETIQ_PROCESSING_JOB_TIMEOUT_SECONDS")
+
+def _timeout_env(name: str, default: int) -> int:
+    raw_value = os.getenv(name)
     if raw_value is None or not raw_value.strip():
-        return DEFAULT_PROCESSING_JOB_TIMEOUT_SECONDS
+        return default
 
     try:
         value = int(raw_value.strip())
     except ValueError:
-        return DEFAULT_PROCESSING_JOB_TIMEOUT_SECONDS
+        return default
 
     return max(1, value)
 
 
+def processing_job_timeout_seconds() -> int:
+    return _timeout_env(
+        "MEETIQ_PROCESSING_JOB_TIMEOUT_SECONDS",
+        DEFAULT_PROCESSING_JOB_TIMEOUT_SECONDS,
+    )
+
+
+def staged_pipeline_enabled() -> bool:
+    return os.getenv("MEETIQ_PROCESSING_PIPELINE", "").strip().lower() == "staged"
+
+
 def process_meeting(meeting_id: int) -> None:
     """Thin wrapper delegating to app.jobs.process_meeting.process_meeting."""
     # Local import to avoid circular imports at module import time
@@ -31,12 +48,75 @@ def process_meeting(meeting_id: int) -> None:
     _impl(meeting_id=str(meeting_id))
 
 
+def transcribe_meeting(meeting_id: int) -> None:
+    from app.jobs.process_meeting import transcribe_meeting_stage
+
+    transcribe_meeting_stage(meeting_id=str(meeting_id))
+
+
+def generate_meeting_notes(meeting_id: int) -> None:
+    from app.jobs.process_meeting import generate_notes_stage
+
+    generate_notes_stage(meeting_id=str(meeting_id))
+
+
+def finalize_meeting_notes(meeting_id: int) -> None:
+    from app.jobs.process_meeting import finalize_notes_stage
+
+    finalize_notes_stage(meeting_id=str(meeting_id))
+
+
+def enqueue_staged_process_meeting(meeting_id: int):
+    """Enqueue processing as three chained jobs on separate queues.
+
+    transcribe -> notes -> polish, linked with depends_on so each job starts
+    only after the previous one succeeds. Each queue has its own timeout and
+    can be served by its own worker pool (RQ_QUEUE=transcribe, ...), so
+    heavy transcription workers scale independently of the cheap notes and
+    network-bound polish workers. Returns the first job of the chain.
+    """
+    transcribe_job = get_queue(
+        os.getenv("MEETIQ_TRANSCRIBE_QUEUE", DEFAULT_TRANSCRIBE_QUEUE)
+    ).enqueue(
+        transcribe_meeting,
+        meeting_id=meeting_id,
+        description=f"transcribe_meeting[{meeting_id}]",
+        job_timeout=processing_job_timeout_seconds(),
+    )
+    notes_job = get_queue(os.getenv("MEETIQ_NOTES_QUEUE", DEFAULT_NOTES_QUEUE)).enqueue(
+        generate_meeting_notes,
+        meeting_id=meeting_id,
+        description=f"generate_meeting_notes[{meeting_id}]",
+        job_timeout=_timeout_env(
+            "MEETIQ_NOTES_JOB_TIMEOUT_SECONDS",
+            DEFAULT_NOTES_JOB_TIMEOUT_SECONDS,
+        ),
+        depends_on=transcribe_job,
+    )
+    get_queue(os.getenv("MEETIQ_POLISH_QUEUE", DEFAULT_POLISH_QUEUE)).enqueue(
+        finalize_meeting_notes,
+        meeting_id=meeting_id,
+        description=f"finalize_meeting_notes[{meeting_id}]",
+        job_timeout=_timeout_env(
+            "MEETIQ_POLISH_JOB_TIMEOUT_SECONDS",
+            DEFAULT_POLISH_JOB_TIMEOUT_SECONDS,
+        ),
+        depends_on=notes_job,
+    )
+    return transcribe_job
+
+
 def enqueue_process_meeting(meeting_id: int):
     """Enqueue the meeting for async processing via RQ.
 
     This wraps the shared process_meeting(meeting_id) job so the
-    API, tests, and worker all share the same logic.
+    API, tests, and worker all share the same logic. With
+    MEETIQ_PROCESSING_PIPELINE=staged the work is split across queues
+    instead (see enqueue_staged_process_meeting).
     """
+    if staged_pipeline_enabled():
+        return enqueue_staged_process_meeting(meeting_id)
+
     job = queue.enqueue(
         process_meeting,
         meeting_id=meeting_id,
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import re
+import shutil
 import tempfile
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from urllib.parse import urlparse
 
-import boto3
 from rq import get_current_job
 from sqlalchemy.orm import Session
 
@@ -25,15 +28,30 @@ from app.services.long_transcript_sections import (
     build_long_transcript_coverage_metadata,
     build_long_transcript_section_metadata,
 )
-from app.services.media import load_audio_for_meeting
+from app.services.media import (
+    NORMALIZED_AUDIO_CONTENT_TYPE,
+    NORMALIZED_AUDIO_PROFILE,
+    normalized_audio_artifact_path,
+    prepare_audio_file_for_meeting,
+)
 from app.services.note_strategies.factory import get_notes_strategy
 from app.services.notes import generate_meeting_notes
+from app.services.notes_pass_profiler import NotesPassProfiler
+from app.services.notes_pass_runner import (
+    NotesPass,
+    NotesWorkspace,
+    parse_pass_order,
+    resolve_pass_order,
+    run_notes_passes,
+)
 from app.services.notes_pipeline.consistency import apply_risk_action_owner_consistency
 from app.services.notes_postprocess import normalize_canonical_notes
 from app.services.notes_quality_pass import (
     _pilot_rc1_precision_cleanup_result,
     apply_focused_30min_quality_pass,
 )
+from app.services.object_storage import ObjectStore
+from app.services.object_storage import s3_client as shared_s3_client
 from app.services.ocr import extract_slide_text_for_meeting
 from app.services.persisted_action_contract import (
     _finalize_persisted_action_contract,
@@ -44,6 +62,7 @@ from app.services.processing_observability import (
     commit_stage,
     mark_completed,
     mark_failed,
+    record_notes_passes,
 )
 from app.services.quality_engine_v2 import (
     is_quality_engine_v2_email_allowlisted,
@@ -54,34 +73,28 @@ from app.services.quality_engine_v3 import (
     finalize_quality_engine_v3_persisted_notes,
     run_quality_engine_v3,
 )
+from app.services.transcript_document import TranscriptDocument
 from app.services.transcript_observability import build_transcript_observability_metadata
 from app.services.transcription import get_transcriber
+from app.services.transcription.base import stream_in_batches
+from app.services.transcription.cache import (
+    load_cached_transcription,
+    store_cached_transcription,
+    transcription_cache_enabled,
+    transcription_cache_key,
+)
+from app.services.transcription.factory import configured_transcriber_identity
+from app.services.transcription.partial_transcript import (
+    append_partial_transcript,
+    clear_partial_transcript,
+)
+from app.services.transcription.schemas import TranscriptionResult, TranscriptionSegment
 
 log = logging.getLogger(__name__)
 
 
-def _s3_region() -> str | None:
-    return os.getenv("S3_REGION") or os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
-
-
 def _s3_client():
-    kwargs: dict[str, Any] = {}
-
-    region = _s3_region()
-    if region:
-        kwargs["region_name"] = region
-
-    endpoint = os.getenv("S3_ENDPOINT") or os.getenv("AWS_ENDPOINT_URL")
-    if endpoint:
-        kwargs["endpoint_url"] = endpoint
-
-    access_key = os.getenv("S3_ACCESS_KEY") or os.getenv("AWS_ACCESS_KEY_ID")
-    secret_key = os.getenv("S3_SECRET_KEY") or os.getenv("AWS_SECRET_ACCESS_KEY")
-    if access_key and secret_key:
-        kwargs["aws_access_key_id"] = access_key
-        kwargs["aws_secret_access_key"] = secret_key
-
-    return boto3.client("s3", **kwargs)
+    return shared_s3_client()
 
 
 def _media_suffix(raw_media_path: str) -> str:
@@ -94,22 +107,301 @@ def _media_suffix(raw_media_path: str) -> str:
     )
 
 
-def _read_raw_media_bytes(raw_media_path: str) -> bytes:
-    if raw_media_path.startswith("s3://"):
-        parsed = urlparse(raw_media_path)
-        bucket = parsed.netloc
-        key = parsed.path.lstrip("/")
-        if not bucket or not key:
-            raise RuntimeError(f"Invalid S3 raw_media_path: {raw_media_path}")
+RAW_MEDIA_DOWNLOAD_CHUNK_BYTES = 8 * 1024 * 1024
 
-        obj = _s3_client().get_object(Bucket=bucket, Key=key)
-        return obj["Body"].read()
 
-    if not os.path.exists(raw_media_path):
+def _copy_stream_in_chunks(
+    source: BinaryIO,
+    destination: BinaryIO,
+    *,
+    hasher: Any | None = None,
+) -> int:
+    """Copy a readable stream in fixed-size chunks and return the byte count."""
+
+    total = 0
+    while True:
+        chunk = source.read(RAW_MEDIA_DOWNLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        destination.write(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+        total += len(chunk)
+    return total
+
+
+def _split_s3_path(path: str) -> tuple[str, str]:
+    parsed = urlparse(path)
+    bucket = parsed.netloc
+    key = parsed.path.lstrip("/")
+    if not bucket or not key:
+        raise RuntimeError(f"Invalid S3 raw_media_path: {path}")
+    return bucket, key
+
+
+def _download_raw_media_to_tempfile(
+    raw_media_path: str,
+    *,
+    hasher: Any | None = None,
+) -> Path:
+    """Stream uploaded media from S3/MinIO or local disk into a worker temp file.
+
+    The recording is never held in memory as a whole: the object body (or the
+    local upload) is copied to disk in RAW_MEDIA_DOWNLOAD_CHUNK_BYTES pieces so
+    worker RSS stays flat regardless of recording length. When a hashlib
+    object is passed it is fed the same chunks. The caller owns the returned
+    file and must remove it.
+    """
+
+    s3_location: tuple[str, str] | None = None
+    if raw_media_path.startswith("s3://"):
+        s3_location = _split_s3_path(raw_media_path)
+    elif not os.path.exists(raw_media_path):
         raise RuntimeError(f"Raw media file not found: {raw_media_path}")
 
-    with open(raw_media_path, "rb") as f:
-        return f.read()
+    tmp = tempfile.NamedTemporaryFile(suffix=_media_suffix(raw_media_path), delete=False)
+    tmp_path = Path(tmp.name)
+    try:
+        with tmp:
+            if s3_location is not None:
+                bucket, key = s3_location
+                ObjectStore(bucket, _s3_client()).get_to_file(
+                    key,
+                    tmp,
+                    hasher=hasher,
+                    chunk_bytes=RAW_MEDIA_DOWNLOAD_CHUNK_BYTES,
+                )
+            else:
+                with open(raw_media_path, "rb") as source:
+                    _copy_stream_in_chunks(source, tmp, hasher=hasher)
+    except BaseException:
+        _remove_file_quietly(tmp_path)
+        raise
+
+    return tmp_path
+
+
+def _remove_file_quietly(path: str | Path | None) -> None:
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _stored_media_exists(path: str) -> bool:
+    if path.startswith("s3://"):
+        bucket, key = _split_s3_path(path)
+        try:
+            return ObjectStore(bucket, _s3_client()).exists(key)
+        except Exception:
+            return False
+
+    return os.path.exists(path)
+
+
+def _store_normalized_audio(local_path: Path, artifact_path: str) -> None:
+    if artifact_path.startswith("s3://"):
+        bucket, key = _split_s3_path(artifact_path)
+        ObjectStore(bucket, _s3_client()).put_from_file(
+            key,
+            local_path,
+            content_type=NORMALIZED_AUDIO_CONTENT_TYPE,
+        )
+        return
+
+    Path(artifact_path).parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(local_path, artifact_path)
+
+
+def _prepare_meeting_audio(
+    db: Session,
+    meeting: Meeting,
+    raw_media_path: str,
+    log_extra: dict[str, Any],
+) -> Path:
+    """Return a worker-owned temp file holding 16 kHz mono audio for the meeting.
+
+    On retry-processing the normalized artifact stored next to the raw media is
+    reused when its content hash still matches the upload, which skips both the
+    raw download and the ffmpeg pass. Otherwise the raw media is streamed down,
+    hashed, normalized once, and the artifact is stored for the next attempt.
+    """
+
+    cached_path = meeting.normalized_audio_path
+    if (
+        meeting.media_sha256
+        and cached_path
+        and cached_path == normalized_audio_artifact_path(raw_media_path, meeting.media_sha256)
+        and _stored_media_exists(cached_path)
+    ):
+        log.info(
+            "process_meeting: reusing normalized audio",
+            extra={**log_extra, "normalized_audio_path": cached_path},
+        )
+        return _download_raw_media_to_tempfile(cached_path)
+
+    hasher = hashlib.sha256()
+    try:
+        media_path = _download_raw_media_to_tempfile(raw_media_path, hasher=hasher)
+    except RuntimeError as exc:
+        raise RuntimeError(
+            f"Raw media file not found for meeting {meeting.id}: {raw_media_path}"
+        ) from exc
+
+    media_sha256 = hasher.hexdigest()
+    # Transcripts are cached by the upload's hash, so record it even when the
+    # normalized artifact is not stored.
+    meeting.media_sha256 = media_sha256
+
+    try:
+        audio_path = prepare_audio_file_for_meeting(str(meeting.id), media_path)
+    except BaseException:
+        _remove_file_quietly(media_path)
+        raise
+
+    if audio_path == media_path:
+        return media_path
+
+    _remove_file_quietly(media_path)
+
+    artifact_path = normalized_audio_artifact_path(raw_media_path, media_sha256)
+    try:
+        _store_normalized_audio(audio_path, artifact_path)
+    except Exception:  # noqa: BLE001
+        log.warning(
+            "process_meeting: could not store normalized audio",
+            extra={**log_extra, "normalized_audio_path": artifact_path},
+            exc_info=True,
+        )
+        return audio_path
+
+    if cached_path and cached_path != artifact_path:
+        delete_raw_media_best_effort(cached_path)
+    meeting.media_sha256 = media_sha256
+    meeting.normalized_audio_path = artifact_path
+    db.add(meeting)
+    db.commit()
+    return audio_path
+
+
+PARTIAL_TRANSCRIPT_BATCH_SIZE = 25
+
+
+def _transcribe_with_partial_transcript(
+    db: Session,
+    meeting: Meeting,
+    audio_path: Path,
+    log_extra: dict[str, Any],
+) -> TranscriptionResult:
+    """Transcribe audio_path, saving segments to the partial transcript as they arrive."""
+
+    transcriber = get_transcriber()
+    clear_partial_transcript(db, meeting.id)
+    db.commit()
+    saved_count = 0
+
+    def flush(segments: list[TranscriptionSegment]) -> None:
+        nonlocal saved_count
+        append_partial_transcript(db, meeting.id, saved_count, segments)
+        db.commit()
+        saved_count += len(segments)
+        log.info(
+            "process_meeting: partial transcript flushed",
+            extra={**log_extra, "segment_count": saved_count},
+        )
+
+    return stream_in_batches(
+        transcriber.stream(str(audio_path)),
+        flush,
+        batch_size=PARTIAL_TRANSCRIPT_BATCH_SIZE,
+    )
+
+
+def _load_checkpoint(meeting: Meeting, stage: str) -> Any:
+    """Return the saved output of stage from a previous failed attempt, if any.
+
+    Checkpoints belong to the uploaded media they were computed from, so a
+    re-upload (new media_sha256) makes them all stale.
+    """
+
+    checkpoints = getattr(meeting, "processing_checkpoints", None)
+    if not isinstance(checkpoints, dict):
+        return None
+    if checkpoints.get("media_sha256") != getattr(meeting, "media_sha256", None):
+        return None
+    return checkpoints.get(stage)
+
+
+def _save_checkpoint(db: Session, meeting: Meeting, stage: str, payload: Any) -> None:
+    checkpoints = getattr(meeting, "processing_checkpoints", None)
+    media_sha256 = getattr(meeting, "media_sha256", None)
+    if not isinstance(checkpoints, dict) or checkpoints.get("media_sha256") != media_sha256:
+        checkpoints = {"media_sha256": media_sha256}
+
+    # Round-trip through JSON so the checkpoint is detached from objects the
+    # later stages mutate in place.
+    meeting.processing_checkpoints = {
+        **checkpoints,
+        stage: json.loads(json.dumps(payload, default=str)),
+    }
+    db.commit()
+
+
+def _file_sha256(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def _transcribe_meeting_audio(
+    db: Session,
+    meeting: Meeting,
+    audio_path: Path,
+    log_extra: dict[str, Any],
+) -> TranscriptionResult:
+    """Return the transcript for audio_path, reusing a cached one when possible.
+
+    The cache is keyed by the uploaded media's hash and the normalization
+    profile plus the configured model and language, so retries, notes-engine
+    re-runs and re-uploads of the same recording skip transcription. Hashing
+    the upload rather than the normalized file keeps the key stable across
+    ffmpeg runs. Confidential meetings are never written to the cache.
+    """
+
+    if not transcription_cache_enabled():
+        return _transcribe_with_partial_transcript(db, meeting, audio_path, log_extra)
+
+    audio_sha256 = getattr(meeting, "media_sha256", None) or _file_sha256(audio_path)
+    model_name, language = configured_transcriber_identity()
+    cache_key = transcription_cache_key(
+        f"{audio_sha256}:{NORMALIZED_AUDIO_PROFILE}", model_name, language
+    )
+
+    cached = load_cached_transcription(db, cache_key)
+    if cached is not None:
+        log.info(
+            "process_meeting: transcription cache hit",
+            extra={**log_extra, "transcription_cache_key": cache_key},
+        )
+        return cached
+
+    transcription = _transcribe_with_partial_transcript(db, meeting, audio_path, log_extra)
+
+    if not bool(getattr(meeting, "confidential_mode", False)) and isinstance(
+        transcription, TranscriptionResult
+    ):
+        store_cached_transcription(
+            db,
+            cache_key,
+            audio_sha256=audio_sha256,
+            model_name=model_name,
+            language=language,
+            meeting_id=meeting.id,
+            result=transcription,
+        )
+
+    return transcription
 
 
 def _finalize_confidential_recording_delete(
@@ -142,6 +434,10 @@ def _finalize_confidential_recording_delete(
         deleted = False
         delete_error = str(exc)[:500]
 
+    normalized_audio_path = getattr(meeting, "normalized_audio_path", None)
+    if normalized_audio_path and delete_raw_media_best_effort(normalized_audio_path):
+        meeting.normalized_audio_path = None
+
     if deleted:
         meeting.recording_deleted_at = datetime.now(timezone.utc)
         meeting.recording_delete_status = "deleted"
@@ -930,15 +1226,363 @@ def _run_selected_quality_engine(
     transcript_text: str | None,
     *,
     mode: str,
+    document: TranscriptDocument | None = None,
 ) -> dict[str, Any]:
     """Run the selected notes engine without changing production routing defaults."""
 
     if mode == "v3":
-        return run_quality_engine_v3(notes, transcript_text, mode="v3")
+        return run_quality_engine_v3(notes, transcript_text, mode="v3", document=document)
 
     return run_quality_engine_v2(notes, transcript_text, mode=mode)
 
 
+# Fields of the persisted notes the pre-quality-engine passes work on, in
+# the order normalize_canonical_notes has always received them.
+PERSISTED_NOTES_FIELDS = (
+    "summary",
+    "key_points",
+    "action_items",
+    "summary_slots",
+    "decisions",
+    "action_item_objects",
+    "decision_objects",
+)
+
+_PRECISION_PAYLOAD_FIELDS = (
+    "summary",
+    "summary_slots",
+    "key_points",
+    "action_items",
+    "action_item_objects",
+    "decisions",
+    "decision_objects",
+)
+
+
+@dataclass(frozen=True)
+class _NotesPassContext:
+    transcript_text: str
+    raw_transcript_text: str
+    quality_engine_applied: bool = False
+    is_qev3_output: bool = False
+
+
+def _clean_action_items_pass(workspace: NotesWorkspace) -> None:
+    action_items = clean_action_items(workspace.get("action_items") or [])
+    action_item_objects = workspace.get("action_item_objects") or []
+
+    if not action_items and action_item_objects:
+        rebuilt: list[str] = []
+        for item in action_item_objects:
+            owner = str(item.get("owner") or "").strip()
+            task = str(item.get("task") or "").strip()
+            due_date = str(item.get("due_date") or "").strip()
+
+            if not task:
+                continue
+
+            line = f"{owner} - {task}" if owner else task
+            if due_date:
+                line += f" (due: {due_date})"
+            rebuilt.append(line)
+
+        action_items = clean_action_items(rebuilt)
+
+    workspace.set("action_items", action_items)
+
+
+def _deterministic_action_cleanup_pass(workspace: NotesWorkspace) -> None:
+    action_items, action_item_objects = apply_deterministic_action_cleanup(
+        workspace.get("action_items"),
+        workspace.get("action_item_objects"),
+    )
+    workspace.set("action_items", action_items)
+    workspace.set("action_item_objects", action_item_objects)
+
+
+def _precision_cleanup_pass(workspace: NotesWorkspace) -> None:
+    # The cleanup may rewrite other fields of its payload; only its action
+    # and decision results are kept.
+    payload = _pilot_rc1_precision_cleanup_result(
+        {field: workspace.get(field) for field in _PRECISION_PAYLOAD_FIELDS}
+    )
+    for field in ("action_items", "action_item_objects", "decisions", "decision_objects"):
+        workspace.set(field, payload.get(field) or [])
+
+
+def _persisted_action_contract_pass(workspace: NotesWorkspace) -> None:
+    decision_action_recall_text = "\n".join(
+        str(item.get("text") or "")
+        for item in workspace.get("decision_objects") or []
+        if isinstance(item, dict)
+    )
+    raw_action_recall_text = "\n".join(
+        part
+        for part in [workspace.context.transcript_text, decision_action_recall_text]
+        if part.strip()
+    )
+    action_items, action_item_objects, summary_slots = _finalize_persisted_action_contract(
+        cleaned_action_items=workspace.get("action_items"),
+        action_item_objects=workspace.get("action_item_objects"),
+        summary_slots=workspace.get("summary_slots"),
+        raw_transcript_text=raw_action_recall_text,
+    )
+    workspace.set("action_items", action_items)
+    workspace.set("action_item_objects", action_item_objects)
+    workspace.set("summary_slots", summary_slots)
+
+
+def _normalize_notes_pass(workspace: NotesWorkspace) -> None:
+    workspace.update(normalize_canonical_notes(workspace.notes))
+
+
+def _restore_publishable_actions_pass(workspace: NotesWorkspace) -> None:
+    workspace.update(
+        _restore_publishable_actions_from_objects(workspace.notes),
+        ("action_items", "summary_slots"),
+    )
+
+
+def _risk_action_owner_consistency_pass(workspace: NotesWorkspace) -> None:
+    workspace.update(apply_risk_action_owner_consistency(workspace.notes))
+
+
+def _finalize_qev3_pass(workspace: NotesWorkspace) -> None:
+    workspace.update(finalize_quality_engine_v3_persisted_notes(workspace.notes))
+
+
+def _qev2_action_precision_cleanup_pass(workspace: NotesWorkspace) -> None:
+    workspace.update(_apply_qev2_action_precision_cleanup(workspace.notes))
+
+
+def _strip_confirmed_marker(task: str) -> str:
+    for marker in (". Confirmed,", ". confirmed,"):
+        if marker in task:
+            task = task.split(marker, 1)[0].strip()
+    return re.sub(r"\s+that$", "", task, flags=re.I)
+
+
+def _strip_confirmed_markers_pass(workspace: NotesWorkspace) -> None:
+    changed = False
+    for action_obj in workspace.get("action_item_objects", []) or []:
+        if not isinstance(action_obj, dict):
+            continue
+        # Two rounds, as the chain has always applied this cleanup: the
+        # second can strip one more trailing "that".
+        for _ in range(2):
+            task = _strip_confirmed_marker(str(action_obj.get("task") or "").strip())
+            if not task:
+                continue
+            text = f"{action_obj.get('owner') or 'Team'}: {task}"
+            if action_obj.get("task") != task or action_obj.get("text") != text:
+                action_obj["task"] = task
+                action_obj["text"] = text
+                changed = True
+    if changed:
+        # QEv3 output shares these dicts between both action fields.
+        workspace.touch("action_item_objects")
+        workspace.touch("action_items")
+
+
+def _align_action_items_pass(workspace: NotesWorkspace) -> None:
+    action_items_source = (
+        [] if workspace.context.is_qev3_output else workspace.get("action_items") or []
+    )
+    workspace.set(
+        "action_items",
+        align_action_items_with_objects(
+            action_items_source,
+            workspace.get("action_item_objects") or [],
+        ),
+    )
+
+
+def _sync_next_steps_pass(workspace: NotesWorkspace) -> None:
+    action_item_objects = workspace.get("action_item_objects")
+    if not action_item_objects:
+        return
+    summary_slots_for_publish = dict(workspace.get("summary_slots") or {})
+    summary_slots_for_publish["next_steps"] = [
+        str(item.get("task") or "").rstrip(".") + "."
+        for item in action_item_objects[:5]
+        if isinstance(item, dict) and str(item.get("task") or "").strip()
+    ]
+    workspace.set("summary_slots", summary_slots_for_publish)
+
+
+def _llm_polish_pass(workspace: NotesWorkspace) -> None:
+    workspace.update(apply_llm_polish_to_notes(workspace.notes))
+
+
+def _long_meeting_final_polish_pass(workspace: NotesWorkspace) -> None:
+    workspace.update(
+        _apply_long_meeting_final_polish_after_llm(
+            workspace.notes,
+            transcript_text=workspace.context.raw_transcript_text,
+        )
+    )
+
+
+def _applies_qev3_result(context: _NotesPassContext) -> bool:
+    return context.quality_engine_applied and context.is_qev3_output
+
+
+def _applies_qev2_result(context: _NotesPassContext) -> bool:
+    return context.quality_engine_applied and not context.is_qev3_output
+
+
+def _is_qev3_output(context: _NotesPassContext) -> bool:
+    return context.is_qev3_output
+
+
+_ACTION_FIELDS = ("action_items", "action_item_objects")
+
+NOTES_PASSES: dict[str, NotesPass] = {
+    notes_pass.name: notes_pass
+    for notes_pass in (
+        NotesPass(
+            "clean_action_items",
+            _clean_action_items_pass,
+            reads=_ACTION_FIELDS,
+            writes=("action_items",),
+        ),
+        NotesPass(
+            "deterministic_action_cleanup",
+            _deterministic_action_cleanup_pass,
+            reads=_ACTION_FIELDS,
+            writes=_ACTION_FIELDS,
+        ),
+        NotesPass(
+            "precision_cleanup",
+            _precision_cleanup_pass,
+            reads=_PRECISION_PAYLOAD_FIELDS,
+            writes=(*_ACTION_FIELDS, "decisions", "decision_objects"),
+        ),
+        NotesPass(
+            "persisted_action_contract",
+            _persisted_action_contract_pass,
+            reads=(*_ACTION_FIELDS, "summary_slots", "decision_objects"),
+            writes=(*_ACTION_FIELDS, "summary_slots"),
+        ),
+        NotesPass("normalize_persisted_notes", _normalize_notes_pass),
+        NotesPass(
+            "restore_publishable_actions",
+            _restore_publishable_actions_pass,
+            reads=(*_ACTION_FIELDS, "summary_slots"),
+            writes=("action_items", "summary_slots"),
+        ),
+        NotesPass("risk_action_owner_consistency", _risk_action_owner_consistency_pass),
+        NotesPass("finalize_qev3_notes", _finalize_qev3_pass, when=_applies_qev3_result),
+        NotesPass(
+            "qev2_action_precision_cleanup",
+            _qev2_action_precision_cleanup_pass,
+            when=_applies_qev2_result,
+        ),
+        NotesPass(
+            "strip_confirmed_markers",
+            _strip_confirmed_markers_pass,
+            reads=("action_item_objects",),
+            writes=_ACTION_FIELDS,
+        ),
+        NotesPass("finalize_qev3_persisted_notes", _finalize_qev3_pass, when=_is_qev3_output),
+        NotesPass(
+            "align_action_items",
+            _align_action_items_pass,
+            reads=_ACTION_FIELDS,
+            writes=("action_items",),
+        ),
+        NotesPass(
+            "sync_next_steps",
+            _sync_next_steps_pass,
+            reads=("action_item_objects", "summary_slots"),
+            writes=("summary_slots",),
+        ),
+        NotesPass("llm_polish", _llm_polish_pass, when=_is_qev3_output),
+        NotesPass(
+            "long_meeting_final_polish",
+            _long_meeting_final_polish_pass,
+            when=_is_qev3_output,
+        ),
+    )
+}
+
+# Marks where the pass order hands off to the (checkpointed) quality engine.
+QUALITY_ENGINE_PASS = "quality_engine"
+NOTES_PASS_ORDER_ENV = "MEETIQ_NOTES_PASS_ORDER"
+DEFAULT_NOTES_PASS_ORDER = (
+    "clean_action_items",
+    "deterministic_action_cleanup",
+    "precision_cleanup",
+    "persisted_action_contract",
+    "normalize_persisted_notes",
+    "restore_publishable_actions",
+    "risk_action_owner_consistency",
+    QUALITY_ENGINE_PASS,
+    "finalize_qev3_notes",
+    "qev2_action_precision_cleanup",
+    "strip_confirmed_markers",
+    "finalize_qev3_persisted_notes",
+    "align_action_items",
+    "sync_next_steps",
+    "llm_polish",
+    "long_meeting_final_polish",
+)
+
+
+def _split_notes_pass_order(
+    order: tuple[str, ...],
+) -> tuple[tuple[NotesPass, ...], tuple[NotesPass, ...]]:
+    if order.count(QUALITY_ENGINE_PASS) != 1:
+        raise ValueError(f"notes pass order must name {QUALITY_ENGINE_PASS!r} exactly once")
+    boundary = order.index(QUALITY_ENGINE_PASS)
+    return (
+        resolve_pass_order(NOTES_PASSES, order[:boundary]),
+        resolve_pass_order(NOTES_PASSES, order[boundary + 1 :]),
+    )
+
+
+def configured_notes_passes() -> tuple[tuple[NotesPass, ...], tuple[NotesPass, ...]]:
+    """Passes to run before and after the quality engine.
+
+    MEETIQ_NOTES_PASS_ORDER overrides DEFAULT_NOTES_PASS_ORDER with a
+    comma-separated list of pass names; an invalid list is logged and the
+    default order is used.
+    """
+
+    order = parse_pass_order(os.getenv(NOTES_PASS_ORDER_ENV)) or DEFAULT_NOTES_PASS_ORDER
+    try:
+        return _split_notes_pass_order(order)
+    except ValueError as exc:
+        log.warning(
+            "process_meeting: ignoring %s: %s",
+            NOTES_PASS_ORDER_ENV,
+            exc,
+        )
+        return _split_notes_pass_order(DEFAULT_NOTES_PASS_ORDER)
+
+
+PIPELINE_STAGE_TRANSCRIBE = "transcribing"
+PIPELINE_STAGE_NOTES = "quality_engine"
+
+
+def transcribe_meeting_stage(meeting_id: str) -> None:
+    """Staged pipeline, step 1: prepare audio and checkpoint the transcript."""
+
+    _run_meeting_pipeline(meeting_id, stop_after=PIPELINE_STAGE_TRANSCRIBE)
+
+
+def generate_notes_stage(meeting_id: str) -> None:
+    """Staged pipeline, step 2: notes generation and the quality engine."""
+
+    _run_meeting_pipeline(meeting_id, stop_after=PIPELINE_STAGE_NOTES, begin=False)
+
+
+def finalize_notes_stage(meeting_id: str) -> None:
+    """Staged pipeline, step 3: LLM polish and persisting the notes row."""
+
+    _run_meeting_pipeline(meeting_id, begin=False)
+
+
 def process_meeting(meeting_id: str) -> None:
     """
     Golden-path meeting processing job.
@@ -947,11 +1591,32 @@ def process_meeting(meeting_id: str) -> None:
       - Loads Meeting from DB
       - Marks status PROCESSING -> DONE / ERROR
       - Reads the real uploaded media from meeting.raw_media_path
-      - Extracts audio bytes via app.services.media.load_audio_for_meeting
-      - Transcribes audio locally
+      - Streams the uploaded media to a worker temp file in fixed-size chunks
+      - Normalizes it once to 16 kHz mono audio (reused on retry-processing)
+      - Transcribes audio from that file path
       - Optionally enriches transcript with slide OCR
       - Generates notes
       - Persists a MeetingNotes row
+
+    The transcript, raw notes and quality-engine output are checkpointed on
+    the meeting as each stage finishes; a retry after a failure resumes from
+    the first stage without a checkpoint.
+    """
+
+    _run_meeting_pipeline(meeting_id)
+
+
+def _run_meeting_pipeline(
+    meeting_id: str,
+    *,
+    stop_after: str | None = None,
+    begin: bool = True,
+) -> None:
+    """Run process_meeting, optionally stopping once a checkpoint is saved.
+
+    The staged jobs in app.jobs.meetings each run the pipeline up to their
+    own checkpoint; later jobs pick up from the checkpoints earlier ones left.
+    Only the first job counts as a new processing attempt.
     """
     job = get_current_job()
     job_id = job.id if job is not None else None
@@ -972,9 +1637,10 @@ def process_meeting(meeting_id: str) -> None:
             raise RuntimeError(f"Meeting {meeting_id} not found in worker database")
 
         # 2) Mark as PROCESSING
-        begin_attempt(meeting)
-        db.commit()
-        db.refresh(meeting)
+        if begin:
+            begin_attempt(meeting)
+            db.commit()
+            db.refresh(meeting)
 
         # 3) Read real uploaded media from saved path
         raw_media_path = getattr(meeting, "raw_media_path", None)
@@ -986,53 +1652,49 @@ def process_meeting(meeting_id: str) -> None:
             extra={**log_extra, "raw_media_path": raw_media_path},
         )
 
-        try:
-            media_bytes = _read_raw_media_bytes(raw_media_path)
-        except RuntimeError as exc:
-            raise RuntimeError(
-                f"Raw media file not found for meeting {meeting.id}: {raw_media_path}"
-            ) from exc
+        transcript_checkpoint = _load_checkpoint(meeting, "transcribing")
+        if isinstance(transcript_checkpoint, dict):
+            log.info("process_meeting: resuming from transcript checkpoint", extra=log_extra)
+            current_stage = "transcribing"
+            transcription = TranscriptionResult.from_dict(transcript_checkpoint)
+        else:
+            audio_path: Path | None = None
+            try:
+                current_stage = "processing_audio"
+                commit_stage(
+                    db,
+                    meeting,
+                    current_stage,
+                    status="PROCESSING",
+                    completed_key="media_validation_completed_at",
+                    started_key="audio_conversion_started_at",
+                )
+                audio_path = _prepare_meeting_audio(db, meeting, raw_media_path, log_extra)
+                commit_stage(
+                    db,
+                    meeting,
+                    current_stage,
+                    status="PROCESSING",
+                    completed_key="audio_conversion_completed_at",
+                )
 
-        current_stage = "processing_audio"
-        commit_stage(
-            db,
-            meeting,
-            current_stage,
-            status="PROCESSING",
-            completed_key="media_validation_completed_at",
-            started_key="audio_conversion_started_at",
-        )
-        audio_bytes = load_audio_for_meeting(str(meeting.id), media_bytes)
-        commit_stage(
-            db,
-            meeting,
-            current_stage,
-            status="PROCESSING",
-            completed_key="audio_conversion_completed_at",
-        )
+                # 4) Transcription
+                log.info("process_meeting: transcribing audio", extra=log_extra)
+                current_stage = "transcribing"
+                commit_stage(
+                    db,
+                    meeting,
+                    current_stage,
+                    status="PROCESSING",
+                    started_key="transcription_started_at",
+                )
 
-        # 4) Transcription
-        log.info("process_meeting: transcribing audio", extra=log_extra)
-        current_stage = "transcribing"
-        commit_stage(
-            db,
-            meeting,
-            current_stage,
-            status="PROCESSING",
-            started_key="transcription_started_at",
-        )
+                transcription = _transcribe_meeting_audio(db, meeting, audio_path, log_extra)
+            finally:
+                _remove_file_quietly(audio_path)
 
-        with tempfile.NamedTemporaryFile(suffix=_media_suffix(raw_media_path), delete=False) as tmp:
-            tmp.write(audio_bytes)
-            tmp_audio_path = tmp.name
+            _save_checkpoint(db, meeting, "transcribing", transcription.to_dict())
 
-        try:
-            transcription = get_transcriber().transcribe(tmp_audio_path)
-        finally:
-            try:
-                os.remove(tmp_audio_path)
-            except OSError:
-                pass
         commit_stage(
             db,
             meeting,
@@ -1040,13 +1702,27 @@ def process_meeting(meeting_id: str) -> None:
             status="PROCESSING",
             completed_key="transcription_completed_at",
         )
+        if stop_after == PIPELINE_STAGE_TRANSCRIBE:
+            log.info("process_meeting: transcription stage finished", extra=log_extra)
+            return
+
+        notes_strategy_name = getattr(settings, "NOTES_STRATEGY", "local_summary")
+        notes_checkpoint = _load_checkpoint(meeting, "generating_notes")
+        if not (
+            isinstance(notes_checkpoint, dict)
+            and notes_checkpoint.get("strategy") == notes_strategy_name
+        ):
+            notes_checkpoint = None
 
         # 4a) Optional slide OCR enrichment
-        log.info("process_meeting: running slide OCR", extra=log_extra)
-        slide_text = extract_slide_text_for_meeting(
-            db=db,
-            meeting_id=meeting.id,
-        )
+        if notes_checkpoint is not None:
+            slide_text = notes_checkpoint.get("slide_text")
+        else:
+            log.info("process_meeting: running slide OCR", extra=log_extra)
+            slide_text = extract_slide_text_for_meeting(
+                db=db,
+                meeting_id=meeting.id,
+            )
 
         # 5) Generate notes
         log.info("process_meeting: generating notes", extra=log_extra)
@@ -1059,18 +1735,23 @@ def process_meeting(meeting_id: str) -> None:
             started_key="notes_generation_started_at",
         )
 
-        notes_strategy_name = getattr(settings, "NOTES_STRATEGY", "local_summary")
-
         raw_transcript_payload = transcription.to_dict()
         transcript_text = str(
             getattr(transcription, "text", "") or raw_transcript_payload.get("text") or ""
         )
+        # Handed to the passes below that split this text, so sections and
+        # each pass's sentence split are computed once per run.
+        transcript_document = TranscriptDocument(transcript_text)
         transcript_metadata = build_transcript_observability_metadata(
             transcript_text,
             media_duration_seconds=getattr(meeting, "media_duration_seconds", None),
         )
-        section_metadata = build_long_transcript_section_metadata(transcript_text)
-        coverage_metadata = build_long_transcript_coverage_metadata(transcript_text)
+        section_metadata = build_long_transcript_section_metadata(
+            transcript_text, document=transcript_document
+        )
+        coverage_metadata = build_long_transcript_coverage_metadata(
+            transcript_text, document=transcript_document
+        )
         coverage_log_metadata = {
             f"coverage_{key}": value for key, value in coverage_metadata.items()
         }
@@ -1089,13 +1770,40 @@ def process_meeting(meeting_id: str) -> None:
         if slide_text:
             raw_transcript_payload["slide_text"] = slide_text
 
-        if notes_strategy_name == "local_rules":
-            notes_dict = generate_meeting_notes(raw_transcript_payload)
+        # Times every notes pass below; stored under processing_timings.
+        passes = NotesPassProfiler()
+        if notes_checkpoint is not None:
+            log.info("process_meeting: resuming from notes checkpoint", extra=log_extra)
+            notes_dict = notes_checkpoint["notes"]
         else:
-            notes_result = get_notes_strategy().generate(transcript_text, slide_text or "")
-            notes_dict = notes_result.to_api_dict()
-            notes_dict = normalize_canonical_notes(notes_dict)
-            notes_dict = apply_focused_30min_quality_pass(notes_dict, transcript_text)
+            if notes_strategy_name == "local_rules":
+                notes_dict = passes.run(
+                    "generate_meeting_notes", generate_meeting_notes, raw_transcript_payload
+                )
+            else:
+                notes_result = passes.run(
+                    "generate",
+                    get_notes_strategy().generate,
+                    transcript_text,
+                    slide_text or "",
+                )
+                notes_dict = notes_result.to_api_dict()
+                notes_dict = passes.run(
+                    "normalize_generated_notes", normalize_canonical_notes, notes_dict
+                )
+                notes_dict = passes.run(
+                    "focused_30min_quality_pass",
+                    apply_focused_30min_quality_pass,
+                    notes_dict,
+                    transcript_text,
+                    document=transcript_document,
+                )
+            _save_checkpoint(
+                db,
+                meeting,
+                "generating_notes",
+                {"strategy": notes_strategy_name, "slide_text": slide_text, "notes": notes_dict},
+            )
         commit_stage(
             db,
             meeting,
@@ -1112,96 +1820,43 @@ def process_meeting(meeting_id: str) -> None:
             status="PROCESSING",
             started_key="finalization_started_at",
         )
-        cleaned_action_items = clean_action_items(notes_dict.get("action_items") or [])
-        action_item_objects = notes_dict.get("action_item_objects") or []
-
-        if not cleaned_action_items and action_item_objects:
-            rebuilt: list[str] = []
-            for item in action_item_objects:
-                owner = str(item.get("owner") or "").strip()
-                task = str(item.get("task") or "").strip()
-                due_date = str(item.get("due_date") or "").strip()
-
-                if not task:
-                    continue
-
-                line = f"{owner} - {task}" if owner else task
-                if due_date:
-                    line += f" (due: {due_date})"
-                rebuilt.append(line)
-
-            cleaned_action_items = clean_action_items(rebuilt)
-
-        cleaned_action_items, action_item_objects = apply_deterministic_action_cleanup(
-            cleaned_action_items,
-            action_item_objects,
-        )
-
-        summary_text = str(notes_dict.get("summary") or "")
-        summary_slots = notes_dict.get("summary_slots") or None
-        key_points = notes_dict.get("key_points") or []
-        decisions = notes_dict.get("decisions") or []
-        decision_objects = notes_dict.get("decision_objects") or []
-
-        precision_payload: dict[str, Any] = {
-            "summary": summary_text,
-            "summary_slots": summary_slots,
-            "key_points": key_points,
-            "action_items": cleaned_action_items,
-            "action_item_objects": action_item_objects,
-            "decisions": decisions,
-            "decision_objects": decision_objects,
-        }
-        precision_payload = _pilot_rc1_precision_cleanup_result(precision_payload)
-
-        cleaned_action_items = precision_payload.get("action_items") or []
-        action_item_objects = precision_payload.get("action_item_objects") or []
-        decisions = precision_payload.get("decisions") or []
-        decision_objects = precision_payload.get("decision_objects") or []
-
-        decision_action_recall_text = "\n".join(
-            str(item.get("text") or "") for item in decision_objects if isinstance(item, dict)
-        )
-        raw_action_recall_text = "\n".join(
-            part
-            for part in [
-                str(
-                    locals().get("transcript_text")
-                    or locals().get("transcript")
-                    or locals().get("raw_transcript")
-                    or ""
-                ),
-                decision_action_recall_text,
-            ]
-            if part.strip()
+        passes_before_quality_engine, passes_after_quality_engine = configured_notes_passes()
+        notes_pass_context = _NotesPassContext(
+            transcript_text=transcript_text,
+            raw_transcript_text=str(raw_transcript_payload or ""),
         )
 
-        cleaned_action_items, action_item_objects, summary_slots = (
-            _finalize_persisted_action_contract(
-                cleaned_action_items=cleaned_action_items,
-                action_item_objects=action_item_objects,
-                summary_slots=summary_slots,
-                raw_transcript_text=raw_action_recall_text,
-            )
+        quality_engine_routing = _quality_engine_routing_context(meeting)
+        notes_engine_mode = str(quality_engine_routing["resolved_notes_engine_mode"])
+        quality_engine_checkpoint = _load_checkpoint(meeting, "quality_engine")
+        resume_quality_engine = (
+            isinstance(quality_engine_checkpoint, dict)
+            and quality_engine_checkpoint.get("mode") == notes_engine_mode
         )
 
         # 6) Persist MeetingNotes row
-        normalized_notes = normalize_canonical_notes(
-            {
-                "summary": summary_text,
-                "key_points": key_points,
-                "action_items": cleaned_action_items,
-                "summary_slots": summary_slots,
-                "decisions": decisions,
-                "action_item_objects": action_item_objects,
-                "decision_objects": decision_objects,
-            }
-        )
-        normalized_notes = _restore_publishable_actions_from_objects(normalized_notes)
-        normalized_notes = apply_risk_action_owner_consistency(normalized_notes)
+        if resume_quality_engine:
+            # The checkpointed result was computed from these same inputs and
+            # carries the persisted notes whenever the engine did not apply.
+            normalized_notes = quality_engine_checkpoint["result"]["notes"]
+        else:
+            normalized_notes = run_notes_passes(
+                NotesWorkspace(
+                    {
+                        "summary": str(notes_dict.get("summary") or ""),
+                        "key_points": notes_dict.get("key_points") or [],
+                        "action_items": notes_dict.get("action_items") or [],
+                        "summary_slots": notes_dict.get("summary_slots") or None,
+                        "decisions": notes_dict.get("decisions") or [],
+                        "action_item_objects": notes_dict.get("action_item_objects") or [],
+                        "decision_objects": notes_dict.get("decision_objects") or [],
+                    },
+                    notes_pass_context,
+                ),
+                passes_before_quality_engine,
+                profiler=passes,
+            )
 
-        quality_engine_routing = _quality_engine_routing_context(meeting)
-        notes_engine_mode = str(quality_engine_routing["resolved_notes_engine_mode"])
         log.info(
             "process_meeting: quality engine routing",
             extra={
@@ -1220,11 +1875,24 @@ def process_meeting(meeting_id: str) -> None:
             status="PROCESSING",
             started_key="quality_engine_started_at",
         )
-        quality_engine_result = _run_selected_quality_engine(
-            normalized_notes,
-            transcript_text,
-            mode=notes_engine_mode,
-        )
+        if resume_quality_engine:
+            log.info("process_meeting: resuming from quality engine checkpoint", extra=log_extra)
+            quality_engine_result = quality_engine_checkpoint["result"]
+        else:
+            quality_engine_result = passes.run(
+                QUALITY_ENGINE_PASS,
+                _run_selected_quality_engine,
+                normalized_notes,
+                transcript_text,
+                mode=notes_engine_mode,
+                document=transcript_document,
+            )
+            _save_checkpoint(
+                db,
+                meeting,
+                "quality_engine",
+                {"mode": notes_engine_mode, "result": quality_engine_result},
+            )
         quality_engine_metadata = quality_engine_result.get("metadata", {})
         if not isinstance(quality_engine_metadata, dict):
             quality_engine_metadata = {}
@@ -1235,6 +1903,7 @@ def process_meeting(meeting_id: str) -> None:
                 **_quality_engine_result_log_fields(quality_engine_metadata),
             },
         )
+        record_notes_passes(meeting, passes.as_dict())
         commit_stage(
             db,
             meeting,
@@ -1242,70 +1911,19 @@ def process_meeting(meeting_id: str) -> None:
             status="PROCESSING",
             completed_key="quality_engine_completed_at",
         )
+        if stop_after == PIPELINE_STAGE_NOTES:
+            log.info("process_meeting: notes stage finished", extra=log_extra)
+            return
         is_qev3_output = _is_successful_selected_qev3_output(
             notes_engine_mode,
             quality_engine_metadata,
         )
-        if _should_apply_quality_engine_result(notes_engine_mode, quality_engine_metadata):
-            normalized_notes = quality_engine_result["notes"]
-            if is_qev3_output:
-                normalized_notes = finalize_quality_engine_v3_persisted_notes(normalized_notes)
-            else:
-                normalized_notes = _apply_qev2_action_precision_cleanup(normalized_notes)
-
-        for action_obj in normalized_notes.get("action_item_objects", []) or []:
-            if not isinstance(action_obj, dict):
-                continue
-            task = str(action_obj.get("task") or "").strip()
-            for marker_text in (". Confirmed,", ". confirmed,"):
-                if marker_text in task:
-                    task = task.split(marker_text, 1)[0].strip()
-            task = re.sub(r"\s+that$", "", task, flags=re.I)
-            if task:
-                action_obj["task"] = task
-                action_obj["text"] = f"{action_obj.get('owner') or 'Team'}: {task}"
-
-        for action_obj in normalized_notes.get("action_item_objects", []) or []:
-            if not isinstance(action_obj, dict):
-                continue
-            task = str(action_obj.get("task") or "").strip()
-            for marker in (". Confirmed,", ". confirmed,"):
-                if marker in task:
-                    task = task.split(marker, 1)[0].strip()
-            task = re.sub(r"\s+that$", "", task, flags=re.I)
-            if task:
-                action_obj["task"] = task
-                action_obj["text"] = f"{action_obj.get('owner') or 'Team'}: {task}"
-
-        if is_qev3_output:
-            normalized_notes = finalize_quality_engine_v3_persisted_notes(normalized_notes)
-            log.info(
-                "process_meeting: qev3 final persisted output applied",
-                extra={
-                    **log_extra,
-                    "qev3_final_action_count": len(
-                        normalized_notes.get("action_item_objects") or []
-                    ),
-                    "qev3_final_next_step_count": len(
-                        (normalized_notes.get("summary_slots") or {}).get("next_steps") or []
-                    ),
-                },
-            )
-
-        action_items_source = [] if is_qev3_output else normalized_notes.get("action_items") or []
-        normalized_notes["action_items"] = align_action_items_with_objects(
-            action_items_source,
-            normalized_notes.get("action_item_objects") or [],
+        quality_engine_applied = _should_apply_quality_engine_result(
+            notes_engine_mode,
+            quality_engine_metadata,
         )
-
-        if normalized_notes.get("action_item_objects"):
-            summary_slots_for_publish = dict(normalized_notes.get("summary_slots") or {})
-            summary_slots_for_publish["next_steps"] = [
-                str(item.get("task") or "").rstrip(".") + "."
-                for item in normalized_notes.get("action_item_objects", [])[:5]
-                if isinstance(item, dict) and str(item.get("task") or "").strip()
-            ]
-            normalized_notes["summary_slots"] = summary_slots_for_publish
+        if quality_engine_applied:
+            normalized_notes = quality_engine_result["notes"]
 
         llm_polish_enabled_value = os.getenv("MEETIQ_LLM_POLISH_ENABLED", "")
         llm_gate_fields = {
@@ -1332,11 +1950,30 @@ def process_meeting(meeting_id: str) -> None:
             flush=True,
         )
 
-        if is_qev3_output:
-            normalized_notes = apply_llm_polish_to_notes(normalized_notes)
-            normalized_notes = _apply_long_meeting_final_polish_after_llm(
+        normalized_notes = run_notes_passes(
+            NotesWorkspace(
                 normalized_notes,
-                transcript_text=str(raw_transcript_payload or ""),
+                replace(
+                    notes_pass_context,
+                    quality_engine_applied=quality_engine_applied,
+                    is_qev3_output=is_qev3_output,
+                ),
+            ),
+            passes_after_quality_engine,
+            profiler=passes,
+        )
+        if is_qev3_output:
+            log.info(
+                "process_meeting: qev3 final persisted output applied",
+                extra={
+                    **log_extra,
+                    "qev3_final_action_count": len(
+                        normalized_notes.get("action_item_objects") or []
+                    ),
+                    "qev3_final_next_step_count": len(
+                        (normalized_notes.get("summary_slots") or {}).get("next_steps") or []
+                    ),
+                },
             )
 
         model_version_for_persistence = _model_version_with_quality_engine_suffix(
@@ -1373,6 +2010,17 @@ def process_meeting(meeting_id: str) -> None:
         )
         db.add(notes_row)
 
+        record_notes_passes(meeting, passes.as_dict())
+        log.info(
+            "process_meeting: notes pass timings",
+            extra={
+                **log_extra,
+                "notes_pass_seconds": {
+                    timing.name: round(timing.seconds, 4) for timing in passes.passes()
+                },
+                "notes_pass_total_seconds": round(passes.total_seconds, 4),
+            },
+        )
         commit_stage(
             db,
             meeting,
@@ -1381,7 +2029,9 @@ def process_meeting(meeting_id: str) -> None:
             completed_key="finalization_completed_at",
         )
 
-        # 7) Mark meeting as DONE
+        # 7) Mark meeting as DONE; the notes row now carries the full transcript.
+        clear_partial_transcript(db, meeting.id)
+        meeting.processing_checkpoints = None
         mark_completed(meeting)
 
         db.commit()
@@ -1395,7 +2045,7 @@ def process_meeting(meeting_id: str) -> None:
 
         log.info(
             "process_meeting: finished",
-            extra={**log_extra, "summary_preview": summary_text[:80]},
+            extra={**log_extra, "summary_preview": str(notes_dict.get("summary") or "")[:80]},
         )
 
     except Exception as exc:
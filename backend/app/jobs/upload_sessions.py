@@ -0,0 +1,35 @@
+"""Reaper for abandoned resumable upload sessions.
+
+Run it periodically, e.g. hourly from cron:
+
+    python -m app.jobs.upload_sessions
+
+or enqueue expire_stale_upload_sessions from an RQ scheduler.
+"""
+
+from __future__ import annotations
+
+from app.db import SessionLocal
+from app.services.object_storage import s3_bucket_from_env, s3_client
+from app.services.resumable_upload import expire_upload_sessions
+
+
+def expire_stale_upload_sessions() -> int:
+    db = SessionLocal()
+    try:
+        return expire_upload_sessions(
+            db,
+            s3_client=s3_client() if s3_bucket_from_env() else None,
+        )
+    finally:
+        db.close()
+
+
+def main() -> int:
+    deleted = expire_stale_upload_sessions()
+    print(f"Deleted {deleted} expired upload session(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -97,6 +97,17 @@ JOBS_FAILED = Counter(
     "Total jobs that failed.",
 )
 
+# Notes-stage passes of process_meeting (labels: pass, and direction for items)
+NOTES_PASS_LATENCY = Summary(
+    "notes_pass_duration_seconds",
+    "Time spent in each notes post-processing pass.",
+)
+
+NOTES_PASS_ITEMS = Counter(
+    "notes_pass_items_total",
+    "Actions, decisions and key points entering and leaving each notes pass.",
+)
+
 
 @contextmanager
 def track_http_request(
@@ -124,6 +135,8 @@ def render_all_metrics_prometheus() -> str:
         JOBS_ENQUEUED,
         JOBS_COMPLETED,
         JOBS_FAILED,
+        NOTES_PASS_LATENCY,
+        NOTES_PASS_ITEMS,
     ):
         lines.extend(metric.render_prometheus())
         lines.append("")
@@ -1,6 +1,7 @@
 from minio import Minio
 
 from .core.settings import settings
+from .services.object_storage import minio_client
 
 
 def get_minio() -> Minio | None:
@@ -10,9 +11,9 @@ def get_minio() -> Minio | None:
         or not settings.MINIO_SECRET_KEY
     ):
         return None
-    return Minio(
+    return minio_client(
         settings.MINIO_ENDPOINT,
-        access_key=settings.MINIO_ACCESS_KEY,
-        secret_key=settings.MINIO_SECRET_KEY,
+        settings.MINIO_ACCESS_KEY,
+        settings.MINIO_SECRET_KEY,
         secure=settings.MINIO_USE_SSL,
     )
@@ -17,7 +17,10 @@ from app.models import job as _job  # noqa: F401,E402
 from app.models import meeting as _meeting  # noqa: F401,E402
 from app.models import meeting_feedback as _meeting_feedback  # noqa: F401,E402
 from app.models import meeting_notes as _meeting_notes  # noqa: F401,E402
+from app.models import transcript_segment as _transcript_segment  # noqa: F401,E402
+from app.models import transcription_cache as _transcription_cache  # noqa: F401,E402
 from app.models import upload_ledger as _upload_ledger  # noqa: F401,E402
+from app.models import upload_session as _upload_session  # noqa: F401,E402
 from app.models import user as _user  # noqa: F401,E402
 
 Transcript = Any  # type: ignore[misc]
@@ -41,6 +41,8 @@ class Meeting(Base):
     media_size_bytes: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     media_content_type: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     media_filename: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    media_sha256: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    normalized_audio_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     confidential_mode: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=False, server_default="false", index=True
@@ -67,6 +69,7 @@ class Meeting(Base):
         Integer, nullable=False, default=0, server_default="0"
     )
     processing_timings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    processing_checkpoints: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     status: Mapped[str] = mapped_column(
         String(20), nullable=False, default="new", server_default="new"
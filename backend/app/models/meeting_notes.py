@@ -28,6 +28,8 @@ class MeetingNotes(Base):
     decision_objects = Column(JSON, nullable=True)
 
     model_version = Column(String, nullable=True)
+    # Bumped on every edit; part of the rendered-notes cache key.
+    revision = Column(Integer, nullable=False, default=1, server_default="1")
     created_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
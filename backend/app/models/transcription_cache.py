@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base
+
+
+class TranscriptionCacheEntry(Base):
+    __tablename__ = "transcription_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    audio_sha256: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    model_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    language: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    meeting_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
@@ -2,14 +2,29 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 import logging
 import os
 import re
+import shutil
+import uuid
 from pathlib import Path
 from typing import Any, List, Literal
 
-import boto3
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile
+import anyio.from_thread
+from boto3.s3.transfer import TransferConfig
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -18,10 +33,45 @@ from app.deps import get_current_user
 from app.jobs.meetings import enqueue_process_meeting
 from app.models.meeting import Meeting
 from app.models.meeting_notes import MeetingNotes
+from app.models.upload_session import UploadSession, UploadSessionPart
 from app.models.user import User
 from app.services.billing import get_effective_plan
-from app.services.media_metadata import probe_media_duration_seconds
+from app.services.media_metadata import (
+    probe_media_file_duration_seconds,
+    probe_media_fileobj_duration_seconds_async,
+)
+from app.services.media_upload import (
+    MEDIA_UPLOAD_CHUNK_BYTES,
+    UploadDigest,
+    UploadTooLargeError,
+    configured_max_upload_bytes,
+    digest_upload,
+    upload_size_label,
+)
+from app.services.object_storage import ObjectStore, s3_bucket_from_env
+from app.services.object_storage import s3_client as shared_s3_client
 from app.services.processing_observability import mark_stage, mark_uploaded, serialize_progress
+from app.services.rendered_notes_cache import invalidate_rendered_notes, render_notes_cached
+from app.services.resumable_upload import (
+    UPLOAD_SESSION_PART_BYTES,
+    UploadPartError,
+    abort_part_storage,
+    begin_part_storage,
+    discard_stitched_recording,
+    expected_part_size,
+    missing_part_numbers,
+    part_count,
+    part_offset,
+    promote_stitched_recording,
+    staged_recording_key,
+    stitch_parts,
+    store_part,
+    upload_session_expired,
+)
+from app.services.transcription.partial_transcript import (
+    load_partial_transcript,
+    partial_transcript_count,
+)
 from app.services.usage_limits import (
     can_use_confidential_mode,
     enforce_free_trial_duration_limit,
@@ -29,6 +79,7 @@ from app.services.usage_limits import (
     max_duration_seconds_for_upload,
     record_upload_ledger_entry,
 )
+from app.storage import S3Storage
 
 router = APIRouter(prefix="/v1/meetings", tags=["meetings"])
 logger = logging.getLogger(__name__)
@@ -39,6 +90,27 @@ class MeetingNotesSectionUpdate(BaseModel):
     value: str | list[str]
 
 
+class DirectUploadRequest(BaseModel):
+    filename: str
+    content_type: str | None = None
+    size_bytes: int | None = None
+    confidential_mode: bool = False
+
+
+class DirectUploadComplete(BaseModel):
+    filename: str
+    storage_key: str
+    content_type: str | None = None
+    confidential_mode: bool = False
+
+
+class UploadSessionCreate(BaseModel):
+    filename: str
+    content_type: str | None = None
+    size_bytes: int
+    confidential_mode: bool = False
+
+
 UPLOAD_DIR = Path("/app/backend/storage/uploads")
 SUPPORTED_EXTENSIONS = {
     ".flac",
@@ -52,7 +124,13 @@ SUPPORTED_EXTENSIONS = {
     ".mpeg",
     ".mpga",
 }
-MAX_UPLOAD_BYTES = 24 * 1024 * 1024
+DIRECT_UPLOAD_URL_TTL_SECONDS = 15 * 60
+DIRECT_UPLOAD_PROBE_URL_TTL_SECONDS = 5 * 60
+RAW_MEDIA_MULTIPART_CHUNK_BYTES = 8 * 1024 * 1024
+RAW_MEDIA_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=RAW_MEDIA_MULTIPART_CHUNK_BYTES,
+    multipart_chunksize=RAW_MEDIA_MULTIPART_CHUNK_BYTES,
+)
 
 
 def _get_db() -> Session:
@@ -64,72 +142,92 @@ def _get_db() -> Session:
 
 
 def _s3_bucket() -> str | None:
-    return (
-        os.getenv("S3_BUCKET")
-        or os.getenv("AWS_S3_BUCKET")
-        or os.getenv("S3_BUCKET_NAME")
-        or os.getenv("OBJECT_BUCKET")
-    )
+    return s3_bucket_from_env()
 
 
-def _s3_region() -> str | None:
-    return os.getenv("S3_REGION") or os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
+def _s3_client():
+    return shared_s3_client()
 
 
-def _s3_client():
-    kwargs: dict[str, Any] = {}
+def _use_s3_storage() -> bool:
+    return os.getenv("STORAGE_BACKEND", "").lower() == "s3" and bool(_s3_bucket())
 
-    region = _s3_region()
-    if region:
-        kwargs["region_name"] = region
 
-    endpoint = os.getenv("S3_ENDPOINT") or os.getenv("AWS_ENDPOINT_URL")
-    if endpoint:
-        kwargs["endpoint_url"] = endpoint
+def _raw_media_key(meeting_id: str, filename: str | None) -> str:
+    suffix = Path(filename or "").suffix or ".mp4"
+    return f"raw_media/meeting_{meeting_id}{suffix}"
 
-    access_key = os.getenv("S3_ACCESS_KEY") or os.getenv("AWS_ACCESS_KEY_ID")
-    secret_key = os.getenv("S3_SECRET_KEY") or os.getenv("AWS_SECRET_ACCESS_KEY")
-    if access_key and secret_key:
-        kwargs["aws_access_key_id"] = access_key
-        kwargs["aws_secret_access_key"] = secret_key
 
-    return boto3.client("s3", **kwargs)
+def _staging_media_key(
+    meeting_id: str,
+    filename: str | None,
+    staging_id: str | None = None,
+) -> str:
+    """
+    A fresh object key for an upload that has not been validated yet.
 
+    Uploads land here and are copied to _raw_media_key only once they pass
+    validation, so a rejected or concurrent upload never touches the
+    recording a meeting already has.
+    """
+    suffix = Path(filename or "").suffix or ".mp4"
+    return f"raw_media/staging/{meeting_id}/{staging_id or uuid.uuid4().hex}{suffix}"
 
-def _use_s3_storage() -> bool:
-    return os.getenv("STORAGE_BACKEND", "").lower() == "s3" and bool(_s3_bucket())
 
+def _is_staging_media_key(meeting_id: str, key: str) -> bool:
+    return re.fullmatch(rf"raw_media/staging/{meeting_id}/[0-9a-f]{{32}}\.\w+", key) is not None
 
-def _save_raw_media(
-    meeting_id: str,
-    file: UploadFile,
-    data: bytes,
-) -> str:
+
+def _discard_staged_media(storage: ObjectStore, staging_key: str) -> None:
+    try:
+        storage.delete(staging_key)
+    except Exception:  # noqa: BLE001
+        logger.warning("could not delete staged upload %s", staging_key, exc_info=True)
+
+
+def _promote_staged_media(storage: ObjectStore, staging_key: str, key: str) -> None:
+    """Copy a validated staging object to its live key, then drop the staging copy."""
+    storage.copy(staging_key, key, transfer_config=RAW_MEDIA_TRANSFER_CONFIG)
+    _discard_staged_media(storage, staging_key)
+
+
+def _direct_upload_storage() -> S3Storage:
+    if not _use_s3_storage():
+        raise HTTPException(
+            status_code=409,
+            detail="Direct uploads need object storage; use the regular upload instead.",
+        )
+    return S3Storage()
+
+
+def _save_raw_media(meeting_id: str, file: UploadFile) -> str:
     """
-    Persist uploaded media.
+    Persist uploaded media from the file Starlette spooled it to.
 
     In production, store the media in S3 so both the web service and worker
-    can access the same object. In local development, fall back to disk.
+    can access the same object. Large files go up as a multipart upload read
+    straight from the spooled file. In local development, fall back to disk.
     """
-    suffix = Path(file.filename or "").suffix or ".mp4"
+    key = _raw_media_key(meeting_id, file.filename)
+    file.file.seek(0)
 
     if _use_s3_storage():
         bucket = _s3_bucket()
         if not bucket:
             raise RuntimeError("S3 storage requested but no S3 bucket is configured")
 
-        key = f"raw_media/meeting_{meeting_id}{suffix}"
-        _s3_client().put_object(
-            Bucket=bucket,
-            Key=key,
-            Body=data,
-            ContentType=file.content_type or "application/octet-stream",
+        ObjectStore(bucket, _s3_client()).put_fileobj(
+            key,
+            file.file,
+            content_type=file.content_type or "application/octet-stream",
+            transfer_config=RAW_MEDIA_TRANSFER_CONFIG,
         )
         return f"s3://{bucket}/{key}"
 
     UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-    out_path = UPLOAD_DIR / f"meeting_{meeting_id}{suffix}"
-    out_path.write_bytes(data)
+    out_path = UPLOAD_DIR / Path(key).name
+    with out_path.open("wb") as out:
+        shutil.copyfileobj(file.file, out, MEDIA_UPLOAD_CHUNK_BYTES)
     return str(out_path)
 
 
@@ -166,14 +264,13 @@ def _render_action_item_md(item: Any) -> str:
     return f"- [ ] {str(item)}"
 
 
-@router.post("/{meeting_id}/upload")
-async def upload_meeting_media(
+def _meeting_accepting_upload(
     meeting_id: int,
-    file: UploadFile = File(...),
-    confidential_mode: bool = Form(False),
-    db: Session = Depends(_get_db),
-    current_user: User = Depends(get_current_user),
-) -> dict[str, Any]:
+    *,
+    confidential_mode: bool,
+    db: Session,
+    current_user: User,
+) -> Meeting:
     meeting = db.get(Meeting, meeting_id)
     if meeting is None or meeting.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Meeting not found")
@@ -192,20 +289,71 @@ async def upload_meeting_media(
         current_user=current_user,
         meeting=meeting,
     )
+    return meeting
+
+
+def _upload_too_large_error(max_upload_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail=(
+            "This file is too large for hosted transcription. Please upload a file "
+            f"under {upload_size_label(max_upload_bytes)} or use compressed m4a/mp3."
+        ),
+    )
+
+
+def _unsupported_file_type_error() -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail="Unsupported file type. Please upload MP3, MP4, M4A, WAV, WEBM, OGG, or FLAC.",
+    )
 
-    raw_bytes = await file.read()
-    if len(raw_bytes) > MAX_UPLOAD_BYTES:
-        raise HTTPException(
-            status_code=400,
-            detail="This file is too large for hosted transcription. Please upload a file under 24 MB or use compressed m4a/mp3.",
-        )
+
+@router.post("/{meeting_id}/upload")
+async def upload_meeting_media(
+    meeting_id: int,
+    file: UploadFile = File(...),
+    confidential_mode: bool = Form(False),
+    db: Session = Depends(_get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict[str, Any]:
+    meeting = _meeting_accepting_upload(
+        meeting_id,
+        confidential_mode=confidential_mode,
+        db=db,
+        current_user=current_user,
+    )
 
     extension = Path(file.filename or "").suffix.lower()
+    max_upload_bytes = configured_max_upload_bytes()
+    try:
+        upload = await digest_upload(file, max_bytes=max_upload_bytes)
+    except UploadTooLargeError:
+        raise _upload_too_large_error(max_upload_bytes) from None
+
+    return await _accept_spooled_upload(
+        meeting=meeting,
+        file=file,
+        upload=upload,
+        extension=extension,
+        confidential_mode=confidential_mode,
+        db=db,
+        current_user=current_user,
+    )
+
+
+async def _accept_spooled_upload(
+    *,
+    meeting: Meeting,
+    file: UploadFile,
+    upload: UploadDigest,
+    extension: str,
+    confidential_mode: bool,
+    db: Session,
+    current_user: User,
+) -> dict[str, Any]:
     if extension not in SUPPORTED_EXTENSIONS:
-        raise HTTPException(
-            status_code=400,
-            detail="Unsupported file type. Please upload MP3, MP4, M4A, WAV, WEBM, OGG, or FLAC.",
-        )
+        raise _unsupported_file_type_error()
 
     mark_stage(
         meeting,
@@ -215,11 +363,49 @@ async def upload_meeting_media(
         clear_error=True,
     )
 
-    media_duration_seconds = probe_media_duration_seconds(
-        raw_bytes,
-        suffix=extension or ".bin",
+    media_duration_seconds = await probe_media_fileobj_duration_seconds_async(file.file)
+    _enforce_upload_duration(
+        meeting=meeting,
+        filename=file.filename,
+        extension=extension,
+        size_bytes=upload.size_bytes,
+        duration_seconds=media_duration_seconds,
+        db=db,
+        current_user=current_user,
     )
 
+    try:
+        raw_path = await run_in_threadpool(_save_raw_media, str(meeting.id), file)
+    except Exception:
+        raise HTTPException(
+            status_code=500,
+            detail="We couldn't process this file. Please try a shorter recording or upload a supported audio/video format.",
+        )
+
+    return _finish_meeting_upload(
+        meeting=meeting,
+        raw_path=raw_path,
+        filename=file.filename,
+        content_type=file.content_type,
+        size_bytes=upload.size_bytes,
+        sha256=upload.sha256,
+        duration_seconds=media_duration_seconds,
+        confidential_mode=confidential_mode,
+        db=db,
+        current_user=current_user,
+    )
+
+
+def _enforce_upload_duration(
+    *,
+    meeting: Meeting,
+    filename: str | None,
+    extension: str,
+    size_bytes: int,
+    duration_seconds: float | None,
+    db: Session,
+    current_user: User,
+) -> None:
     effective_plan = get_effective_plan(db=db, user=current_user)
     max_duration_seconds = max_duration_seconds_for_upload(
         db=db,
@@ -229,14 +415,14 @@ async def upload_meeting_media(
     logger.info(
         "upload duration gate",
         extra={
-            "meeting_id": meeting_id,
+            "meeting_id": meeting.id,
             "user_id": current_user.id,
             "user_email": current_user.email,
             "effective_plan": effective_plan,
-            "upload_filename": file.filename,
+            "upload_filename": filename,
             "extension": extension,
-            "file_size_bytes": len(raw_bytes),
-            "media_duration_seconds": media_duration_seconds,
+            "file_size_bytes": size_bytes,
+            "media_duration_seconds": duration_seconds,
             "max_duration_seconds": max_duration_seconds,
         },
     )
@@ -244,32 +430,40 @@ async def upload_meeting_media(
     enforce_free_trial_duration_limit(
         db=db,
         current_user=current_user,
-        duration_seconds=media_duration_seconds,
+        duration_seconds=duration_seconds,
     )
 
-    try:
-        raw_path = _save_raw_media(str(meeting_id), file, raw_bytes)
-    except Exception:
-        raise HTTPException(
-            status_code=500,
-            detail="We couldn't process this file. Please try a shorter recording or upload a supported audio/video format.",
-        )
 
+def _finish_meeting_upload(
+    *,
+    meeting: Meeting,
+    raw_path: str,
+    filename: str | None,
+    content_type: str | None,
+    size_bytes: int,
+    sha256: str | None,
+    duration_seconds: float | None,
+    confidential_mode: bool,
+    db: Session,
+    current_user: User,
+) -> dict[str, Any]:
+    """Record a stored recording on the meeting and enqueue processing."""
     record_upload_ledger_entry(
         db=db,
         current_user=current_user,
         meeting=meeting,
-        original_filename=file.filename,
-        file_size_bytes=len(raw_bytes),
-        content_type=file.content_type,
+        original_filename=filename,
+        file_size_bytes=size_bytes,
+        content_type=content_type,
         storage_key=raw_path,
     )
 
     meeting.raw_media_path = raw_path
-    meeting.media_duration_seconds = media_duration_seconds
-    meeting.media_size_bytes = len(raw_bytes)
-    meeting.media_content_type = file.content_type
-    meeting.media_filename = file.filename
+    meeting.media_duration_seconds = duration_seconds
+    meeting.media_size_bytes = size_bytes
+    meeting.media_content_type = content_type
+    meeting.media_filename = filename
+    meeting.media_sha256 = sha256
     meeting.confidential_mode = bool(confidential_mode)
     meeting.recording_retention_policy = (
         "delete_after_notes" if meeting.confidential_mode else "standard"
@@ -283,11 +477,11 @@ async def upload_meeting_media(
     db.commit()
     db.refresh(meeting)
 
-    job = enqueue_process_meeting(meeting_id=meeting_id)
+    job = enqueue_process_meeting(meeting_id=meeting.id)
 
     return {
         "status": "ok",
-        "meeting_id": meeting_id,
+        "meeting_id": meeting.id,
         "job_id": job.id,
         "raw_media_path": meeting.raw_media_path,
         "media_duration_seconds": meeting.media_duration_seconds,
@@ -300,6 +494,492 @@ async def upload_meeting_media(
     }
 
 
+@router.post("/{meeting_id}/upload-url")
+def create_direct_upload(
+    meeting_id: int,
+    payload: DirectUploadRequest,
+    db: Session = Depends(_get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict[str, Any]:
+    """
+    Step one of a direct upload: a presigned PUT URL for a staging object.
+
+    The client sends the recording straight to object storage and then calls
+    upload-complete with the returned storage_key; no media bytes pass through
+    the API.
+    """
+    meeting = _meeting_accepting_upload(
+        meeting_id,
+        confidential_mode=payload.confidential_mode,
+        db=db,
+        current_user=current_user,
+    )
+
+    if Path(payload.filename).suffix.lower() not in SUPPORTED_EXTENSIONS:
+        raise _unsupported_file_type_error()
+
+    max_upload_bytes = configured_max_upload_bytes()
+    if payload.size_bytes is not None and payload.size_bytes > max_upload_bytes:
+        raise _upload_too_large_error(max_upload_bytes)
+
+    storage = _direct_upload_storage()
+    key = _staging_media_key(str(meeting.id), payload.filename)
+    content_type = payload.content_type or "application/octet-stream"
+    return {
+        "method": "PUT",
+        "upload_url": storage.presign_put(
+            key,
+            content_type=content_type,
+            expires=DIRECT_UPLOAD_URL_TTL_SECONDS,
+        ),
+        "headers": {"Content-Type": content_type},
+        "storage_key": key,
+        "expires_in": DIRECT_UPLOAD_URL_TTL_SECONDS,
+        "max_size_bytes": max_upload_bytes,
+    }
+
+
+@router.post("/{meeting_id}/upload-complete")
+def complete_direct_upload(
+    meeting_id: int,
+    payload: DirectUploadComplete,
+    db: Session = Depends(_get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict[str, Any]:
+    """
+    Step two of a direct upload: validate the staged object and enqueue it.
+
+    ffprobe reads the object through a short-lived presigned GET URL, so only
+    the container headers it needs are fetched (as HTTP range requests). A
+    valid object is copied to the meeting's raw media key; one that fails
+    validation is deleted from staging and the meeting keeps its recording.
+    """
+    meeting = _meeting_accepting_upload(
+        meeting_id,
+        confidential_mode=payload.confidential_mode,
+        db=db,
+        current_user=current_user,
+    )
+
+    extension = Path(payload.filename).suffix.lower()
+    if extension not in SUPPORTED_EXTENSIONS:
+        raise _unsupported_file_type_error()
+
+    storage = _direct_upload_storage()
+    staging_key = payload.storage_key
+    head = None
+    if _is_staging_media_key(str(meeting.id), staging_key):
+        head = storage.head(staging_key)
+    if head is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Upload not found. Please upload the file again.",
+        )
+
+    try:
+        size_bytes = int(head.get("ContentLength") or 0)
+        max_upload_bytes = configured_max_upload_bytes()
+        if size_bytes > max_upload_bytes:
+            raise _upload_too_large_error(max_upload_bytes)
+
+        mark_stage(
+            meeting,
+            "validating_media",
+            status="PROCESSING",
+            started_key="upload_received_at",
+            clear_error=True,
+        )
+
+        media_duration_seconds = probe_media_file_duration_seconds(
+            storage.sign_url(staging_key, expires=DIRECT_UPLOAD_PROBE_URL_TTL_SECONDS)
+        )
+        _enforce_upload_duration(
+            meeting=meeting,
+            filename=payload.filename,
+            extension=extension,
+            size_bytes=size_bytes,
+            duration_seconds=media_duration_seconds,
+            db=db,
+            current_user=current_user,
+        )
+    except HTTPException:
+        db.rollback()
+        _discard_staged_media(storage, staging_key)
+        raise
+
+    key = _raw_media_key(str(meeting.id), payload.filename)
+    try:
+        _promote_staged_media(storage, staging_key, key)
+    except Exception as exc:
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail="We couldn't store this file. Please upload it again.",
+        ) from exc
+
+    # The worker hashes the media when it downloads it; until then no earlier
+    # checkpoint may be taken to belong to this recording.
+    meeting.processing_checkpoints = None
+    return _finish_meeting_upload(
+        meeting=meeting,
+        raw_path=f"s3://{storage.bucket}/{key}",
+        filename=payload.filename,
+        content_type=head.get("ContentType") or payload.content_type,
+        size_bytes=size_bytes,
+        sha256=None,
+        duration_seconds=media_duration_seconds,
+        confidential_mode=payload.confidential_mode,
+        db=db,
+        current_user=current_user,
+    )
+
+
+def _get_upload_session(
+    meeting_id: int,
+    session_id: str,
+    *,
+    db: Session,
+    current_user: User,
+) -> UploadSession:
+    upload_session = db.get(UploadSession, session_id)
+    if (
+        upload_session is None
+        or upload_session.meeting_id != meeting_id
+        or upload_session.user_id != current_user.id
+    ):
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return upload_session
+
+
+def _upload_session_parts(db: Session, upload_session: UploadSession) -> list[UploadSessionPart]:
+    return (
+        db.query(UploadSessionPart)
+        .filter(UploadSessionPart.session_id == upload_session.id)
+        .order_by(UploadSessionPart.part_number)
+        .all()
+    )
+
+
+def _serialize_upload_session(
+    upload_session: UploadSession,
+    parts: list[UploadSessionPart],
+) -> dict[str, Any]:
+    missing = missing_part_numbers(upload_session, parts)
+    return {
+        "session_id": upload_session.id,
+        "meeting_id": upload_session.meeting_id,
+        "status": upload_session.status,
+        "total_size_bytes": upload_session.total_size_bytes,
+        "part_size_bytes": upload_session.part_size_bytes,
+        "part_count": part_count(upload_session.total_size_bytes, upload_session.part_size_bytes),
+        "received_bytes": sum(part.size_bytes for part in parts),
+        "received_parts": [
+            {
+                "part_number": part.part_number,
+                "offset": part.offset_bytes,
+                "size_bytes": part.size_bytes,
+                "sha256": part.sha256,
+            }
+            for part in parts
+        ],
+        "missing_parts": missing,
+        "next_offset": (
+            part_offset(upload_session, missing[0]) if missing else upload_session.total_size_bytes
+        ),
+    }
+
+
+def _require_open_upload_session(
+    upload_session: UploadSession,
+    *,
+    statuses: tuple[str, ...] = ("open",),
+) -> None:
+    if upload_session.status not in statuses:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Upload session is {upload_session.status}.",
+        )
+    if upload_session_expired(upload_session):
+        raise HTTPException(status_code=410, detail="Upload session has expired.")
+
+
+@router.post("/{meeting_id}/upload-sessions")
+def create_upload_session(
+    meeting_id: int,
+    payload: UploadSessionCreate,
+    db: Session = Depends(_get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict[str, Any]:
+    """
+    Start a resumable upload.
+
+    The client PUTs the recording as numbered parts of part_size_bytes
+    (each with its sha256), can ask which parts arrived after a dropped
+    connection, and calls complete once every part is in.
+    """
+    meeting = _meeting_accepting_upload(
+        meeting_id,
+        confidential_mode=payload.confidential_mode,
+        db=db,
+        current_user=current_user,
+    )
+
+    if Path(payload.filename).suffix.lower() not in SUPPORTED_EXTENSIONS:
+        raise _unsupported_file_type_error()
+
+    max_upload_bytes = configured_max_upload_bytes()
+    if payload.size_bytes > max_upload_bytes:
+        raise _upload_too_large_error(max_upload_bytes)
+    if payload.size_bytes <= 0:
+        raise HTTPException(status_code=400, detail="The file is empty.")
+
+    session_id = uuid.uuid4().hex
+    key = _staging_media_key(str(meeting.id), payload.filename, session_id)
+    if _use_s3_storage():
+        storage_key = f"s3://{_s3_bucket()}/{key}"
+        s3_client = _s3_client()
+    else:
+        storage_key = str(UPLOAD_DIR / "staging" / str(meeting.id) / Path(key).name)
+        s3_client = None
+
+    upload_session = UploadSession(
+        id=session_id,
+        meeting_id=meeting.id,
+        user_id=current_user.id,
+        original_filename=payload.filename,
+        content_type=payload.content_type,
+        total_size_bytes=payload.size_bytes,
+        part_size_bytes=UPLOAD_SESSION_PART_BYTES,
+        confidential_mode=payload.confidential_mode,
+        storage_key=storage_key,
+        status="open",
+    )
+    begin_part_storage(upload_session, s3_client=s3_client)
+    db.add(upload_session)
+    db.commit()
+    db.refresh(upload_session)
+    return _serialize_upload_session(upload_session, [])
+
+
+@router.get("/{meeting_id}/upload-sessions/{session_id}")
+def get_upload_session(
+    meeting_id: int,
+    session_id: str,
+    db: Session = Depends(_get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict[str, Any]:
+    upload_session = _get_upload_session(meeting_id, session_id, db=db, current_user=current_user)
+    return _serialize_upload_session(upload_session, _upload_session_parts(db, upload_session))
+
+
+def _store_session_part(
+    upload_session: UploadSession,
+    part_number: int,
+    data: bytes,
+) -> str | None:
+    s3_client = _s3_client() if upload_session.s3_upload_id else None
+    return store_part(upload_session, part_number, data, s3_client=s3_client)
+
+
+async def _read_session_part(request: Request, part_number: int, expected_size: int) -> bytes:
+    data = bytearray()
+    async for chunk in request.stream():
+        data.extend(chunk)
+        if len(data) > expected_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Part {part_number} must be {expected_size} bytes.",
+            )
+    if len(data) != expected_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Part {part_number} must be {expected_size} bytes.",
+        )
+    return bytes(data)
+
+
+@router.put("/{meeting_id}/upload-sessions/{session_id}/parts/{part_number}")
+def upload_session_part(
+    meeting_id: int,
+    session_id: str,
+    part_number: int,
+    request: Request,
+    part_sha256: str = Header(..., alias="X-Part-Sha256"),
+    db: Session = Depends(_get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict[str, Any]:
+    upload_session = _get_upload_session(meeting_id, session_id, db=db, current_user=current_user)
+    _require_open_upload_session(upload_session)
+    try:
+        expected_size = expected_part_size(upload_session, part_number)
+    except UploadPartError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    # A sync route runs in the threadpool, so the session queries stay off the
+    # event loop; only the body is read back on it.
+    data = anyio.from_thread.run(_read_session_part, request, part_number, expected_size)
+
+    sha256 = hashlib.sha256(data).hexdigest()
+    if sha256 != part_sha256.strip().lower():
+        raise HTTPException(
+            status_code=400,
+            detail=f"Part {part_number} checksum mismatch; please resend it.",
+        )
+
+    part = (
+        db.query(UploadSessionPart)
+        .filter(
+            UploadSessionPart.session_id == upload_session.id,
+            UploadSessionPart.part_number == part_number,
+        )
+        .one_or_none()
+    )
+    if part is None or part.sha256 != sha256:
+        etag = _store_session_part(upload_session, part_number, data)
+        if part is None:
+            part = UploadSessionPart(session_id=upload_session.id, part_number=part_number)
+            db.add(part)
+        part.offset_bytes = part_offset(upload_session, part_number)
+        part.size_bytes = expected_size
+        part.sha256 = sha256
+        part.etag = etag
+        db.commit()
+
+    return {
+        "part_number": part_number,
+        "offset": part.offset_bytes,
+        "size_bytes": part.size_bytes,
+        "sha256": part.sha256,
+    }
+
+
+@router.post("/{meeting_id}/upload-sessions/{session_id}/complete")
+def complete_upload_session(
+    meeting_id: int,
+    session_id: str,
+    db: Session = Depends(_get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict[str, Any]:
+    upload_session = _get_upload_session(meeting_id, session_id, db=db, current_user=current_user)
+    _require_open_upload_session(upload_session, statuses=("open", "stitched"))
+    meeting = _meeting_accepting_upload(
+        meeting_id,
+        confidential_mode=upload_session.confidential_mode,
+        db=db,
+        current_user=current_user,
+    )
+
+    parts = _upload_session_parts(db, upload_session)
+    missing = missing_part_numbers(upload_session, parts)
+    if missing:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "message": "Upload is missing parts.",
+                **_serialize_upload_session(upload_session, parts),
+            },
+        )
+
+    s3_client = _s3_client() if upload_session.s3_upload_id else None
+    key = _raw_media_key(str(meeting.id), upload_session.original_filename)
+    sha256 = None
+    if upload_session.status == "open":
+        # Once stitched, a retried complete only re-runs validation.
+        sha256 = stitch_parts(upload_session, parts, s3_client=s3_client)
+        upload_session.status = "stitched"
+        db.commit()
+
+    extension = Path(upload_session.original_filename).suffix.lower()
+    try:
+        mark_stage(
+            meeting,
+            "validating_media",
+            status="PROCESSING",
+            started_key="upload_received_at",
+            clear_error=True,
+        )
+        staged_key = staged_recording_key(upload_session)
+        media_duration_seconds = probe_media_file_duration_seconds(
+            S3Storage().sign_url(staged_key, expires=DIRECT_UPLOAD_PROBE_URL_TTL_SECONDS)
+            if s3_client is not None
+            else staged_key
+        )
+        _enforce_upload_duration(
+            meeting=meeting,
+            filename=upload_session.original_filename,
+            extension=extension,
+            size_bytes=upload_session.total_size_bytes,
+            duration_seconds=media_duration_seconds,
+            db=db,
+            current_user=current_user,
+        )
+    except HTTPException:
+        db.rollback()
+        _discard_stitched_session(upload_session, s3_client=s3_client)
+        upload_session.status = "rejected"
+        db.commit()
+        raise
+
+    destination = key if s3_client is not None else str(UPLOAD_DIR / Path(key).name)
+    try:
+        raw_path = promote_stitched_recording(
+            upload_session,
+            destination,
+            s3_client=s3_client,
+            transfer_config=RAW_MEDIA_TRANSFER_CONFIG,
+        )
+    except Exception as exc:
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail="We couldn't store this file. Please upload it again.",
+        ) from exc
+    if s3_client is not None:
+        _discard_stitched_session(upload_session, s3_client=s3_client)
+
+    if sha256 is None:
+        # The worker hashes the media when it downloads it; see upload-complete.
+        meeting.processing_checkpoints = None
+    upload_session.status = "completed"
+    return _finish_meeting_upload(
+        meeting=meeting,
+        raw_path=raw_path,
+        filename=upload_session.original_filename,
+        content_type=upload_session.content_type,
+        size_bytes=upload_session.total_size_bytes,
+        sha256=sha256,
+        duration_seconds=media_duration_seconds,
+        confidential_mode=upload_session.confidential_mode,
+        db=db,
+        current_user=current_user,
+    )
+
+
+def _discard_stitched_session(upload_session: UploadSession, *, s3_client: Any) -> None:
+    try:
+        discard_stitched_recording(upload_session, s3_client=s3_client)
+    except Exception:  # noqa: BLE001
+        logger.warning("could not delete staged resumable upload", exc_info=True)
+
+
+@router.delete("/{meeting_id}/upload-sessions/{session_id}")
+def abort_upload_session(
+    meeting_id: int,
+    session_id: str,
+    db: Session = Depends(_get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict[str, Any]:
+    upload_session = _get_upload_session(meeting_id, session_id, db=db, current_user=current_user)
+    _require_open_upload_session(upload_session)
+    abort_part_storage(
+        upload_session,
+        s3_client=_s3_client() if upload_session.s3_upload_id else None,
+    )
+    upload_session.status = "aborted"
+    db.commit()
+    return _serialize_upload_session(upload_session, _upload_session_parts(db, upload_session))
+
+
 def _clean_client_facing_json_text(value: Any) -> str:
     cleaned = str(value or "")
 
@@ -797,6 +1477,31 @@ def _publishable_key_points_payload(
     return output
 
 
+def _rendering_variant() -> tuple[bool, ...]:
+    """Settings the publishable filters read, for the rendered-notes cache key."""
+
+    return (_qev3d_key_points_publishable_enabled(),)
+
+
+def _render_client_notes(notes: MeetingNotes) -> dict[str, Any]:
+    summary_slots = _clean_client_facing_json_slots(notes.summary_slots)
+    publishable_actions = _publishable_action_payload(notes, summary_slots)
+    summary_slots = publishable_actions["summary_slots"]
+    publishable_key_points = _publishable_key_points_payload(
+        notes,
+        summary_slots,
+        publishable_actions,
+    )
+
+    return {
+        "summary": _client_facing_summary_from_slots(notes.summary, summary_slots),
+        "summary_slots": summary_slots,
+        "key_points": publishable_key_points,
+        "action_items": publishable_actions["action_items"],
+        "action_item_objects": publishable_actions["action_item_objects"],
+    }
+
+
 @router.get("/{meeting_id}/notes/ai")
 def get_meeting_notes(
     meeting_id: int,
@@ -817,30 +1522,74 @@ def get_meeting_notes(
         raise HTTPException(status_code=404, detail="Notes not found")
 
     status = getattr(meeting, "status", None) or "UNKNOWN"
-    summary_slots = _clean_client_facing_json_slots(notes.summary_slots)
-    publishable_actions = _publishable_action_payload(notes, summary_slots)
-    summary_slots = publishable_actions["summary_slots"]
-    publishable_key_points = _publishable_key_points_payload(
+    rendered = render_notes_cached(
         notes,
-        summary_slots,
-        publishable_actions,
+        "json",
+        lambda: _render_client_notes(notes),
+        variant=_rendering_variant(),
     )
 
     return {
         "meeting_id": meeting_id,
         "status": status,
         **serialize_progress(meeting),
-        "summary": _client_facing_summary_from_slots(notes.summary, summary_slots),
-        "summary_slots": summary_slots,
-        "key_points": publishable_key_points,
+        "summary": rendered["summary"],
+        "summary_slots": rendered["summary_slots"],
+        "key_points": rendered["key_points"],
         "decisions": notes.decisions or [],
         "decision_objects": notes.decision_objects or [],
-        "action_items": publishable_actions["action_items"],
-        "action_item_objects": publishable_actions["action_item_objects"],
+        "action_items": rendered["action_items"],
+        "action_item_objects": rendered["action_item_objects"],
         "model_version": notes.model_version,
     }
 
 
+@router.get("/{meeting_id}/transcript/partial")
+def get_partial_transcript(
+    meeting_id: int,
+    after: int = 0,
+    db: Session = Depends(_get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict[str, Any]:
+    """Return transcript segments saved so far, starting at index ``after``.
+
+    While a meeting is transcribing, segments are appended in batches, so
+    clients can poll with ``after`` set to the count they already hold. Once
+    notes exist the full transcript is served and ``complete`` is true.
+    """
+
+    meeting = db.get(Meeting, meeting_id)
+    if meeting is None or meeting.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+
+    start = max(0, after)
+    segment_count = partial_transcript_count(db, meeting_id)
+    segments = load_partial_transcript(db, meeting_id, start) if segment_count else []
+    complete = False
+    if not segment_count:
+        notes = (
+            db.query(MeetingNotes)
+            .filter(MeetingNotes.meeting_id == meeting_id)
+            .order_by(MeetingNotes.id.desc())
+            .first()
+        )
+        raw_transcript = notes.raw_transcript if notes is not None else None
+        if isinstance(raw_transcript, dict):
+            final_segments = raw_transcript.get("segments") or []
+            segment_count = len(final_segments)
+            segments = final_segments[start:]
+            complete = True
+
+    return {
+        "meeting_id": meeting_id,
+        "status": getattr(meeting, "status", None) or "UNKNOWN",
+        **serialize_progress(meeting),
+        "complete": complete,
+        "segment_count": segment_count,
+        "segments": segments,
+    }
+
+
 @router.patch("/{meeting_id}/notes/ai")
 def update_meeting_notes_section(
     meeting_id: int,
@@ -909,9 +1658,11 @@ def update_meeting_notes_section(
         # generated objects so edited action_items become the source of truth.
         notes.action_item_objects = []
 
+    notes.revision = int(notes.revision or 1) + 1
     db.add(notes)
     db.commit()
     db.refresh(notes)
+    invalidate_rendered_notes(notes.id)
 
     return get_meeting_notes(
         meeting_id=meeting_id,
@@ -943,26 +1694,9 @@ def _clean_publishable_markdown_text(text: str) -> str:
     return cleaned
 
 
-@router.get("/{meeting_id}/notes.md")
-def download_meeting_notes_markdown(
-    meeting_id: int,
-    db: Session = Depends(_get_db),
-    current_user: User = Depends(get_current_user),
-) -> Response:
-    meeting = db.get(Meeting, meeting_id)
-    if meeting is None or meeting.user_id != current_user.id:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+def _render_notes_markdown_body(notes: MeetingNotes) -> str:
+    """Markdown export below the title line, already cleaned."""
 
-    notes = (
-        db.query(MeetingNotes)
-        .filter(MeetingNotes.meeting_id == meeting_id)
-        .order_by(MeetingNotes.id.desc())
-        .first()
-    )
-    if notes is None:
-        raise HTTPException(status_code=404, detail="Notes not found")
-
-    title = getattr(meeting, "title", f"Meeting {meeting_id}")
     publishable_actions = _publishable_action_payload(notes, notes.summary_slots or {})
     summary_slots = publishable_actions["summary_slots"]
     publishable_key_points = _publishable_key_points_payload(
@@ -972,8 +1706,6 @@ def download_meeting_notes_markdown(
     )
 
     lines: List[str] = []
-    lines.append(f"# {title}")
-    lines.append("")
 
     if summary_slots:
         edited_summary = _clean_client_facing_json_text(summary_slots.get("edited_summary"))
@@ -1047,7 +1779,38 @@ def download_meeting_notes_markdown(
         lines.append("- (none)")
     lines.append("")
 
-    md = _clean_publishable_markdown_text("\n".join(lines))
+    return _clean_publishable_markdown_text("\n".join(lines))
+
+
+@router.get("/{meeting_id}/notes.md")
+def download_meeting_notes_markdown(
+    meeting_id: int,
+    db: Session = Depends(_get_db),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    meeting = db.get(Meeting, meeting_id)
+    if meeting is None or meeting.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+
+    notes = (
+        db.query(MeetingNotes)
+        .filter(MeetingNotes.meeting_id == meeting_id)
+        .order_by(MeetingNotes.id.desc())
+        .first()
+    )
+    if notes is None:
+        raise HTTPException(status_code=404, detail="Notes not found")
+
+    title = getattr(meeting, "title", f"Meeting {meeting_id}")
+    # The cleanup never spans lines, so the cached body and the live title
+    # are cleaned separately.
+    body = render_notes_cached(
+        notes,
+        "markdown",
+        lambda: _render_notes_markdown_body(notes),
+        variant=_rendering_variant(),
+    )
+    md = _clean_publishable_markdown_text(f"# {title}") + "\n\n" + body
     filename = f"meeting_{meeting_id}_notes.md"
 
     headers = {
@@ -9,6 +9,7 @@ from app.jobs.meetings import enqueue_process_meeting
 from app.models.meeting import Meeting
 from app.models.meeting_notes import MeetingNotes
 from app.models.note import Note
+from app.models.transcription_cache import TranscriptionCacheEntry
 from app.models.user import User
 from app.schemas.meetings import MeetingCreate, MeetingRead, MeetingUpdate
 from app.schemas.notes import NoteCreate, NoteRead
@@ -176,15 +177,21 @@ def delete_meeting(
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     raw_media_path = m.raw_media_path
+    normalized_audio_path = m.normalized_audio_path
 
     db.query(MeetingNotes).filter(MeetingNotes.meeting_id == meeting_id).delete(
         synchronize_session=False
     )
     db.query(Note).filter(Note.meeting_id == meeting_id).delete(synchronize_session=False)
+    db.query(TranscriptionCacheEntry).filter(
+        TranscriptionCacheEntry.meeting_id == meeting_id
+    ).delete(synchronize_session=False)
     db.delete(m)
     db.commit()
 
     delete_raw_media_best_effort(raw_media_path)
+    if normalized_audio_path:
+        delete_raw_media_best_effort(normalized_audio_path)
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -4,10 +4,12 @@ from pathlib import Path
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 
 from ..core.settings import settings
 from ..minio_client import get_minio
+from ..services.media_upload import copy_upload
 
 router = APIRouter(prefix="/v1/meetings", tags=["slides"])
 STORAGE = Path("storage")
@@ -28,18 +30,22 @@ async def upload_slides(meeting_id: int, files: list[UploadFile] = File(...)):
         name = Path(uf.filename).name
         dest = d / name
         with dest.open("wb") as w:
-            w.write(await uf.read())
+            await copy_upload(uf, w)
         saved.append(name)
 
-        # Optional MinIO push
-        m = get_minio()
-        if m:
-            if not m.bucket_exists(settings.SLIDES_BUCKET):
-                m.make_bucket(settings.SLIDES_BUCKET)
-            m.fput_object(settings.SLIDES_BUCKET, f"{meeting_id}/{name}", str(dest))
+        # Optional MinIO push; the client is blocking, so keep it off the event loop.
+        await run_in_threadpool(_push_slide_to_minio, meeting_id, name, dest)
     return {"saved": saved, "count": len(saved)}
 
 
+def _push_slide_to_minio(meeting_id: int, name: str, path: Path) -> None:
+    m = get_minio()
+    if m:
+        if not m.bucket_exists(settings.SLIDES_BUCKET):
+            m.make_bucket(settings.SLIDES_BUCKET)
+        m.fput_object(settings.SLIDES_BUCKET, f"{meeting_id}/{name}", str(path))
+
+
 @router.get("/{meeting_id}/slides.zip")
 def download_slides_zip(meeting_id: int):
     d = _meeting_dir(meeting_id)
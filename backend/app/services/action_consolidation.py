@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import replace
 
 from app.services.chunk_action_extractor import CandidateAction
+from app.services.near_duplicate_index import NearDuplicateIndex
 
 _CONFIDENCE_RANK = {
     "low": 1,
@@ -34,41 +35,63 @@ def consolidate_candidate_actions(
     """Merge duplicate candidate actions without over-merging distinct work."""
 
     consolidated: list[CandidateAction] = []
+    # Only actions with the same owner and deadline merge, so each such group
+    # keeps its own token index of positions in consolidated.
+    groups: dict[tuple[str, str], NearDuplicateIndex[int]] = {}
 
     for candidate in sorted(candidates, key=lambda item: item.source_chunk):
-        match_index = _find_merge_match(consolidated, candidate)
+        group = groups.setdefault(_merge_group(candidate), NearDuplicateIndex())
+        match_slot = _find_merge_match(group, candidate)
 
-        if match_index is None:
+        if match_slot is None:
+            action = _normalise(candidate.action)
+            group.add(len(consolidated), _tokens(action), key=action)
             consolidated.append(candidate)
             continue
 
-        consolidated[match_index] = _merge_actions(
-            consolidated[match_index],
-            candidate,
-        )
+        position = group.value(match_slot)
+        merged = _merge_actions(consolidated[position], candidate)
+        consolidated[position] = merged
+        action = _normalise(merged.action)
+        group.replace(match_slot, position, _tokens(action), key=action)
 
     return sorted(consolidated, key=lambda item: item.source_chunk)
 
 
+def _merge_group(action: CandidateAction) -> tuple[str, str]:
+    return _normalise(action.owner), _normalise(action.deadline)
+
+
 def _find_merge_match(
-    consolidated: list[CandidateAction],
+    group: NearDuplicateIndex[int],
     candidate: CandidateAction,
 ) -> int | None:
-    for index, existing in enumerate(consolidated):
-        if _should_merge(existing, candidate):
-            return index
+    """First action in the group whose text is similar enough to merge.
 
-    return None
+    Similar means one normalised text contains the other, or the shared
+    tokens cover at least 75% of the smaller token set.
+    """
 
+    action = _normalise(candidate.action)
+    if not action:
+        return None
 
-def _should_merge(left: CandidateAction, right: CandidateAction) -> bool:
-    if _normalise(left.owner) != _normalise(right.owner):
-        return False
+    tokens = _tokens(action)
+    shared_by_slot = dict(group.query(tokens))
 
-    if _normalise(left.deadline) != _normalise(right.deadline):
-        return False
+    for slot in group.slots():
+        existing = group.key(slot)
+        if not existing:
+            continue
 
-    return _similarity(left.action, right.action) >= 0.75
+        if action in existing or existing in action:
+            return slot
+
+        shared = shared_by_slot.get(slot, 0)
+        if shared and shared / min(len(tokens), len(group.tokens(slot))) >= 0.75:
+            return slot
+
+    return None
 
 
 def _merge_actions(left: CandidateAction, right: CandidateAction) -> CandidateAction:
@@ -124,22 +147,3 @@ def _tokens(value: str) -> set[str]:
         if token.strip(".,:;!?()[]{}").lower()
         and token.strip(".,:;!?()[]{}").lower() not in _STOPWORDS
     }
-
-
-def _similarity(left: str, right: str) -> float:
-    left_norm = _normalise(left)
-    right_norm = _normalise(right)
-
-    if not left_norm or not right_norm:
-        return 0.0
-
-    if left_norm in right_norm or right_norm in left_norm:
-        return 1.0
-
-    left_tokens = _tokens(left_norm)
-    right_tokens = _tokens(right_norm)
-
-    if not left_tokens or not right_tokens:
-        return 0.0
-
-    return len(left_tokens & right_tokens) / min(len(left_tokens), len(right_tokens))
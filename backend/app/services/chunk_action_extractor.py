@@ -3,6 +3,8 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+from app.services.chunk_pool import chunk_workers_for, map_chunks
+
 _ACTION_MARKERS = (
     " will ",
     " should ",
@@ -93,13 +95,24 @@ def extract_candidate_actions(
     candidates before the later model/pipeline consolidation layer.
     """
 
+    chunks = chunk_transcript(transcript, max_words=max_words_per_chunk)
+    word_count = chunks[-1].end_word if chunks else 0
+    per_chunk = map_chunks(
+        _extract_chunk_candidates,
+        chunks,
+        workers=chunk_workers_for(word_count),
+    )
+
+    return [candidate for candidates in per_chunk for candidate in candidates]
+
+
+def _extract_chunk_candidates(chunk: TranscriptChunk) -> list[CandidateAction]:
     candidates: list[CandidateAction] = []
 
-    for chunk in chunk_transcript(transcript, max_words=max_words_per_chunk):
-        for statement in _split_statements(chunk.text):
-            candidate = _candidate_from_statement(statement, chunk.index)
-            if candidate is not None:
-                candidates.append(candidate)
+    for statement in _split_statements(chunk.text):
+        candidate = _candidate_from_statement(statement, chunk.index)
+        if candidate is not None:
+            candidates.append(candidate)
 
     return candidates
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+from app.services.near_duplicate_index import NearDuplicateIndex
+
 _PLACEHOLDER_PREFIXES = (
     "tbd",
     "tbd after transcript review",
@@ -113,11 +115,14 @@ def score_actions(
     deadline_total = 0
     deadline_correct = 0
 
+    actual_index = _index_actual_actions(actual)
+
     for expected_item in expected:
-        match_index = _find_best_match(expected_item, actual, matched_actual_indexes)
+        match_index = _find_best_match(expected_item, actual_index)
         if match_index is None:
             continue
 
+        actual_index.remove(match_index)
         matched_actual_indexes.add(match_index)
         actual_item = actual[match_index]
 
@@ -144,19 +149,48 @@ def score_actions(
     )
 
 
+def _index_actual_actions(actual: list[ActualAction]) -> NearDuplicateIndex[ActualAction]:
+    index: NearDuplicateIndex[ActualAction] = NearDuplicateIndex()
+    for actual_item in actual:
+        action = _normalise(actual_item.action)
+        index.add(actual_item, _tokens(action), key=action)
+    return index
+
+
 def _find_best_match(
     expected_item: ExpectedAction,
-    actual: list[ActualAction],
-    used_indexes: set[int],
+    actual_index: NearDuplicateIndex[ActualAction],
 ) -> int | None:
+    """Index of the unmatched actual action most similar to expected_item.
+
+    Slots in actual_index are positions in the actual list; matched actions
+    are removed from it. Ties go to the earlier action.
+    """
+
+    expected_action = _normalise(expected_item.action)
+    if not expected_action:
+        return None
+
+    expected_tokens = _tokens(expected_action)
+    shared_by_slot = dict(actual_index.query(expected_tokens))
     best_index: int | None = None
     best_score = 0.0
 
-    for index, actual_item in enumerate(actual):
-        if index in used_indexes:
+    for index in actual_index.slots():
+        actual_action = actual_index.key(index)
+        if not actual_action:
+            continue
+
+        if expected_action in actual_action or actual_action in expected_action:
+            similarity = 1.0
+        elif shared_by_slot.get(index):
+            similarity = shared_by_slot[index] / min(
+                len(expected_tokens),
+                len(actual_index.tokens(index)),
+            )
+        else:
             continue
 
-        similarity = _similarity(expected_item.action, actual_item.action)
         if similarity > best_score:
             best_score = similarity
             best_index = index
@@ -219,23 +253,3 @@ def _tokens(value: str) -> set[str]:
         if token.strip(".,:;!?()[]{}").lower()
         and token.strip(".,:;!?()[]{}").lower() not in _STOPWORDS
     }
-
-
-def _similarity(left: str, right: str) -> float:
-    left_norm = _normalise(left)
-    right_norm = _normalise(right)
-
-    if not left_norm or not right_norm:
-        return 0.0
-
-    if left_norm in right_norm or right_norm in left_norm:
-        return 1.0
-
-    left_tokens = _tokens(left_norm)
-    right_tokens = _tokens(right_norm)
-
-    if not left_tokens or not right_tokens:
-        return 0.0
-
-    overlap = len(left_tokens & right_tokens)
-    return overlap / min(len(left_tokens), len(right_tokens))
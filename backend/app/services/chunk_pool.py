@@ -0,0 +1,121 @@
+"""Process pool for fanning independent transcript chunks out across cores.
+
+Notes heuristics are pure Python and hold the GIL, so threads do not help;
+worker processes do. Results always come back in input order, so callers
+merge them exactly as the serial loop would.
+
+The pool is opt-in (MEETIQ_NOTES_CHUNK_WORKERS) and only used from
+VERY_LONG_TRANSCRIPT_WORD_THRESHOLD words: starting workers costs more
+than the chunk work of an ordinary meeting. It is created on first use and
+kept for the life of the process.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import math
+import multiprocessing
+import os
+import pickle
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TypeVar
+
+from app.services.transcript_observability import VERY_LONG_TRANSCRIPT_WORD_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+CHUNK_WORKERS_ENV = "MEETIQ_NOTES_CHUNK_WORKERS"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def configured_chunk_workers() -> int:
+    """Worker processes requested via MEETIQ_NOTES_CHUNK_WORKERS.
+
+    Unset, empty, invalid or 1 means serial; ``auto`` uses every core.
+    """
+
+    raw_value = str(os.getenv(CHUNK_WORKERS_ENV) or "").strip().lower()
+    if not raw_value:
+        return 0
+    if raw_value == "auto":
+        workers = os.cpu_count() or 1
+    else:
+        try:
+            workers = int(raw_value)
+        except ValueError:
+            return 0
+    return workers if workers > 1 else 0
+
+
+def chunk_workers_for(word_count: int) -> int:
+    """Workers to use for a transcript of ``word_count`` words (0 = serial)."""
+
+    if word_count < VERY_LONG_TRANSCRIPT_WORD_THRESHOLD:
+        return 0
+    return configured_chunk_workers()
+
+
+def map_chunks(fn: Callable[[T], R], items: Sequence[T], *, workers: int) -> list[R]:
+    """``[fn(item) for item in items]``, spread over ``workers`` processes.
+
+    ``fn`` and the items must be picklable (module-level function, plain
+    data). Falls back to the serial loop when workers < 2, when there is
+    at most one item, or when the pool fails.
+    """
+
+    if workers < 2 or len(items) < 2:
+        return [fn(item) for item in items]
+
+    try:
+        pool = _get_pool(workers)
+        # A few batches per worker keeps IPC overhead low while still
+        # balancing chunks of uneven cost.
+        batch_size = max(1, math.ceil(len(items) / (workers * 4)))
+        return list(pool.map(fn, items, chunksize=batch_size))
+    except (BrokenProcessPool, OSError, pickle.PicklingError) as exc:
+        logger.warning("chunk pool failed; running %d chunks serially: %s", len(items), exc)
+        shutdown_chunk_pool()
+        return [fn(item) for item in items]
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+
+    with _pool_lock:
+        if _pool is not None and _pool_workers == workers:
+            return _pool
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        # forkserver children start from a clean interpreter rather than a
+        # copy of a worker that may hold DB connections or threads.
+        start_methods = multiprocessing.get_all_start_methods()
+        method = "forkserver" if "forkserver" in start_methods else "spawn"
+        _pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(method),
+        )
+        _pool_workers = workers
+        return _pool
+
+
+def shutdown_chunk_pool() -> None:
+    global _pool, _pool_workers
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
+
+
+atexit.register(shutdown_chunk_pool)
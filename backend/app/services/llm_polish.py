@@ -331,11 +331,11 @@ def apply_llm_polish_to_notes(
     invalid JSON, and schema mismatches all return the original notes unchanged.
     """
 
-    original = copy.deepcopy(notes)
-
     if not llm_polish_enabled():
         log.warning("llm_polish: skipped disabled")
-        return original
+        return notes
+
+    original = copy.deepcopy(notes)
 
     provider = str(os.getenv("MEETIQ_LLM_PROVIDER") or "groq").strip().lower()
     model = (
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.services.transcript_document import TranscriptDocument
 
 
 @dataclass(frozen=True)
@@ -55,8 +59,21 @@ def split_transcript_sections(transcript_text: str | None) -> list[TranscriptSec
     return sections
 
 
-def build_long_transcript_section_metadata(transcript_text: str | None) -> dict[str, object]:
-    sections = split_transcript_sections(transcript_text)
+def _sections(
+    transcript_text: str | None,
+    document: TranscriptDocument | None,
+) -> list[TranscriptSection]:
+    if document is not None and document.holds(transcript_text):
+        return list(document.sections)
+    return split_transcript_sections(transcript_text)
+
+
+def build_long_transcript_section_metadata(
+    transcript_text: str | None,
+    *,
+    document: TranscriptDocument | None = None,
+) -> dict[str, object]:
+    sections = _sections(transcript_text, document)
     if not sections:
         return {
             "section_count": 0,
@@ -75,8 +92,10 @@ def build_long_transcript_section_metadata(transcript_text: str | None) -> dict[
 
 def select_beginning_middle_end_sections(
     transcript_text: str | None,
+    *,
+    document: TranscriptDocument | None = None,
 ) -> list[TranscriptSection]:
-    sections = split_transcript_sections(transcript_text)
+    sections = _sections(transcript_text, document)
     if len(sections) <= 3:
         return sections
 
@@ -94,8 +113,12 @@ def select_beginning_middle_end_sections(
     return selected
 
 
-def build_long_transcript_coverage_metadata(transcript_text: str | None) -> dict[str, object]:
-    selected_sections = select_beginning_middle_end_sections(transcript_text)
+def build_long_transcript_coverage_metadata(
+    transcript_text: str | None,
+    *,
+    document: TranscriptDocument | None = None,
+) -> dict[str, object]:
+    selected_sections = select_beginning_middle_end_sections(transcript_text, document=document)
 
     return {
         "coverage_section_count": len(selected_sections),
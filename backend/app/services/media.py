@@ -1,26 +1,134 @@
 from __future__ import annotations
 
+import logging
+import posixpath
+import subprocess
+import tempfile
 from pathlib import Path
 
 from sqlalchemy.orm import Session
 
 from app import models
 
+log = logging.getLogger(__name__)
 
-def load_audio_for_meeting(meeting_id: str, video_bytes: bytes) -> bytes:
+
+NORMALIZED_AUDIO_SAMPLE_RATE = 16000
+NORMALIZED_AUDIO_BITRATE = "32k"
+NORMALIZED_AUDIO_SUFFIX = ".ogg"
+NORMALIZED_AUDIO_CONTENT_TYPE = "audio/ogg"
+# Names the normalize_audio_file settings; a transcript is only reusable for
+# audio normalized the same way.
+NORMALIZED_AUDIO_PROFILE = f"opus-{NORMALIZED_AUDIO_SAMPLE_RATE}-{NORMALIZED_AUDIO_BITRATE}-voip"
+
+
+def normalized_audio_artifact_path(raw_media_path: str, content_sha256: str) -> str:
+    """
+    Return where the normalized audio for a recording is stored.
+
+    The artifact sits next to the raw media (same S3 prefix or directory) and
+    its name carries the raw media content hash, so a re-uploaded recording
+    never reuses audio derived from an older file:
+
+      s3://bucket/raw_media/meeting_7.mp4
+        -> s3://bucket/raw_media/meeting_7.audio-16k-<sha256[:16]>.ogg
+    """
+    base = raw_media_path.split("?", 1)[0]
+    head, name = posixpath.split(base)
+    stem = posixpath.splitext(name)[0] or "media"
+    return posixpath.join(head, f"{stem}.audio-16k-{content_sha256[:16]}{NORMALIZED_AUDIO_SUFFIX}")
+
+
+def normalize_audio_file(
+    source_path: str | Path,
+    output_path: str | Path,
+    *,
+    timeout_seconds: int = 60 * 60,
+) -> None:
     """
-    TEMPORARY STUB.
+    Extract a 16 kHz mono Opus track from any supported audio/video container.
 
-    In the final version this will:
-      - write the MP4 bytes to a temp file
-      - call ffmpeg (or similar) to extract a mono 16kHz WAV
-      - return the WAV bytes
+    Output is bit-exact, so normalizing the same media twice gives the same
+    artifact.
 
-    For now we just return the original bytes so the worker pipeline can be wired
-    and tests can monkeypatch this function.
+    Raises FileNotFoundError when ffmpeg is not installed and RuntimeError when
+    ffmpeg cannot decode the input.
     """
-    # NOTE: Tests will monkeypatch this to return a known "fake audio" payload.
-    return video_bytes
+    try:
+        subprocess.run(
+            [
+                "ffmpeg",
+                "-y",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-i",
+                str(source_path),
+                "-vn",
+                "-ac",
+                "1",
+                "-ar",
+                str(NORMALIZED_AUDIO_SAMPLE_RATE),
+                "-c:a",
+                "libopus",
+                "-b:a",
+                NORMALIZED_AUDIO_BITRATE,
+                "-application",
+                "voip",
+                # Same input, same bytes: no random Ogg stream serial and no
+                # encoder/metadata tags.
+                "-map_metadata",
+                "-1",
+                "-fflags",
+                "+bitexact",
+                "-flags:a",
+                "+bitexact",
+                str(output_path),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=timeout_seconds,
+        )
+    except subprocess.CalledProcessError as exc:
+        raise RuntimeError(
+            f"Failed to normalize meeting audio: {exc.stderr or exc.stdout or exc}"
+        ) from exc
+    except subprocess.TimeoutExpired as exc:
+        raise RuntimeError("Audio normalization timed out") from exc
+
+
+def prepare_audio_file_for_meeting(meeting_id: str, media_path: str | Path) -> Path:
+    """
+    Return a 16 kHz mono audio file the transcriber can read for this meeting.
+
+    Runs ffmpeg once over the downloaded media and writes the normalized track
+    to a new temp file owned by the caller. When ffmpeg is not installed (local
+    dev, unit tests) the downloaded media path is returned unchanged so the
+    transcriber can still decode the original container.
+    """
+    source = Path(media_path)
+    with tempfile.NamedTemporaryFile(
+        prefix=f"meeting_{meeting_id}_",
+        suffix=NORMALIZED_AUDIO_SUFFIX,
+        delete=False,
+    ) as tmp:
+        output = Path(tmp.name)
+
+    try:
+        normalize_audio_file(source, output)
+    except FileNotFoundError:
+        output.unlink(missing_ok=True)
+        log.warning(
+            "media: ffmpeg not available, transcribing original media",
+            extra={"meeting_id": meeting_id},
+        )
+        return source
+    except BaseException:
+        output.unlink(missing_ok=True)
+        raise
+
+    return output
 
 
 # --- Real MVP: helper to list slide files for a meeting ---
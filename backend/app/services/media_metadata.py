@@ -1,54 +1,115 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import subprocess
-import tempfile
+from pathlib import Path
+from typing import BinaryIO
 
 
-def probe_media_duration_seconds(
-    data: bytes,
+def probe_media_file_duration_seconds(
+    path: str | Path,
     *,
-    suffix: str,
     timeout_seconds: int = 20,
 ) -> float | None:
     """
-    Return media duration in seconds using ffprobe when available.
+    Return the duration of a media file on disk using ffprobe when available.
 
     Returns None if ffprobe is unavailable or duration cannot be detected.
     """
-    normalized_suffix = suffix if suffix.startswith(".") else f".{suffix}"
-    if normalized_suffix == ".":
-        normalized_suffix = ".bin"
-
-    with tempfile.NamedTemporaryFile(suffix=normalized_suffix, delete=True) as tmp:
-        tmp.write(data)
-        tmp.flush()
-
-        try:
-            result = subprocess.run(
-                [
-                    "ffprobe",
-                    "-v",
-                    "error",
-                    "-show_entries",
-                    "format=duration",
-                    "-of",
-                    "json",
-                    tmp.name,
-                ],
-                capture_output=True,
-                check=False,
-                text=True,
-                timeout=timeout_seconds,
-            )
-        except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
-            return None
-
-    if result.returncode != 0:
+    try:
+        result = subprocess.run(
+            _ffprobe_duration_command(path),
+            capture_output=True,
+            check=False,
+            text=True,
+            timeout=timeout_seconds,
+        )
+    except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
+        return None
+
+    return _duration_from_ffprobe_output(result.returncode, result.stdout)
+
+
+async def probe_media_fileobj_duration_seconds_async(
+    fileobj: BinaryIO,
+    *,
+    timeout_seconds: int = 20,
+) -> float | None:
+    """
+    Same as probe_media_file_duration_seconds, for an open file with no path.
+
+    ffprobe runs as an asyncio subprocess, so other requests keep being
+    served while it reads the file; a probe that times out is killed. The
+    file becomes ffprobe's stdin and ffprobe opens /dev/stdin. That reopens
+    the file itself rather than reading a pipe, so ffprobe can still seek to
+    trailing metadata such as an mp4 moov atom. An in-memory spooled file is
+    rolled over to disk by fileno(). The file is rewound afterwards.
+    """
+    try:
+        fileobj.seek(0)
+        fileno = fileobj.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    try:
+        return await _probe_duration_async(
+            _ffprobe_duration_command("/dev/stdin"),
+            stdin=fileno,
+            timeout_seconds=timeout_seconds,
+        )
+    finally:
+        fileobj.seek(0)
+
+
+async def _probe_duration_async(
+    command: list[str],
+    *,
+    stdin: int,
+    timeout_seconds: int,
+) -> float | None:
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=stdin,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except (FileNotFoundError, OSError, NotImplementedError):
+        return None
+
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout_seconds)
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        return None
+
+    return _duration_from_ffprobe_output(
+        process.returncode,
+        stdout.decode("utf-8", errors="replace"),
+    )
+
+
+def _ffprobe_duration_command(path: str | Path) -> list[str]:
+    return [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "json",
+        str(path),
+    ]
+
+
+def _duration_from_ffprobe_output(returncode: int | None, stdout: str | None) -> float | None:
+    if returncode != 0:
         return None
 
     try:
-        payload = json.loads(result.stdout or "{}")
+        payload = json.loads(stdout or "{}")
         raw_duration = payload.get("format", {}).get("duration")
         duration = float(raw_duration)
     except (TypeError, ValueError, json.JSONDecodeError):
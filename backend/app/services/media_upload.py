@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+
+MAX_UPLOAD_BYTES_ENV = "MEETIQ_MAX_UPLOAD_BYTES"
+DEFAULT_MAX_UPLOAD_BYTES = 24 * 1024 * 1024
+MEDIA_UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(f"upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+@dataclass(frozen=True)
+class UploadDigest:
+    """Size and content hash of an upload, read where Starlette spooled it."""
+
+    size_bytes: int
+    sha256: str
+
+
+def configured_max_upload_bytes() -> int:
+    raw_value = str(os.getenv(MAX_UPLOAD_BYTES_ENV) or "").strip()
+    if not raw_value:
+        return DEFAULT_MAX_UPLOAD_BYTES
+    try:
+        value = int(raw_value)
+    except ValueError:
+        return DEFAULT_MAX_UPLOAD_BYTES
+    return value if value > 0 else DEFAULT_MAX_UPLOAD_BYTES
+
+
+def upload_size_label(max_bytes: int) -> str:
+    return f"{max_bytes / (1024 * 1024):g} MB"
+
+
+async def digest_upload(file: UploadFile, *, max_bytes: int) -> UploadDigest:
+    """
+    Hash and size-check an upload in place, then rewind it.
+
+    Starlette's multipart parser has already written the whole body to
+    file.file (a SpooledTemporaryFile that moves to disk past 1 MiB) before
+    the route runs, so max_bytes bounds what is hashed, probed and stored,
+    not what the API receives. The spool is read in MEDIA_UPLOAD_CHUNK_BYTES
+    pieces in the threadpool rather than copied to a second temp file; the
+    probe and the store then read the same file. Raises UploadTooLargeError
+    once more than max_bytes have been read.
+    """
+    declared_size = getattr(file, "size", None)
+    if isinstance(declared_size, int) and declared_size > max_bytes:
+        raise UploadTooLargeError(max_bytes)
+
+    return await run_in_threadpool(_digest_spooled_file, file.file, max_bytes)
+
+
+def _digest_spooled_file(spooled: BinaryIO, max_bytes: int) -> UploadDigest:
+    hasher = hashlib.sha256()
+    size_bytes = 0
+    spooled.seek(0)
+    try:
+        while True:
+            chunk = spooled.read(MEDIA_UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            size_bytes += len(chunk)
+            if size_bytes > max_bytes:
+                raise UploadTooLargeError(max_bytes)
+            hasher.update(chunk)
+    finally:
+        spooled.seek(0)
+
+    return UploadDigest(size_bytes=size_bytes, sha256=hasher.hexdigest())
+
+
+async def copy_upload(file: UploadFile, destination: BinaryIO) -> int:
+    """
+    Copy an upload into an open file in chunks and return the byte count.
+
+    Disk writes run in the threadpool so a slow disk does not stall the event
+    loop.
+    """
+    size_bytes = 0
+    while True:
+        chunk = await file.read(MEDIA_UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            return size_bytes
+        size_bytes += len(chunk)
+        await run_in_threadpool(destination.write, chunk)
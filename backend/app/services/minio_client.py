@@ -12,6 +12,7 @@ from minio import Minio
 from minio.error import S3Error
 
 from app.core.logger import get_logger
+from app.services.object_storage import minio_client
 
 log = get_logger(__name__)
 
@@ -25,10 +26,10 @@ SLIDES_BUCKET = os.getenv("SLIDES_BUCKET", "meeting-slides")
 # If your keys are like "meetings/<id>/slides/<file>", set prefix to "meetings/"
 SLIDES_KEY_PREFIX = os.getenv("SLIDES_KEY_PREFIX", "")  # e.g. "meetings/"
 
-_minio = Minio(
+_minio: Minio = minio_client(
     MINIO_ENDPOINT,
-    access_key=MINIO_ACCESS_KEY,
-    secret_key=MINIO_SECRET_KEY,
+    MINIO_ACCESS_KEY,
+    MINIO_SECRET_KEY,
     secure=MINIO_USE_SSL,
 )
 
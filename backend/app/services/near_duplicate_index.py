@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class NearDuplicateIndex(Generic[T]):
+    """Inverted token index over the items a dedupe pass has kept so far.
+
+    Dedupe loops ask "which kept item, in order, does this candidate
+    duplicate?" and used to answer by rebuilding and intersecting token sets
+    against every kept item. Here each kept item's tokens are stored once
+    and posted under every token, so query() only visits items that share
+    tokens with the candidate and reports how many they share. Callers keep
+    their own similarity rule (overlap over the shorter or longer set,
+    subset, ...) and apply it to those counts.
+
+    The index is exact, not approximate: an item left out of a query shares
+    fewer than ``min_shared`` tokens, so any rule that needs that many shared
+    tokens can skip it safely. Slots are insertion positions and never move,
+    which keeps "first match in list order" semantics intact.
+    """
+
+    __slots__ = ("_values", "_tokens", "_keys", "_postings", "_by_key")
+
+    def __init__(self) -> None:
+        self._values: list[T | None] = []
+        self._tokens: list[frozenset[str] | None] = []
+        self._keys: list[str] = []
+        self._postings: dict[str, set[int]] = {}
+        self._by_key: dict[str, set[int]] = {}
+
+    def __len__(self) -> int:
+        return sum(1 for tokens in self._tokens if tokens is not None)
+
+    def add(self, value: T, tokens: Iterable[str], *, key: str = "") -> int:
+        """Store value under its tokens and return its slot."""
+
+        slot = len(self._values)
+        self._values.append(None)
+        self._tokens.append(None)
+        self._keys.append("")
+        self._store(slot, value, tokens, key)
+        return slot
+
+    def replace(self, slot: int, value: T, tokens: Iterable[str], *, key: str = "") -> None:
+        """Swap the item at slot, e.g. for the richer of two duplicates."""
+
+        self._unpost(slot)
+        self._store(slot, value, tokens, key)
+
+    def remove(self, slot: int) -> None:
+        self._unpost(slot)
+        self._values[slot] = None
+        self._tokens[slot] = None
+        self._keys[slot] = ""
+
+    def value(self, slot: int) -> T:
+        return self._values[slot]  # type: ignore[return-value]
+
+    def tokens(self, slot: int) -> frozenset[str]:
+        return self._tokens[slot] or frozenset()
+
+    def key(self, slot: int) -> str:
+        return self._keys[slot]
+
+    def slots(self) -> list[int]:
+        """Live slots in insertion order."""
+
+        return [slot for slot, tokens in enumerate(self._tokens) if tokens is not None]
+
+    def values(self) -> list[T]:
+        return [self._values[slot] for slot in self.slots()]  # type: ignore[misc]
+
+    def query(
+        self,
+        tokens: Iterable[str],
+        *,
+        min_shared: int = 1,
+        key: str = "",
+    ) -> list[tuple[int, int]]:
+        """(slot, shared token count) for likely duplicates, in slot order.
+
+        Items sharing at least ``min_shared`` distinct tokens are returned,
+        plus any item stored under the same non-empty ``key`` whatever its
+        overlap.
+        """
+
+        shared: dict[int, int] = {}
+        for token in set(tokens):
+            for slot in self._postings.get(token, ()):
+                shared[slot] = shared.get(slot, 0) + 1
+
+        matches = {slot for slot, count in shared.items() if count >= min_shared}
+        if key:
+            matches.update(self._by_key.get(key, ()))
+        return [(slot, shared.get(slot, 0)) for slot in sorted(matches)]
+
+    def _store(self, slot: int, value: T, tokens: Iterable[str], key: str) -> None:
+        token_set = frozenset(tokens)
+        self._values[slot] = value
+        self._tokens[slot] = token_set
+        self._keys[slot] = key
+        for token in token_set:
+            self._postings.setdefault(token, set()).add(slot)
+        if key:
+            self._by_key.setdefault(key, set()).add(slot)
+
+    def _unpost(self, slot: int) -> None:
+        for token in self._tokens[slot] or ():
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.discard(slot)
+                if not posting:
+                    del self._postings[token]
+        key = self._keys[slot]
+        if key:
+            keyed = self._by_key.get(key)
+            if keyed is not None:
+                keyed.discard(slot)
+                if not keyed:
+                    del self._by_key[key]
@@ -0,0 +1,137 @@
+"""Vectorized sentence ranking for LocalSummaryStrategy.
+
+The pure-Python loops in local_summary are the reference implementation.
+This module re-expresses the same arithmetic over NumPy arrays so very long
+meetings rank every chunk in a handful of array operations:
+
+- per-chunk word counts come from one sparse (chunk, word) term-frequency
+  table instead of one Counter per chunk;
+- every chunk is ordered by a single lexsort, keeping the stable
+  score-descending order of ``sorted(..., reverse=True)``;
+- topic coverage reads a boolean point x topic matrix.
+
+Scores are integer sums, so float64 holds them exactly and both backends
+produce identical rankings. NumPy is optional; without it the Python
+backend is always used.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Collection, Sequence
+from itertools import chain
+
+from app.services.transcript_observability import VERY_LONG_TRANSCRIPT_WORD_THRESHOLD
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with the transcription stack
+    np = None  # type: ignore[assignment]
+
+SCORING_BACKEND_ENV = "MEETIQ_NOTES_SCORING_BACKEND"
+SCORING_BACKENDS = {"auto", "python", "numpy"}
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def scoring_backend(word_count: int, requested: str | None = None) -> str:
+    """Resolve the ranking backend for a transcript of ``word_count`` words.
+
+    ``auto`` (the default) keeps the Python loops for ordinary meetings and
+    switches to NumPy from VERY_LONG_TRANSCRIPT_WORD_THRESHOLD words, where
+    the per-chunk loops dominate. ``numpy`` falls back to ``python`` when
+    NumPy is not installed.
+    """
+
+    mode = str(requested or os.getenv(SCORING_BACKEND_ENV) or "auto").strip().lower()
+    if mode not in SCORING_BACKENDS:
+        mode = "auto"
+    if mode == "python" or np is None:
+        return "python"
+    if mode == "numpy":
+        return "numpy"
+    return "numpy" if word_count >= VERY_LONG_TRANSCRIPT_WORD_THRESHOLD else "python"
+
+
+def rank_chunks(
+    chunk_tokens: Sequence[Sequence[Sequence[str]]],
+    chunk_bonuses: Sequence[Sequence[int]],
+    stopwords: Collection[str],
+) -> list[list[int]]:
+    """Per chunk, sentence indexes ordered by score, highest first.
+
+    A sentence scores the chunk-local count of each of its tokens (stopwords
+    and words of two characters or fewer count zero) plus its bonus. Ties
+    keep sentence order.
+    """
+
+    chunk_sizes = [len(sentences) for sentences in chunk_tokens]
+    sentence_lengths = [len(tokens) for sentences in chunk_tokens for tokens in sentences]
+    sentence_count = len(sentence_lengths)
+    if not sentence_count:
+        return [[] for _ in chunk_sizes]
+
+    tokens = list(chain.from_iterable(chain.from_iterable(chunk_tokens)))
+    vocabulary = {word: word_id for word_id, word in enumerate(dict.fromkeys(tokens))}
+    words = np.fromiter(map(vocabulary.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+    counted = np.fromiter(
+        (word not in stopwords and len(word) > 2 for word in vocabulary),
+        dtype=bool,
+        count=len(vocabulary),
+    )
+    bonuses = np.fromiter(
+        chain.from_iterable(chunk_bonuses),
+        dtype=np.float64,
+        count=sentence_count,
+    )
+    sentence_chunk = np.repeat(np.arange(len(chunk_sizes)), chunk_sizes)
+    token_sentence = np.repeat(np.arange(sentence_count), sentence_lengths)
+
+    # Sparse term-frequency table keyed by (chunk, word): each token looks up
+    # how often its word occurs in its own chunk.
+    cells = sentence_chunk[token_sentence] * max(len(vocabulary), 1) + words
+    _cells, cell_index = np.unique(cells, return_inverse=True)
+    chunk_word_counts = np.bincount(cell_index, weights=counted[words])
+    scores = bonuses + np.bincount(
+        token_sentence,
+        weights=chunk_word_counts[cell_index],
+        minlength=sentence_count,
+    )
+
+    order = np.lexsort((np.arange(sentence_count), -scores, sentence_chunk))
+    offsets = np.concatenate(([0], np.cumsum(chunk_sizes)))
+    return [
+        (order[start:end] - start).tolist()
+        for start, end in zip(offsets[:-1], offsets[1:], strict=True)
+    ]
+
+
+def select_diverse_indexes(
+    point_topics: Sequence[Collection[str]],
+    topics: Sequence[str],
+    limit: int,
+) -> list[int]:
+    """Indexes of distinct points: first point per topic, then in order.
+
+    Mirrors select_diverse_points once points are deduplicated, so an index
+    stands in for its dedupe key.
+    """
+
+    topic_matrix = np.array(
+        [[topic in found for topic in topics] for found in point_topics],
+        dtype=bool,
+    ).reshape(len(point_topics), len(topics))
+    seen = np.zeros(len(point_topics), dtype=bool)
+    selected: list[int] = []
+
+    for column in range(len(topics)):
+        hits = np.flatnonzero(topic_matrix[:, column] & ~seen)
+        if hits.size:
+            selected.append(int(hits[0]))
+            seen[hits[0]] = True
+
+    remaining = max(limit - len(selected), 1)
+    selected.extend(np.flatnonzero(~seen)[:remaining].tolist())
+    return selected[:limit]
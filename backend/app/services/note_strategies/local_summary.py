@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import re
 from collections import Counter
-from dataclasses import replace
+from collections.abc import Collection
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from app.services.action_recall_owner_marker_pass import apply_owner_marker_action_recall
+from app.services.chunk_pool import chunk_workers_for, map_chunks
+from app.services.near_duplicate_index import NearDuplicateIndex
 from app.services.notes_pipeline.consistency import apply_risk_action_owner_consistency
 from app.services.notes_postprocess import postprocess_notes_v3
+from app.services.notes_rules import phrase_set, rule, rule_family
 
+from . import local_scoring
 from .base import ActionItem, NotesResult, NotesStrategy
 
 SourceType = Literal["transcript", "slide"]
@@ -209,6 +215,18 @@ TOPIC_PATTERNS: dict[str, tuple[str, ...]] = {
     ),
 }
 
+_CUE_RULES = rule_family("local_summary.cue", CUE_PATTERNS)
+_OWNER_RULES = rule_family("local_summary.owner", OWNER_PATTERNS)
+_DUE_RULES = rule_family("local_summary.due", DUE_PATTERNS, re.IGNORECASE)
+_TOPIC_RULES = {
+    topic: rule_family(f"local_summary.topic.{topic}", patterns)
+    for topic, patterns in TOPIC_PATTERNS.items()
+}
+_DEADLINE_RULE = rule(
+    "local_summary.deadline",
+    r"\bby (monday|tuesday|wednesday|thursday|friday|tomorrow|next week|next month)\b",
+)
+
 
 def normalize_known_names(text: str) -> str:
     for wrong, correct in NAME_CORRECTIONS.items():
@@ -272,37 +290,171 @@ def tokenize(text: str) -> list[str]:
     return re.findall(r"[a-zA-Z0-9_-]+", text.lower())
 
 
+# Sentences recur across chunk ranking, the long-meeting per-chunk passes and
+# the whole-record passes; one process rarely sees more distinct sentences
+# than this between meetings.
+MAX_CACHED_SENTENCE_FEATURES = 16_384
+
+
+@dataclass(frozen=True, eq=False)
+class SentenceFeatures:
+    """Per-sentence facts used by the local selectors, each computed at most once.
+
+    Every field is a pure function of the sentence text, so one row is shared
+    by every selector that sees the sentence: chunk ranking, topic coverage,
+    and the action, decision and risk extractors, which only filter and rank
+    these rows.
+    """
+
+    sentence: str
+    _action_items: dict[str, ActionItem | None] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
+    @cached_property
+    def lowered(self) -> str:
+        return self.sentence.lower()
+
+    @cached_property
+    def tokens(self) -> tuple[str, ...]:
+        return tuple(tokenize(self.sentence))
+
+    @cached_property
+    def dedupe_key(self) -> str:
+        return re.sub(r"[^a-z0-9]+", "", self.lowered)
+
+    @cached_property
+    def cue_hits(self) -> int:
+        return _CUE_RULES.count(self.lowered)
+
+    @cached_property
+    def has_deadline(self) -> bool:
+        return _DEADLINE_RULE.search(self.lowered) is not None
+
+    @cached_property
+    def topics(self) -> frozenset[str]:
+        return frozenset(
+            topic for topic, rules in _TOPIC_RULES.items() if rules.search(self.lowered)
+        )
+
+    @cached_property
+    def owner(self) -> str | None:
+        return extract_owner(self.sentence)
+
+    @cached_property
+    def due(self) -> str | None:
+        return extract_due(self.sentence)
+
+    @cached_property
+    def is_action(self) -> bool:
+        return looks_like_action(self.sentence)
+
+    @cached_property
+    def is_decision(self) -> bool:
+        return looks_like_decision(self.sentence)
+
+    @cached_property
+    def decision_text(self) -> str | None:
+        return _clean_sentence_text(self.sentence) if self.is_decision else None
+
+    @cached_property
+    def risk_text(self) -> str | None:
+        return _risk_text(self)
+
+    def action_item(self, source: SourceType) -> ActionItem | None:
+        if source not in self._action_items:
+            self._action_items[source] = _action_item_candidate(self, source)
+        return self._action_items[source]
+
+
+# Rows computed in chunk-pool workers, waiting to be adopted by
+# sentence_features(); see prime_sentence_features().
+_primed_features: dict[str, SentenceFeatures] = {}
+
+
+@lru_cache(maxsize=MAX_CACHED_SENTENCE_FEATURES)
+def sentence_features(sentence: str) -> SentenceFeatures:
+    primed = _primed_features.pop(sentence, None)
+    return primed if primed is not None else SentenceFeatures(sentence)
+
+
+def prime_sentence_features(rows: list[SentenceFeatures]) -> None:
+    """Adopt rows computed elsewhere unless the sentence is already cached."""
+    try:
+        for row in rows:
+            _primed_features[row.sentence] = row
+            sentence_features(row.sentence)
+    finally:
+        _primed_features.clear()
+
+
+_WARM_FIELDS = ("tokens", "cue_hits", "has_deadline", "decision_text", "risk_text")
+
+
+def _warm_chunk_features(chunk: list[tuple[str, SourceType]]) -> list[SentenceFeatures]:
+    """Compute the features every record pass reads; runs in chunk-pool workers."""
+    rows: dict[str, SentenceFeatures] = {}
+    for sentence, source in chunk:
+        features = sentence_features(sentence)
+        # Reading a cached_property computes and stores it on the row.
+        for name in _WARM_FIELDS:
+            getattr(features, name)
+        features.action_item(source)
+        rows[sentence] = features
+    return list(rows.values())
+
+
+def warm_sentence_features(
+    chunks: list[list[tuple[str, SourceType]]],
+    *,
+    word_count: int,
+) -> None:
+    """Fill the feature table for very long meetings across the chunk pool.
+
+    Chunks are independent, so workers compute their rows in parallel and
+    the rows are adopted here in chunk order; every later selector then
+    reads the same values the serial path would compute.
+    """
+    workers = chunk_workers_for(word_count)
+    if not workers:
+        return
+    for rows in map_chunks(_warm_chunk_features, chunks, workers=workers):
+        prime_sentence_features(rows)
+
+
 def word_freq(sentences: list[str]) -> Counter[str]:
     counts: Counter[str] = Counter()
     for sentence in sentences:
-        for word in tokenize(sentence):
+        for word in sentence_features(sentence).tokens:
             if word not in STOPWORDS and len(word) > 2:
                 counts[word] += 1
     return counts
 
 
-def sentence_score(sentence: str, freq: Counter[str], source: SourceType) -> float:
-    score = 0.0
-    lowered = sentence.lower()
+def sentence_bonus(sentence: str, source: SourceType) -> int:
+    """The part of sentence_score that does not depend on word counts."""
+    features = sentence_features(sentence)
+    bonus = 8 * features.cue_hits
 
-    for word in tokenize(sentence):
-        score += freq.get(word, 0)
+    if features.has_deadline:
+        bonus += 6
 
-    for pattern in CUE_PATTERNS:
-        if re.search(pattern, lowered):
-            score += 8
+    if ":" in sentence:
+        bonus += 1
 
-    if re.search(
-        r"\bby (monday|tuesday|wednesday|thursday|friday|tomorrow|next week|next month)\b",
-        lowered,
-    ):
-        score += 6
+    bonus += 2 if source == "transcript" else 1
+    return bonus
 
-    if ":" in sentence:
-        score += 1
 
-    score += 2 if source == "transcript" else 1
-    return score
+def sentence_score(sentence: str, freq: Counter[str], source: SourceType) -> float:
+    score = 0.0
+
+    for word in sentence_features(sentence).tokens:
+        score += freq.get(word, 0)
+
+    return score + sentence_bonus(sentence, source)
 
 
 def dedupe_points(points: list[str]) -> list[str]:
@@ -310,7 +462,7 @@ def dedupe_points(points: list[str]) -> list[str]:
     out: list[str] = []
 
     for point in points:
-        key = re.sub(r"[^a-z0-9]+", "", point.lower())
+        key = sentence_features(point).dedupe_key
         if key and key not in seen:
             seen.add(key)
             out.append(point)
@@ -319,31 +471,41 @@ def dedupe_points(points: list[str]) -> list[str]:
 
 
 def sentence_topics(sentence: str) -> set[str]:
-    lowered = sentence.lower()
-    matched: set[str] = set()
-    for topic, patterns in TOPIC_PATTERNS.items():
-        if any(re.search(pattern, lowered) for pattern in patterns):
-            matched.add(topic)
-    return matched
+    return set(sentence_features(sentence).topics)
 
 
-def select_diverse_points(points: list[str], limit: int = 12) -> list[str]:
-    unique_points = dedupe_points(points)
+def select_diverse_points(
+    points: list[str],
+    limit: int = 12,
+    *,
+    backend: str = "python",
+) -> list[str]:
+    if backend == "numpy":
+        unique = dedupe_points(points)
+        indexes = local_scoring.select_diverse_indexes(
+            [sentence_features(point).topics for point in unique],
+            tuple(TOPIC_PATTERNS),
+            limit,
+        )
+        return [unique[index] for index in indexes]
+
+    unique_points = [
+        (point, sentence_features(point).dedupe_key, sentence_features(point).topics)
+        for point in dedupe_points(points)
+    ]
     selected: list[str] = []
     seen: set[str] = set()
 
     for topic in TOPIC_PATTERNS:
-        for point in unique_points:
-            key = re.sub(r"[^a-z0-9]+", "", point.lower())
+        for point, key, topics in unique_points:
             if key in seen:
                 continue
-            if topic in sentence_topics(point):
+            if topic in topics:
                 selected.append(point)
                 seen.add(key)
                 break
 
-    for point in unique_points:
-        key = re.sub(r"[^a-z0-9]+", "", point.lower())
+    for point, key, _topics in unique_points:
         if key in seen:
             continue
         selected.append(point)
@@ -363,21 +525,19 @@ def make_summary(points: list[str], max_points: int = 4) -> str:
 
 def extract_owner(sentence: str) -> str | None:
     sentence = normalize_known_names(sentence)
-    for pattern in OWNER_PATTERNS:
-        match = re.search(pattern, sentence)
-        if match:
-            owner = match.group(1) if match.groups() else "Team"
-            return NAME_CORRECTIONS.get(owner, owner)
+    match = _OWNER_RULES.first(sentence)
+    if match:
+        owner = match.group(1) if match.groups() else "Team"
+        return NAME_CORRECTIONS.get(owner, owner)
     if re.search(r"\bteam\s+will\b", sentence, re.IGNORECASE):
         return "Team"
     return None
 
 
 def extract_due(sentence: str) -> str | None:
-    for pattern in DUE_PATTERNS:
-        match = re.search(pattern, sentence, re.IGNORECASE)
-        if match:
-            return match.group(1)
+    match = _DUE_RULES.first(sentence)
+    if match:
+        return match.group(1)
     return None
 
 
@@ -405,6 +565,35 @@ def clean_action_text(sentence: str) -> str:
     return text.strip(" .")
 
 
+_STRONG_ACTION_RULES = rule_family(
+    "local_summary.strong_action",
+    (
+        r"\bneed to\b",
+        r"\bneeds to\b",
+        r"\bshould\b",
+        r"\bmust\b",
+        r"\blet'?s\b",
+        r"\baction item\b",
+        r"\baction items\b",
+        r"\bnext step\b",
+        r"\bnext steps\b",
+        r"\bfollow up\b",
+        r"\bto do\b",
+        r"\bowner\b",
+        r"\bby (monday|tuesday|wednesday|thursday|friday|tomorrow|next week|next month)\b",
+        r"\bwill\b",
+    ),
+)
+_OWNER_FUTURE_RULES = rule_family(
+    "local_summary.owner_future",
+    (
+        r"\b[A-Z][a-z]+\s+will\b",
+        r"\b[A-Z][a-z]+\s+should\b",
+        r"\b[A-Z][a-z]+\s+needs to\b",
+    ),
+)
+
+
 def looks_like_action(sentence: str) -> bool:
     lowered = sentence.lower().strip()
 
@@ -429,32 +618,10 @@ def looks_like_action(sentence: str) -> bool:
     if any(lowered.startswith(x) for x in weak_starts):
         return False
 
-    strong_patterns = [
-        r"\bneed to\b",
-        r"\bneeds to\b",
-        r"\bshould\b",
-        r"\bmust\b",
-        r"\blet'?s\b",
-        r"\baction item\b",
-        r"\baction items\b",
-        r"\bnext step\b",
-        r"\bnext steps\b",
-        r"\bfollow up\b",
-        r"\bto do\b",
-        r"\bowner\b",
-        r"\bby (monday|tuesday|wednesday|thursday|friday|tomorrow|next week|next month)\b",
-        r"\bwill\b",
-    ]
-
-    if any(re.search(pattern, lowered) for pattern in strong_patterns):
+    if _STRONG_ACTION_RULES.search(lowered):
         return True
 
-    owner_future_patterns = [
-        r"\b[A-Z][a-z]+\s+will\b",
-        r"\b[A-Z][a-z]+\s+should\b",
-        r"\b[A-Z][a-z]+\s+needs to\b",
-    ]
-    if any(re.search(pattern, sentence) for pattern in owner_future_patterns):
+    if _OWNER_FUTURE_RULES.search(sentence):
         return True
 
     words = tokenize(sentence)
@@ -497,57 +664,70 @@ def looks_like_decision(sentence: str) -> bool:
     return any(phrase in lowered for phrase in phrases)
 
 
-def extract_action_items(records: list[tuple[str, SourceType]]) -> list[ActionItem]:
-    items: list[ActionItem] = []
+_ACTION_TASK_NOISE_PHRASES = phrase_set(
+    "local_summary.action_task_noise",
+    (
+        "the main purpose",
+        "i'd like us to leave this meeting",
+        "turns short meeting recordings",
+        "we can check the summary",
+        "identify decisions and action items",
+        "create a meeting, upload the file, process it",
+        "that will allow us to see",
+    ),
+)
+_ACTION_MARKER_RULE = rule(
+    "local_summary.action_marker",
+    r"\b(action item|action items|next step|next steps|follow up)\b",
+    re.IGNORECASE,
+)
+_ACTION_MODAL_RULE = rule(
+    "local_summary.action_modal",
+    r"\bwill\b|\bshould\b|\bneeds to\b|\bneed to\b",
+    re.IGNORECASE,
+)
 
-    for sentence, source in records:
-        if not looks_like_action(sentence):
-            continue
 
-        cleaned_task = _clean_sentence_text(clean_action_text(sentence))
-        lowered_task = cleaned_task.lower()
-
-        if any(
-            phrase in lowered_task
-            for phrase in [
-                "the main purpose",
-                "i'd like us to leave this meeting",
-                "turns short meeting recordings",
-                "we can check the summary",
-                "identify decisions and action items",
-                "create a meeting, upload the file, process it",
-                "that will allow us to see",
-            ]
-        ):
-            continue
+def _action_item_candidate(features: SentenceFeatures, source: SourceType) -> ActionItem | None:
+    if not features.is_action:
+        return None
 
-        owner = extract_owner(sentence)
-        due = extract_due(sentence)
-        confidence = 0.35
-
-        if owner:
-            confidence += 0.25
-        if due:
-            confidence += 0.20
-        if re.search(
-            r"\b(action item|action items|next step|next steps|follow up)\b",
-            sentence,
-            re.IGNORECASE,
-        ):
-            confidence += 0.20
-        if re.search(r"\bwill\b|\bshould\b|\bneeds to\b|\bneed to\b", sentence, re.IGNORECASE):
-            confidence += 0.10
-        if source == "transcript":
-            confidence += 0.05
+    sentence = features.sentence
+    cleaned_task = _clean_sentence_text(clean_action_text(sentence))
+    if _ACTION_TASK_NOISE_PHRASES.search(cleaned_task.lower()):
+        return None
 
-        items.append(
-            ActionItem(
-                owner=owner,
-                task=cleaned_task,
-                due=due,
-                confidence=min(confidence, 0.95),
-            )
-        )
+    owner = features.owner
+    due = features.due
+    confidence = 0.35
+
+    if owner:
+        confidence += 0.25
+    if due:
+        confidence += 0.20
+    if _ACTION_MARKER_RULE.search(sentence):
+        confidence += 0.20
+    if _ACTION_MODAL_RULE.search(sentence):
+        confidence += 0.10
+    if source == "transcript":
+        confidence += 0.05
+
+    return ActionItem(
+        owner=owner,
+        task=cleaned_task,
+        due=due,
+        confidence=min(confidence, 0.95),
+    )
+
+
+def extract_action_items(records: list[tuple[str, SourceType]]) -> list[ActionItem]:
+    items: list[ActionItem] = []
+
+    for sentence, source in records:
+        item = sentence_features(sentence).action_item(source)
+        if item is not None:
+            # Candidates are shared across calls; hand out copies.
+            items.append(replace(item))
 
     deduped: list[ActionItem] = []
     seen = set()
@@ -731,12 +911,11 @@ def extract_final_section_action_items(
 
 
 def extract_decisions(records: list[tuple[str, SourceType]]) -> list[str]:
-    decisions: list[str] = []
-    for sentence, _source in records:
-        if not looks_like_decision(sentence):
-            continue
-        cleaned = _clean_sentence_text(sentence)
-        decisions.append(cleaned)
+    decisions = [
+        text
+        for text in (sentence_features(sentence).decision_text for sentence, _source in records)
+        if text is not None
+    ]
     return dedupe_points(decisions)[:5]
 
 
@@ -1143,9 +1322,9 @@ def _build_outcome(
     return ""
 
 
-def extract_risks(records: list[tuple[str, SourceType]]) -> list[str]:
-    risks: list[str] = []
-    risk_patterns = (
+_RISK_RULES = rule_family(
+    "local_summary.risk",
+    (
         r"\brisk(?:s)?\b",
         r"\bblocker(?:s)?\b",
         r"\bdependency\b|\bdependencies\b",
@@ -1160,61 +1339,83 @@ def extract_risks(records: list[tuple[str, SourceType]]) -> list[str]:
         r"\bsupport burden\b",
         r"\bpartial transcript\b",
         r"\bmislaid decisions and actions\b",
-    )
-    agenda_phrases = (
+    ),
+)
+_EXPLICIT_RISK_LANGUAGE_RULE = rule(
+    "local_summary.explicit_risk_language",
+    r"\b(?:may|could|might|unclear|not clear|risk of|blocker|delay|fail|miss|confuse|failure)\b",
+)
+_REVIEWED_SECTION_RULE = rule(
+    "local_summary.reviewed_section",
+    r"\bsection reviewed\b|\breviewed upload reliability\b",
+)
+
+
+_RISK_AGENDA_PHRASES = phrase_set(
+    "local_summary.risk_agenda",
+    (
         "review risks",
         "risks and action items",
         "risks questions and owners",
         "capture risks separately",
         "decisions risks questions",
         "confirm proposal scope",
-    )
+    ),
+)
 
-    for sentence, _source in records:
-        lowered = sentence.lower()
 
-        if "partial transcript" in lowered and (
-            "mislaid decisions" in lowered
-            or "miss decisions" in lowered
-            or "may look complete" in lowered
-        ):
-            risks.append(_clean_sentence_text(sentence))
-            continue
+def _risk_text(features: SentenceFeatures) -> str | None:
+    sentence = features.sentence
+    lowered = features.lowered
 
-        has_explicit_risk_language = bool(
-            re.search(
-                r"\b(?:may|could|might|unclear|not clear|risk of|blocker|delay|fail|miss|confuse|failure)\b",
-                lowered,
-            )
-        )
+    if "partial transcript" in lowered and (
+        "mislaid decisions" in lowered
+        or "miss decisions" in lowered
+        or "may look complete" in lowered
+    ):
+        return _clean_sentence_text(sentence)
 
-        if any(phrase in lowered for phrase in agenda_phrases) and not has_explicit_risk_language:
-            continue
+    has_explicit_risk_language = bool(_EXPLICIT_RISK_LANGUAGE_RULE.search(lowered))
 
-        # Long-meeting filler often says a section "reviewed" reliability,
-        # timeout behavior, or support expectations. That context is useful
-        # for key points, but it is not itself a risk unless risk language is present.
-        if re.search(r"\bsection reviewed\b|\breviewed upload reliability\b", lowered):
-            if not has_explicit_risk_language:
-                continue
+    if _RISK_AGENDA_PHRASES.search(lowered) and not has_explicit_risk_language:
+        return None
 
-        if (
-            "raw media path" in lowered
-            or "runtime" in lowered
-            or "timeout" in lowered
-            or "sequencing" in lowered
-            or "stress test" in lowered
-            or "timing logs" in lowered
-            or any(re.search(pattern, lowered) for pattern in risk_patterns)
-        ):
-            risks.append(_clean_sentence_text(sentence))
+    # Long-meeting filler often says a section "reviewed" reliability,
+    # timeout behavior, or support expectations. That context is useful
+    # for key points, but it is not itself a risk unless risk language is present.
+    if _REVIEWED_SECTION_RULE.search(lowered):
+        if not has_explicit_risk_language:
+            return None
+
+    if (
+        "raw media path" in lowered
+        or "runtime" in lowered
+        or "timeout" in lowered
+        or "sequencing" in lowered
+        or "stress test" in lowered
+        or "timing logs" in lowered
+        or _RISK_RULES.search(lowered)
+    ):
+        return _clean_sentence_text(sentence)
+    return None
+
+
+def extract_risks(records: list[tuple[str, SourceType]]) -> list[str]:
+    risks = [
+        text
+        for text in (sentence_features(sentence).risk_text for sentence, _source in records)
+        if text is not None
+    ]
 
     return dedupe_points(risks)[:5]
 
 
-_ACTION_ITEM_BAD_PHRASES = (
-    "concrete owners for the follow-up actions",
-    "action item clean up in the current version",
+_ACTION_ITEM_BAD_PHRASES = phrase_set(
+    "local_summary.action_item_bad",
+    (
+        "concrete owners for the follow-up actions",
+        "action item clean up in the current version",
+    ),
 )
 
 _ACTION_ITEM_BAD_PREFIXES = (
@@ -1270,7 +1471,7 @@ def _looks_like_publishable_action_task(task: str) -> bool:
 
     if not task:
         return False
-    if any(phrase in lowered for phrase in _ACTION_ITEM_BAD_PHRASES):
+    if _ACTION_ITEM_BAD_PHRASES.search(lowered):
         return False
     if any(lowered.startswith(prefix) for prefix in _ACTION_ITEM_BAD_PREFIXES):
         return False
@@ -1428,22 +1629,37 @@ def _long_meeting_chunk_priority_indexes(
     return [*highlighted, *remaining]
 
 
-def _rank_chunk_points(
-    chunk: list[tuple[str, SourceType]],
-    *,
-    limit: int = 2,
-) -> list[str]:
-    sentences = [sentence for sentence, _source in chunk]
-    if not sentences:
-        return []
-
-    freq = word_freq(sentences)
-    ranked = sorted(
+def _rank_chunk(chunk: list[tuple[str, SourceType]]) -> list[tuple[str, SourceType]]:
+    """Chunk records ordered by sentence_score against the chunk's own word counts."""
+    freq = word_freq([sentence for sentence, _source in chunk])
+    return sorted(
         chunk,
         key=lambda item: sentence_score(item[0], freq, item[1]),
         reverse=True,
     )
 
+
+def _rank_chunks(
+    chunks: list[list[tuple[str, SourceType]]],
+    *,
+    backend: str = "python",
+) -> list[list[tuple[str, SourceType]]]:
+    if backend != "numpy":
+        return [_rank_chunk(chunk) for chunk in chunks]
+
+    orders = local_scoring.rank_chunks(
+        [[sentence_features(sentence).tokens for sentence, _source in chunk] for chunk in chunks],
+        [[sentence_bonus(sentence, source) for sentence, source in chunk] for chunk in chunks],
+        STOPWORDS,
+    )
+    return [[chunk[index] for index in order] for chunk, order in zip(chunks, orders, strict=True)]
+
+
+def _rank_chunk_points(
+    ranked: list[tuple[str, SourceType]],
+    *,
+    limit: int = 2,
+) -> list[str]:
     points: list[str] = []
     for sentence, _source in ranked:
         cleaned = _clean_sentence_text(sentence)
@@ -1457,20 +1673,25 @@ def _rank_chunk_points(
 
 
 def _select_long_meeting_points(
-    chunks: list[list[tuple[str, SourceType]]],
+    ranked_chunks: list[list[tuple[str, SourceType]]],
     candidate_points: list[str],
     *,
     limit: int = 12,
+    backend: str = "python",
 ) -> list[str]:
     """Prevent long notes from over-focusing on only the first part of the meeting."""
     coverage_points: list[str] = []
-    for index in _representative_chunk_indexes(chunks):
-        coverage_points.extend(_rank_chunk_points(chunks[index], limit=2))
+    for index in _representative_chunk_indexes(ranked_chunks):
+        coverage_points.extend(_rank_chunk_points(ranked_chunks[index], limit=2))
 
     if not coverage_points:
-        return select_diverse_points(candidate_points, limit=limit)
+        return select_diverse_points(candidate_points, limit=limit, backend=backend)
 
-    return select_diverse_points([*coverage_points, *candidate_points], limit=limit)
+    return select_diverse_points(
+        [*coverage_points, *candidate_points],
+        limit=limit,
+        backend=backend,
+    )
 
 
 def _dedupe_text_items_in_order(items: list[str], *, limit: int) -> list[str]:
@@ -1521,13 +1742,16 @@ def _extract_long_meeting_action_items(
     chunks: list[list[tuple[str, SourceType]]],
     *,
     limit: int,
+    owner_commitment_actions: list[ActionItem],
+    final_section_actions: list[ActionItem],
+    final_actions: list[ActionItem],
 ) -> list[ActionItem]:
     """Extract actions per chunk so middle/end actions are not lost in long meetings."""
     items: list[ActionItem] = []
 
-    items.extend(_extract_explicit_owner_commitment_actions(records, limit=limit))
-    items.extend(extract_final_section_action_items(records))
-    items.extend(extract_action_items(extract_final_action_records(records)))
+    items.extend(owner_commitment_actions)
+    items.extend(final_section_actions)
+    items.extend(final_actions)
 
     for index in _long_meeting_chunk_priority_indexes(chunks):
         items.extend(extract_action_items(chunks[index]))
@@ -1881,12 +2105,14 @@ def _meaningful_risk_words(text: str) -> set[str]:
     }
 
 
-def _risk_similarity(left: str, right: str) -> float:
-    left_words = _meaningful_risk_words(left)
-    right_words = _meaningful_risk_words(right)
+def _risk_similarity(
+    left_words: Collection[str],
+    right_words: Collection[str],
+    shared: int,
+) -> float:
     if not left_words or not right_words:
         return 0.0
-    return len(left_words & right_words) / max(1, min(len(left_words), len(right_words)))
+    return shared / max(1, min(len(left_words), len(right_words)))
 
 
 def _clean_publishable_risk_text(text: str) -> str:
@@ -1952,32 +2178,31 @@ def _prefer_more_specific_risk(left: str, right: str) -> str:
 
 
 def _prepare_publishable_risks(risks: list[str], limit: int = 3) -> list[str]:
-    cleaned: list[str] = []
+    cleaned: NearDuplicateIndex[str] = NearDuplicateIndex()
 
     for risk in risks:
         item = _clean_publishable_risk_text(risk)
         if not item:
             continue
 
-        duplicate_index: int | None = None
-        for index, existing in enumerate(cleaned):
-            if _risk_similarity(item, existing) >= 0.70:
-                duplicate_index = index
+        words = _meaningful_risk_words(item)
+        duplicate_slot: int | None = None
+        for slot, shared in cleaned.query(words):
+            if _risk_similarity(words, cleaned.tokens(slot), shared) >= 0.70:
+                duplicate_slot = slot
                 break
 
-        if duplicate_index is not None:
-            cleaned[duplicate_index] = _prefer_more_specific_risk(
-                cleaned[duplicate_index],
-                item,
-            )
+        if duplicate_slot is not None:
+            preferred = _prefer_more_specific_risk(cleaned.value(duplicate_slot), item)
+            cleaned.replace(duplicate_slot, preferred, _meaningful_risk_words(preferred))
             continue
 
-        cleaned.append(item)
+        cleaned.add(item, words)
 
         if len(cleaned) >= limit:
             break
 
-    return cleaned
+    return cleaned.values()
 
 
 def _ensure_decision_backed_action_items(
@@ -2260,16 +2485,9 @@ def _local_clean_action_task_from_text(text: object) -> str:
     return task
 
 
-def _local_text_looks_actionable(text: object) -> bool:
-    if _local_reject_action_text(text):
-        return False
-
-    value = str(text or "").strip().lower()
-
-    if len(value) < 8:
-        return False
-
-    action_patterns = (
+_LOCAL_ACTION_RULES = rule_family(
+    "local_summary.local_action",
+    (
         r"\bconfirm\b",
         r"\bsend\b",
         r"\bschedule\b",
@@ -2284,9 +2502,20 @@ def _local_text_looks_actionable(text: object) -> bool:
         r"\bfollow[- ]?up\b",
         r"\bdocument\b",
         r"\bwrite\b",
-    )
+    ),
+)
+
+
+def _local_text_looks_actionable(text: object) -> bool:
+    if _local_reject_action_text(text):
+        return False
+
+    value = str(text or "").strip().lower()
+
+    if len(value) < 8:
+        return False
 
-    return any(re.search(pattern, value) for pattern in action_patterns)
+    return _LOCAL_ACTION_RULES.search(value)
 
 
 def _local_action_item_from_text(text: object) -> ActionItem | None:
@@ -2331,8 +2560,14 @@ def _local_action_fallback_from_texts(
 
 
 def _local_marker_norm(text: object) -> str:
-    value = str(text or "").strip()
-    value = re.sub(r"\s+", " ", value)
+    return _local_marker_norm_text(str(text or ""))
+
+
+# Both explicit-marker passes in generate() normalize the same record
+# sentences and raw transcript.
+@lru_cache(maxsize=4096)
+def _local_marker_norm_text(value: str) -> str:
+    value = re.sub(r"\s+", " ", value.strip())
     return value.strip()
 
 
@@ -2653,6 +2888,20 @@ def _apply_local_summary_consistency(
     return cleaned_slots, cleaned_actions, cleaned_objects
 
 
+def _local_action_item_objects(action_items: list[ActionItem]) -> list[dict[str, object]]:
+    return [
+        {
+            "owner": item.owner,
+            "task": _clean_sentence_text(item.task),
+            "due_date": item.due,
+            "confidence": item.confidence,
+            "status": "open",
+            "priority": "medium",
+        }
+        for item in action_items
+    ]
+
+
 class LocalSummaryStrategy(NotesStrategy):
     def generate(self, transcript_text: str, slide_text: str = "") -> NotesResult:
         _explicit_marker_raw_text = str(transcript_text or "")
@@ -2673,21 +2922,24 @@ class LocalSummaryStrategy(NotesStrategy):
         chunks = chunk_records(records, max_chars=1800)
         long_meeting = _is_long_meeting_records(records, chunks)
 
-        candidate_points: list[str] = []
-        for chunk in chunks:
-            sentences = [sentence for sentence, _source in chunk]
-            freq = word_freq(sentences)
-            ranked = sorted(
-                chunk,
-                key=lambda item: sentence_score(item[0], freq, item[1]),
-                reverse=True,
-            )
-            candidate_points.extend([sentence for sentence, _source in ranked[:5]])
+        word_count = sum(len(sentence.split()) for sentence, _source in records)
+        warm_sentence_features(chunks, word_count=word_count)
+
+        scoring_backend = local_scoring.scoring_backend(word_count)
+        ranked_chunks = _rank_chunks(chunks, backend=scoring_backend)
+        candidate_points = [
+            sentence for ranked in ranked_chunks for sentence, _source in ranked[:5]
+        ]
 
         selected_points = (
-            _select_long_meeting_points(chunks, candidate_points, limit=12)
+            _select_long_meeting_points(
+                ranked_chunks,
+                candidate_points,
+                limit=12,
+                backend=scoring_backend,
+            )
             if long_meeting
-            else select_diverse_points(candidate_points, limit=12)
+            else select_diverse_points(candidate_points, limit=12, backend=scoring_backend)
         )
         processed_v3 = postprocess_notes_v3(selected_points)
 
@@ -2695,7 +2947,11 @@ class LocalSummaryStrategy(NotesStrategy):
         key_points = _clean_publishable_key_points(
             [
                 p
-                for p in select_diverse_points([*v3_key_points, *selected_points], limit=12)
+                for p in select_diverse_points(
+                    [*v3_key_points, *selected_points],
+                    limit=12,
+                    backend=scoring_backend,
+                )
                 if not p.lower().startswith("by the end of the meeting")
                 and "i would also us to confirm" not in p.lower()
             ],
@@ -2706,13 +2962,25 @@ class LocalSummaryStrategy(NotesStrategy):
         filtered_v3_actions = [
             item for item in v3_actions if _looks_like_publishable_action_task(item.task)
         ]
+        final_actions = extract_action_items(extract_final_action_records(records))
+        final_section_actions = extract_final_section_action_items(records)
+        owner_commitment_actions = (
+            _extract_explicit_owner_commitment_actions(records, limit=action_limit)
+            if long_meeting
+            else []
+        )
         heuristic_actions = (
-            _extract_long_meeting_action_items(records, chunks, limit=action_limit)
+            _extract_long_meeting_action_items(
+                records,
+                chunks,
+                limit=action_limit,
+                owner_commitment_actions=owner_commitment_actions,
+                final_section_actions=final_section_actions,
+                final_actions=final_actions,
+            )
             if long_meeting
             else extract_action_items(records)
         )
-        final_actions = extract_action_items(extract_final_action_records(records))
-        final_section_actions = extract_final_section_action_items(records)
         prioritized_final_actions = merge_action_items(
             final_section_actions, final_actions, limit=action_limit
         )
@@ -2829,17 +3097,7 @@ class LocalSummaryStrategy(NotesStrategy):
             limit=action_limit,
         )
 
-        action_item_objects = [
-            {
-                "owner": item.owner,
-                "task": _clean_sentence_text(item.task),
-                "due_date": item.due,
-                "confidence": item.confidence,
-                "status": "open",
-                "priority": "medium",
-            }
-            for item in action_items
-        ]
+        action_item_objects = _local_action_item_objects(action_items)
 
         summary_slots, action_items, action_item_objects = _apply_local_summary_consistency(  # type: ignore[assignment]
             summary_slots=summary_slots,
@@ -2856,7 +3114,7 @@ class LocalSummaryStrategy(NotesStrategy):
         # Final post-consistency pass: explicit "Action item for Owner"
         # transcript markers must not be dropped by cleanup/consistency steps.
         action_items = _local_explicit_action_marker_items(
-            raw_text=str(locals().get("_explicit_marker_raw_text") or ""),
+            raw_text=_explicit_marker_raw_text,
             records=records,  # type: ignore[arg-type]
             key_points=key_points,
             decisions=decisions,
@@ -2865,17 +3123,7 @@ class LocalSummaryStrategy(NotesStrategy):
             limit=max(action_limit, 7),
         )
 
-        action_item_objects = [
-            {
-                "owner": item.owner,
-                "task": _clean_sentence_text(item.task),
-                "due_date": item.due,
-                "confidence": item.confidence,
-                "status": "open",
-                "priority": "medium",
-            }
-            for item in action_items
-        ]
+        action_item_objects = _local_action_item_objects(action_items)
 
         summary_slots = dict(summary_slots)
         summary_slots["next_steps"] = _build_next_steps_from_action_items(
@@ -2891,12 +3139,8 @@ class LocalSummaryStrategy(NotesStrategy):
             summary_slots=summary_slots,
         )
         if long_meeting:
-            explicit_owner_commitment_actions = _extract_explicit_owner_commitment_actions(
-                records,
-                limit=action_limit,
-            )
             action_items = merge_action_items(
-                explicit_owner_commitment_actions,
+                owner_commitment_actions,
                 action_items,
                 limit=action_limit,
             )
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from app.metrics import NOTES_PASS_ITEMS, NOTES_PASS_LATENCY
+
+R = TypeVar("R")
+
+_NOTES_LIST_KEYS = (
+    ("action_item_objects", "action_items"),
+    ("decision_objects", "decisions"),
+    ("key_points",),
+)
+
+
+def count_notes_items(value: Any) -> int | None:
+    """Number of actions, decisions and key points carried by a pass value.
+
+    Understands notes dicts, quality engine results ({"notes": ...}),
+    NotesResult-like objects, plain lists and (items, ...) tuples. Returns
+    None for anything else.
+    """
+
+    if isinstance(value, dict):
+        if isinstance(value.get("notes"), dict):
+            return count_notes_items(value["notes"])
+        if not any(key in value for keys in _NOTES_LIST_KEYS for key in keys):
+            return None
+        total = 0
+        for keys in _NOTES_LIST_KEYS:
+            items = next((value[key] for key in keys if value.get(key)), None) or []
+            total += len(items) if isinstance(items, list) else 0
+        return total
+    if isinstance(value, list):
+        return len(value)
+    if isinstance(value, tuple):
+        return count_notes_items(value[0]) if value else 0
+    if hasattr(value, "action_items") and hasattr(value, "key_points"):
+        return sum(
+            len(getattr(value, name, None) or [])
+            for name in ("action_items", "decisions", "key_points")
+        )
+    return None
+
+
+def folded_stack_lines(passes: dict[str, dict[str, Any]], root: str = "notes") -> list[str]:
+    """Collapsed-stack lines (``root;pass microseconds``) for flamegraph tools.
+
+    ``passes`` is the NotesPassProfiler.as_dict() shape, e.g. as read back
+    from processing_timings.
+    """
+
+    return [
+        f"{root};{name} {max(1, round(float(timing.get('seconds') or 0) * 1_000_000))}"
+        for name, timing in passes.items()
+    ]
+
+
+@dataclass
+class NotesPassTiming:
+    name: str
+    calls: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+    items_in: int | None = None
+    items_out: int | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "skipped": self.skipped,
+            "seconds": round(self.seconds, 6),
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+        }
+
+
+class NotesPassProfiler:
+    """Times each notes pass of one meeting and counts items in and out.
+
+    Passes are kept in the order they first ran. A pass that runs more than
+    once accumulates its time; item counts are from its last run. Every run
+    is also reported to the notes pass metrics.
+    """
+
+    def __init__(self) -> None:
+        self._passes: dict[str, NotesPassTiming] = {}
+
+    def run(self, name: str, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Call fn(*args, **kwargs) as pass ``name``.
+
+        Items in are counted from the first argument (positional or
+        keyword); items out from the return value.
+        """
+
+        source = args[0] if args else next(iter(kwargs.values()), None)
+        items_in = count_notes_items(source)
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            self._record(name, time.perf_counter() - started, items_in, None)
+            raise
+        self._record(name, time.perf_counter() - started, items_in, count_notes_items(result))
+        return result
+
+    def record_skip(self, name: str) -> None:
+        """Count a pass the runner skipped because its inputs were unchanged."""
+
+        self._timing(name).skipped += 1
+
+    def passes(self) -> list[NotesPassTiming]:
+        return list(self._passes.values())
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(timing.seconds for timing in self._passes.values())
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Pass name -> timing, in run order (the processing_timings shape)."""
+
+        return {timing.name: timing.as_dict() for timing in self._passes.values()}
+
+    def folded_stacks(self, root: str = "notes") -> list[str]:
+        return folded_stack_lines(self.as_dict(), root)
+
+    def _record(
+        self,
+        name: str,
+        seconds: float,
+        items_in: int | None,
+        items_out: int | None,
+    ) -> None:
+        timing = self._timing(name)
+        timing.calls += 1
+        timing.seconds += seconds
+        timing.items_in = items_in
+        timing.items_out = items_out
+
+        labels = {"pass": name}
+        NOTES_PASS_LATENCY.observe(seconds, labels)
+        if items_in is not None:
+            NOTES_PASS_ITEMS.inc({**labels, "direction": "in"}, items_in)
+        if items_out is not None:
+            NOTES_PASS_ITEMS.inc({**labels, "direction": "out"}, items_out)
+
+    def _timing(self, name: str) -> NotesPassTiming:
+        timing = self._passes.get(name)
+        if timing is None:
+            timing = self._passes[name] = NotesPassTiming(name)
+        return timing
@@ -0,0 +1,168 @@
+"""Declarative runner for the notes post-processing passes.
+
+A pass declares the notes fields it reads and writes. The runner keeps one
+working notes dict for the whole chain and each pass updates it in place
+through NotesWorkspace, so nothing is copied between passes. The workspace
+records when each field last changed, which lets the runner skip a pass
+whose inputs are unchanged since the same transform last ran and left them
+as they were: a deterministic pass cannot change anything the second time.
+
+Pass order is plain config (a sequence of registered pass names), so a pass
+can be moved, dropped or run on its own when benchmarking.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from app.services.notes_pass_profiler import NotesPassProfiler
+
+logger = logging.getLogger(__name__)
+
+ALL_FIELDS = "*"
+
+
+@dataclass(frozen=True)
+class NotesPass:
+    """One post-processing step over the working notes.
+
+    ``apply`` receives the workspace and changes only the fields named in
+    ``writes`` (ALL_FIELDS for passes that may touch any field). ``when``
+    gates the pass on the run context, e.g. only for QEv3 output.
+    """
+
+    name: str
+    apply: Callable[[NotesWorkspace], None]
+    reads: tuple[str, ...] = (ALL_FIELDS,)
+    writes: tuple[str, ...] = (ALL_FIELDS,)
+    when: Callable[[Any], bool] | None = None
+
+
+class NotesWorkspace:
+    """The notes dict shared by every pass, plus per-field change tracking."""
+
+    def __init__(self, notes: dict[str, Any], context: Any = None) -> None:
+        self.notes = notes
+        self.context = context
+        self.revision = 0
+        self._changed_at: dict[str, int] = {}
+        self._writable: frozenset[str] = frozenset()
+
+    def get(self, field: str, default: Any = None) -> Any:
+        return self.notes.get(field, default)
+
+    def set(self, field: str, value: Any) -> None:
+        """Assign a field; only a different value counts as a change."""
+
+        self._check_writable(field)
+        current = self.notes.get(field)
+        if field in self.notes and (current is value or current == value):
+            return
+        self.notes[field] = value
+        self._mark(field)
+
+    def touch(self, field: str) -> None:
+        """Record that a pass changed a field's value in place."""
+
+        self._check_writable(field)
+        self._mark(field)
+
+    def update(self, result: Mapping[str, Any], fields: Iterable[str] | None = None) -> None:
+        """Take fields from a pass function's returned notes dict.
+
+        With no ``fields`` the whole dict is adopted: every key is set and
+        keys the function dropped are removed.
+        """
+
+        if fields is not None:
+            for field in fields:
+                if field in result:
+                    self.set(field, result[field])
+            return
+        for field in [field for field in self.notes if field not in result]:
+            self._check_writable(field)
+            del self.notes[field]
+            self._mark(field)
+        for field, value in result.items():
+            self.set(field, value)
+
+    def changed_since(self, fields: Iterable[str], revision: int) -> bool:
+        fields = tuple(fields)
+        if ALL_FIELDS in fields:
+            return any(changed > revision for changed in self._changed_at.values())
+        return any(self._changed_at.get(field, 0) > revision for field in fields)
+
+    def _mark(self, field: str) -> None:
+        self.revision += 1
+        self._changed_at[field] = self.revision
+
+    def _check_writable(self, field: str) -> None:
+        if ALL_FIELDS not in self._writable and field not in self._writable:
+            raise ValueError(f"notes pass wrote undeclared field {field!r}")
+
+
+def resolve_pass_order(
+    registry: Mapping[str, NotesPass],
+    order: Sequence[str],
+) -> tuple[NotesPass, ...]:
+    unknown = [name for name in order if name not in registry]
+    if unknown:
+        raise ValueError(f"unknown notes passes: {', '.join(unknown)}")
+    return tuple(registry[name] for name in order)
+
+
+def parse_pass_order(raw_value: str | None) -> tuple[str, ...]:
+    return tuple(name.strip() for name in str(raw_value or "").split(",") if name.strip())
+
+
+def run_notes_passes(
+    workspace: NotesWorkspace,
+    passes: Sequence[NotesPass],
+    *,
+    profiler: NotesPassProfiler | None = None,
+) -> dict[str, Any]:
+    """Run passes over the workspace in order and return the working notes."""
+
+    # transform -> workspace revision after a run that changed nothing
+    unchanged_after: dict[Callable[[NotesWorkspace], None], int] = {}
+
+    for notes_pass in passes:
+        if notes_pass.when is not None and not notes_pass.when(workspace.context):
+            continue
+        previous = unchanged_after.get(notes_pass.apply)
+        if previous is not None and not workspace.changed_since(notes_pass.reads, previous):
+            logger.debug("notes pass %s skipped: inputs unchanged", notes_pass.name)
+            if profiler is not None:
+                profiler.record_skip(notes_pass.name)
+            continue
+
+        revision = workspace.revision
+        _run_pass(workspace, notes_pass, profiler)
+        if workspace.revision == revision:
+            unchanged_after[notes_pass.apply] = revision
+        else:
+            unchanged_after.pop(notes_pass.apply, None)
+
+    return workspace.notes
+
+
+def _run_pass(
+    workspace: NotesWorkspace,
+    notes_pass: NotesPass,
+    profiler: NotesPassProfiler | None,
+) -> None:
+    def apply(notes: dict[str, Any]) -> dict[str, Any]:
+        notes_pass.apply(workspace)
+        return workspace.notes
+
+    workspace._writable = frozenset(notes_pass.writes)
+    try:
+        if profiler is None:
+            apply(workspace.notes)
+        else:
+            profiler.run(notes_pass.name, apply, workspace.notes)
+    finally:
+        workspace._writable = frozenset()
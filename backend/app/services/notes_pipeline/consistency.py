@@ -12,6 +12,8 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from app.services.notes_rules import RuleFamily, rule_family
+
 _GENERIC_OWNERS = {"", "team", "we", "unknown", "none", "unassigned"}
 
 _BAD_RISK_PATTERNS = [
@@ -97,6 +99,12 @@ _BAD_DECISION_PATTERNS = [
     r"\bavailable for baseline scoring\b",
 ]
 
+_BAD_RISK_RULES = rule_family("consistency.bad_risk", _BAD_RISK_PATTERNS, re.I)
+_RISK_SIGNAL_RULES = rule_family("consistency.risk_signal", _RISK_SIGNAL_PATTERNS, re.I)
+_BAD_ACTION_RULES = rule_family("consistency.bad_action", _BAD_ACTION_PATTERNS, re.I)
+_ACTION_SIGNAL_RULES = rule_family("consistency.action_signal", _ACTION_SIGNAL_PATTERNS, re.I)
+_BAD_DECISION_RULES = rule_family("consistency.bad_decision", _BAD_DECISION_PATTERNS, re.I)
+
 _READABILITY_FIXES = (
     (r"\breviewrecommended\b", "review recommended"),
     (r"\btomake\b", "to make"),
@@ -135,9 +143,8 @@ def _norm(value: str) -> str:
     return value.strip()
 
 
-def _matches_any(text: str, patterns: list[str]) -> bool:
-    normalized = _norm(text)
-    return any(re.search(pattern, normalized, flags=re.I) for pattern in patterns)
+def _matches_any(text: str, rules: RuleFamily) -> bool:
+    return rules.search(_norm(text))
 
 
 def _dedupe_key(text: str) -> str:
@@ -336,10 +343,10 @@ def clean_risks(risks: list[Any]) -> list[str]:
         if not text:
             continue
 
-        if _matches_any(text, _BAD_RISK_PATTERNS):
+        if _matches_any(text, _BAD_RISK_RULES):
             continue
 
-        if not _matches_any(text, _RISK_SIGNAL_PATTERNS):
+        if not _matches_any(text, _RISK_SIGNAL_RULES):
             continue
 
         key = _dedupe_key(text)
@@ -362,7 +369,7 @@ def clean_decisions(decisions: list[Any]) -> list[str]:
             continue
 
         normalized = _norm(text)
-        if _matches_any(text, _BAD_DECISION_PATTERNS):
+        if _matches_any(text, _BAD_DECISION_RULES):
             continue
         if normalized in seen:
             continue
@@ -403,10 +410,10 @@ def _candidate_action_from_text(text: str) -> str | None:
     if len(candidate) < 8:
         return None
 
-    if _matches_any(candidate, _BAD_ACTION_PATTERNS):
+    if _matches_any(candidate, _BAD_ACTION_RULES):
         return None
 
-    if not _matches_any(candidate, _ACTION_SIGNAL_PATTERNS):
+    if not _matches_any(candidate, _ACTION_SIGNAL_RULES):
         return None
 
     return candidate
@@ -506,7 +513,7 @@ def dedupe_actions(actions: list[dict[str, Any]]) -> list[dict[str, Any]]:
         if not task:
             continue
 
-        if _matches_any(task, _BAD_ACTION_PATTERNS):
+        if _matches_any(task, _BAD_ACTION_RULES):
             continue
 
         key = _action_merge_key(task)
@@ -735,6 +742,6 @@ def _clean_publishable_text_field(text: str) -> str:
         cleaned,
         flags=re.I,
     )
-    if _matches_any(cleaned, _BAD_DECISION_PATTERNS) or _matches_any(cleaned, _BAD_ACTION_PATTERNS):
+    if _matches_any(cleaned, _BAD_DECISION_RULES) or _matches_any(cleaned, _BAD_ACTION_RULES):
         return ""
     return cleaned.strip()
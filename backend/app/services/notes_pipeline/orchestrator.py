@@ -11,6 +11,7 @@ from app.schemas.meeting_notes import (
 )
 from app.services.notes_pipeline.compose import compose_summary
 from app.services.notes_pipeline.consistency import apply_risk_action_owner_consistency
+from app.services.notes_rules import phrase_set
 
 PURPOSE_PATTERNS = (
     r"^the purpose of this meeting is\b",
@@ -107,6 +108,7 @@ BAD_ACTION_PHRASES = (
     "we agreed",
     "we decided",
 )
+_BAD_ACTION_PHRASE_SET = phrase_set("orchestrator.bad_action", BAD_ACTION_PHRASES)
 
 DUE_PATTERNS = (
     r"\bby\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b",
@@ -313,7 +315,7 @@ def _is_good_action(sentence: str) -> bool:
         return False
     if len(s.split()) > 35:
         return False
-    if any(bad in s for bad in BAD_ACTION_PHRASES):
+    if _BAD_ACTION_PHRASE_SET.search(s):
         return False
     if s.startswith("if "):
         return False
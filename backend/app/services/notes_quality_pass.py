@@ -3,6 +3,10 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from app.services.near_duplicate_index import NearDuplicateIndex
+from app.services.notes_rules import rule, rule_family
+from app.services.transcript_document import TranscriptDocument, split_text
+
 ACTION_HINTS = re.compile(
     r"\b("
     r"need to|needs to|should|must|follow up|next step|action item|owner|deadline|due|please|"
@@ -138,6 +142,46 @@ FILLER_PREFIXES = [
     r"^we'll\s+",
     r"^team will\s+",
 ]
+_FILLER_PREFIX_RULES = rule_family(
+    "notes_quality_pass.filler_prefix",
+    FILLER_PREFIXES,
+    re.IGNORECASE,
+)
+_ACTION_HEDGE_RULES = rule_family(
+    "notes_quality_pass.action_hedge",
+    (
+        r"\bwe should\b",
+        r"\bwe need to\b",
+        r"\bwe have to\b",
+        r"\bit would be good to\b",
+    ),
+    re.IGNORECASE,
+)
+_DECISION_LEAD_IN_RULES = rule_family(
+    "notes_quality_pass.decision_lead_in",
+    (
+        r"^we decided to\s+",
+        r"^decided to\s+",
+        r"^we agreed to\s+",
+        r"^agreed to\s+",
+        r"^the decision is(?: that)?\s+",
+        r"^the plan is(?: to)?\s+",
+        r"^we will use\s+",
+        r"^we'll use\s+",
+        r"^let's use\s+",
+        r"^we are going with\s+",
+        r"^we're going with\s+",
+    ),
+    re.IGNORECASE,
+)
+_WHITESPACE_RULE = rule("notes_quality_pass.whitespace", r"\s+")
+_ARTICLE_RULE = rule("notes_quality_pass.article", r"\b(the|a|an)\b")
+_NON_ALNUM_SPACE_RULE = rule("notes_quality_pass.non_alnum_space", r"[^a-z0-9\s]")
+_SPEAKER_LABEL_PREFIX_RULE = rule(
+    "notes_quality_pass.speaker_label_prefix",
+    r"^(?:speaker|participant)\s+\d+\s*[:.-]\s*",
+    re.IGNORECASE,
+)
 
 COMMON_ACTION_STARTERS = {
     "prepare",
@@ -748,12 +792,17 @@ def _long_meeting_next_step_limit(text: str) -> int:
     return 3
 
 
-def apply_focused_30min_quality_pass(result: Any, transcript: Any) -> Any:
+def apply_focused_30min_quality_pass(
+    result: Any,
+    transcript: Any,
+    *,
+    document: TranscriptDocument | None = None,
+) -> Any:
     text = _transcript_to_text(transcript)
     if not text.strip():
         return result
 
-    sentences = _extract_sentences(text)
+    sentences = split_text(text, _extract_sentences, document)
     if len(sentences) < 8:
         return _apply_pilot_rc1_structured_signal_fallback(result, sentences)
 
@@ -934,9 +983,9 @@ def _dedupe_norm(text: str) -> str:
     text = _strip_speaker_noise(text)
     text = DECISION_NOISE.sub("", text)
     text = text.lower()
-    text = re.sub(r"\b(the|a|an)\b", " ", text)
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _ARTICLE_RULE.sub(" ", text)
+    text = _NON_ALNUM_SPACE_RULE.sub(" ", text)
+    text = _WHITESPACE_RULE.sub(" ", text).strip()
     return text
 
 
@@ -988,14 +1037,12 @@ def _starts_with_action_verb(text: str) -> bool:
 def _clean_action_sentence(text: str) -> str:
     text = _strip_speaker_noise(text.strip())
 
-    for pattern in FILLER_PREFIXES:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+    for prefix in _FILLER_PREFIX_RULES.rules:
+        text = prefix.sub("", text)
 
-    text = re.sub(r"\bwe should\b", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\bwe need to\b", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\bwe have to\b", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\bit would be good to\b", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\s+", " ", text).strip(" ,.-")
+    for hedge in _ACTION_HEDGE_RULES.rules:
+        text = hedge.sub("", text)
+    text = _WHITESPACE_RULE.sub(" ", text).strip(" ,.-")
 
     if not text:
         return ""
@@ -1006,24 +1053,11 @@ def _clean_action_sentence(text: str) -> str:
 def _clean_decision_sentence(text: str) -> str:
     text = _strip_speaker_noise(text.strip())
 
-    patterns = [
-        r"^we decided to\s+",
-        r"^decided to\s+",
-        r"^we agreed to\s+",
-        r"^agreed to\s+",
-        r"^the decision is(?: that)?\s+",
-        r"^the plan is(?: to)?\s+",
-        r"^we will use\s+",
-        r"^we'll use\s+",
-        r"^let's use\s+",
-        r"^we are going with\s+",
-        r"^we're going with\s+",
-    ]
-    for pattern in patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+    for lead_in in _DECISION_LEAD_IN_RULES.rules:
+        text = lead_in.sub("", text)
 
     text = DECISION_NOISE.sub("", text)
-    text = re.sub(r"\s+", " ", text).strip(" ,.-")
+    text = _WHITESPACE_RULE.sub(" ", text).strip(" ,.-")
 
     if not text:
         return ""
@@ -1298,13 +1332,8 @@ def _merge_pilot_rc1_candidate_tuples(
 
 
 def _pilot_rc1_clean_candidate_text(text: str) -> str:
-    cleaned = re.sub(r"\s+", " ", str(text)).strip(" -:,.")
-    cleaned = re.sub(
-        r"^(?:speaker|participant)\s+\d+\s*[:.-]\s*",
-        "",
-        cleaned,
-        flags=re.IGNORECASE,
-    )
+    cleaned = _WHITESPACE_RULE.sub(" ", str(text)).strip(" -:,.")
+    cleaned = _SPEAKER_LABEL_PREFIX_RULE.sub("", cleaned)
     return cleaned.strip(" -:,.")
 
 
@@ -1977,22 +2006,32 @@ def _pilot_rc1_precision_decision_key(value: str) -> str:
     return re.sub(r"\s+", " ", key).strip()
 
 
-def _pilot_rc1_precision_is_near_duplicate(new_key: str, seen_keys: set[str]) -> bool:
+def _pilot_rc1_precision_is_near_duplicate(
+    new_key: str,
+    seen_keys: NearDuplicateIndex[str],
+) -> bool:
     if not new_key:
         return True
 
-    for existing in seen_keys:
-        if new_key == existing:
-            return True
+    if seen_keys.query((), key=new_key):
+        return True
+
+    for existing in seen_keys.values():
         if len(new_key) >= 24 and new_key in existing:
             return True
         if len(existing) >= 24 and existing in new_key:
             return True
 
-        new_tokens = set(new_key.split())
-        existing_tokens = set(existing.split())
-        if len(new_tokens) >= 5 and len(existing_tokens) >= 5:
-            overlap = len(new_tokens & existing_tokens) / max(len(new_tokens), len(existing_tokens))
+    # An overlap of 0.78 between two sets of at least five tokens needs at
+    # least four shared tokens.
+    new_tokens = set(new_key.split())
+    if len(new_tokens) < 5:
+        return False
+
+    for slot, shared in seen_keys.query(new_tokens, min_shared=4):
+        existing_tokens = seen_keys.tokens(slot)
+        if len(existing_tokens) >= 5:
+            overlap = shared / max(len(new_tokens), len(existing_tokens))
             if overlap >= 0.78:
                 return True
 
@@ -2001,7 +2040,7 @@ def _pilot_rc1_precision_is_near_duplicate(new_key: str, seen_keys: set[str]) ->
 
 def _pilot_rc1_precision_dedupe_decisions(decisions: list[str], *, limit: int = 5) -> list[str]:
     deduped: list[str] = []
-    seen: set[str] = set()
+    seen: NearDuplicateIndex[str] = NearDuplicateIndex()
 
     for decision in decisions:
         clean = re.sub(r"\s+", " ", str(decision or "")).strip(" ,.;:-")
@@ -2020,7 +2059,7 @@ def _pilot_rc1_precision_dedupe_decisions(decisions: list[str], *, limit: int =
         if _pilot_rc1_precision_is_near_duplicate(key, seen):
             continue
 
-        seen.add(key)
+        seen.add(key, key.split(), key=key)
         deduped.append(clean)
 
         if len(deduped) >= limit:
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+# Per-rule counters cost a perf_counter pair per evaluation and force
+# families to test every member pattern, so they are opt-in.
+RULE_STATS_ENV = "MEETIQ_NOTES_RULE_STATS"
+
+# Backreferences are numbered within one pattern; they would point at the
+# wrong group once the pattern is embedded in a merged alternation.
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _truthy(value: str | None) -> bool:
+    return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass
+class RuleStats:
+    calls: int = 0
+    hits: int = 0
+    seconds: float = 0.0
+
+
+# Rule name -> pattern (or literal phrase) for every registered rule.
+_rules: dict[str, str] = {}
+_stats: dict[str, RuleStats] | None = {} if _truthy(os.getenv(RULE_STATS_ENV)) else None
+_stats_lock = threading.Lock()
+
+
+def _record(name: str, hit: bool, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    stats = _stats
+    if stats is None:
+        return
+    with _stats_lock:
+        entry = stats.get(name)
+        if entry is None:
+            entry = stats[name] = RuleStats()
+        entry.calls += 1
+        entry.seconds += elapsed
+        if hit:
+            entry.hits += 1
+
+
+class Rule:
+    """One named regex, compiled once at import time."""
+
+    __slots__ = ("name", "pattern", "regex")
+
+    def __init__(self, name: str, pattern: str, flags: int = 0) -> None:
+        self.name = name
+        self.pattern = pattern
+        self.regex = re.compile(pattern, flags)
+
+    def __repr__(self) -> str:
+        return f"Rule({self.name!r}, {self.pattern!r})"
+
+    def search(self, text: str) -> re.Match[str] | None:
+        if _stats is None:
+            return self.regex.search(text)
+        started = time.perf_counter()
+        match = self.regex.search(text)
+        _record(self.name, match is not None, started)
+        return match
+
+    def match(self, text: str) -> re.Match[str] | None:
+        if _stats is None:
+            return self.regex.match(text)
+        started = time.perf_counter()
+        match = self.regex.match(text)
+        _record(self.name, match is not None, started)
+        return match
+
+    def sub(self, repl: str, text: str, count: int = 0) -> str:
+        if _stats is None:
+            return self.regex.sub(repl, text, count)
+        started = time.perf_counter()
+        result, replaced = self.regex.subn(repl, text, count)
+        _record(self.name, replaced > 0, started)
+        return result
+
+
+class RuleFamily:
+    """Related patterns (cue words, deadlines, ...) evaluated as one unit.
+
+    Members are also merged into a single alternation, so the common case of
+    a sentence matching none of them costs one scan instead of one scan per
+    pattern. Methods keep the per-pattern semantics of the loops they
+    replace: any(), count of matching patterns, first match in list order.
+    """
+
+    __slots__ = ("merged", "name", "rules")
+
+    def __init__(self, name: str, patterns: Iterable[str], flags: int = 0) -> None:
+        patterns = tuple(patterns)
+        self.name = name
+        self.rules = tuple(
+            Rule(f"{name}[{index}]", pattern, flags) for index, pattern in enumerate(patterns)
+        )
+        self.merged = _merge(patterns, flags)
+
+    def __repr__(self) -> str:
+        return f"RuleFamily({self.name!r}, {len(self.rules)} rules)"
+
+    @property
+    def patterns(self) -> tuple[str, ...]:
+        return tuple(rule.pattern for rule in self.rules)
+
+    def search(self, text: str) -> bool:
+        """True when any member pattern matches."""
+
+        if _stats is not None:
+            return bool(self._matching(text))
+        if self.merged is not None:
+            return self.merged.search(text) is not None
+        return any(rule.regex.search(text) for rule in self.rules)
+
+    def count(self, text: str) -> int:
+        """Number of member patterns that match."""
+
+        if _stats is not None:
+            return len(self._matching(text))
+        if self.merged is not None and self.merged.search(text) is None:
+            return 0
+        return sum(1 for rule in self.rules if rule.regex.search(text))
+
+    def first(self, text: str) -> re.Match[str] | None:
+        """Match of the first member pattern, in declaration order, that matches."""
+
+        if _stats is not None:
+            matches = [rule.search(text) for rule in self.rules]
+            return next((match for match in matches if match), None)
+        if self.merged is not None and self.merged.search(text) is None:
+            return None
+        for rule in self.rules:
+            match = rule.regex.search(text)
+            if match:
+                return match
+        return None
+
+    def _matching(self, text: str) -> list[Rule]:
+        return [rule for rule in self.rules if rule.search(text)]
+
+
+class PhraseSet:
+    """Literal phrases checked by substring containment, built once per list.
+
+    The same interface as an Aho-Corasick automaton (one call reports every
+    phrase id found), but backed by CPython's C substring search: on the
+    10-40 phrase lists used here a merged regex alternation of the escaped
+    phrases measured up to 2x slower, and a pure-Python automaton slower
+    still. Build sets at import time with phrase_set(), never per call.
+    """
+
+    __slots__ = ("_names", "name", "phrases")
+
+    def __init__(self, name: str, phrases: Iterable[str]) -> None:
+        self.name = name
+        self.phrases = tuple(dict.fromkeys(phrases))
+        self._names = tuple(f"{name}[{index}]" for index in range(len(self.phrases)))
+
+    def __repr__(self) -> str:
+        return f"PhraseSet({self.name!r}, {len(self.phrases)} phrases)"
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.phrases)
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def search(self, text: str) -> bool:
+        """True when text contains any phrase."""
+
+        if _stats is not None:
+            return bool(self.matches(text))
+        for phrase in self.phrases:
+            if phrase in text:
+                return True
+        return False
+
+    def contains_all(self, text: str) -> bool:
+        if _stats is not None:
+            return len(self.matches(text)) == len(self.phrases)
+        for phrase in self.phrases:
+            if phrase not in text:
+                return False
+        return True
+
+    def matches(self, text: str) -> frozenset[int]:
+        """Ids (indexes into phrases) of every phrase text contains."""
+
+        if _stats is None:
+            return frozenset(index for index, phrase in enumerate(self.phrases) if phrase in text)
+        found: list[int] = []
+        for index, phrase in enumerate(self.phrases):
+            started = time.perf_counter()
+            hit = phrase in text
+            _record(self._names[index], hit, started)
+            if hit:
+                found.append(index)
+        return frozenset(found)
+
+
+def _merge(patterns: tuple[str, ...], flags: int) -> re.Pattern[str] | None:
+    if len(patterns) < 2 or any(_BACKREFERENCE_RE.search(pattern) for pattern in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+    except re.error:
+        # Duplicate group names or inline global flags cannot be merged.
+        return None
+
+
+def rule(name: str, pattern: str, flags: int = 0) -> Rule:
+    """Compile and register a single named rule."""
+
+    compiled = Rule(name, pattern, flags)
+    _rules[name] = pattern
+    return compiled
+
+
+def rule_family(name: str, patterns: Iterable[str], flags: int = 0) -> RuleFamily:
+    """Compile and register a family of related rules."""
+
+    family = RuleFamily(name, patterns, flags)
+    for member in family.rules:
+        _rules[member.name] = member.pattern
+    return family
+
+
+def phrase_set(name: str, phrases: Iterable[str]) -> PhraseSet:
+    """Build and register a named set of literal phrases."""
+
+    keywords = PhraseSet(name, phrases)
+    for member_name, phrase in zip(keywords._names, keywords.phrases, strict=True):
+        _rules[member_name] = phrase
+    return keywords
+
+
+def rule_stats_enabled() -> bool:
+    return _stats is not None
+
+
+def enable_rule_stats(enabled: bool = True) -> None:
+    """Turn per-rule counters on or off; turning them on starts from zero."""
+
+    global _stats
+    _stats = {} if enabled else None
+
+
+def reset_rule_stats() -> None:
+    if _stats is not None:
+        with _stats_lock:
+            _stats.clear()
+
+
+def rule_stats() -> list[dict[str, Any]]:
+    """Counters for every registered rule, slowest first.
+
+    Rules that were never evaluated or never matched are included, which is
+    what makes dead heuristics visible.
+    """
+
+    stats = _stats or {}
+    rows: list[dict[str, Any]] = []
+    with _stats_lock:
+        for name, pattern in _rules.items():
+            entry = stats.get(name) or RuleStats()
+            rows.append(
+                {
+                    "rule": name,
+                    "pattern": pattern,
+                    "calls": entry.calls,
+                    "hits": entry.hits,
+                    "seconds": round(entry.seconds, 6),
+                }
+            )
+    rows.sort(key=lambda row: (-row["seconds"], row["rule"]))
+    return rows
@@ -0,0 +1,248 @@
+"""Process-wide object storage clients and a small bucket API on top of them.
+
+boto3 and MinIO clients are thread-safe once built, but building one
+re-resolves credentials and starts with an empty connection pool, so a
+client per call pays a fresh TLS handshake on every storage operation.
+Clients here are built once per distinct configuration and shared by the
+API and the worker. ObjectStore wraps one bucket with the operations the
+app needs (get to file, put from file, copy, presign, head, delete).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+S3_MAX_POOL_CONNECTIONS_ENV = "MEETIQ_S3_MAX_POOL_CONNECTIONS"
+S3_MAX_ATTEMPTS_ENV = "MEETIQ_S3_MAX_ATTEMPTS"
+DEFAULT_S3_MAX_POOL_CONNECTIONS = 32
+DEFAULT_S3_MAX_ATTEMPTS = 5
+OBJECT_COPY_CHUNK_BYTES = 8 * 1024 * 1024
+
+_clients: dict[Hashable, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    try:
+        value = int(str(os.getenv(name) or "").strip())
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def s3_bucket_from_env() -> str | None:
+    return (
+        os.getenv("S3_BUCKET")
+        or os.getenv("AWS_S3_BUCKET")
+        or os.getenv("S3_BUCKET_NAME")
+        or os.getenv("OBJECT_BUCKET")
+    )
+
+
+@dataclass(frozen=True)
+class S3ClientConfig:
+    region_name: str | None = None
+    endpoint_url: str | None = None
+    access_key: str | None = None
+    secret_key: str | None = None
+    use_ssl: bool = True
+    path_style: bool = False
+
+    @classmethod
+    def from_env(cls) -> S3ClientConfig:
+        access_key = os.getenv("S3_ACCESS_KEY") or os.getenv("AWS_ACCESS_KEY_ID")
+        secret_key = os.getenv("S3_SECRET_KEY") or os.getenv("AWS_SECRET_ACCESS_KEY")
+        has_keys = bool(access_key and secret_key)
+        return cls(
+            region_name=(
+                os.getenv("S3_REGION") or os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
+            ),
+            endpoint_url=os.getenv("S3_ENDPOINT") or os.getenv("AWS_ENDPOINT_URL"),
+            access_key=access_key if has_keys else None,
+            secret_key=secret_key if has_keys else None,
+        )
+
+
+def s3_client(config: S3ClientConfig | None = None) -> Any:
+    """The shared boto3 S3 client for config (default: the S3_* environment)."""
+
+    config = config or S3ClientConfig.from_env()
+    pool_size = _positive_int_env(S3_MAX_POOL_CONNECTIONS_ENV, DEFAULT_S3_MAX_POOL_CONNECTIONS)
+    max_attempts = _positive_int_env(S3_MAX_ATTEMPTS_ENV, DEFAULT_S3_MAX_ATTEMPTS)
+    cache_key = ("s3", config, pool_size, max_attempts)
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            client = _clients[cache_key] = _build_s3_client(config, pool_size, max_attempts)
+        return client
+
+
+def _build_s3_client(config: S3ClientConfig, pool_size: int, max_attempts: int) -> Any:
+    client_config = Config(
+        max_pool_connections=pool_size,
+        retries={"max_attempts": max_attempts, "mode": "standard"},
+        tcp_keepalive=True,
+        s3={"addressing_style": "path"} if config.path_style else None,
+    )
+    # Sessions are not thread-safe; this one is only used here, under the lock.
+    session = boto3.session.Session(
+        aws_access_key_id=config.access_key,
+        aws_secret_access_key=config.secret_key,
+        region_name=config.region_name,
+    )
+    return session.client(
+        "s3",
+        endpoint_url=config.endpoint_url,
+        config=client_config,
+        use_ssl=config.use_ssl,
+        verify=None if config.use_ssl else False,
+    )
+
+
+def minio_client(endpoint: str, access_key: str, secret_key: str, *, secure: bool) -> Any:
+    """The shared MinIO client for these connection settings."""
+
+    cache_key = ("minio", endpoint, access_key, secret_key, secure)
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            from minio import Minio
+
+            client = _clients[cache_key] = Minio(
+                endpoint,
+                access_key=access_key,
+                secret_key=secret_key,
+                secure=secure,
+            )
+        return client
+
+
+def clear_object_storage_clients() -> None:
+    with _clients_lock:
+        _clients.clear()
+
+
+def _is_missing_object_error(exc: ClientError) -> bool:
+    error = exc.response.get("Error", {})
+    code = str(error.get("Code", ""))
+    status_code = exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return status_code == 404 or code in {"404", "NoSuchKey", "NotFound"}
+
+
+class ObjectStore:
+    """One bucket on the shared S3 client."""
+
+    def __init__(self, bucket: str, client: Any | None = None) -> None:
+        self.bucket = bucket
+        self.client = client if client is not None else s3_client()
+
+    def get_to_file(
+        self,
+        key: str,
+        destination: BinaryIO,
+        *,
+        hasher: Any | None = None,
+        chunk_bytes: int = OBJECT_COPY_CHUNK_BYTES,
+    ) -> int:
+        """Stream an object into an open file in chunks; returns the byte count."""
+
+        body = self.client.get_object(Bucket=self.bucket, Key=key)["Body"]
+        total = 0
+        try:
+            while True:
+                chunk = body.read(chunk_bytes)
+                if not chunk:
+                    return total
+                destination.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                total += len(chunk)
+        finally:
+            body.close()
+
+    def put_from_file(
+        self,
+        key: str,
+        path: str | Path,
+        *,
+        content_type: str | None = None,
+        transfer_config: Any | None = None,
+    ) -> None:
+        """Upload a local file; large files go up as a multipart upload."""
+
+        kwargs: dict[str, Any] = {}
+        if content_type:
+            kwargs["ExtraArgs"] = {"ContentType": content_type}
+        if transfer_config is not None:
+            kwargs["Config"] = transfer_config
+        self.client.upload_file(str(path), self.bucket, key, **kwargs)
+
+    def put_fileobj(
+        self,
+        key: str,
+        body: BinaryIO,
+        *,
+        content_type: str,
+        transfer_config: Any | None = None,
+    ) -> None:
+        """Upload an open file; large bodies go up as a multipart upload."""
+
+        kwargs: dict[str, Any] = {}
+        if transfer_config is not None:
+            kwargs["Config"] = transfer_config
+        self.client.upload_fileobj(
+            Fileobj=body,
+            Bucket=self.bucket,
+            Key=key,
+            ExtraArgs={"ContentType": content_type},
+            **kwargs,
+        )
+
+    def copy(self, source_key: str, key: str, *, transfer_config: Any | None = None) -> None:
+        """Server-side copy within the bucket; large objects are copied in parts."""
+
+        kwargs: dict[str, Any] = {}
+        if transfer_config is not None:
+            kwargs["Config"] = transfer_config
+        self.client.copy({"Bucket": self.bucket, "Key": source_key}, self.bucket, key, **kwargs)
+
+    def presign_get(self, key: str, expires: int = 3600) -> str:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=int(expires),
+        )
+
+    def presign_put(self, key: str, content_type: str, expires: int = 900) -> str:
+        """URL a client can PUT the object body to directly, with this Content-Type."""
+
+        return self.client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": self.bucket, "Key": key, "ContentType": content_type},
+            ExpiresIn=int(expires),
+        )
+
+    def head(self, key: str) -> dict[str, Any] | None:
+        """Object metadata, or None when the object does not exist."""
+
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as exc:
+            if _is_missing_object_error(exc):
+                return None
+            raise
+
+    def exists(self, key: str) -> bool:
+        return self.head(key) is not None
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
@@ -4,6 +4,7 @@ import re
 from typing import Any
 
 from app.services.chunk_action_recovery import recover_chunk_level_actions
+from app.services.notes_rules import rule_family
 
 from .action_recall_owner_marker_pass import apply_owner_marker_action_recall
 
@@ -72,11 +73,9 @@ def _normalize_questionnaire_after_lunch_action_text(text: str) -> str:
     return text
 
 
-def _extract_due_date(task: str, existing: object = None) -> str | None:
-    if existing:
-        return str(existing)
-
-    patterns = [
+_DUE_DATE_RULES = rule_family(
+    "persisted_action_contract.due_date",
+    (
         r"\bby\s+\d{1,2}\s*(?:am|pm)\s+tomorrow\b",
         r"\bby\s+\d{1,2}\s*(?:am|pm)\b",
         r"\bby\s+monday(?:\s+morning|\s+afternoon)?\b",
@@ -85,12 +84,19 @@ def _extract_due_date(task: str, existing: object = None) -> str | None:
         r"\btomorrow\s+afternoon\b",
         r"\bmonday\s+afternoon\b",
         r"\btoday\b",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, task, flags=re.IGNORECASE)
-        if match:
-            value = match.group(0)
-            return value[0].lower() + value[1:]
+    ),
+    re.IGNORECASE,
+)
+
+
+def _extract_due_date(task: str, existing: object = None) -> str | None:
+    if existing:
+        return str(existing)
+
+    match = _DUE_DATE_RULES.first(task)
+    if match:
+        value = match.group(0)
+        return value[0].lower() + value[1:]
     return None
 
 
@@ -38,6 +38,9 @@ TIMING_KEYS = {
     "processing_failed_at",
 }
 
+# processing_timings entry holding NotesPassProfiler.as_dict() per pass.
+NOTES_PASSES_TIMING_KEY = "notes_passes"
+
 GENERIC_PROCESSING_ERROR = (
     "We could not process this recording. Please check the file format and try again."
 )
@@ -119,6 +122,24 @@ def mark_stage(
     return meeting
 
 
+def record_notes_passes(meeting: Meeting, passes: dict[str, Any]) -> Meeting:
+    """Store per-pass notes timings alongside the stage timestamps.
+
+    Staged jobs profile different passes, so entries are merged by pass
+    name; a retried pass replaces its earlier entry.
+    """
+
+    if not passes:
+        return meeting
+    timings = _timings(meeting)
+    existing = timings.get(NOTES_PASSES_TIMING_KEY)
+    merged = dict(existing) if isinstance(existing, dict) else {}
+    merged.update(passes)
+    timings[NOTES_PASSES_TIMING_KEY] = merged
+    meeting.processing_timings = timings
+    return meeting
+
+
 def begin_attempt(meeting: Meeting) -> Meeting:
     meeting.processing_attempts = int(getattr(meeting, "processing_attempts", 0) or 0) + 1
     return mark_stage(
@@ -5,6 +5,8 @@ import os
 import re
 from typing import Any
 
+from app.services.notes_rules import rule_family
+
 KNOWN_ENTITY_VARIANTS: dict[str, tuple[str, ...]] = {
     "Acjen AI": (
         r"\ba gen\.?\s*ai\b",
@@ -151,12 +153,9 @@ def _strip_speaker_prefix(text: str) -> tuple[str, str]:
     return speaker, body
 
 
-def _looks_like_meta_key_point(text: str) -> bool:
-    normalized = _dedupe_key(text)
-    if not normalized:
-        return True
-
-    meta_patterns = (
+_META_KEY_POINT_RULES = rule_family(
+    "quality_engine_v2.meta_key_point",
+    (
         r"\bthis recording is part of\b",
         r"\b30 60 minute quality baseline\b",
         r"\bfinish with exact decisions risks questions and owners\b",
@@ -166,8 +165,16 @@ def _looks_like_meta_key_point(text: str) -> bool:
         r"\bcontains clear decisions action items risks open questions\b",
         r"\blisten for concrete actions\b",
         r"\bwhat a user will expect after a real meeting\b",
-    )
-    return any(re.search(pattern, normalized) for pattern in meta_patterns)
+    ),
+)
+
+
+def _looks_like_meta_key_point(text: str) -> bool:
+    normalized = _dedupe_key(text)
+    if not normalized:
+        return True
+
+    return _META_KEY_POINT_RULES.search(normalized)
 
 
 def _looks_like_action_key_point(text: str) -> bool:
@@ -292,12 +299,9 @@ def _normalize_question(text: str) -> str:
     return cleaned if cleaned.endswith("?") else f"{cleaned}?"
 
 
-def _looks_like_rhetorical_or_answered_question(text: str) -> bool:
-    normalized = _dedupe_key(text)
-    if not normalized:
-        return True
-
-    rhetorical_patterns = (
+_RHETORICAL_QUESTION_RULES = rule_family(
+    "quality_engine_v2.rhetorical_question",
+    (
         r"\bdoes that make sense\b",
         r"\bcan you hear me\b",
         r"\bany questions\b",
@@ -305,18 +309,28 @@ def _looks_like_rhetorical_or_answered_question(text: str) -> bool:
         r"\bokay\b",
         r"\byou know\b",
         r"\bwhat do you think\b",
-    )
-    answered_patterns = (
+    ),
+)
+_ANSWERED_QUESTION_RULES = rule_family(
+    "quality_engine_v2.answered_question",
+    (
         r"\balready answered\b",
         r"\banswered\b",
         r"\bresolved\b",
         r"\bconfirmed\b",
         r"\bdecided\b",
         r"\bclosed\b",
-    )
+    ),
+)
 
-    return any(re.search(pattern, normalized) for pattern in rhetorical_patterns) or any(
-        re.search(pattern, normalized) for pattern in answered_patterns
+
+def _looks_like_rhetorical_or_answered_question(text: str) -> bool:
+    normalized = _dedupe_key(text)
+    if not normalized:
+        return True
+
+    return _RHETORICAL_QUESTION_RULES.search(normalized) or _ANSWERED_QUESTION_RULES.search(
+        normalized
     )
 
 
@@ -484,12 +498,9 @@ def _normalize_risk(text: str) -> str:
     return cleaned if cleaned.endswith((".", "!", "?")) else f"{cleaned}."
 
 
-def _looks_like_resolved_or_generic_risk(text: str) -> bool:
-    normalized = _dedupe_key(text)
-    if not normalized:
-        return True
-
-    resolved_patterns = (
+_RESOLVED_RISK_RULES = rule_family(
+    "quality_engine_v2.resolved_risk",
+    (
         r"\bno risks?\b",
         r"\bnot a risk\b",
         r"\bno longer a risk\b",
@@ -500,8 +511,11 @@ def _looks_like_resolved_or_generic_risk(text: str) -> bool:
         r"\bclosed\b",
         r"\bfixed\b",
         r"\balready handled\b",
-    )
-    generic_patterns = (
+    ),
+)
+_GENERIC_RISK_RULES = rule_family(
+    "quality_engine_v2.generic_risk",
+    (
         r"^risks?$",
         r"^blockers?$",
         r"\breview risks?\b",
@@ -509,17 +523,27 @@ def _looks_like_resolved_or_generic_risk(text: str) -> bool:
         r"\brisk review\b",
         r"\brisks? and (?:action items|owners|questions)\b",
         r"\brisk register\b",
-    )
-    action_like_patterns = (
+    ),
+)
+_ACTION_LIKE_RISK_RULES = rule_family(
+    "quality_engine_v2.action_like_risk",
+    (
         r"\b[A-Z]?[a-z]+\s+will\s+\w+",
         r"\baction\s+for\b",
         r"\bplease\s+\w+",
-    )
+    ),
+)
+
+
+def _looks_like_resolved_or_generic_risk(text: str) -> bool:
+    normalized = _dedupe_key(text)
+    if not normalized:
+        return True
 
     return (
-        any(re.search(pattern, normalized) for pattern in resolved_patterns)
-        or any(re.search(pattern, normalized) for pattern in generic_patterns)
-        or any(re.search(pattern, text) for pattern in action_like_patterns)
+        _RESOLVED_RISK_RULES.search(normalized)
+        or _GENERIC_RISK_RULES.search(normalized)
+        or _ACTION_LIKE_RISK_RULES.search(text)
     )
 
 
@@ -804,12 +828,9 @@ def _normalize_action_task(text: str) -> str:
     return cleaned[0].upper() + cleaned[1:]
 
 
-def _looks_like_generic_action(task: str) -> bool:
-    normalized = _dedupe_key(task)
-    if not normalized:
-        return True
-
-    generic_patterns = (
+_GENERIC_ACTION_RULES = rule_family(
+    "quality_engine_v2.generic_action",
+    (
         r"^follow up$",
         r"^check\b",
         r"^review\b",
@@ -827,14 +848,24 @@ def _looks_like_generic_action(task: str) -> bool:
         r"\bfinish with exact decisions\b",
         r"\bfinish with a marked decision\b",
         r"\bthis recording is part of\b",
-    )
-    deliverable_patterns = (
+    ),
+)
+_DELIVERABLE_RULES = rule_family(
+    "quality_engine_v2.deliverable",
+    (
         r"\b(?:write|draft|prepare|create|update|add|remove|submit|send|verify|confirm)\b",
         r"\b(?:template|macro|tracker|copy|page|link|note|warning|checklist|submission|logs?)\b",
-    )
+    ),
+)
+
+
+def _looks_like_generic_action(task: str) -> bool:
+    normalized = _dedupe_key(task)
+    if not normalized:
+        return True
 
-    is_generic = any(re.search(pattern, normalized) for pattern in generic_patterns)
-    has_deliverable = any(re.search(pattern, normalized) for pattern in deliverable_patterns)
+    is_generic = _GENERIC_ACTION_RULES.search(normalized)
+    has_deliverable = _DELIVERABLE_RULES.search(normalized)
     return is_generic and not has_deliverable
 
 
@@ -1054,12 +1085,9 @@ def _normalize_decision_text(text: str) -> str:
     return cleaned if cleaned.endswith((".", "!", "?")) else f"{cleaned}."
 
 
-def _looks_like_non_decision(text: str) -> bool:
-    normalized = _dedupe_key(text)
-    if not normalized:
-        return True
-
-    blocked_patterns = (
+_NON_DECISION_RULES = rule_family(
+    "quality_engine_v2.non_decision",
+    (
         r"\bmaybe\b",
         r"\bwe discussed\b",
         r"\bdiscussed in this meeting\b",
@@ -1086,9 +1114,16 @@ def _looks_like_non_decision(text: str) -> bool:
         r"\bfinish with exact decisions\b",
         r"\bfinish with a marked decision\b",
         r"\bseparate confirmed decisions from general discussion\b",
-    )
+    ),
+)
 
-    return any(re.search(pattern, normalized) for pattern in blocked_patterns)
+
+def _looks_like_non_decision(text: str) -> bool:
+    normalized = _dedupe_key(text)
+    if not normalized:
+        return True
+
+    return _NON_DECISION_RULES.search(normalized)
 
 
 def _extract_decisions_from_text(text: str) -> list[dict[str, Any]]:
@@ -1609,14 +1644,20 @@ def _has_transcript_like_notes(notes: dict[str, Any]) -> bool:
     )
 
 
-def _has_suspicious_email_or_domain(notes: dict[str, Any]) -> bool:
-    blob = _note_text_blob(notes)
-    patterns = (
+_SUSPICIOUS_EMAIL_RULES = rule_family(
+    "quality_engine_v2.suspicious_email",
+    (
         r"\b[\w.+-]+\s+(?:at|\[at\])\s+[\w.-]+",
         r"\b[\w.+-]+@[\w.-]+\.(?:con|cmo|comm|aii|ioo)\b",
         r"\b(?:vercell|go\s+daddy|meetiq\.ai|support@acjen\.(?:com|io|co))\b",
-    )
-    return any(re.search(pattern, blob, flags=re.IGNORECASE) for pattern in patterns)
+    ),
+    re.IGNORECASE,
+)
+
+
+def _has_suspicious_email_or_domain(notes: dict[str, Any]) -> bool:
+    blob = _note_text_blob(notes)
+    return _SUSPICIOUS_EMAIL_RULES.search(blob)
 
 
 def critic_quality_engine_v2_notes(
@@ -6,6 +6,9 @@ import re
 from typing import Any
 
 from app.services.long_transcript_sections import select_beginning_middle_end_sections
+from app.services.near_duplicate_index import NearDuplicateIndex
+from app.services.notes_rules import RuleFamily, rule_family
+from app.services.transcript_document import TranscriptDocument, split_text
 
 ACTION_VERBS = {
     "create",
@@ -162,6 +165,12 @@ INVALID_ACTION_PHRASES = [
     r"^decision\s+(one|two|three|four|five|six)\s*:",
 ]
 
+_WEAK_ACTION_RULES = rule_family("quality_engine_v3.weak_action", WEAK_ACTION_PATTERNS)
+_DECISION_RULES = rule_family("quality_engine_v3.decision", DECISION_PATTERNS)
+_RISK_RULES = rule_family("quality_engine_v3.risk", RISK_PATTERNS)
+_PURPOSE_RULES = rule_family("quality_engine_v3.purpose", PURPOSE_PATTERNS)
+_INVALID_ACTION_RULES = rule_family("quality_engine_v3.invalid_action", INVALID_ACTION_PHRASES)
+
 
 def _text(value: Any) -> str:
     if value is None:
@@ -185,9 +194,8 @@ def _lower(text: Any) -> str:
     return _clean_sentence(text).lower()
 
 
-def _matches_any(text: str, patterns: list[str]) -> bool:
-    lowered = text.lower()
-    return any(re.search(pattern, lowered) for pattern in patterns)
+def _matches_any(text: str, rules: RuleFamily) -> bool:
+    return rules.search(text.lower())
 
 
 def _dedupe_key(text: Any) -> str:
@@ -264,9 +272,10 @@ def _dedupe_sentence_order(sentences: list[str]) -> list[str]:
 
 def _split_transcript_sentences_with_long_coverage(
     transcript_text: str | None,
+    document: TranscriptDocument | None = None,
 ) -> list[str]:
-    full_sentences = _split_transcript_sentences(transcript_text)
-    selected_sections = select_beginning_middle_end_sections(transcript_text)
+    full_sentences = split_text(transcript_text, _split_transcript_sentences, document)
+    selected_sections = select_beginning_middle_end_sections(transcript_text, document=document)
 
     if len(selected_sections) < 3:
         return full_sentences
@@ -379,13 +388,13 @@ def _is_invalid_action_text(text: str) -> bool:
     if not cleaned or len(cleaned) < 12:
         return True
 
-    if _matches_any(cleaned, WEAK_ACTION_PATTERNS):
+    if _matches_any(cleaned, _WEAK_ACTION_RULES):
         return True
 
-    if _matches_any(cleaned, PURPOSE_PATTERNS):
+    if _matches_any(cleaned, _PURPOSE_RULES):
         return True
 
-    if _matches_any(cleaned, INVALID_ACTION_PHRASES):
+    if _matches_any(cleaned, _INVALID_ACTION_RULES):
         return True
 
     lowered = cleaned.lower()
@@ -401,7 +410,7 @@ def _is_invalid_action_text(text: str) -> bool:
     ):
         return True
 
-    if _matches_any(cleaned, DECISION_PATTERNS) and not _has_action_verb(cleaned):
+    if _matches_any(cleaned, _DECISION_RULES) and not _has_action_verb(cleaned):
         return True
 
     return False
@@ -885,32 +894,37 @@ def _preferred_action_item(
 
 
 def _dedupe_actions(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    deduped: list[dict[str, Any]] = []
+    # Overlapping actions share their task key or at least three task tokens
+    # (see _actions_semantically_overlap), so only those are compared.
+    deduped: NearDuplicateIndex[dict[str, Any]] = NearDuplicateIndex()
 
     for item in items:
         key = _action_key(item)
         if not key:
             continue
 
-        replacement_index: int | None = None
+        task = _dedupe_key(item.get("task") or item.get("text"))
+        tokens = _action_task_tokens(item)
+        replacement_slot: int | None = None
         should_add = True
 
-        for index, existing in enumerate(deduped):
+        for slot, _shared in deduped.query(tokens, min_shared=3, key=task):
+            existing = deduped.value(slot)
             if not _actions_semantically_overlap(existing, item):
                 continue
 
             preferred = _preferred_action_item(existing, item)
             if preferred is item:
-                replacement_index = index
+                replacement_slot = slot
             should_add = False
             break
 
-        if replacement_index is not None:
-            deduped[replacement_index] = item
+        if replacement_slot is not None:
+            deduped.replace(replacement_slot, item, tokens, key=task)
         elif should_add:
-            deduped.append(item)
+            deduped.add(item, tokens, key=task)
 
-    return deduped
+    return deduped.values()
 
 
 def _normalize_decision_text(text: Any) -> str:
@@ -1001,7 +1015,7 @@ def _is_decision_sentence(sentence: str) -> bool:
     if re.search(r"\bwill be (reviewed|finalized|updated|prepared|created)\b", lowered):
         return False
 
-    if _matches_any(cleaned, WEAK_ACTION_PATTERNS):
+    if _matches_any(cleaned, _WEAK_ACTION_RULES):
         return False
 
     if re.search(r"\b(first pilot audience|target audience)\b.*\b(will be|is|are)\b", lowered):
@@ -1013,7 +1027,7 @@ def _is_decision_sentence(sentence: str) -> bool:
     if re.search(r"\bbackup meeting\b.*\b(will keep|keep|processed)\b", lowered):
         return True
 
-    if _matches_any(cleaned, DECISION_PATTERNS):
+    if _matches_any(cleaned, _DECISION_RULES):
         return True
 
     return False
@@ -1076,7 +1090,7 @@ def _is_risk_sentence(sentence: str) -> bool:
     ):
         return True
 
-    if _matches_any(cleaned, RISK_PATTERNS) and not _is_decision_sentence(cleaned):
+    if _matches_any(cleaned, _RISK_RULES) and not _is_decision_sentence(cleaned):
         return True
 
     return False
@@ -1134,7 +1148,7 @@ def _infer_purpose(sentences: list[str], existing: Any = None) -> str:
         return existing_text
 
     for sentence in sentences:
-        if _matches_any(sentence, PURPOSE_PATTERNS):
+        if _matches_any(sentence, _PURPOSE_RULES):
             return _clean_sentence(sentence)
 
     for sentence in sentences:
@@ -1415,7 +1429,12 @@ def _commercial_quality_metadata(
     }
 
 
-def apply_quality_engine_v3(notes: dict[str, Any], transcript_text: str | None) -> dict[str, Any]:
+def apply_quality_engine_v3(
+    notes: dict[str, Any],
+    transcript_text: str | None,
+    *,
+    document: TranscriptDocument | None = None,
+) -> dict[str, Any]:
     """Apply QEv3-B commercial-quality deterministic cleanup.
 
     This intentionally does not call an LLM. V3-B focuses on correctness:
@@ -1424,7 +1443,7 @@ def apply_quality_engine_v3(notes: dict[str, Any], transcript_text: str | None)
     """
 
     improved = copy.deepcopy(notes)
-    sentences = _split_transcript_sentences_with_long_coverage(transcript_text)
+    sentences = _split_transcript_sentences_with_long_coverage(transcript_text, document)
 
     slots = _summary_slots(improved)
 
@@ -1706,9 +1725,11 @@ def finalize_quality_engine_v3_persisted_notes(notes: dict[str, Any]) -> dict[st
 
     The frontend renders action_items, while Markdown prefers action_item_objects.
     This helper keeps both sources synchronized after any pipeline cleanup.
+    Every field it rewrites is rebuilt, so a shallow copy keeps the input
+    intact.
     """
 
-    output = copy.deepcopy(notes)
+    output = dict(notes)
 
     candidate_actions: list[dict[str, Any]] = []
     for item in _as_list(output.get("action_item_objects")) + _as_list(output.get("action_items")):
@@ -1748,6 +1769,7 @@ def run_quality_engine_v3(
     transcript_text: str | None,
     *,
     mode: str = "v3",
+    document: TranscriptDocument | None = None,
 ) -> dict[str, Any]:
     normalized_mode = str(mode or "").strip().lower()
 
@@ -1763,7 +1785,7 @@ def run_quality_engine_v3(
         }
 
     try:
-        improved = apply_quality_engine_v3(notes, transcript_text)
+        improved = apply_quality_engine_v3(notes, transcript_text, document=document)
         qev3_metadata = improved.pop("_qev3_metadata", {})
         return {
             "notes": improved,
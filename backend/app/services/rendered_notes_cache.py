@@ -0,0 +1,126 @@
+"""Per-process cache of client-facing notes renderings.
+
+GET notes/ai and notes.md run the regex-heavy publishable filters over notes
+that only change when a meeting is processed or a section is edited. Each
+rendering is cached under the notes row identity, its revision (bumped on
+every edit) and NOTES_RENDERER_VERSION, so edits and re-processing (a new
+row) miss naturally and other API workers never serve a stale revision.
+created_at is part of the identity because SQLite reuses the highest row id
+after a delete.
+
+Bump NOTES_RENDERER_VERSION whenever a change to the publishable filters
+should alter already-rendered notes. Cached values are shared between
+requests and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+NOTES_RENDERER_VERSION = 1
+RENDERED_NOTES_CACHE_SIZE_ENV = "MEETIQ_RENDERED_NOTES_CACHE_SIZE"
+DEFAULT_RENDERED_NOTES_CACHE_SIZE = 512
+
+T = TypeVar("T")
+
+
+def configured_cache_size() -> int:
+    """Entries kept per process; 0 disables the cache."""
+
+    raw_value = str(os.getenv(RENDERED_NOTES_CACHE_SIZE_ENV) or "").strip()
+    if not raw_value:
+        return DEFAULT_RENDERED_NOTES_CACHE_SIZE
+    try:
+        return max(0, int(raw_value))
+    except ValueError:
+        return DEFAULT_RENDERED_NOTES_CACHE_SIZE
+
+
+class RenderedNotesCache:
+    """Thread-safe LRU of renderings keyed by notes row, revision and kind."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[Hashable, ...], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_render(self, key: tuple[Hashable, ...], render: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Rendered outside the lock; two concurrent misses just both render.
+        value = render()
+        if self.maxsize <= 0:
+            return value
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, notes_id: int) -> None:
+        """Drop every cached rendering of one notes row."""
+
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == notes_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_cache = RenderedNotesCache(configured_cache_size())
+
+
+def rendered_notes_cache() -> RenderedNotesCache:
+    return _cache
+
+
+def render_notes_cached(
+    notes: Any,
+    kind: str,
+    render: Callable[[], T],
+    *,
+    variant: tuple[Hashable, ...] = (),
+) -> T:
+    """Return ``render()`` for this notes row, computing it once per revision.
+
+    ``variant`` carries any other input the rendering depends on, such as a
+    feature flag. Rows without an id (not yet flushed) are never cached.
+    """
+
+    notes_id = getattr(notes, "id", None)
+    if notes_id is None:
+        return render()
+    created_at = getattr(notes, "created_at", None)
+    key = (
+        notes_id,
+        int(getattr(notes, "revision", None) or 1),
+        created_at.isoformat() if created_at is not None else None,
+        NOTES_RENDERER_VERSION,
+        kind,
+        *variant,
+    )
+    return _cache.get_or_render(key, render)
+
+
+def invalidate_rendered_notes(notes_id: int | None) -> None:
+    if notes_id is not None:
+        _cache.invalidate(notes_id)
@@ -0,0 +1,308 @@
+"""Part storage for resumable meeting uploads.
+
+A session's recording arrives as numbered parts of part_size_bytes; only
+the last part may be shorter. With S3/MinIO each part goes straight into an
+S3 multipart upload and completion is a server-side stitch. Locally each
+part is a file in the session directory and completion concatenates them
+with a chunked copy. Either way a part is only held in memory for the
+request that carries it.
+
+The stitched recording lands at the session's own staging location
+(session.storage_key). It is promoted to the meeting's raw media key only
+after it passes validation, and discarded otherwise.
+
+Sessions expire upload_session_ttl_seconds() after they are created.
+expire_upload_sessions() aborts whatever part storage an expired session
+still holds and deletes its row; app.jobs.upload_sessions runs it and is
+meant to be scheduled (cron or an RQ scheduler). A bucket lifecycle rule
+with AbortIncompleteMultipartUpload is still worth keeping as a backstop
+for multipart uploads whose row is already gone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from sqlalchemy.orm import Session
+
+from app.models.upload_session import UploadSession, UploadSessionPart
+
+logger = logging.getLogger(__name__)
+
+# S3 rejects multipart parts under 5 MiB (except the last one).
+UPLOAD_SESSION_PART_BYTES = 8 * 1024 * 1024
+STITCH_CHUNK_BYTES = 1024 * 1024
+LOCAL_SESSIONS_DIRNAME = ".sessions"
+DEFAULT_UPLOAD_SESSION_TTL_SECONDS = 24 * 60 * 60
+
+
+class UploadPartError(ValueError):
+    pass
+
+
+def upload_session_ttl_seconds() -> int:
+    raw_value = os.getenv("MEETIQ_UPLOAD_SESSION_TTL_SECONDS")
+    if raw_value is None or not raw_value.strip():
+        return DEFAULT_UPLOAD_SESSION_TTL_SECONDS
+
+    try:
+        value = int(raw_value.strip())
+    except ValueError:
+        return DEFAULT_UPLOAD_SESSION_TTL_SECONDS
+
+    return max(1, value)
+
+
+def upload_session_expired(session: UploadSession, *, now: datetime | None = None) -> bool:
+    created_at = session.created_at
+    if created_at is None:
+        return False
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+
+    current_time = now or datetime.now(timezone.utc)
+    return current_time - created_at >= timedelta(seconds=upload_session_ttl_seconds())
+
+
+def part_count(total_size_bytes: int, part_size_bytes: int) -> int:
+    return max(1, -(-total_size_bytes // part_size_bytes))
+
+
+def part_offset(session: UploadSession, part_number: int) -> int:
+    return (part_number - 1) * session.part_size_bytes
+
+
+def expected_part_size(session: UploadSession, part_number: int) -> int:
+    total_parts = part_count(session.total_size_bytes, session.part_size_bytes)
+    if part_number < 1 or part_number > total_parts:
+        raise UploadPartError(f"part {part_number} is out of range for this upload")
+    remaining = session.total_size_bytes - part_offset(session, part_number)
+    return min(session.part_size_bytes, remaining)
+
+
+def missing_part_numbers(
+    session: UploadSession,
+    parts: Sequence[UploadSessionPart],
+) -> list[int]:
+    received = {part.part_number for part in parts}
+    total = part_count(session.total_size_bytes, session.part_size_bytes)
+    return [number for number in range(1, total + 1) if number not in received]
+
+
+def _split_s3_key(storage_key: str) -> tuple[str, str]:
+    parsed = urlparse(storage_key)
+    return parsed.netloc, parsed.path.lstrip("/")
+
+
+def _is_s3(session: UploadSession) -> bool:
+    return session.storage_key.startswith("s3://")
+
+
+def _local_session_dir(session: UploadSession) -> Path:
+    return Path(session.storage_key).parent / LOCAL_SESSIONS_DIRNAME / session.id
+
+
+def _local_part_path(session: UploadSession, part_number: int) -> Path:
+    return _local_session_dir(session) / f"{part_number:05d}.part"
+
+
+def begin_part_storage(session: UploadSession, *, s3_client: Any = None) -> None:
+    if _is_s3(session):
+        bucket, key = _split_s3_key(session.storage_key)
+        response = s3_client.create_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            ContentType=session.content_type or "application/octet-stream",
+        )
+        session.s3_upload_id = response["UploadId"]
+        return
+
+    _local_session_dir(session).mkdir(parents=True, exist_ok=True)
+
+
+def store_part(
+    session: UploadSession,
+    part_number: int,
+    data: bytes,
+    *,
+    s3_client: Any = None,
+) -> str | None:
+    """Store one part, replacing any earlier copy; returns the S3 ETag if any."""
+
+    if _is_s3(session):
+        bucket, key = _split_s3_key(session.storage_key)
+        response = s3_client.upload_part(
+            Bucket=bucket,
+            Key=key,
+            UploadId=session.s3_upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return response["ETag"]
+
+    path = _local_part_path(session, part_number)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".partial")
+    partial.write_bytes(data)
+    os.replace(partial, path)
+    return None
+
+
+def staged_recording_key(session: UploadSession) -> str:
+    """Object key (S3) or local path of the session's stitched recording."""
+
+    if _is_s3(session):
+        return _split_s3_key(session.storage_key)[1]
+    return session.storage_key
+
+
+def stitch_parts(
+    session: UploadSession,
+    parts: Sequence[UploadSessionPart],
+    *,
+    s3_client: Any = None,
+) -> str | None:
+    """
+    Join the parts into the session's staged recording at session.storage_key.
+
+    S3 completes the multipart upload server-side. Locally the parts are
+    copied into place in STITCH_CHUNK_BYTES pieces, which also yields the
+    recording's sha256 (returned; None for S3).
+    """
+    ordered = sorted(parts, key=lambda part: part.part_number)
+
+    if _is_s3(session):
+        bucket, key = _split_s3_key(session.storage_key)
+        s3_client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=session.s3_upload_id,
+            MultipartUpload={
+                "Parts": [{"ETag": part.etag, "PartNumber": part.part_number} for part in ordered]
+            },
+        )
+        return None
+
+    output = Path(session.storage_key)
+    partial = output.with_name(f"{output.name}.{session.id}.partial")
+    hasher = hashlib.sha256()
+    try:
+        with partial.open("wb") as destination:
+            for part in ordered:
+                with _local_part_path(session, part.part_number).open("rb") as source:
+                    while chunk := source.read(STITCH_CHUNK_BYTES):
+                        hasher.update(chunk)
+                        destination.write(chunk)
+        os.replace(partial, output)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+    shutil.rmtree(_local_session_dir(session), ignore_errors=True)
+    return hasher.hexdigest()
+
+
+def promote_stitched_recording(
+    session: UploadSession,
+    destination: str,
+    *,
+    s3_client: Any = None,
+    transfer_config: Any = None,
+) -> str:
+    """
+    Put the validated recording at destination (a key in the same bucket, or a path).
+
+    S3 copies the staged object server-side (in parts when it is large) and
+    leaves the staged copy for discard_stitched_recording. Locally the file is
+    renamed into place. Returns the recording's new storage location.
+    """
+    if _is_s3(session):
+        bucket, key = _split_s3_key(session.storage_key)
+        kwargs = {"Config": transfer_config} if transfer_config is not None else {}
+        s3_client.copy({"Bucket": bucket, "Key": key}, bucket, destination, **kwargs)
+        return f"s3://{bucket}/{destination}"
+
+    Path(destination).parent.mkdir(parents=True, exist_ok=True)
+    os.replace(session.storage_key, destination)
+    return destination
+
+
+def discard_stitched_recording(session: UploadSession, *, s3_client: Any = None) -> None:
+    """Delete the session's staged recording; the meeting's recording is untouched."""
+
+    if _is_s3(session):
+        bucket, key = _split_s3_key(session.storage_key)
+        s3_client.delete_object(Bucket=bucket, Key=key)
+        return
+
+    Path(session.storage_key).unlink(missing_ok=True)
+
+
+def abort_part_storage(session: UploadSession, *, s3_client: Any = None) -> None:
+    if _is_s3(session):
+        if session.s3_upload_id:
+            bucket, key = _split_s3_key(session.storage_key)
+            s3_client.abort_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=session.s3_upload_id,
+            )
+        return
+
+    shutil.rmtree(_local_session_dir(session), ignore_errors=True)
+
+
+def expire_upload_sessions(
+    db: Session,
+    *,
+    now: datetime | None = None,
+    s3_client: Any = None,
+) -> int:
+    """
+    Delete sessions older than the TTL, releasing the storage they still hold.
+
+    Open sessions have their parts or S3 multipart upload aborted and
+    stitched ones their staged recording deleted; the other states hold
+    nothing but the row. A session whose storage cannot be released keeps
+    its row so the next sweep retries it. Returns the number deleted.
+    """
+    current_time = now or datetime.now(timezone.utc)
+    cutoff = current_time - timedelta(seconds=upload_session_ttl_seconds())
+    expired = (
+        db.query(UploadSession)
+        .filter(UploadSession.created_at < cutoff)
+        .order_by(UploadSession.created_at)
+        .all()
+    )
+
+    deleted = 0
+    for session in expired:
+        try:
+            if session.status == "open":
+                abort_part_storage(session, s3_client=s3_client)
+            elif session.status == "stitched":
+                discard_stitched_recording(session, s3_client=s3_client)
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                "could not release storage for expired upload session %s",
+                session.id,
+                exc_info=True,
+            )
+            continue
+
+        db.query(UploadSessionPart).filter(UploadSessionPart.session_id == session.id).delete(
+            synchronize_session=False
+        )
+        db.delete(session)
+        db.commit()
+        deleted += 1
+
+    return deleted
@@ -5,8 +5,7 @@ import time
 from pathlib import Path
 from typing import BinaryIO, Optional, Protocol
 
-import boto3
-from botocore.client import Config
+from app.services.object_storage import ObjectStore, S3ClientConfig, s3_client
 
 
 class Storage(Protocol):
@@ -42,7 +41,7 @@ class FSStorage:
         self._path(key).unlink(missing_ok=True)
 
 
-class S3Storage:
+class S3Storage(ObjectStore):
     def __init__(
         self,
         bucket: str,
@@ -52,43 +51,32 @@ class S3Storage:
         secret_key: Optional[str] = None,
         secure: bool = True,
     ):
-        self.bucket = bucket
-        session = boto3.session.Session(
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region,
-        )
-        self.client = session.client(
-            "s3",
-            endpoint_url=endpoint,
-            config=Config(s3={"addressing_style": "path"}),
-            use_ssl=secure,
-            verify=secure,
+        super().__init__(
+            bucket,
+            s3_client(
+                S3ClientConfig(
+                    region_name=region,
+                    endpoint_url=endpoint,
+                    access_key=access_key,
+                    secret_key=secret_key,
+                    use_ssl=secure,
+                    path_style=True,
+                )
+            ),
         )
 
     def put(self, key: str, body: BinaryIO, content_type: str) -> None:
-        self.client.upload_fileobj(
-            Fileobj=body,
-            Bucket=self.bucket,
-            Key=key,
-            ExtraArgs={"ContentType": content_type},
-        )
+        self.put_fileobj(key, body, content_type=content_type)
 
     def presign_get(self, key: str, ttl: int = 3600) -> str:
-        return self.client.generate_presigned_url(
-            "get_object", Params={"Bucket": self.bucket, "Key": key}, ExpiresIn=ttl
-        )
+        return super().presign_get(key, expires=ttl)
 
     def exists(self, key: str) -> bool:
         try:
-            self.client.head_object(Bucket=self.bucket, Key=key)
-            return True
+            return super().exists(key)
         except Exception:
             return False
 
-    def delete(self, key: str) -> None:
-        self.client.delete_object(Bucket=self.bucket, Key=key)
-
 
 def choose_storage() -> Storage:
     env = os.getenv("ENV", "dev").lower()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from app.services.long_transcript_sections import TranscriptSection
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, eq=False)
+class TranscriptDocument:
+    """One transcript, built once per notes run and handed to the passes.
+
+    Section boundaries are computed on first use. Each pass keeps its own
+    sentence-splitting rules (merging them would change the notes), so
+    sentences() memoizes a split per splitter and returns it as a tuple:
+    every pass that receives the document splits the transcript once.
+    """
+
+    text: str
+    _views: dict[Callable[[Any], Any], tuple[Any, ...]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
+    @cached_property
+    def sections(self) -> tuple[TranscriptSection, ...]:
+        from app.services.long_transcript_sections import split_transcript_sections
+
+        return tuple(split_transcript_sections(self.text))
+
+    def sentences(self, splitter: Callable[[str], list[T]]) -> tuple[T, ...]:
+        cached = self._views.get(splitter)
+        if cached is None:
+            cached = tuple(splitter(self.text))
+            self._views[splitter] = cached
+        return cached
+
+    def holds(self, text: object) -> bool:
+        return text is self.text or text == self.text
+
+
+def split_text(
+    text: str | None,
+    splitter: Callable[[Any], list[T]],
+    document: TranscriptDocument | None = None,
+) -> list[T]:
+    """splitter(text), served from document when it holds this same text.
+
+    Passes also split notes fragments and coverage excerpts; those texts are
+    split directly.
+    """
+
+    if document is not None and document.holds(text):
+        return list(document.sentences(splitter))
+    return splitter(text)
@@ -4,6 +4,8 @@ import re
 from collections.abc import Iterable
 from typing import Any
 
+from app.services.notes_rules import PhraseSet, phrase_set
+
 _SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
 _WORD_RE = re.compile(r"[a-z0-9]+")
 _DATE_RE = re.compile(
@@ -12,91 +14,100 @@ _DATE_RE = re.compile(
     re.IGNORECASE,
 )
 
-_DECISION_CUES = (
-    "agreed to",
-    "agreed that",
-    "approved",
-    "confirmed",
-    "decided",
-    "decision",
-    "final decision",
-    "keep",
-    "limit",
-    "use",
-    "we will",
-    "will use",
-    "will keep",
-    "will limit",
-    "will not",
-    "do not",
-    "do n't",
+_DECISION_CUES = phrase_set(
+    "transcript_signal_extractor.decision_cue",
+    (
+        "agreed to",
+        "agreed that",
+        "approved",
+        "confirmed",
+        "decided",
+        "decision",
+        "final decision",
+        "keep",
+        "limit",
+        "use",
+        "we will",
+        "will use",
+        "will keep",
+        "will limit",
+        "will not",
+        "do not",
+        "do n't",
+    ),
 )
 
-_ACTION_CUES = (
-    "action",
-    "action item",
-    "assign",
-    "assigned",
-    "circulate",
-    "complete",
-    "confirm",
-    "document",
-    "follow up",
-    "prepare",
-    "review",
-    "run",
-    "send",
-    "share",
-    "upload",
-    "verify",
-    "will",
-    "needs to",
-    "need to",
-    "owner",
+_ACTION_CUES = phrase_set(
+    "transcript_signal_extractor.action_cue",
+    (
+        "action",
+        "action item",
+        "assign",
+        "assigned",
+        "circulate",
+        "complete",
+        "confirm",
+        "document",
+        "follow up",
+        "prepare",
+        "review",
+        "run",
+        "send",
+        "share",
+        "upload",
+        "verify",
+        "will",
+        "needs to",
+        "need to",
+        "owner",
+    ),
 )
 
-_RISK_CUES = (
-    "risk",
-    "risks",
-    "concern",
-    "concerns",
-    "blocker",
-    "blocked",
-    "blocking",
-    "delay",
-    "delays",
-    "delayed",
-    "dependency",
-    "dependencies",
-    "scope creep",
-    "over-promising",
-    "overpromising",
-    "unrealistic",
-    "stale",
-    "unprepared",
-    "pricing confirmation",
-    "pricing delay",
-    "miss",
-    "missed",
-    "missing",
-    "failure",
-    "failed",
-    "unstable",
-    "low confidence",
-    "quality issue",
-    "accuracy issue",
-    "compliance",
-    "privacy",
-    "security",
-    "may delay",
-    "may reduce",
-    "may create",
-    "might delay",
-    "could delay",
-    "could reduce",
-    "could create",
-    "without",
-    "unless",
+_RISK_CUES = phrase_set(
+    "transcript_signal_extractor.risk_cue",
+    (
+        "risk",
+        "risks",
+        "concern",
+        "concerns",
+        "blocker",
+        "blocked",
+        "blocking",
+        "delay",
+        "delays",
+        "delayed",
+        "dependency",
+        "dependencies",
+        "scope creep",
+        "over-promising",
+        "overpromising",
+        "unrealistic",
+        "stale",
+        "unprepared",
+        "pricing confirmation",
+        "pricing delay",
+        "miss",
+        "missed",
+        "missing",
+        "failure",
+        "failed",
+        "unstable",
+        "low confidence",
+        "quality issue",
+        "accuracy issue",
+        "compliance",
+        "privacy",
+        "security",
+        "may delay",
+        "may reduce",
+        "may create",
+        "might delay",
+        "could delay",
+        "could reduce",
+        "could create",
+        "without",
+        "unless",
+    ),
 )
 
 
@@ -168,9 +179,8 @@ def _dedupe_keep_order(items: Iterable[str]) -> list[str]:
     return deduped
 
 
-def _contains_any(text: str, cues: Iterable[str]) -> bool:
-    lowered = text.lower()
-    return any(cue in lowered for cue in cues)
+def _contains_any(text: str, cues: PhraseSet) -> bool:
+    return cues.search(text.lower())
 
 
 def _clean_decision(sentence: str) -> str:
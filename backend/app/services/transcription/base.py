@@ -1,12 +1,76 @@
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator
 from pathlib import Path
 
-from .schemas import TranscriptionResult
+from .schemas import TranscriptionResult, TranscriptionSegment
+
+SegmentStream = Generator[TranscriptionSegment, None, TranscriptionResult]
+
+DEFAULT_STREAM_BATCH_SIZE = 25
+DEFAULT_STREAM_FLUSH_INTERVAL_SECONDS = 10.0
+
+
+def collect_stream(stream: SegmentStream) -> TranscriptionResult:
+    """Exhaust a segment stream and return its final result."""
+
+    while True:
+        try:
+            next(stream)
+        except StopIteration as stop:
+            return stop.value
 
 
 class Transcriber(ABC):
     @abstractmethod
     def transcribe(self, audio_path: str | Path) -> TranscriptionResult:
         raise NotImplementedError
+
+    def stream(self, audio_path: str | Path) -> SegmentStream:
+        """Yield segments as they are transcribed, then return the full result.
+
+        Providers that only produce output at the end yield every segment once
+        transcribe() has returned.
+        """
+
+        result = self.transcribe(audio_path)
+        yield from result.segments
+        return result
+
+
+def stream_in_batches(
+    stream: SegmentStream,
+    on_segments: Callable[[list[TranscriptionSegment]], None],
+    *,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    flush_interval_seconds: float = DEFAULT_STREAM_FLUSH_INTERVAL_SECONDS,
+) -> TranscriptionResult:
+    """Exhaust a segment stream, passing segments to on_segments in batches.
+
+    A batch is flushed once it holds batch_size segments or once
+    flush_interval_seconds have passed since the previous flush, so slow
+    transcription still reports progress regularly.
+    """
+
+    batch: list[TranscriptionSegment] = []
+    last_flush = time.monotonic()
+
+    while True:
+        try:
+            segment = next(stream)
+        except StopIteration as stop:
+            result = stop.value
+            break
+
+        batch.append(segment)
+        if len(batch) >= batch_size or time.monotonic() - last_flush >= flush_interval_seconds:
+            on_segments(batch)
+            batch = []
+            last_flush = time.monotonic()
+
+    if batch:
+        on_segments(batch)
+
+    return result
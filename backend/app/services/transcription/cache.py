@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.transcription_cache import TranscriptionCacheEntry
+
+from .schemas import TranscriptionResult
+
+log = logging.getLogger(__name__)
+
+
+def transcription_cache_enabled() -> bool:
+    value = os.getenv("MEETIQ_TRANSCRIPTION_CACHE", "").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def transcription_cache_key(audio_identity: str, model_name: str, language: str | None) -> str:
+    identity = "\n".join([audio_identity, model_name, language or "auto"])
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def load_cached_transcription(db: Session, cache_key: str) -> TranscriptionResult | None:
+    entry = db.get(TranscriptionCacheEntry, cache_key)
+    if entry is None:
+        return None
+
+    return TranscriptionResult.from_dict(entry.payload)
+
+
+def store_cached_transcription(
+    db: Session,
+    cache_key: str,
+    *,
+    audio_sha256: str,
+    model_name: str,
+    language: str | None,
+    meeting_id: int | None,
+    result: TranscriptionResult,
+) -> None:
+    if db.get(TranscriptionCacheEntry, cache_key) is not None:
+        return
+
+    db.add(
+        TranscriptionCacheEntry(
+            cache_key=cache_key,
+            audio_sha256=audio_sha256,
+            model_name=model_name,
+            language=language,
+            meeting_id=meeting_id,
+            payload=result.to_dict(),
+        )
+    )
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another worker cached the same audio first; its entry is equivalent.
+        db.rollback()
+        return
+
+    log.info(
+        "transcription_cache: stored",
+        extra={"cache_key": cache_key, "meeting_id": meeting_id},
+    )
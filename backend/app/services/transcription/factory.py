@@ -4,19 +4,81 @@ import os
 
 from .base import Transcriber
 
+LOCAL_PROVIDERS = {"local", "local_whisper", "faster_whisper"}
 
-def get_transcriber() -> Transcriber:
+
+def _configured_provider() -> str:
     provider = os.getenv("TRANSCRIPTION_PROVIDER", "").strip().lower()
 
     if not provider:
         provider = "openai" if os.getenv("OPENAI_API_KEY") else "local_whisper"
 
+    return provider
+
+
+def preload_transcription_model() -> bool:
+    """Warm the local Whisper model at worker start when configured to.
+
+    Returns True when a model was loaded; the worker must then run jobs
+    in-process (SimpleWorker) instead of forking per job.
+    """
+
+    if _configured_provider() not in LOCAL_PROVIDERS:
+        return False
+
+    from .local_whisper import preload_configured_model
+
+    return preload_configured_model()
+
+
+def configured_transcriber_identity() -> tuple[str, str | None]:
+    """Return (model identity, language) for the configured provider.
+
+    Read from settings alone so callers can check the transcription cache
+    without constructing a transcriber (and loading a local model).
+    """
+
+    from . import vad
+
+    provider = _configured_provider()
+    # VAD settings change which audio is transcribed, so they are part of the
+    # identity: faster-whisper only takes min-silence, the OpenAI path trims
+    # with all three.
+    if provider in LOCAL_PROVIDERS:
+        from .local_whisper import _configured_language, configured_model_key
+
+        model_size, compute_type, _, _ = configured_model_key()
+        model = f"faster-whisper:{model_size}:{compute_type}"
+        language = _configured_language()
+        if vad.vad_enabled():
+            model = f"{model}+vad-{vad.min_silence_seconds():g}"
+    else:
+        from .openai_whisper import configured_chunking
+
+        threshold_seconds, chunk_seconds, overlap_seconds = configured_chunking()
+        model = (
+            f"{provider}:{os.getenv('OPENAI_TRANSCRIPTION_MODEL', 'whisper-1')}"
+            f":chunks-{threshold_seconds}-{chunk_seconds}-{overlap_seconds:g}"
+        )
+        language = None
+        if vad.vad_enabled():
+            model = (
+                f"{model}+vad-{vad.threshold_db():g}-{vad.min_silence_seconds():g}"
+                f"-{vad.padding_seconds():g}"
+            )
+
+    return model, language
+
+
+def get_transcriber() -> Transcriber:
+    provider = _configured_provider()
+
     if provider in {"openai", "openai_whisper", "whisper_api"}:
         from .openai_whisper import OpenAIWhisperTranscriber
 
         return OpenAIWhisperTranscriber()
 
-    if provider in {"local", "local_whisper", "faster_whisper"}:
+    if provider in LOCAL_PROVIDERS:
         from .local_whisper import LocalWhisperTranscriber
 
         return LocalWhisperTranscriber()
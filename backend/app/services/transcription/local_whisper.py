@@ -1,13 +1,43 @@
 from __future__ import annotations
 
+import logging
 import os
+import threading
 from pathlib import Path
 
 from faster_whisper import WhisperModel
 
-from .base import Transcriber
+from . import vad
+from .base import SegmentStream, Transcriber, collect_stream
 from .schemas import TranscriptionResult, TranscriptionSegment
 
+log = logging.getLogger(__name__)
+
+DEFAULT_MODEL_SIZE = "base"
+DEFAULT_COMPUTE_TYPE = "int8"
+DEFAULT_CPU_THREADS = 0
+DEFAULT_NUM_WORKERS = 1
+
+ModelKey = tuple[str, str, int, int]
+
+_models: dict[ModelKey, WhisperModel] = {}
+_models_lock = threading.Lock()
+
+
+def _truthy(value: object) -> bool:
+    return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _non_negative_int_env(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return default
+
 
 def _configured_language() -> str | None:
     """Return configured local-whisper language.
@@ -29,16 +59,90 @@ def _configured_language() -> str | None:
     return value
 
 
+def configured_model_key() -> ModelKey:
+    """Return (model size, compute type, cpu_threads, num_workers) from env.
+
+    cpu_threads=0 leaves the thread count to CTranslate2.
+    """
+
+    model_size = os.getenv("LOCAL_WHISPER_MODEL_SIZE", "").strip() or DEFAULT_MODEL_SIZE
+    compute_type = os.getenv("LOCAL_WHISPER_COMPUTE_TYPE", "").strip() or DEFAULT_COMPUTE_TYPE
+    cpu_threads = _non_negative_int_env("LOCAL_WHISPER_CPU_THREADS", DEFAULT_CPU_THREADS)
+    num_workers = max(1, _non_negative_int_env("LOCAL_WHISPER_NUM_WORKERS", DEFAULT_NUM_WORKERS))
+    return model_size, compute_type, cpu_threads, num_workers
+
+
+def get_whisper_model(key: ModelKey | None = None) -> WhisperModel:
+    """Return the process-wide WhisperModel for key, loading it on first use."""
+
+    key = key or configured_model_key()
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            model_size, compute_type, cpu_threads, num_workers = key
+            log.info(
+                "local_whisper: loading model",
+                extra={
+                    "model_size": model_size,
+                    "compute_type": compute_type,
+                    "cpu_threads": cpu_threads,
+                    "num_workers": num_workers,
+                },
+            )
+            model = WhisperModel(
+                model_size,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+            )
+            _models[key] = model
+
+    return model
+
+
+def preload_configured_model() -> bool:
+    """Load the configured model when LOCAL_WHISPER_PRELOAD is enabled.
+
+    Only for non-forking workers: CTranslate2 starts its threads when the
+    model is built and a forked child does not get them. The worker entry
+    points switch to RQ's SimpleWorker when this returns True, so every job
+    runs in the process that owns the model and reuses it. Without preload,
+    RQ's default forking worker loads the model inside each job's child.
+    """
+
+    if not _truthy(os.getenv("LOCAL_WHISPER_PRELOAD")):
+        return False
+
+    get_whisper_model()
+    return True
+
+
 class LocalWhisperTranscriber(Transcriber):
     def __init__(self) -> None:
         self.model_name = "faster-whisper"
         self.transcription_language = _configured_language()
-        self.model = WhisperModel("base", compute_type="int8")
+        self.model = get_whisper_model()
 
     def transcribe(self, audio_path: str | Path) -> TranscriptionResult:
-        transcribe_kwargs: dict[str, str] = {}
+        return collect_stream(self.stream(audio_path))
+
+    def stream(self, audio_path: str | Path) -> SegmentStream:
+        # faster-whisper decodes lazily: each segment is produced as the model
+        # reaches it, so callers can persist partial transcripts as they go.
+        transcribe_kwargs: dict[str, object] = {}
         if self.transcription_language:
             transcribe_kwargs["language"] = self.transcription_language
+        if vad.vad_enabled():
+            # faster-whisper's Silero VAD drops silence before decoding and
+            # reports segment times on the original timeline.
+            transcribe_kwargs["vad_filter"] = True
+            transcribe_kwargs["vad_parameters"] = {
+                "min_silence_duration_ms": int(vad.min_silence_seconds() * 1000)
+            }
 
         segments, info = self.model.transcribe(str(audio_path), **transcribe_kwargs)
 
@@ -50,13 +154,13 @@ class LocalWhisperTranscriber(Transcriber):
             if text:
                 text_parts.append(text)
 
-            segment_list.append(
-                TranscriptionSegment(
-                    start=float(seg.start),
-                    end=float(seg.end),
-                    text=text,
-                )
+            segment = TranscriptionSegment(
+                start=float(seg.start),
+                end=float(seg.end),
+                text=text,
             )
+            segment_list.append(segment)
+            yield segment
 
         return TranscriptionResult(
             text=" ".join(text_parts).strip(),
@@ -3,14 +3,18 @@ from __future__ import annotations
 import logging
 import math
 import os
+import re
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from openai import OpenAI
 
+from . import vad
 from .base import Transcriber
 from .schemas import TranscriptionResult, TranscriptionSegment
 
@@ -20,6 +24,9 @@ DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_DELAY_SECONDS = 2.0
 DEFAULT_CHUNK_THRESHOLD_SECONDS = 180 * 60
 DEFAULT_CHUNK_SECONDS = 30 * 60
+DEFAULT_CHUNK_CONCURRENCY = 1
+DEFAULT_CHUNK_OVERLAP_SECONDS = 0.0
+SEAM_DUPLICATE_TEXT_SIMILARITY = 0.6
 
 
 def _to_dict(value: Any) -> dict[str, Any]:
@@ -136,6 +143,59 @@ def _write_audio_chunk(
         ) from exc
 
 
+def _segment_words(text: str) -> set[str]:
+    return set(re.findall(r"[a-z0-9']+", text.lower()))
+
+
+def _is_seam_duplicate(left: TranscriptionSegment, right: TranscriptionSegment) -> bool:
+    """Return True when two segments from adjacent chunks are the same speech."""
+
+    if min(left.end, right.end) <= max(left.start, right.start):
+        return False
+
+    left_words = _segment_words(left.text)
+    right_words = _segment_words(right.text)
+    if not left_words or not right_words:
+        return False
+
+    shared = len(left_words & right_words)
+    return shared / min(len(left_words), len(right_words)) >= SEAM_DUPLICATE_TEXT_SIMILARITY
+
+
+def _raise_first_chunk_failure(
+    futures: list[tuple[float, Future[TranscriptionResult]]],
+) -> None:
+    for _, future in futures:
+        if future.done() and not future.cancelled() and future.exception() is not None:
+            future.result()
+
+
+def configured_chunking() -> tuple[int, int, float]:
+    """Return (chunk threshold seconds, chunk seconds, overlap seconds) from env.
+
+    These decide where long audio is cut, so they shape the transcript.
+    """
+
+    chunk_threshold_seconds = _int_env(
+        "OPENAI_TRANSCRIPTION_CHUNK_THRESHOLD_SECONDS",
+        DEFAULT_CHUNK_THRESHOLD_SECONDS,
+    )
+    chunk_seconds = _int_env(
+        "OPENAI_TRANSCRIPTION_CHUNK_SECONDS",
+        DEFAULT_CHUNK_SECONDS,
+    )
+    # Overlap must stay below half a chunk so stitching boundaries keep
+    # increasing from one chunk to the next.
+    chunk_overlap_seconds = min(
+        _float_env(
+            "OPENAI_TRANSCRIPTION_CHUNK_OVERLAP_SECONDS",
+            DEFAULT_CHUNK_OVERLAP_SECONDS,
+        ),
+        chunk_seconds / 2,
+    )
+    return chunk_threshold_seconds, chunk_seconds, chunk_overlap_seconds
+
+
 class OpenAIWhisperTranscriber(Transcriber):
     def __init__(self) -> None:
         self.model_name = os.getenv("OPENAI_TRANSCRIPTION_MODEL", "whisper-1")
@@ -148,17 +208,46 @@ class OpenAIWhisperTranscriber(Transcriber):
             "OPENAI_TRANSCRIPTION_RETRY_DELAY_SECONDS",
             DEFAULT_RETRY_DELAY_SECONDS,
         )
-        self.chunk_threshold_seconds = _int_env(
-            "OPENAI_TRANSCRIPTION_CHUNK_THRESHOLD_SECONDS",
-            DEFAULT_CHUNK_THRESHOLD_SECONDS,
-        )
-        self.chunk_seconds = _int_env(
-            "OPENAI_TRANSCRIPTION_CHUNK_SECONDS",
-            DEFAULT_CHUNK_SECONDS,
+        (
+            self.chunk_threshold_seconds,
+            self.chunk_seconds,
+            self.chunk_overlap_seconds,
+        ) = configured_chunking()
+        self.chunk_concurrency = _int_env(
+            "OPENAI_TRANSCRIPTION_CONCURRENCY",
+            DEFAULT_CHUNK_CONCURRENCY,
         )
 
     def transcribe(self, audio_path: str | Path) -> TranscriptionResult:
         path = Path(audio_path)
+
+        if vad.vad_enabled():
+            speech_trim = vad.plan_speech_trim(path)
+            if speech_trim is not None:
+                timeline, duration_seconds = speech_trim
+                return self._transcribe_speech_only(
+                    path,
+                    timeline=timeline,
+                    duration_seconds=duration_seconds,
+                )
+
+        return self._transcribe_path(path)
+
+    def _transcribe_speech_only(
+        self,
+        audio_path: Path,
+        *,
+        timeline: vad.SpeechTimeline,
+        duration_seconds: float,
+    ) -> TranscriptionResult:
+        with tempfile.TemporaryDirectory(prefix="meetiq-vad-") as tmpdir:
+            speech_path = Path(tmpdir) / "speech.mp3"
+            vad.write_speech_audio(audio_path, speech_path, timeline.regions)
+            result = self._transcribe_path(speech_path)
+
+        return timeline.remap(result, duration_seconds=duration_seconds)
+
+    def _transcribe_path(self, path: Path) -> TranscriptionResult:
         duration_seconds = _probe_audio_duration_seconds(path)
 
         if duration_seconds is not None and duration_seconds > self.chunk_threshold_seconds:
@@ -169,68 +258,200 @@ class OpenAIWhisperTranscriber(Transcriber):
 
         return self._transcribe_single_file(path)
 
+    def _chunk_plan(self, duration_seconds: float) -> list[tuple[int, float, float]]:
+        """Return (index, start_seconds, duration_seconds) for each audio chunk.
+
+        Chunks start every chunk_seconds and run chunk_overlap_seconds past the
+        next chunk's start, so words spoken across a cut are heard in full by
+        at least one chunk.
+        """
+
+        plan: list[tuple[int, float, float]] = []
+        chunk_count = math.ceil(duration_seconds / self.chunk_seconds)
+
+        for index in range(chunk_count):
+            start_seconds = float(index * self.chunk_seconds)
+            remaining_seconds = duration_seconds - start_seconds
+            if remaining_seconds <= 0:
+                break
+
+            plan.append(
+                (
+                    index,
+                    start_seconds,
+                    min(float(self.chunk_seconds) + self.chunk_overlap_seconds, remaining_seconds),
+                )
+            )
+
+        return plan
+
     def _transcribe_long_audio_in_chunks(
         self,
         audio_path: Path,
         *,
         duration_seconds: float,
     ) -> TranscriptionResult:
-        chunk_count = math.ceil(duration_seconds / self.chunk_seconds)
-        chunk_results: list[tuple[float, TranscriptionResult]] = []
+        plan = self._chunk_plan(duration_seconds)
 
         log.info(
             "openai transcription: chunking long audio",
             extra={
                 "duration_seconds": duration_seconds,
                 "chunk_seconds": self.chunk_seconds,
-                "chunk_count": chunk_count,
+                "chunk_count": len(plan),
+                "chunk_concurrency": self.chunk_concurrency,
             },
         )
 
         with tempfile.TemporaryDirectory(prefix="meetiq-transcription-chunks-") as tmpdir:
             tmpdir_path = Path(tmpdir)
 
-            for index in range(chunk_count):
-                start_seconds = float(index * self.chunk_seconds)
-                remaining_seconds = duration_seconds - start_seconds
-                if remaining_seconds <= 0:
-                    break
-
-                chunk_duration_seconds = min(
-                    float(self.chunk_seconds),
-                    remaining_seconds,
-                )
-                chunk_path = tmpdir_path / f"chunk_{index:04d}.mp3"
-
-                _write_audio_chunk(
-                    source_path=audio_path,
-                    output_path=chunk_path,
-                    start_seconds=start_seconds,
-                    duration_seconds=chunk_duration_seconds,
-                )
-
-                log.info(
-                    "openai transcription: transcribing chunk",
-                    extra={
-                        "chunk_index": index,
-                        "chunk_count": chunk_count,
-                        "chunk_start_seconds": start_seconds,
-                        "chunk_duration_seconds": chunk_duration_seconds,
-                    },
+            if self.chunk_concurrency > 1 and len(plan) > 1:
+                chunk_results = self._transcribe_chunks_concurrently(
+                    audio_path,
+                    tmpdir_path,
+                    plan,
                 )
-
-                chunk_results.append(
+            else:
+                chunk_results = [
                     (
                         start_seconds,
-                        self._transcribe_single_file(chunk_path),
+                        self._transcribe_chunk(
+                            self._split_chunk(
+                                audio_path,
+                                tmpdir_path,
+                                index=index,
+                                start_seconds=start_seconds,
+                                chunk_duration_seconds=chunk_duration_seconds,
+                            ),
+                            index=index,
+                            chunk_count=len(plan),
+                            start_seconds=start_seconds,
+                            chunk_duration_seconds=chunk_duration_seconds,
+                        ),
                     )
-                )
+                    for index, start_seconds, chunk_duration_seconds in plan
+                ]
 
         return self._combine_chunk_results(
             chunk_results,
             duration_seconds=duration_seconds,
         )
 
+    def _split_chunk(
+        self,
+        audio_path: Path,
+        tmpdir_path: Path,
+        *,
+        index: int,
+        start_seconds: float,
+        chunk_duration_seconds: float,
+    ) -> Path:
+        chunk_path = tmpdir_path / f"chunk_{index:04d}.mp3"
+        _write_audio_chunk(
+            source_path=audio_path,
+            output_path=chunk_path,
+            start_seconds=start_seconds,
+            duration_seconds=chunk_duration_seconds,
+        )
+        return chunk_path
+
+    def _transcribe_chunk(
+        self,
+        chunk_path: Path,
+        *,
+        index: int,
+        chunk_count: int,
+        start_seconds: float,
+        chunk_duration_seconds: float,
+    ) -> TranscriptionResult:
+        log.info(
+            "openai transcription: transcribing chunk",
+            extra={
+                "chunk_index": index,
+                "chunk_count": chunk_count,
+                "chunk_start_seconds": start_seconds,
+                "chunk_duration_seconds": chunk_duration_seconds,
+            },
+        )
+        return self._transcribe_single_file(chunk_path)
+
+    def _transcribe_chunks_concurrently(
+        self,
+        audio_path: Path,
+        tmpdir_path: Path,
+        plan: list[tuple[int, float, float]],
+    ) -> list[tuple[float, TranscriptionResult]]:
+        """Split and transcribe chunks as a pipeline over a bounded thread pool.
+
+        The calling thread keeps splitting with ffmpeg while up to
+        chunk_concurrency uploads are in flight. At most one split chunk waits
+        ahead of the pool, so temp disk usage stays bounded. Each chunk keeps
+        its own retry loop; the first chunk that still fails cancels the rest.
+        Results are returned in offset order regardless of completion order.
+        """
+
+        chunk_count = len(plan)
+        slots = threading.BoundedSemaphore(self.chunk_concurrency + 1)
+        futures: list[tuple[float, Future[TranscriptionResult]]] = []
+
+        def transcribe_and_release(
+            chunk_path: Path,
+            index: int,
+            start_seconds: float,
+            chunk_duration_seconds: float,
+        ) -> TranscriptionResult:
+            try:
+                return self._transcribe_chunk(
+                    chunk_path,
+                    index=index,
+                    chunk_count=chunk_count,
+                    start_seconds=start_seconds,
+                    chunk_duration_seconds=chunk_duration_seconds,
+                )
+            finally:
+                chunk_path.unlink(missing_ok=True)
+                slots.release()
+
+        with ThreadPoolExecutor(
+            max_workers=self.chunk_concurrency,
+            thread_name_prefix="openai-transcription",
+        ) as pool:
+            try:
+                for index, start_seconds, chunk_duration_seconds in plan:
+                    slots.acquire()
+                    _raise_first_chunk_failure(futures)
+                    try:
+                        chunk_path = self._split_chunk(
+                            audio_path,
+                            tmpdir_path,
+                            index=index,
+                            start_seconds=start_seconds,
+                            chunk_duration_seconds=chunk_duration_seconds,
+                        )
+                    except BaseException:
+                        slots.release()
+                        raise
+
+                    futures.append(
+                        (
+                            start_seconds,
+                            pool.submit(
+                                transcribe_and_release,
+                                chunk_path,
+                                index,
+                                start_seconds,
+                                chunk_duration_seconds,
+                            ),
+                        )
+                    )
+
+                return [(start_seconds, future.result()) for start_seconds, future in futures]
+            except BaseException:
+                for _, future in futures:
+                    future.cancel()
+                raise
+
     def _transcribe_single_file(self, audio_path: Path) -> TranscriptionResult:
         last_error: Exception | None = None
 
@@ -302,6 +523,12 @@ class OpenAIWhisperTranscriber(Transcriber):
         *,
         duration_seconds: float,
     ) -> TranscriptionResult:
+        if self.chunk_overlap_seconds > 0:
+            return self._combine_overlapping_chunk_results(
+                chunk_results,
+                duration_seconds=duration_seconds,
+            )
+
         text_parts: list[str] = []
         segments: list[TranscriptionSegment] = []
         language: str | None = None
@@ -329,3 +556,77 @@ class OpenAIWhisperTranscriber(Transcriber):
             segments=segments,
             model_name=self.model_name,
         )
+
+    def _combine_overlapping_chunk_results(
+        self,
+        chunk_results: list[tuple[float, TranscriptionResult]],
+        *,
+        duration_seconds: float,
+    ) -> TranscriptionResult:
+        """Stitch overlapping chunks on the midpoint of each overlap window.
+
+        Each chunk owns the segments whose midpoint falls between the middle of
+        its leading overlap and the middle of its trailing overlap, which keeps
+        the copy of a boundary segment transcribed with more surrounding
+        context. A segment straddling the seam can still be reported by both
+        chunks; when the last kept segment of one chunk and the first kept
+        segment of the next overlap in time and text, only the longer is kept.
+        """
+
+        half_overlap = self.chunk_overlap_seconds / 2
+        offsets = [offset_seconds for offset_seconds, _ in chunk_results]
+        # One entry per chunk: its kept segments, or its raw text when the API
+        # returned no segments to stitch on.
+        stitched: list[list[TranscriptionSegment] | str] = []
+        previous: list[TranscriptionSegment] = []
+        language: str | None = None
+
+        for index, (offset_seconds, chunk_result) in enumerate(chunk_results):
+            if language is None and chunk_result.language:
+                language = str(chunk_result.language)
+
+            if not chunk_result.segments:
+                stitched.append(chunk_result.text.strip())
+                previous = []
+                continue
+
+            lower = offsets[index] + half_overlap if index > 0 else float("-inf")
+            upper = offsets[index + 1] + half_overlap if index + 1 < len(offsets) else float("inf")
+
+            owned = [
+                TranscriptionSegment(
+                    start=segment.start + offset_seconds,
+                    end=segment.end + offset_seconds,
+                    text=segment.text,
+                )
+                for segment in chunk_result.segments
+                if lower <= offset_seconds + (segment.start + segment.end) / 2 < upper
+            ]
+
+            if owned and previous and _is_seam_duplicate(previous[-1], owned[0]):
+                if len(owned[0].text.strip()) > len(previous[-1].text.strip()):
+                    previous.pop()
+                else:
+                    owned.pop(0)
+
+            stitched.append(owned)
+            previous = owned
+
+        text_parts: list[str] = []
+        segments: list[TranscriptionSegment] = []
+        for entry in stitched:
+            if isinstance(entry, str):
+                chunk_text = entry
+            else:
+                segments.extend(entry)
+                chunk_text = " ".join(segment.text.strip() for segment in entry).strip()
+            if chunk_text:
+                text_parts.append(chunk_text)
+
+        return TranscriptionResult(
+            text="\n\n".join(text_parts).strip(),
+            language=language,
+            duration_seconds=duration_seconds,
+            segments=segments,
+            model_name=self.model_name,
+        )
@@ -0,0 +1,63 @@
+"""Transcript segments saved while a meeting is still transcribing.
+
+Segments are rows appended one batch at a time, so each flush writes only
+the new batch however long the meeting runs. The rows are dropped once the
+notes row holds the full transcript.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.transcript_segment import MeetingTranscriptSegment
+
+from .schemas import TranscriptionSegment
+
+
+def clear_partial_transcript(db: Session, meeting_id: int) -> None:
+    db.query(MeetingTranscriptSegment).filter(
+        MeetingTranscriptSegment.meeting_id == meeting_id
+    ).delete(synchronize_session=False)
+
+
+def append_partial_transcript(
+    db: Session,
+    meeting_id: int,
+    first_position: int,
+    segments: list[TranscriptionSegment],
+) -> None:
+    db.add_all(
+        MeetingTranscriptSegment(
+            meeting_id=meeting_id,
+            position=first_position + offset,
+            start_seconds=segment.start,
+            end_seconds=segment.end,
+            text=segment.text,
+        )
+        for offset, segment in enumerate(segments)
+    )
+
+
+def partial_transcript_count(db: Session, meeting_id: int) -> int:
+    return (
+        db.query(func.count(MeetingTranscriptSegment.id))
+        .filter(MeetingTranscriptSegment.meeting_id == meeting_id)
+        .scalar()
+        or 0
+    )
+
+
+def load_partial_transcript(db: Session, meeting_id: int, after: int = 0) -> list[dict[str, Any]]:
+    rows = (
+        db.query(MeetingTranscriptSegment)
+        .filter(
+            MeetingTranscriptSegment.meeting_id == meeting_id,
+            MeetingTranscriptSegment.position >= after,
+        )
+        .order_by(MeetingTranscriptSegment.position)
+        .all()
+    )
+    return [{"start": row.start_seconds, "end": row.end_seconds, "text": row.text} for row in rows]
@@ -26,3 +26,20 @@ class TranscriptionResult:
             "segments": [asdict(s) for s in self.segments],
             "model_name": self.model_name,
         }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> TranscriptionResult:
+        return cls(
+            text=str(payload.get("text") or ""),
+            language=payload.get("language"),
+            duration_seconds=payload.get("duration_seconds"),
+            segments=[
+                TranscriptionSegment(
+                    start=float(segment["start"]),
+                    end=float(segment["end"]),
+                    text=str(segment.get("text") or ""),
+                )
+                for segment in payload.get("segments") or []
+            ],
+            model_name=str(payload.get("model_name") or ""),
+        )
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+import numpy as np
+
+from .schemas import TranscriptionResult, TranscriptionSegment
+
+log = logging.getLogger(__name__)
+
+VAD_SAMPLE_RATE = 16000
+VAD_FRAME_SECONDS = 0.03
+# 1000 frames = 30 s of audio, ~1 MB of PCM per read.
+VAD_READ_FRAMES = 1000
+VAD_DECODE_TIMEOUT_SECONDS = 3600
+DEFAULT_THRESHOLD_DB = -45.0
+DEFAULT_MIN_SILENCE_SECONDS = 2.0
+DEFAULT_PADDING_SECONDS = 0.3
+# Trimming only pays for the extra ffmpeg pass when it removes a real share of
+# the recording.
+MIN_TRIMMED_FRACTION = 0.1
+
+SpeechRegion = tuple[float, float]
+
+
+def _truthy(value: object) -> bool:
+    return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _float_env(name: str, default: float) -> float:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def vad_enabled() -> bool:
+    return _truthy(os.getenv("TRANSCRIPTION_VAD"))
+
+
+def threshold_db() -> float:
+    return _float_env("TRANSCRIPTION_VAD_THRESHOLD_DB", DEFAULT_THRESHOLD_DB)
+
+
+def min_silence_seconds() -> float:
+    return max(0.0, _float_env("TRANSCRIPTION_VAD_MIN_SILENCE_SECONDS", DEFAULT_MIN_SILENCE_SECONDS))
+
+
+def padding_seconds() -> float:
+    return max(0.0, _float_env("TRANSCRIPTION_VAD_PADDING_SECONDS", DEFAULT_PADDING_SECONDS))
+
+
+def speech_regions_from_frame_levels(
+    levels_db: np.ndarray,
+    *,
+    frame_seconds: float = VAD_FRAME_SECONDS,
+    threshold_db: float = DEFAULT_THRESHOLD_DB,
+    min_silence_seconds: float = DEFAULT_MIN_SILENCE_SECONDS,
+    padding_seconds: float = DEFAULT_PADDING_SECONDS,
+) -> list[SpeechRegion]:
+    """Group loud frames into padded speech regions.
+
+    Quiet gaps shorter than min_silence_seconds stay inside the surrounding
+    region so pauses between sentences are never cut.
+    """
+
+    duration_seconds = len(levels_db) * frame_seconds
+    voiced = np.flatnonzero(levels_db >= threshold_db)
+    if voiced.size == 0:
+        return []
+
+    gap_frames = max(1, int(round(min_silence_seconds / frame_seconds)))
+    breaks = np.flatnonzero(np.diff(voiced) > gap_frames)
+    starts = np.concatenate(([voiced[0]], voiced[breaks + 1]))
+    ends = np.concatenate((voiced[breaks], [voiced[-1]])) + 1
+
+    regions: list[SpeechRegion] = []
+    for start_frame, end_frame in zip(starts, ends, strict=True):
+        start = max(0.0, start_frame * frame_seconds - padding_seconds)
+        end = min(duration_seconds, end_frame * frame_seconds + padding_seconds)
+        if regions and start <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+
+    return regions
+
+
+def _frame_levels_db(audio_path: str | Path) -> np.ndarray:
+    """Decode audio to 16 kHz mono PCM and return per-frame RMS level in dBFS.
+
+    ffmpeg's output is read VAD_READ_FRAMES frames at a time and reduced to
+    levels as it arrives, so memory stays flat however long the recording.
+    """
+
+    frame_samples = int(VAD_SAMPLE_RATE * VAD_FRAME_SECONDS)
+    block_bytes = VAD_READ_FRAMES * frame_samples * 2
+    command = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        str(audio_path),
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(VAD_SAMPLE_RATE),
+        "-f",
+        "s16le",
+        "-",
+    ]
+
+    levels: list[np.ndarray] = []
+    timed_out = threading.Event()
+    with (
+        tempfile.TemporaryFile() as stderr,
+        subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr) as proc,
+    ):
+        assert proc.stdout is not None
+
+        def expire() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(VAD_DECODE_TIMEOUT_SECONDS, expire)
+        timer.start()
+        try:
+            # read() only comes back short at EOF, where a trailing partial
+            # frame is dropped.
+            while block := proc.stdout.read(block_bytes):
+                frame_count = len(block) // (frame_samples * 2)
+                samples = np.frombuffer(block, dtype="<i2", count=frame_count * frame_samples)
+                frames = samples.reshape(frame_count, frame_samples).astype(np.float64)
+                levels.append(np.sqrt(np.mean(frames**2, axis=1)))
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, VAD_DECODE_TIMEOUT_SECONDS)
+        if returncode != 0:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(
+                returncode, command, stderr=stderr.read().decode(errors="replace")
+            )
+
+    if not levels:
+        return np.empty(0)
+
+    rms = np.concatenate(levels)
+    return 20 * np.log10(np.maximum(rms, 1.0) / 32768.0)
+
+
+def detect_speech_regions(audio_path: str | Path) -> tuple[list[SpeechRegion], float]:
+    """Return (speech regions, total duration seconds) for audio_path."""
+
+    levels_db = _frame_levels_db(audio_path)
+    regions = speech_regions_from_frame_levels(
+        levels_db,
+        threshold_db=threshold_db(),
+        min_silence_seconds=min_silence_seconds(),
+        padding_seconds=padding_seconds(),
+    )
+    return regions, len(levels_db) * VAD_FRAME_SECONDS
+
+
+def write_speech_audio(
+    source_path: str | Path,
+    output_path: str | Path,
+    regions: list[SpeechRegion],
+) -> None:
+    """Write only the given regions of source_path, back to back, to output_path."""
+
+    selection = "+".join(f"between(t,{start:.3f},{end:.3f})" for start, end in regions)
+
+    try:
+        subprocess.run(
+            [
+                "ffmpeg",
+                "-y",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-i",
+                str(source_path),
+                "-vn",
+                "-af",
+                f"aselect='{selection}',asetpts=N/SR/TB",
+                "-ac",
+                "1",
+                "-ar",
+                str(VAD_SAMPLE_RATE),
+                "-b:a",
+                "64k",
+                str(output_path),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=3600,
+        )
+    except subprocess.CalledProcessError as exc:
+        raise RuntimeError(
+            f"Failed to write speech-only audio: {exc.stderr or exc.stdout or exc}"
+        ) from exc
+
+
+class SpeechTimeline:
+    """Map timestamps in speech-only audio back to the original recording."""
+
+    def __init__(self, regions: list[SpeechRegion]) -> None:
+        self.regions = regions
+        self.trimmed_starts: list[float] = []
+        elapsed = 0.0
+        for start, end in regions:
+            self.trimmed_starts.append(elapsed)
+            elapsed += end - start
+        self.speech_seconds = elapsed
+
+    def to_original(self, seconds: float, *, is_end: bool = False) -> float:
+        # A segment ending exactly on a join belongs to the region before it.
+        find = bisect_left if is_end else bisect_right
+        index = max(0, find(self.trimmed_starts, seconds) - 1)
+        start, end = self.regions[index]
+        return min(end, start + max(0.0, seconds - self.trimmed_starts[index]))
+
+    def remap(self, result: TranscriptionResult, *, duration_seconds: float) -> TranscriptionResult:
+        return TranscriptionResult(
+            text=result.text,
+            language=result.language,
+            duration_seconds=duration_seconds,
+            segments=[
+                TranscriptionSegment(
+                    start=self.to_original(segment.start),
+                    end=self.to_original(segment.end, is_end=True),
+                    text=segment.text,
+                )
+                for segment in result.segments
+            ],
+            model_name=result.model_name,
+        )
+
+
+def plan_speech_trim(audio_path: str | Path) -> tuple[SpeechTimeline, float] | None:
+    """Return the speech timeline to transcribe, or None to use the whole file.
+
+    Detection problems fall back to full-file transcription rather than
+    failing the meeting, as does audio with no detected speech at all (more
+    likely a quiet recording than an empty one).
+    """
+
+    try:
+        regions, duration_seconds = detect_speech_regions(audio_path)
+    except (OSError, subprocess.SubprocessError) as exc:
+        log.warning("vad: speech detection failed; transcribing full audio: %s", exc)
+        return None
+
+    if not regions or duration_seconds <= 0:
+        return None
+
+    timeline = SpeechTimeline(regions)
+    trimmed_fraction = 1 - timeline.speech_seconds / duration_seconds
+    log.info(
+        "vad: speech regions detected",
+        extra={
+            "speech_regions": len(regions),
+            "speech_seconds": round(timeline.speech_seconds, 1),
+            "duration_seconds": round(duration_seconds, 1),
+        },
+    )
+    if trimmed_fraction < MIN_TRIMMED_FRACTION:
+        return None
+
+    return timeline, duration_seconds
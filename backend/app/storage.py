@@ -6,46 +6,19 @@ import os
 from datetime import timedelta
 from typing import Any, Dict
 
-import boto3
 from botocore.exceptions import ClientError
 
-
-def _bucket_name() -> str | None:
-    return (
-        os.getenv("S3_BUCKET")
-        or os.getenv("AWS_S3_BUCKET")
-        or os.getenv("S3_BUCKET_NAME")
-        or os.getenv("OBJECT_BUCKET")
-    )
+from app.services.object_storage import ObjectStore, s3_bucket_from_env
 
 
-def _region_name() -> str | None:
-    return os.getenv("S3_REGION") or os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
+class S3Storage(ObjectStore):
+    """The configured media bucket on the shared, pooled S3 client."""
 
-
-class S3Storage:
     def __init__(self):
-        self.bucket = _bucket_name()
-        if not self.bucket:
+        bucket = s3_bucket_from_env()
+        if not bucket:
             raise RuntimeError("S3 bucket is not configured")
-
-        kwargs: dict[str, Any] = {}
-
-        region = _region_name()
-        if region:
-            kwargs["region_name"] = region
-
-        endpoint = os.getenv("S3_ENDPOINT") or os.getenv("AWS_ENDPOINT_URL")
-        if endpoint:
-            kwargs["endpoint_url"] = endpoint
-
-        access = os.getenv("S3_ACCESS_KEY") or os.getenv("AWS_ACCESS_KEY_ID")
-        secret = os.getenv("S3_SECRET_KEY") or os.getenv("AWS_SECRET_ACCESS_KEY")
-        if access and secret:
-            kwargs["aws_access_key_id"] = access
-            kwargs["aws_secret_access_key"] = secret
-
-        self.client = boto3.client("s3", **kwargs)
+        super().__init__(bucket)
 
     def put_json(self, key: str, obj: Dict[str, Any]) -> str:
         payload = json.dumps(obj, ensure_ascii=False).encode("utf-8")
@@ -61,11 +34,7 @@ class S3Storage:
         expires_td = (
             timedelta(seconds=int(expires)) if isinstance(expires, (int, float)) else expires
         )
-        return self.client.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": self.bucket, "Key": key},
-            ExpiresIn=int(expires_td.total_seconds()),
-        )
+        return self.presign_get(key, expires=int(expires_td.total_seconds()))
 
 
 def choose_storage():
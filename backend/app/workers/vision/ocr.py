@@ -1,22 +1,23 @@
 import tempfile
 from typing import cast
 
-import boto3
 import pytesseract
 from pdf2image import convert_from_bytes
 
 from app.core.db import SessionLocal
 from app.core.logger import get_logger
+from app.services.object_storage import S3ClientConfig, s3_client
 from packages.shared.env import settings
 from packages.shared.models import Slide
 
 log = get_logger(__name__)
-s3 = boto3.client(
-    "s3",
-    endpoint_url=settings.S3_ENDPOINT,
-    aws_access_key_id=settings.S3_ACCESS_KEY,
-    aws_secret_access_key=settings.S3_SECRET_KEY,
-    region_name=getattr(settings, "S3_REGION", None),
+s3 = s3_client(
+    S3ClientConfig(
+        region_name=getattr(settings, "S3_REGION", None),
+        endpoint_url=settings.S3_ENDPOINT,
+        access_key=settings.S3_ACCESS_KEY,
+        secret_key=settings.S3_SECRET_KEY,
+    )
 )
 
 
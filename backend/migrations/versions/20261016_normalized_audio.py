@@ -0,0 +1,33 @@
+"""add media hash and normalized audio artifact columns
+
+Revision ID: 20261016_normalized_audio
+Revises: 20260630_confidential_mode_v1
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20261016_normalized_audio"
+down_revision = "20260630_confidential_mode_v1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "meetings",
+        sa.Column("media_sha256", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "meetings",
+        sa.Column("normalized_audio_path", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("meetings", "normalized_audio_path")
+    op.drop_column("meetings", "media_sha256")
@@ -0,0 +1,28 @@
+"""add processing checkpoints column to meetings
+
+Revision ID: 20261016_processing_checkpoints
+Revises: 20261016_transcription_cache
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20261016_processing_checkpoints"
+down_revision = "20261016_transcription_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "meetings",
+        sa.Column("processing_checkpoints", sa.JSON(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("meetings", "processing_checkpoints")
@@ -0,0 +1,48 @@
+"""store partial transcripts as appended segment rows
+
+Revision ID: 20261016_transcript_segments
+Revises: 20261016_normalized_audio
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20261016_transcript_segments"
+down_revision = "20261016_normalized_audio"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "meeting_transcript_segments",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column(
+            "meeting_id",
+            sa.Integer(),
+            sa.ForeignKey("meetings.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("start_seconds", sa.Float(), nullable=False),
+        sa.Column("end_seconds", sa.Float(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.UniqueConstraint("meeting_id", "position"),
+    )
+    op.create_index(
+        "ix_meeting_transcript_segments_meeting_id",
+        "meeting_transcript_segments",
+        ["meeting_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_meeting_transcript_segments_meeting_id",
+        table_name="meeting_transcript_segments",
+    )
+    op.drop_table("meeting_transcript_segments")
@@ -0,0 +1,50 @@
+"""add transcription cache
+
+Revision ID: 20261016_transcription_cache
+Revises: 20261016_transcript_segments
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20261016_transcription_cache"
+down_revision = "20261016_transcript_segments"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transcription_cache",
+        sa.Column("cache_key", sa.String(length=64), primary_key=True, nullable=False),
+        sa.Column("audio_sha256", sa.String(length=64), nullable=False),
+        sa.Column("model_name", sa.String(length=255), nullable=False),
+        sa.Column("language", sa.String(length=32), nullable=True),
+        sa.Column(
+            "meeting_id",
+            sa.Integer(),
+            sa.ForeignKey("meetings.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_transcription_cache_audio_sha256", "transcription_cache", ["audio_sha256"]
+    )
+    op.create_index("ix_transcription_cache_meeting_id", "transcription_cache", ["meeting_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transcription_cache_meeting_id", table_name="transcription_cache")
+    op.drop_index("ix_transcription_cache_audio_sha256", table_name="transcription_cache")
+    op.drop_table("transcription_cache")
@@ -0,0 +1,28 @@
+"""add revision column to meeting_notes
+
+Revision ID: 20261017_notes_revision
+Revises: 20261016_processing_checkpoints
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20261017_notes_revision"
+down_revision = "20261016_processing_checkpoints"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "meeting_notes",
+        sa.Column("revision", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("meeting_notes", "revision")
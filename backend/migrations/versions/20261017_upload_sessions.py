@@ -0,0 +1,92 @@
+"""add resumable upload sessions
+
+Revision ID: 20261017_upload_sessions
+Revises: 20261017_notes_revision
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20261017_upload_sessions"
+down_revision = "20261017_notes_revision"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "upload_sessions",
+        sa.Column("id", sa.String(length=64), primary_key=True, nullable=False),
+        sa.Column(
+            "meeting_id",
+            sa.Integer(),
+            sa.ForeignKey("meetings.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("original_filename", sa.String(length=1024), nullable=False),
+        sa.Column("content_type", sa.String(length=255), nullable=True),
+        sa.Column("total_size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("part_size_bytes", sa.Integer(), nullable=False),
+        sa.Column(
+            "confidential_mode",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.false(),
+        ),
+        sa.Column("storage_key", sa.String(length=2048), nullable=False),
+        sa.Column("s3_upload_id", sa.String(length=1024), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=False, server_default="open"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index("ix_upload_sessions_meeting_id", "upload_sessions", ["meeting_id"])
+    op.create_index("ix_upload_sessions_user_id", "upload_sessions", ["user_id"])
+
+    op.create_table(
+        "upload_session_parts",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column(
+            "session_id",
+            sa.String(length=64),
+            sa.ForeignKey("upload_sessions.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("part_number", sa.Integer(), nullable=False),
+        sa.Column("offset_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("etag", sa.String(length=255), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.UniqueConstraint("session_id", "part_number"),
+    )
+    op.create_index(
+        "ix_upload_session_parts_session_id", "upload_session_parts", ["session_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_upload_session_parts_session_id", table_name="upload_session_parts")
+    op.drop_table("upload_session_parts")
+    op.drop_index("ix_upload_sessions_user_id", table_name="upload_sessions")
+    op.drop_index("ix_upload_sessions_meeting_id", table_name="upload_sessions")
+    op.drop_table("upload_sessions")
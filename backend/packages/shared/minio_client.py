@@ -5,9 +5,9 @@ import logging
 from contextlib import suppress
 from typing import IO
 
-import boto3
 from mypy_boto3_s3 import S3Client
 
+from app.services.object_storage import S3ClientConfig, s3_client
 from packages.shared.env import settings
 
 log = logging.getLogger(__name__)
@@ -15,20 +15,16 @@ log = logging.getLogger(__name__)
 RAW_BUCKET = getattr(settings, "S3_BUCKET_RAW", "raw")
 SLIDES_BUCKET = getattr(settings, "S3_BUCKET_SLIDES", "slides")
 
-_s3: S3Client | None = None
-
 
 def _client() -> S3Client:
-    global _s3
-    if _s3 is None:
-        _s3 = boto3.client(
-            "s3",
-            endpoint_url=settings.S3_ENDPOINT,
-            aws_access_key_id=settings.S3_ACCESS_KEY,
-            aws_secret_access_key=settings.S3_SECRET_KEY,
+    return s3_client(
+        S3ClientConfig(
             region_name=getattr(settings, "S3_REGION", None),
+            endpoint_url=settings.S3_ENDPOINT,
+            access_key=settings.S3_ACCESS_KEY,
+            secret_key=settings.S3_SECRET_KEY,
         )
-    return _s3
+    )
 
 
 def _ensure_bucket(bucket: str) -> None:
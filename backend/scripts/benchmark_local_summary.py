@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark LocalSummaryStrategy.generate on the long regression fixtures.
+
+Local/QA-only. Each repeat starts from empty per-sentence caches, so the
+timings are what one meeting costs a fresh worker process.
+
+    python backend/scripts/benchmark_local_summary.py --repeat 5
+    python backend/scripts/benchmark_local_summary.py --backend numpy
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = REPO_ROOT / "backend"
+
+for candidate in (REPO_ROOT, BACKEND_ROOT):
+    candidate_text = str(candidate)
+    if candidate_text not in sys.path:
+        sys.path.insert(0, candidate_text)
+
+from app.services.note_strategies import local_scoring, local_summary  # noqa: E402
+
+DEFAULT_CASE_IDS = ("L01", "L02", "L03", "L04")
+DEFAULT_FIXTURE_DIR = BACKEND_ROOT / "tests" / "fixtures" / "meeting_regression"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture-dir", default=str(DEFAULT_FIXTURE_DIR))
+    parser.add_argument(
+        "--case",
+        action="append",
+        default=[],
+        help="Case id prefix to run. Can be repeated. Defaults to L01-L04.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--backend",
+        choices=sorted(local_scoring.SCORING_BACKENDS),
+        default=None,
+        help=f"Sentence ranking backend; defaults to ${local_scoring.SCORING_BACKEND_ENV} or auto.",
+    )
+    parser.add_argument("--output", default=None, help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def transcript_for_case(fixture_dir: Path, case_id: str) -> Path:
+    matches = sorted(fixture_dir.glob(f"{case_id}_*.txt"))
+    if not matches:
+        raise FileNotFoundError(f"no transcript fixture for case {case_id} in {fixture_dir}")
+    return matches[0]
+
+
+def clear_caches() -> None:
+    for name in ("sentence_features", "_local_marker_norm_text"):
+        cached = getattr(local_summary, name, None)
+        if cached is not None and hasattr(cached, "cache_clear"):
+            cached.cache_clear()
+
+
+def benchmark_case(transcript: str, repeat: int) -> dict[str, Any]:
+    strategy = local_summary.LocalSummaryStrategy()
+    timings_ms: list[float] = []
+
+    for _ in range(max(1, repeat)):
+        clear_caches()
+        started = time.perf_counter()
+        strategy.generate(transcript)
+        timings_ms.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "chars": len(transcript),
+        "repeat": len(timings_ms),
+        "min_ms": round(min(timings_ms), 1),
+        "median_ms": round(statistics.median(timings_ms), 1),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    if args.backend:
+        os.environ[local_scoring.SCORING_BACKEND_ENV] = args.backend
+    fixture_dir = Path(args.fixture_dir)
+    case_ids = tuple(args.case) or DEFAULT_CASE_IDS
+
+    report: dict[str, dict[str, Any]] = {}
+    for case_id in case_ids:
+        path = transcript_for_case(fixture_dir, case_id)
+        result = benchmark_case(path.read_text(encoding="utf-8"), args.repeat)
+        report[path.stem] = result
+        print(
+            f"{path.stem:<40} {result['chars']:>8} chars  "
+            f"min {result['min_ms']:>8.1f} ms  median {result['median_ms']:>8.1f} ms"
+        )
+
+    total = sum(result["median_ms"] for result in report.values())
+    print(f"{'total (median)':<40} {'':>14}  {'':>15} {total:>8.1f} ms")
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Profile each notes pass of process_meeting on the regression fixtures.
+
+Local/QA-only. Runs the real job against a throwaway in-memory database;
+only audio preparation, transcription and slide OCR are replaced, with the
+fixture transcript standing in for the ASR output. The per-pass breakdown is
+read back from Meeting.processing_timings, exactly as production records it.
+
+    python backend/scripts/profile_notes_passes.py --engine v3
+    python backend/scripts/profile_notes_passes.py --case L01 --folded notes.folded
+    flamegraph.pl notes.folded > notes.svg
+
+The --folded output is collapsed-stack text (``case;pass microseconds``)
+that flamegraph.pl, speedscope and inferno read directly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = REPO_ROOT / "backend"
+
+for candidate in (REPO_ROOT, BACKEND_ROOT):
+    candidate_text = str(candidate)
+    if candidate_text not in sys.path:
+        sys.path.insert(0, candidate_text)
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.jobs import process_meeting as process_mod  # noqa: E402
+from app.models import Base  # noqa: E402
+from app.models.meeting import Meeting  # noqa: E402
+from app.services.notes_pass_profiler import folded_stack_lines  # noqa: E402
+from app.services.processing_observability import NOTES_PASSES_TIMING_KEY  # noqa: E402
+from app.services.transcription.base import Transcriber  # noqa: E402
+from app.services.transcription.schemas import TranscriptionResult  # noqa: E402
+
+DEFAULT_FIXTURE_DIR = BACKEND_ROOT / "tests" / "fixtures" / "meeting_regression"
+OUTSIDE_PASSES = "(outside notes passes)"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture-dir", default=str(DEFAULT_FIXTURE_DIR))
+    parser.add_argument(
+        "--case",
+        action="append",
+        default=[],
+        help="Case id prefix to run. Can be repeated. Defaults to every transcript fixture.",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=("v1", "v2", "v3"),
+        default=None,
+        help="Quality engine mode; defaults to $NOTES_ENGINE or v1.",
+    )
+    parser.add_argument(
+        "--folded",
+        default=None,
+        help="Write collapsed stacks for a flamegraph to this path ('-' for stdout).",
+    )
+    parser.add_argument("--output", default=None, help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+class FixtureTranscriber(Transcriber):
+    def __init__(self) -> None:
+        self.text = ""
+
+    def transcribe(self, audio_path: str | Path) -> TranscriptionResult:
+        return TranscriptionResult(
+            text=self.text,
+            language="en",
+            duration_seconds=None,
+            segments=[],
+            model_name="fixture",
+        )
+
+
+def transcripts(fixture_dir: Path, case_ids: list[str]) -> list[Path]:
+    paths = sorted(fixture_dir.glob("*.txt"))
+    if case_ids:
+        paths = [path for path in paths if any(path.stem.startswith(case) for case in case_ids)]
+    if not paths:
+        raise FileNotFoundError(f"no transcript fixtures matched in {fixture_dir}")
+    return paths
+
+
+def install_fixture_job(work_dir: Path, transcriber: FixtureTranscriber) -> sessionmaker:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+
+    def prepare_audio(db, meeting, raw_media_path, log_extra) -> Path:
+        path = work_dir / f"meeting-{meeting.id}.ogg"
+        path.write_bytes(b"fixture")
+        return path
+
+    process_mod.SessionLocal = factory
+    process_mod._prepare_meeting_audio = prepare_audio
+    process_mod.get_transcriber = lambda: transcriber
+    process_mod.extract_slide_text_for_meeting = lambda **kwargs: ""
+    return factory
+
+
+def profile_case(factory: sessionmaker, title: str) -> dict[str, Any]:
+    with factory() as db:
+        meeting = Meeting(title=title, raw_media_path=f"/fixtures/{title}.mp4", status="PROCESSING")
+        db.add(meeting)
+        db.commit()
+        meeting_id = meeting.id
+
+    started = time.perf_counter()
+    # process_meeting prints its LLM polish gate; keep the report readable.
+    with contextlib.redirect_stdout(io.StringIO()):
+        process_mod.process_meeting(str(meeting_id))
+    total_seconds = time.perf_counter() - started
+
+    with factory() as db:
+        meeting = db.get(Meeting, meeting_id)
+        timings = dict(meeting.processing_timings or {})
+    passes = dict(timings.get(NOTES_PASSES_TIMING_KEY) or {})
+    pass_seconds = sum(float(timing.get("seconds") or 0) for timing in passes.values())
+    return {
+        "total_seconds": round(total_seconds, 6),
+        "notes_pass_seconds": round(pass_seconds, 6),
+        "passes": passes,
+    }
+
+
+def print_case(case: str, result: dict[str, Any]) -> None:
+    print(
+        f"{case}: {result['total_seconds'] * 1000:.1f} ms total, "
+        f"{result['notes_pass_seconds'] * 1000:.1f} ms in notes passes"
+    )
+    for name, timing in result["passes"].items():
+        items_in = "-" if timing.get("items_in") is None else timing["items_in"]
+        items_out = "-" if timing.get("items_out") is None else timing["items_out"]
+        skipped = f"  skipped x{timing['skipped']}" if timing.get("skipped") else ""
+        print(
+            f"  {name:<36} {float(timing['seconds']) * 1000:>9.1f} ms"
+            f"  x{timing['calls']:<2} items {items_in:>4} -> {items_out:<4}{skipped}"
+        )
+
+
+def folded_lines(report: dict[str, dict[str, Any]]) -> list[str]:
+    lines: list[str] = []
+    for case, result in report.items():
+        lines.extend(folded_stack_lines(result["passes"], root=case))
+        outside = result["total_seconds"] - result["notes_pass_seconds"]
+        if outside > 0:
+            lines.append(f"{case};{OUTSIDE_PASSES} {round(outside * 1_000_000)}")
+    return lines
+
+
+def main() -> int:
+    args = parse_args()
+    if args.engine:
+        os.environ["NOTES_ENGINE"] = args.engine
+    os.environ.setdefault("MEETIQ_TRANSCRIPTION_CACHE", "0")
+    logging.disable(logging.CRITICAL)
+
+    paths = transcripts(Path(args.fixture_dir), args.case)
+    transcriber = FixtureTranscriber()
+    report: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix="notes-profile-") as work_dir:
+        factory = install_fixture_job(Path(work_dir), transcriber)
+        for path in paths:
+            transcriber.text = path.read_text(encoding="utf-8")
+            report[path.stem] = profile_case(factory, path.stem)
+            print_case(path.stem, report[path.stem])
+
+    if args.folded:
+        folded = "\n".join(folded_lines(report)) + "\n"
+        if args.folded == "-":
+            sys.stdout.write(folded)
+        else:
+            Path(args.folded).write_text(folded, encoding="utf-8")
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
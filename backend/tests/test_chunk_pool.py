@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from app.services import chunk_pool
+from app.services.chunk_action_extractor import extract_candidate_actions
+from app.services.chunk_pool import (
+    CHUNK_WORKERS_ENV,
+    chunk_workers_for,
+    configured_chunk_workers,
+    map_chunks,
+    shutdown_chunk_pool,
+)
+from app.services.note_strategies import local_summary
+from app.services.note_strategies.local_summary import (
+    prime_sentence_features,
+    sentence_features,
+)
+
+
+@pytest.mark.parametrize(
+    ("raw_value", "expected"),
+    [("", 0), ("1", 0), ("4", 4), ("lots", 0), ("auto", None)],
+)
+def test_configured_chunk_workers(monkeypatch, raw_value, expected):
+    monkeypatch.setenv(CHUNK_WORKERS_ENV, raw_value)
+    monkeypatch.setattr(chunk_pool.os, "cpu_count", lambda: 6)
+
+    assert configured_chunk_workers() == (6 if expected is None else expected)
+
+
+def test_short_transcripts_stay_serial(monkeypatch):
+    monkeypatch.setenv(CHUNK_WORKERS_ENV, "4")
+
+    assert chunk_workers_for(chunk_pool.VERY_LONG_TRANSCRIPT_WORD_THRESHOLD - 1) == 0
+    assert chunk_workers_for(chunk_pool.VERY_LONG_TRANSCRIPT_WORD_THRESHOLD) == 4
+
+
+def test_map_chunks_keeps_input_order():
+    assert map_chunks(str.upper, ["b", "a", "c"], workers=0) == ["B", "A", "C"]
+
+
+def test_parallel_candidate_extraction_matches_serial(monkeypatch):
+    transcript = " ".join(
+        f"Speaker {index % 3}: I will send report {index} by Friday. We discussed item {index}."
+        for index in range(60)
+    )
+    serial = extract_candidate_actions(transcript, max_words_per_chunk=40)
+
+    monkeypatch.setenv(CHUNK_WORKERS_ENV, "2")
+    monkeypatch.setattr(chunk_pool, "VERY_LONG_TRANSCRIPT_WORD_THRESHOLD", 1)
+    try:
+        parallel = extract_candidate_actions(transcript, max_words_per_chunk=40)
+    finally:
+        shutdown_chunk_pool()
+
+    assert parallel == serial
+    assert [item.source_chunk for item in parallel] == sorted(
+        item.source_chunk for item in parallel
+    )
+
+
+def test_primed_rows_are_adopted_once():
+    local_summary.sentence_features.cache_clear()
+    cached = sentence_features("Lee will book the room by Monday.")
+    primed = local_summary.SentenceFeatures("Dana will send the deck by Friday.")
+    stale = local_summary.SentenceFeatures("Lee will book the room by Monday.")
+
+    prime_sentence_features([primed, stale])
+
+    assert sentence_features("Dana will send the deck by Friday.") is primed
+    assert sentence_features("Lee will book the room by Monday.") is cached
+    assert local_summary._primed_features == {}
@@ -83,15 +83,18 @@ def _patch_successful_upload(monkeypatch: pytest.MonkeyPatch) -> None:
         "enforce_free_trial_duration_limit",
         lambda **kwargs: None,
     )
+    async def probe_duration(fileobj) -> float:
+        return 60.0
+
     monkeypatch.setattr(
         meeting_notes_api,
-        "probe_media_duration_seconds",
-        lambda raw_bytes, suffix: 60.0,
+        "probe_media_fileobj_duration_seconds_async",
+        probe_duration,
     )
     monkeypatch.setattr(
         meeting_notes_api,
         "_save_raw_media",
-        lambda meeting_id, file, raw_bytes: f"s3://test-bucket/raw_media/{meeting_id}.mp3",
+        lambda meeting_id, file: f"s3://test-bucket/raw_media/{meeting_id}.mp3",
     )
     monkeypatch.setattr(
         meeting_notes_api,
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base
+from app.models.meeting import Meeting
+from app.models.user import User
+from app.routers import meeting_notes_api
+from app.storage import S3Storage
+
+
+class FakeStorage:
+    bucket = "test-bucket"
+    objects: dict[str, dict] = {}
+    deleted: list[str] = []
+    copied: list[tuple[str, str]] = []
+
+    def presign_put(self, key: str, content_type: str, expires: int = 900) -> str:
+        return f"https://storage.test/{self.bucket}/{key}?put&expires={expires}"
+
+    def sign_url(self, key: str, expires: int = 3600) -> str:
+        return f"https://storage.test/{self.bucket}/{key}?get"
+
+    def head(self, key: str) -> dict | None:
+        return self.objects.get(key)
+
+    def copy(self, source_key: str, key: str, *, transfer_config=None) -> None:
+        self.copied.append((source_key, key))
+        self.objects[key] = dict(self.objects[source_key])
+
+    def delete(self, key: str) -> None:
+        self.deleted.append(key)
+        self.objects.pop(key, None)
+
+
+@pytest.fixture()
+def direct_upload(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[tuple[TestClient, Session, Meeting]]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    user = User(
+        email="owner@example.com",
+        password_hash="not-used-in-test",
+        first_name="Test",
+        last_name="User",
+        organization_name="Test Org",
+    )
+    db.add(user)
+    db.commit()
+    meeting = Meeting(title="Direct upload meeting", user_id=user.id, status="new")
+    db.add(meeting)
+    db.commit()
+    db.refresh(meeting)
+
+    FakeStorage.objects = {}
+    FakeStorage.deleted = []
+    FakeStorage.copied = []
+    monkeypatch.setenv("STORAGE_BACKEND", "s3")
+    monkeypatch.setenv("S3_BUCKET", "test-bucket")
+    monkeypatch.setattr(meeting_notes_api, "S3Storage", FakeStorage)
+    for name in ("enforce_free_trial_upload_limit", "enforce_free_trial_duration_limit"):
+        monkeypatch.setattr(meeting_notes_api, name, lambda **kwargs: None)
+    monkeypatch.setattr(
+        meeting_notes_api,
+        "enqueue_process_meeting",
+        lambda meeting_id: SimpleNamespace(id=f"job-{meeting_id}"),
+    )
+
+    app = FastAPI()
+    app.include_router(meeting_notes_api.router)
+    app.dependency_overrides[meeting_notes_api._get_db] = lambda: db
+    app.dependency_overrides[meeting_notes_api.get_current_user] = lambda: user
+    try:
+        yield TestClient(app), db, meeting
+    finally:
+        db.close()
+
+
+def _staged(client: TestClient, meeting: Meeting, filename: str = "call.mp3") -> str:
+    response = client.post(f"/v1/meetings/{meeting.id}/upload-url", json={"filename": filename})
+    key = response.json()["storage_key"]
+    FakeStorage.objects[key] = {"ContentLength": 4096, "ContentType": "audio/mpeg"}
+    return key
+
+
+def test_upload_url_presigns_a_put_for_a_unique_staging_key(direct_upload):
+    client, _, meeting = direct_upload
+    request = {"filename": "call.m4a", "content_type": "audio/mp4", "size_bytes": 1024}
+
+    response = client.post(f"/v1/meetings/{meeting.id}/upload-url", json=request)
+    again = client.post(f"/v1/meetings/{meeting.id}/upload-url", json=request)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["method"] == "PUT"
+    assert body["storage_key"].startswith(f"raw_media/staging/{meeting.id}/")
+    assert body["storage_key"].endswith(".m4a")
+    assert again.json()["storage_key"] != body["storage_key"]
+    assert body["upload_url"].startswith(f"https://storage.test/test-bucket/{body['storage_key']}")
+    assert body["headers"] == {"Content-Type": "audio/mp4"}
+
+
+def test_upload_url_rejects_oversized_and_unsupported_files(direct_upload):
+    client, _, meeting = direct_upload
+
+    too_large = client.post(
+        f"/v1/meetings/{meeting.id}/upload-url",
+        json={"filename": "call.mp3", "size_bytes": 10 * 1024 * 1024 * 1024},
+    )
+    unsupported = client.post(
+        f"/v1/meetings/{meeting.id}/upload-url",
+        json={"filename": "notes.pdf"},
+    )
+
+    assert too_large.status_code == 400
+    assert "too large" in too_large.json()["detail"]
+    assert unsupported.status_code == 400
+    assert "Unsupported file type" in unsupported.json()["detail"]
+
+
+def test_upload_url_requires_object_storage(direct_upload, monkeypatch: pytest.MonkeyPatch):
+    client, _, meeting = direct_upload
+    monkeypatch.setenv("STORAGE_BACKEND", "local")
+
+    response = client.post(f"/v1/meetings/{meeting.id}/upload-url", json={"filename": "a.mp3"})
+
+    assert response.status_code == 409
+
+
+def test_complete_validates_stored_object_and_enqueues(
+    direct_upload,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    client, db, meeting = direct_upload
+    staging_key = _staged(client, meeting)
+    key = f"raw_media/meeting_{meeting.id}.mp3"
+    probed: list[str] = []
+    ledger: list[dict] = []
+    monkeypatch.setattr(
+        meeting_notes_api,
+        "probe_media_file_duration_seconds",
+        lambda path: probed.append(path) or 90.0,
+    )
+    monkeypatch.setattr(
+        meeting_notes_api,
+        "record_upload_ledger_entry",
+        lambda **kwargs: ledger.append(kwargs),
+    )
+    meeting.processing_checkpoints = {"media_sha256": None, "transcription": {"text": "old"}}
+    db.commit()
+
+    response = client.post(
+        f"/v1/meetings/{meeting.id}/upload-complete",
+        json={"filename": "call.mp3", "storage_key": staging_key},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["job_id"] == f"job-{meeting.id}"
+    assert probed == [f"https://storage.test/test-bucket/{staging_key}?get"]
+    assert FakeStorage.copied == [(staging_key, key)]
+    assert FakeStorage.deleted == [staging_key]
+    assert ledger[0]["file_size_bytes"] == 4096
+    assert ledger[0]["storage_key"] == f"s3://test-bucket/{key}"
+    db.refresh(meeting)
+    assert meeting.raw_media_path == f"s3://test-bucket/{key}"
+    assert meeting.media_size_bytes == 4096
+    assert meeting.media_duration_seconds == 90.0
+    assert meeting.media_content_type == "audio/mpeg"
+    assert meeting.media_sha256 is None
+    assert meeting.processing_checkpoints is None
+
+
+def test_complete_without_stored_object_is_rejected(direct_upload):
+    client, _, meeting = direct_upload
+    staging_key = client.post(
+        f"/v1/meetings/{meeting.id}/upload-url",
+        json={"filename": "call.mp3"},
+    ).json()["storage_key"]
+
+    response = client.post(
+        f"/v1/meetings/{meeting.id}/upload-complete",
+        json={"filename": "call.mp3", "storage_key": staging_key},
+    )
+
+    assert response.status_code == 400
+    assert "Upload not found" in response.json()["detail"]
+
+
+def test_complete_only_accepts_this_meetings_staging_keys(direct_upload):
+    client, _, meeting = direct_upload
+    live_key = f"raw_media/meeting_{meeting.id}.mp3"
+    other_key = f"raw_media/staging/{meeting.id + 1}/{'0' * 32}.mp3"
+    for key in (live_key, other_key):
+        FakeStorage.objects[key] = {"ContentLength": 4096, "ContentType": "audio/mpeg"}
+
+    responses = [
+        client.post(
+            f"/v1/meetings/{meeting.id}/upload-complete",
+            json={"filename": "call.mp3", "storage_key": key},
+        )
+        for key in (live_key, other_key)
+    ]
+
+    assert [response.status_code for response in responses] == [400, 400]
+    assert FakeStorage.copied == []
+    assert FakeStorage.deleted == []
+
+
+def test_rejected_upload_deletes_only_its_staging_object(
+    direct_upload,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    client, db, meeting = direct_upload
+    live_key = f"raw_media/meeting_{meeting.id}.mp3"
+    FakeStorage.objects[live_key] = {"ContentLength": 2048, "ContentType": "audio/mpeg"}
+    meeting.raw_media_path = f"s3://test-bucket/{live_key}"
+    db.commit()
+    staging_key = _staged(client, meeting)
+    monkeypatch.setattr(meeting_notes_api, "probe_media_file_duration_seconds", lambda path: None)
+
+    def reject(**kwargs):
+        raise HTTPException(status_code=400, detail="We couldn't detect the recording duration.")
+
+    monkeypatch.setattr(meeting_notes_api, "enforce_free_trial_duration_limit", reject)
+
+    response = client.post(
+        f"/v1/meetings/{meeting.id}/upload-complete",
+        json={"filename": "call.mp3", "storage_key": staging_key},
+    )
+
+    assert response.status_code == 400
+    assert FakeStorage.deleted == [staging_key]
+    assert FakeStorage.copied == []
+    assert live_key in FakeStorage.objects
+    db.refresh(meeting)
+    assert meeting.raw_media_path == f"s3://test-bucket/{live_key}"
+    assert meeting.status == "new"
+
+
+def test_s3_storage_presigns_put_with_content_type(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("S3_BUCKET", "test-bucket")
+    monkeypatch.setenv("S3_REGION", "us-east-1")
+    monkeypatch.setenv("S3_ACCESS_KEY", "test-access")
+    monkeypatch.setenv("S3_SECRET_KEY", "test-secret")
+    monkeypatch.setenv("S3_ENDPOINT", "http://minio.test:9000")
+
+    url = S3Storage().presign_put("raw_media/meeting_1.mp3", "audio/mpeg", expires=600)
+
+    parsed = urlparse(url)
+    assert parsed.netloc == "minio.test:9000"
+    assert parsed.path == "/test-bucket/raw_media/meeting_1.mp3"
+    assert parse_qs(parsed.query)["content-type"] == ["audio/mpeg"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.services.note_strategies import local_scoring
+from app.services.note_strategies.local_summary import (
+    _rank_chunks,
+    build_sentence_records,
+    chunk_records,
+    normalize_text,
+    select_diverse_points,
+)
+
+pytest.importorskip("numpy")
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "meeting_regression"
+
+
+def _fixture_chunks(name: str):
+    text = normalize_text((FIXTURE_DIR / name).read_text(encoding="utf-8"))
+    return chunk_records(build_sentence_records(text, ""), max_chars=1800)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["L03_AMI_IN1001_50min.txt", "M04_decisions_only.txt", "S01_controlled_short.txt"],
+)
+def test_numpy_ranking_matches_python(name):
+    chunks = _fixture_chunks(name)
+
+    assert _rank_chunks(chunks, backend="numpy") == _rank_chunks(chunks, backend="python")
+
+
+def test_ties_keep_sentence_order():
+    chunks = [[("Alpha beta gamma.", "transcript"), ("Delta epsilon zeta.", "transcript")]]
+
+    assert _rank_chunks(chunks, backend="numpy") == chunks
+
+
+@pytest.mark.parametrize("limit", [1, 3, 12])
+def test_numpy_diverse_selection_matches_python(limit):
+    chunks = _fixture_chunks("L01_long_business.txt")
+    points = [sentence for ranked in _rank_chunks(chunks) for sentence, _source in ranked[:5]]
+
+    assert select_diverse_points(points, limit=limit, backend="numpy") == select_diverse_points(
+        points, limit=limit
+    )
+
+
+def test_backend_resolution(monkeypatch):
+    monkeypatch.delenv(local_scoring.SCORING_BACKEND_ENV, raising=False)
+    threshold = local_scoring.VERY_LONG_TRANSCRIPT_WORD_THRESHOLD
+
+    assert local_scoring.scoring_backend(threshold - 1) == "python"
+    assert local_scoring.scoring_backend(threshold) == "numpy"
+    assert local_scoring.scoring_backend(10, "numpy") == "numpy"
+
+    monkeypatch.setenv(local_scoring.SCORING_BACKEND_ENV, "python")
+    assert local_scoring.scoring_backend(threshold) == "python"
+
+    monkeypatch.setattr(local_scoring, "np", None)
+    assert local_scoring.scoring_backend(10, "numpy") == "python"
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+from app.services.note_strategies import local_summary
+from app.services.note_strategies.local_summary import (
+    LocalSummaryStrategy,
+    extract_action_items,
+    extract_decisions,
+    extract_risks,
+    sentence_features,
+)
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "meeting_regression"
+
+
+def test_sentence_features_are_shared_per_sentence():
+    sentence = "Dana will send the budget by Friday."
+
+    features = sentence_features(sentence)
+
+    assert sentence_features(sentence) is features
+    assert features.owner == "Dana"
+    assert features.due == "Friday"
+    assert features.is_action is True
+    assert features.tokens[:3] == ("dana", "will", "send")
+
+
+def test_extracted_action_items_are_independent_copies():
+    records = [("Dana will send the budget by Friday.", "transcript")]
+
+    first = extract_action_items(records)
+    first[0].task = "mutated by caller"
+
+    assert extract_action_items(records)[0].task != "mutated by caller"
+
+
+def test_extractors_read_from_feature_table():
+    records = [
+        ("We decided to keep the pilot at twenty users.", "transcript"),
+        ("The vendor delay may block the launch.", "transcript"),
+        ("Thanks everyone.", "transcript"),
+    ]
+
+    assert extract_decisions(records) == ["We decided to keep the pilot at twenty users"]
+    assert extract_risks(records) == ["The vendor delay may block the launch"]
+
+
+def test_generate_output_does_not_depend_on_warm_caches():
+    transcript = (FIXTURE_DIR / "L01_long_business.txt").read_text(encoding="utf-8")
+    strategy = LocalSummaryStrategy()
+
+    local_summary.sentence_features.cache_clear()
+    cold = strategy.generate(transcript)
+    warm = strategy.generate(transcript)
+
+    assert warm == cold
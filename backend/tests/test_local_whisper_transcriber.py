@@ -19,15 +19,18 @@ class FakeWhisperModel:
         return segments, info
 
 
-def _install_fake_model(monkeypatch):
+def _install_fake_model(monkeypatch, load_args: list[tuple[tuple, dict]] | None = None):
     created: list[FakeWhisperModel] = []
 
     def factory(*args, **kwargs):
+        if load_args is not None:
+            load_args.append((args, kwargs))
         model = FakeWhisperModel()
         created.append(model)
         return model
 
     monkeypatch.setattr(local_whisper, "WhisperModel", factory)
+    monkeypatch.setattr(local_whisper, "_models", {})
     return created
 
 
@@ -55,3 +58,66 @@ def test_local_whisper_allows_auto_language_detection(monkeypatch):
     assert created[0].calls == [("meeting.mp3", {})]
     assert result.language is None
     assert result.text == "Hello world"
+
+
+def test_local_whisper_reuses_loaded_model_across_transcribers(monkeypatch):
+    for name in (
+        "LOCAL_WHISPER_MODEL_SIZE",
+        "LOCAL_WHISPER_COMPUTE_TYPE",
+        "LOCAL_WHISPER_CPU_THREADS",
+        "LOCAL_WHISPER_NUM_WORKERS",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    load_args: list[tuple[tuple, dict]] = []
+    created = _install_fake_model(monkeypatch, load_args)
+
+    first = local_whisper.LocalWhisperTranscriber()
+    second = local_whisper.LocalWhisperTranscriber()
+
+    assert len(created) == 1
+    assert first.model is second.model
+    assert load_args == [
+        (("base",), {"compute_type": "int8", "cpu_threads": 0, "num_workers": 1}),
+    ]
+
+
+def test_local_whisper_model_settings_come_from_env(monkeypatch):
+    monkeypatch.setenv("LOCAL_WHISPER_MODEL_SIZE", "small.en")
+    monkeypatch.setenv("LOCAL_WHISPER_COMPUTE_TYPE", "int8_float32")
+    monkeypatch.setenv("LOCAL_WHISPER_CPU_THREADS", "4")
+    monkeypatch.setenv("LOCAL_WHISPER_NUM_WORKERS", "2")
+    load_args: list[tuple[tuple, dict]] = []
+    created = _install_fake_model(monkeypatch, load_args)
+
+    local_whisper.LocalWhisperTranscriber()
+    monkeypatch.setenv("LOCAL_WHISPER_CPU_THREADS", "8")
+    local_whisper.LocalWhisperTranscriber()
+
+    assert len(created) == 2
+    assert load_args == [
+        (("small.en",), {"compute_type": "int8_float32", "cpu_threads": 4, "num_workers": 2}),
+        (("small.en",), {"compute_type": "int8_float32", "cpu_threads": 8, "num_workers": 2}),
+    ]
+
+
+def test_preload_loads_model_only_when_enabled_for_local_provider(monkeypatch):
+    from app.services.transcription import factory
+
+    created = _install_fake_model(monkeypatch)
+    monkeypatch.setenv("TRANSCRIPTION_PROVIDER", "local_whisper")
+
+    monkeypatch.delenv("LOCAL_WHISPER_PRELOAD", raising=False)
+    assert factory.preload_transcription_model() is False
+    assert created == []
+
+    monkeypatch.setenv("LOCAL_WHISPER_PRELOAD", "1")
+    monkeypatch.setenv("TRANSCRIPTION_PROVIDER", "openai")
+    assert factory.preload_transcription_model() is False
+    assert created == []
+
+    monkeypatch.setenv("TRANSCRIPTION_PROVIDER", "local_whisper")
+    assert factory.preload_transcription_model() is True
+    assert len(created) == 1
+
+    local_whisper.LocalWhisperTranscriber()
+    assert len(created) == 1
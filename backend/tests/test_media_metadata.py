@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from app.services.media_metadata import (
+    probe_media_file_duration_seconds,
+    probe_media_fileobj_duration_seconds_async,
+)
+
+
+def _install_fake_ffprobe(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, body: str) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "ffprobe"
+    script.write_text(f"#!/bin/sh\n{body}\n", encoding="utf-8")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+
+def _spooled(payload: bytes = b"media") -> tempfile.SpooledTemporaryFile:
+    spooled = tempfile.SpooledTemporaryFile(max_size=1024)
+    spooled.write(payload)
+    return spooled
+
+
+def test_file_and_fileobj_probes_read_the_same_duration(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _install_fake_ffprobe(tmp_path, monkeypatch, """echo '{"format": {"duration": "61.5"}}'""")
+
+    assert probe_media_file_duration_seconds("call.mp3") == 61.5
+    assert asyncio.run(probe_media_fileobj_duration_seconds_async(_spooled())) == 61.5
+
+
+def test_async_probe_returns_none_when_ffprobe_fails_or_is_missing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _install_fake_ffprobe(tmp_path, monkeypatch, "exit 1")
+    assert asyncio.run(probe_media_fileobj_duration_seconds_async(_spooled())) is None
+
+    monkeypatch.setenv("PATH", str(tmp_path / "missing"))
+    assert asyncio.run(probe_media_fileobj_duration_seconds_async(_spooled())) is None
+
+
+def test_async_probe_does_not_block_the_event_loop(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _install_fake_ffprobe(tmp_path, monkeypatch, f"exec {shutil.which('sleep')} 5")
+
+    async def probe_while_ticking() -> tuple[float | None, int]:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        duration = await probe_media_fileobj_duration_seconds_async(
+            _spooled(),
+            timeout_seconds=0.3,
+        )
+        ticker.cancel()
+        return duration, ticks
+
+    started = time.monotonic()
+    duration, ticks = asyncio.run(probe_while_ticking())
+
+    assert duration is None
+    assert ticks >= 5
+    assert time.monotonic() - started < 3
+
+
+def test_fileobj_probe_reads_the_spooled_file_as_stdin(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # The fake reads the duration from the file it is given, which must be stdin.
+    _install_fake_ffprobe(
+        tmp_path,
+        monkeypatch,
+        '''read -r duration < "$7"; printf '{"format": {"duration": "%s"}}' "$duration"''',
+    )
+    spooled = _spooled(b"42.5\n")
+
+    duration = asyncio.run(probe_media_fileobj_duration_seconds_async(spooled))
+
+    assert duration == 42.5
+    assert spooled.tell() == 0
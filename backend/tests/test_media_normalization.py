@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import hashlib
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.jobs import process_meeting as process_mod
+from app.models import Base
+from app.models.meeting import Meeting
+from app.services import media
+
+
+@pytest.fixture()
+def db_session() -> Iterator[Session]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _fake_ffmpeg(calls: list[list[str]]):
+    def run(cmd, **kwargs):
+        calls.append(list(cmd))
+        Path(cmd[-1]).write_bytes(b"normalized:" + Path(cmd[cmd.index("-i") + 1]).read_bytes())
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    return run
+
+
+def test_normalized_audio_artifact_sits_next_to_raw_media():
+    sha = "ab" * 32
+
+    assert (
+        media.normalized_audio_artifact_path("s3://bucket/raw_media/meeting_7.mp4", sha)
+        == f"s3://bucket/raw_media/meeting_7.audio-16k-{sha[:16]}.ogg"
+    )
+    assert (
+        media.normalized_audio_artifact_path("/app/storage/uploads/meeting_7.webm", sha)
+        == f"/app/storage/uploads/meeting_7.audio-16k-{sha[:16]}.ogg"
+    )
+
+
+def test_prepare_audio_runs_ffmpeg_to_16k_mono(tmp_path, monkeypatch):
+    calls: list[list[str]] = []
+    monkeypatch.setattr(media.subprocess, "run", _fake_ffmpeg(calls))
+    source = tmp_path / "meeting.mp4"
+    source.write_bytes(b"video")
+
+    output = media.prepare_audio_file_for_meeting("7", source)
+    try:
+        assert output != source
+        assert output.suffix == ".ogg"
+        assert output.read_bytes() == b"normalized:video"
+        assert calls[0][0] == "ffmpeg"
+        assert calls[0][calls[0].index("-ac") + 1] == "1"
+        assert calls[0][calls[0].index("-ar") + 1] == "16000"
+        assert calls[0][calls[0].index("-fflags") + 1] == "+bitexact"
+        assert calls[0][calls[0].index("-flags:a") + 1] == "+bitexact"
+    finally:
+        output.unlink(missing_ok=True)
+
+
+def test_prepare_audio_falls_back_to_original_media_without_ffmpeg(tmp_path, monkeypatch):
+    def missing_ffmpeg(cmd, **kwargs):
+        raise FileNotFoundError("ffmpeg")
+
+    monkeypatch.setattr(media.subprocess, "run", missing_ffmpeg)
+    source = tmp_path / "meeting.mp4"
+    source.write_bytes(b"video")
+
+    assert media.prepare_audio_file_for_meeting("7", source) == source
+
+
+def test_prepare_audio_surfaces_decode_failures(tmp_path, monkeypatch):
+    def failing_ffmpeg(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd, stderr="invalid data")
+
+    monkeypatch.setattr(media.subprocess, "run", failing_ffmpeg)
+    source = tmp_path / "meeting.mp4"
+    source.write_bytes(b"not media")
+
+    with pytest.raises(RuntimeError, match="invalid data"):
+        media.prepare_audio_file_for_meeting("7", source)
+
+
+def test_process_meeting_stores_and_reuses_normalized_audio(
+    db_session: Session,
+    tmp_path,
+    monkeypatch,
+):
+    calls: list[list[str]] = []
+    monkeypatch.setattr(media.subprocess, "run", _fake_ffmpeg(calls))
+
+    raw_path = tmp_path / "meeting_1.mp4"
+    raw_path.write_bytes(b"video")
+    meeting = Meeting(title="Normalize", raw_media_path=str(raw_path), status="PROCESSING")
+    db_session.add(meeting)
+    db_session.commit()
+
+    first = process_mod._prepare_meeting_audio(db_session, meeting, str(raw_path), {})
+    try:
+        assert first.read_bytes() == b"normalized:video"
+    finally:
+        first.unlink(missing_ok=True)
+
+    expected_sha = hashlib.sha256(b"video").hexdigest()
+    assert meeting.media_sha256 == expected_sha
+    assert meeting.normalized_audio_path == media.normalized_audio_artifact_path(
+        str(raw_path), expected_sha
+    )
+    assert Path(meeting.normalized_audio_path).read_bytes() == b"normalized:video"
+    assert len(calls) == 1
+
+    second = process_mod._prepare_meeting_audio(db_session, meeting, str(raw_path), {})
+    try:
+        assert second.read_bytes() == b"normalized:video"
+    finally:
+        second.unlink(missing_ok=True)
+
+    assert len(calls) == 1
+
+
+def test_process_meeting_ignores_artifact_from_previous_upload(
+    db_session: Session,
+    tmp_path,
+    monkeypatch,
+):
+    calls: list[list[str]] = []
+    monkeypatch.setattr(media.subprocess, "run", _fake_ffmpeg(calls))
+
+    raw_path = tmp_path / "meeting_2.mp4"
+    raw_path.write_bytes(b"first upload")
+    meeting = Meeting(title="Re-upload", raw_media_path=str(raw_path), status="PROCESSING")
+    db_session.add(meeting)
+    db_session.commit()
+
+    process_mod._prepare_meeting_audio(db_session, meeting, str(raw_path), {}).unlink()
+    old_artifact = Path(meeting.normalized_audio_path)
+
+    raw_path.write_bytes(b"second upload")
+    meeting.media_sha256 = hashlib.sha256(b"second upload").hexdigest()
+
+    audio = process_mod._prepare_meeting_audio(db_session, meeting, str(raw_path), {})
+    try:
+        assert audio.read_bytes() == b"normalized:second upload"
+    finally:
+        audio.unlink(missing_ok=True)
+
+    assert len(calls) == 2
+    assert Path(meeting.normalized_audio_path) != old_artifact
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base
+from app.models.meeting import Meeting
+from app.models.user import User
+from app.routers import meeting_notes_api
+from app.services import media_upload
+
+PAYLOAD = b"0123456789abcdef" * 64
+
+
+@pytest.fixture()
+def db_session() -> Iterator[Session]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture()
+def spool_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    directory = tmp_path / "spool"
+    directory.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(directory))
+    monkeypatch.setattr(media_upload, "MEDIA_UPLOAD_CHUNK_BYTES", 100)
+    return directory
+
+
+def _client_with_meeting(
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple[TestClient, Meeting]:
+    user = User(
+        email="owner@example.com",
+        password_hash="not-used-in-test",
+        first_name="Test",
+        last_name="User",
+        organization_name="Test Org",
+    )
+    db.add(user)
+    db.commit()
+    meeting = Meeting(title="Upload test meeting", user_id=user.id, status="new")
+    db.add(meeting)
+    db.commit()
+    db.refresh(meeting)
+
+    for name in ("enforce_free_trial_upload_limit", "enforce_free_trial_duration_limit"):
+        monkeypatch.setattr(meeting_notes_api, name, lambda **kwargs: None)
+    monkeypatch.setattr(meeting_notes_api, "record_upload_ledger_entry", lambda **kwargs: None)
+    async def probe_duration(fileobj) -> float:
+        return 60.0
+
+    monkeypatch.setattr(
+        meeting_notes_api,
+        "probe_media_fileobj_duration_seconds_async",
+        probe_duration,
+    )
+    monkeypatch.setattr(
+        meeting_notes_api,
+        "enqueue_process_meeting",
+        lambda meeting_id: SimpleNamespace(id=f"job-{meeting_id}"),
+    )
+
+    app = FastAPI()
+    app.include_router(meeting_notes_api.router)
+    app.dependency_overrides[meeting_notes_api._get_db] = lambda: db
+    app.dependency_overrides[meeting_notes_api.get_current_user] = lambda: user
+    return TestClient(app), meeting
+
+
+def test_upload_streams_to_s3_as_multipart_from_starlette_spool(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    spool_dir: Path,
+):
+    client, meeting = _client_with_meeting(db_session, monkeypatch)
+    uploads: list[dict] = []
+
+    class FakeS3:
+        def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, Config=None):
+            uploads.append(
+                {
+                    "body": Fileobj.read(),
+                    "bucket": Bucket,
+                    "key": Key,
+                    "content_type": ExtraArgs["ContentType"],
+                    "config": Config,
+                }
+            )
+
+    monkeypatch.setenv("STORAGE_BACKEND", "s3")
+    monkeypatch.setenv("S3_BUCKET", "test-bucket")
+    monkeypatch.setattr(meeting_notes_api, "_s3_client", lambda: FakeS3())
+
+    response = client.post(
+        f"/v1/meetings/{meeting.id}/upload",
+        files={"file": ("call.mp3", PAYLOAD, "audio/mpeg")},
+    )
+
+    assert response.status_code == 200
+    assert uploads == [
+        {
+            "body": PAYLOAD,
+            "bucket": "test-bucket",
+            "key": f"raw_media/meeting_{meeting.id}.mp3",
+            "content_type": "audio/mpeg",
+            "config": meeting_notes_api.RAW_MEDIA_TRANSFER_CONFIG,
+        }
+    ]
+    db_session.refresh(meeting)
+    assert meeting.raw_media_path == f"s3://test-bucket/raw_media/meeting_{meeting.id}.mp3"
+    assert meeting.media_size_bytes == len(PAYLOAD)
+    assert meeting.media_sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+    assert list(spool_dir.iterdir()) == []
+
+
+def test_upload_falls_back_to_local_disk(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    spool_dir: Path,
+    tmp_path: Path,
+):
+    client, meeting = _client_with_meeting(db_session, monkeypatch)
+    monkeypatch.delenv("STORAGE_BACKEND", raising=False)
+    monkeypatch.setattr(meeting_notes_api, "UPLOAD_DIR", tmp_path / "uploads")
+
+    response = client.post(
+        f"/v1/meetings/{meeting.id}/upload",
+        files={"file": ("call.wav", PAYLOAD, "audio/wav")},
+    )
+
+    assert response.status_code == 200
+    stored = tmp_path / "uploads" / f"meeting_{meeting.id}.wav"
+    assert response.json()["raw_media_path"] == str(stored)
+    assert stored.read_bytes() == PAYLOAD
+    assert list(spool_dir.iterdir()) == []
+
+
+def test_upload_over_limit_is_rejected_without_storing(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    spool_dir: Path,
+):
+    client, meeting = _client_with_meeting(db_session, monkeypatch)
+    monkeypatch.setenv(media_upload.MAX_UPLOAD_BYTES_ENV, str(1024 * 1024))
+    saved: list[str] = []
+    monkeypatch.setattr(
+        meeting_notes_api,
+        "_save_raw_media",
+        lambda meeting_id, file: saved.append(meeting_id),
+    )
+
+    response = client.post(
+        f"/v1/meetings/{meeting.id}/upload",
+        files={"file": ("call.mp3", b"x" * (1024 * 1024 + 1), "audio/mpeg")},
+    )
+
+    assert response.status_code == 400
+    assert "under 1 MB" in response.json()["detail"]
+    assert saved == []
+    assert list(spool_dir.iterdir()) == []
+
+
+def test_digest_reads_the_spool_in_place_and_rewinds_it(spool_dir: Path):
+    spooled = tempfile.SpooledTemporaryFile()
+    spooled.write(PAYLOAD)
+    upload = UploadFile(spooled, size=None)
+
+    digest = asyncio.run(media_upload.digest_upload(upload, max_bytes=len(PAYLOAD)))
+
+    assert digest.size_bytes == len(PAYLOAD)
+    assert digest.sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+    assert spooled.tell() == 0
+    assert list(spool_dir.iterdir()) == []
+
+
+def test_digest_stops_reading_once_the_limit_is_exceeded(spool_dir: Path):
+    class CountingSpool(io.BytesIO):
+        reads = 0
+
+        def read(self, size: int = -1) -> bytes:
+            self.reads += 1
+            return super().read(size)
+
+    spooled = CountingSpool(b"x" * 1000)
+
+    with pytest.raises(media_upload.UploadTooLargeError):
+        asyncio.run(media_upload.digest_upload(UploadFile(spooled), max_bytes=250))
+
+    assert spooled.reads == 3
+    assert spooled.tell() == 0
@@ -39,3 +39,39 @@ def test_enqueue_process_meeting_uses_configured_timeout(monkeypatch):
     assert fake_queue.kwargs["meeting_id"] == 123
     assert fake_queue.kwargs["description"] == "process_meeting[123]"
     assert fake_queue.kwargs["job_timeout"] == 3 * 60 * 60
+
+
+class FakeNamedQueue:
+    def __init__(self, name: str, enqueued: list) -> None:
+        self.name = name
+        self.enqueued = enqueued
+
+    def enqueue(self, func, **kwargs):
+        job = {"id": f"{self.name}-job", "queue": self.name, "func": func, **kwargs}
+        self.enqueued.append(job)
+        return job
+
+
+def test_staged_pipeline_chains_jobs_across_queues(monkeypatch):
+    enqueued: list[dict] = []
+    monkeypatch.setenv("MEETIQ_PROCESSING_PIPELINE", "staged")
+    monkeypatch.setenv("MEETIQ_NOTES_JOB_TIMEOUT_SECONDS", "600")
+    monkeypatch.delenv("MEETIQ_PROCESSING_JOB_TIMEOUT_SECONDS", raising=False)
+    monkeypatch.delenv("MEETIQ_POLISH_JOB_TIMEOUT_SECONDS", raising=False)
+    monkeypatch.setattr(meetings, "queue", None)
+    monkeypatch.setattr(meetings, "get_queue", lambda name: FakeNamedQueue(name, enqueued))
+
+    job = meetings.enqueue_process_meeting(meeting_id=123)
+
+    transcribe_job, notes_job, polish_job = enqueued
+    assert job is transcribe_job
+    assert [item["queue"] for item in enqueued] == ["transcribe", "notes", "polish"]
+    assert [item["func"] for item in enqueued] == [
+        meetings.transcribe_meeting,
+        meetings.generate_meeting_notes,
+        meetings.finalize_meeting_notes,
+    ]
+    assert "depends_on" not in transcribe_job
+    assert notes_job["depends_on"] is transcribe_job
+    assert polish_job["depends_on"] is notes_job
+    assert [item["job_timeout"] for item in enqueued] == [4 * 60 * 60, 600, 15 * 60]
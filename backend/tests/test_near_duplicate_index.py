@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from app.services.near_duplicate_index import NearDuplicateIndex
+from app.services.notes_quality_pass import _pilot_rc1_precision_dedupe_decisions
+from app.services.quality_engine_v3 import _dedupe_actions
+
+
+def test_query_reports_shared_counts_in_slot_order():
+    index: NearDuplicateIndex[str] = NearDuplicateIndex()
+    index.add("deck", {"send", "deck", "friday"})
+    index.add("budget", {"send", "budget"})
+    index.add("demo", {"record", "demo"})
+
+    assert index.query({"send", "deck"}) == [(0, 2), (1, 1)]
+    assert index.query({"send", "deck"}, min_shared=2) == [(0, 2)]
+    assert index.query({"unrelated"}) == []
+
+
+def test_key_matches_regardless_of_token_overlap():
+    index: NearDuplicateIndex[str] = NearDuplicateIndex()
+    index.add("first", (), key="to the")
+
+    assert index.query((), key="to the") == [(0, 0)]
+    assert index.query((), key="other") == []
+
+
+def test_replace_and_remove_keep_slots_stable():
+    index: NearDuplicateIndex[str] = NearDuplicateIndex()
+    index.add("a", {"alpha"})
+    index.add("b", {"beta"})
+
+    index.replace(0, "a2", {"gamma"}, key="a2")
+    index.remove(1)
+
+    assert index.query({"alpha"}) == []
+    assert index.query({"gamma"}) == [(0, 1)]
+    assert index.query({"beta"}) == []
+    assert index.slots() == [0]
+    assert index.values() == ["a2"]
+    assert len(index) == 1
+
+
+def test_action_dedupe_keeps_richer_duplicate_in_place():
+    items = [
+        {"task": "Send the budget deck to finance", "owner": "Dana"},
+        {"task": "Book the demo room", "owner": "Lee"},
+        {
+            "task": "Send the budget deck to finance team",
+            "owner": "Dana",
+            "deadline": "Friday",
+        },
+    ]
+
+    deduped = _dedupe_actions(items)
+
+    assert [item["task"] for item in deduped] == [
+        "Send the budget deck to finance team",
+        "Book the demo room",
+    ]
+
+
+def test_decision_dedupe_drops_near_duplicates():
+    decisions = [
+        "We will use the controlled transcript as the main proof of quality.",
+        "Use the controlled transcript as the main proof of quality for the demo.",
+        "Keep the pilot limited to five consultants.",
+    ]
+
+    assert _pilot_rc1_precision_dedupe_decisions(decisions) == [
+        "We will use the controlled transcript as the main proof of quality",
+        "Keep the pilot limited to five consultants",
+    ]
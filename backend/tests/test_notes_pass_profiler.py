@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.metrics import NOTES_PASS_ITEMS, NOTES_PASS_LATENCY
+from app.services.notes_pass_profiler import (
+    NotesPassProfiler,
+    count_notes_items,
+    folded_stack_lines,
+)
+from app.services.processing_observability import record_notes_passes
+
+
+def test_count_notes_items_understands_pass_values():
+    notes = {
+        "action_items": ["Dana - Send the deck"],
+        "action_item_objects": [{"task": "Send the deck"}, {"task": "Book the room"}],
+        "decisions": ["Ship on Friday"],
+        "key_points": ["Budget is on track", "Demo moved"],
+    }
+
+    assert count_notes_items(notes) == 5
+    assert count_notes_items({"notes": notes, "metadata": {}}) == 5
+    assert count_notes_items((["a", "b"], [{"task": "a"}])) == 2
+    assert count_notes_items(["a"]) == 1
+    result = SimpleNamespace(action_items=["a"], decisions=[], key_points=["b"])
+    assert count_notes_items(result) == 2
+    assert count_notes_items("summary text") is None
+
+
+def test_run_times_passes_in_order_and_reports_metrics():
+    profiler = NotesPassProfiler()
+
+    profiler.run("drop_first", lambda items: items[1:], ["a", "b", "c"])
+    profiler.run("keep", lambda items: items, items=["a"])
+    profiler.run("drop_first", lambda items: items[1:], ["a", "b"])
+
+    profile = profiler.as_dict()
+    assert list(profile) == ["drop_first", "keep"]
+    assert profile["drop_first"]["calls"] == 2
+    assert (profile["drop_first"]["items_in"], profile["drop_first"]["items_out"]) == (2, 1)
+    assert (profile["keep"]["items_in"], profile["keep"]["items_out"]) == (1, 1)
+    assert [line.rsplit(" ", 1)[0] for line in profiler.folded_stacks("L01")] == [
+        "L01;drop_first",
+        "L01;keep",
+    ]
+    assert any('pass="keep"' in line for line in NOTES_PASS_LATENCY.render_prometheus())
+    assert any(
+        'direction="out",pass="drop_first"' in line for line in NOTES_PASS_ITEMS.render_prometheus()
+    )
+
+
+def test_failing_pass_is_recorded_and_reraised():
+    profiler = NotesPassProfiler()
+
+    def broken(notes):
+        raise ValueError("bad notes")
+
+    with pytest.raises(ValueError, match="bad notes"):
+        profiler.run("broken", broken, {"key_points": ["a"]})
+
+    assert profiler.as_dict()["broken"]["items_in"] == 1
+    assert profiler.as_dict()["broken"]["items_out"] is None
+
+
+def test_recorded_passes_merge_across_jobs_and_keep_stage_timestamps():
+    meeting = SimpleNamespace(processing_timings={"notes_generation_started_at": "t0"})
+
+    record_notes_passes(meeting, {"generate": {"seconds": 0.5}, "quality_engine": {"seconds": 1}})
+    record_notes_passes(meeting, {"quality_engine": {"seconds": 2}, "llm_polish": {"seconds": 0}})
+
+    timings = meeting.processing_timings
+    assert timings["notes_generation_started_at"] == "t0"
+    assert timings["notes_passes"] == {
+        "generate": {"seconds": 0.5},
+        "quality_engine": {"seconds": 2},
+        "llm_polish": {"seconds": 0},
+    }
+    assert folded_stack_lines(timings["notes_passes"], "M01") == [
+        "M01;generate 500000",
+        "M01;quality_engine 2000000",
+        "M01;llm_polish 1",
+    ]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pytest
+
+from app.jobs import process_meeting as process_mod
+from app.services.notes_pass_profiler import NotesPassProfiler
+from app.services.notes_pass_runner import (
+    NotesPass,
+    NotesWorkspace,
+    parse_pass_order,
+    resolve_pass_order,
+    run_notes_passes,
+)
+
+
+def _drop_empty_key_points(workspace: NotesWorkspace) -> None:
+    workspace.set("key_points", [point for point in workspace.get("key_points") if point])
+
+
+def test_workspace_counts_only_real_changes():
+    workspace = NotesWorkspace({"key_points": ["a"], "summary": "s"})
+    workspace._writable = frozenset({"key_points"})
+
+    workspace.set("key_points", ["a"])
+    assert workspace.revision == 0
+
+    workspace.set("key_points", ["a", "b"])
+    workspace.touch("key_points")
+    assert workspace.revision == 2
+    assert workspace.changed_since(("key_points",), 1)
+    assert not workspace.changed_since(("summary",), 0)
+
+    with pytest.raises(ValueError, match="undeclared field 'summary'"):
+        workspace.set("summary", "other")
+
+
+def test_repeated_pass_is_skipped_until_its_inputs_change():
+    calls: list[str] = []
+
+    def counted(workspace: NotesWorkspace) -> None:
+        calls.append("drop")
+        _drop_empty_key_points(workspace)
+
+    def add_blank(workspace: NotesWorkspace) -> None:
+        workspace.set("key_points", [*workspace.get("key_points"), ""])
+
+    drop = NotesPass("drop", counted, reads=("key_points",), writes=("key_points",))
+    passes = (
+        drop,
+        NotesPass("drop_again", counted, reads=("key_points",), writes=("key_points",)),
+        NotesPass("summary", lambda workspace: workspace.set("summary", "x"), writes=("summary",)),
+        NotesPass("drop_after_summary", counted, reads=("key_points",), writes=("key_points",)),
+        NotesPass("add_blank", add_blank, reads=("key_points",), writes=("key_points",)),
+        NotesPass("drop_after_blank", counted, reads=("key_points",), writes=("key_points",)),
+    )
+    profiler = NotesPassProfiler()
+    workspace = NotesWorkspace({"key_points": ["a", ""], "summary": ""})
+
+    notes = run_notes_passes(workspace, passes, profiler=profiler)
+
+    # The first run changed key_points, so the second still runs; the third
+    # is skipped because only the summary changed since a no-op run.
+    assert calls == ["drop", "drop", "drop"]
+    assert notes == {"key_points": ["a"], "summary": "x"}
+    assert notes is workspace.notes
+    assert profiler.as_dict()["drop_after_summary"]["skipped"] == 1
+
+
+def test_when_gates_passes_on_context():
+    passes = (
+        NotesPass(
+            "qev3_only",
+            lambda workspace: workspace.set("summary", "qev3"),
+            writes=("summary",),
+            when=lambda context: context == "v3",
+        ),
+    )
+
+    assert run_notes_passes(NotesWorkspace({"summary": ""}, "v1"), passes) == {"summary": ""}
+    assert run_notes_passes(NotesWorkspace({"summary": ""}, "v3"), passes) == {"summary": "qev3"}
+
+
+def test_pass_order_is_config():
+    registry = {"drop": NotesPass("drop", _drop_empty_key_points)}
+
+    assert parse_pass_order(" drop, ,drop ") == ("drop", "drop")
+    assert resolve_pass_order(registry, ("drop",)) == (registry["drop"],)
+    with pytest.raises(ValueError, match="unknown notes passes: missing"):
+        resolve_pass_order(registry, ("drop", "missing"))
+
+
+def test_configured_notes_passes_split_at_quality_engine(monkeypatch):
+    monkeypatch.setenv(process_mod.NOTES_PASS_ORDER_ENV, "clean_action_items,quality_engine")
+    before, after = process_mod.configured_notes_passes()
+    assert [notes_pass.name for notes_pass in before] == ["clean_action_items"]
+    assert after == ()
+
+    monkeypatch.setenv(process_mod.NOTES_PASS_ORDER_ENV, "clean_action_items")
+    before, after = process_mod.configured_notes_passes()
+    default_before, default_after = process_mod._split_notes_pass_order(
+        process_mod.DEFAULT_NOTES_PASS_ORDER
+    )
+    assert (before, after) == (default_before, default_after)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from app.services import notes_rules
+from app.services.note_strategies.local_summary import (
+    CUE_PATTERNS,
+    TOPIC_PATTERNS,
+    sentence_topics,
+)
+from app.services.notes_rules import PhraseSet, RuleFamily, rule_family, rule_stats
+
+SENTENCES = [
+    "We decided the owner will follow up by Friday.",
+    "Let's review the demo backup and the runbook.",
+    "Nothing relevant here.",
+    "The next steps are due next week; we agreed.",
+]
+
+
+@pytest.fixture()
+def stats(monkeypatch):
+    monkeypatch.setattr(notes_rules, "_stats", {})
+    monkeypatch.setattr(notes_rules, "_rules", {})
+
+
+@pytest.mark.parametrize("sentence", SENTENCES)
+def test_family_matches_per_pattern_loops(sentence):
+    family = RuleFamily("test.cue", CUE_PATTERNS)
+    lowered = sentence.lower()
+    matching = [pattern for pattern in CUE_PATTERNS if re.search(pattern, lowered)]
+
+    assert family.search(lowered) is bool(matching)
+    assert family.count(lowered) == len(matching)
+
+
+def test_first_returns_match_in_declaration_order():
+    family = RuleFamily("test.due", (r"\bby (friday)\b", r"\b(friday|monday)\b"))
+
+    assert family.first("monday or by friday").group(0) == "by friday"
+    assert family.first("monday").group(1) == "monday"
+    assert family.first("someday") is None
+
+
+def test_patterns_with_backreferences_are_not_merged():
+    family = RuleFamily("test.repeat", (r"^(\w+) \1$", r"\bdemo\b"))
+
+    assert family.merged is None
+    assert family.search("go go") is True
+    assert family.search("demo day") is True
+
+
+def test_sentence_topics_unchanged():
+    for sentence in SENTENCES:
+        lowered = sentence.lower()
+        expected = {
+            topic
+            for topic, patterns in TOPIC_PATTERNS.items()
+            if any(re.search(pattern, lowered) for pattern in patterns)
+        }
+        assert sentence_topics(sentence) == expected
+
+
+def test_stats_count_hits_and_list_unused_rules(stats):
+    family = rule_family("test.verbs", (r"\bsend\b", r"\bship\b", r"\bfax\b"))
+
+    family.search("send it")
+    family.count("ship and send")
+
+    rows = {row["rule"]: row for row in rule_stats()}
+    assert rows["test.verbs[0]"]["calls"] == 2
+    assert rows["test.verbs[0]"]["hits"] == 2
+    assert rows["test.verbs[1]"]["hits"] == 1
+    assert rows["test.verbs[2]"]["hits"] == 0
+    assert rows["test.verbs[2]"]["pattern"] == r"\bfax\b"
+
+
+def test_phrase_set_reports_every_contained_phrase():
+    keywords = PhraseSet("test.cues", ("action item", "action", "owner", "action"))
+
+    assert keywords.phrases == ("action item", "action", "owner")
+    assert keywords.matches("the action item owner") == {0, 1, 2}
+    assert keywords.matches("no cues here") == frozenset()
+    assert keywords.search("assign an owner") is True
+    assert keywords.contains_all("action item for the owner") is True
+    assert keywords.contains_all("action only") is False
+
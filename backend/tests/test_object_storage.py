@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+from collections.abc import Iterator
+
+import pytest
+
+from app.services import object_storage
+from app.services.object_storage import (
+    ObjectStore,
+    S3ClientConfig,
+    clear_object_storage_clients,
+    minio_client,
+    s3_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test-access")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test-secret")
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    clear_object_storage_clients()
+    yield
+    clear_object_storage_clients()
+
+
+def test_s3_client_is_shared_per_configuration():
+    first = s3_client()
+    minio = S3ClientConfig(endpoint_url="http://minio:9000", use_ssl=False, path_style=True)
+
+    assert s3_client() is first
+    assert s3_client(minio) is s3_client(minio)
+    assert s3_client(minio) is not first
+
+
+def test_s3_client_uses_tuned_pool_and_retries(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv(object_storage.S3_MAX_POOL_CONNECTIONS_ENV, "64")
+    monkeypatch.setenv(object_storage.S3_MAX_ATTEMPTS_ENV, "not-a-number")
+
+    config = s3_client().meta.config
+
+    assert config.max_pool_connections == 64
+    assert config.retries["mode"] == "standard"
+    # botocore counts the first try too: max_attempts retries -> max_attempts + 1 calls.
+    assert config.retries["total_max_attempts"] == object_storage.DEFAULT_S3_MAX_ATTEMPTS + 1
+    assert config.tcp_keepalive is True
+
+
+def test_minio_client_is_shared():
+    pytest.importorskip("minio")
+
+    client = minio_client("minio:9000", "access", "secret", secure=False)
+
+    assert minio_client("minio:9000", "access", "secret", secure=False) is client
+    assert minio_client("minio:9000", "other", "secret", secure=False) is not client
+
+
+def test_get_to_file_streams_in_chunks_and_closes_body():
+    class FakeBody(io.BytesIO):
+        reads: list[int] = []
+
+        def read(self, size: int = -1) -> bytes:
+            self.reads.append(size)
+            return super().read(size)
+
+    body = FakeBody(b"abcdefghij" * 3)
+
+    class FakeS3:
+        def get_object(self, Bucket: str, Key: str):
+            assert (Bucket, Key) == ("bucket", "raw_media/call.mp3")
+            return {"Body": body}
+
+    destination = io.BytesIO()
+    written = ObjectStore("bucket", FakeS3()).get_to_file(
+        "raw_media/call.mp3",
+        destination,
+        chunk_bytes=10,
+    )
+
+    assert written == 30
+    assert destination.getvalue() == b"abcdefghij" * 3
+    assert set(body.reads) == {10}
+    assert body.closed
+
+
+def test_copy_is_a_managed_server_side_copy_within_the_bucket():
+    calls: list[tuple] = []
+
+    class FakeS3:
+        def copy(self, CopySource: dict, Bucket: str, Key: str, **kwargs) -> None:
+            calls.append((CopySource, Bucket, Key, kwargs))
+
+    config = object()
+    ObjectStore("bucket", FakeS3()).copy(
+        "raw_media/staging/1/a.mp3",
+        "raw_media/meeting_1.mp3",
+        transfer_config=config,
+    )
+
+    assert calls == [
+        (
+            {"Bucket": "bucket", "Key": "raw_media/staging/1/a.mp3"},
+            "bucket",
+            "raw_media/meeting_1.mp3",
+            {"Config": config},
+        )
+    ]
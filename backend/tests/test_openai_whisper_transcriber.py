@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 from typing import BinaryIO
 
+import pytest
+
 from app.services.transcription import openai_whisper
+from app.services.transcription.schemas import TranscriptionResult, TranscriptionSegment
 
 
 class _FakeTranscriptions:
@@ -132,3 +137,226 @@ def test_openai_whisper_chunks_long_audio_and_offsets_segments(
     assert result.duration_seconds == 5400.0
     assert [segment.start for segment in result.segments] == [1.0, 1801.0, 3601.0]
     assert [segment.end for segment in result.segments] == [2.0, 1802.0, 3602.0]
+
+
+class _LatencyTranscriptions:
+    """Thread-safe fake client that simulates per-chunk upload latency."""
+
+    def __init__(
+        self,
+        *,
+        latency_seconds: dict[str, float],
+        failing_chunks: set[str] | None = None,
+    ) -> None:
+        self.latency_seconds = latency_seconds
+        self.failing_chunks = failing_chunks or set()
+        self.calls: list[str] = []
+        self.completed: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create(
+        self,
+        *,
+        model: str,
+        file: BinaryIO,
+        response_format: str,
+    ) -> dict[str, object]:
+        del model, response_format
+
+        stem = Path(file.name).stem
+        with self._lock:
+            self.calls.append(stem)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            time.sleep(self.latency_seconds.get(stem, 0.0))
+            if stem in self.failing_chunks:
+                raise RuntimeError(f"provider failure for {stem}")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed.append(stem)
+
+        return {
+            "text": f"text for {stem}",
+            "language": "en",
+            "duration": 10.0,
+            "segments": [{"start": 1.0, "end": 2.0, "text": f"segment for {stem}"}],
+        }
+
+
+def _configure_long_audio(monkeypatch, *, chunk_count: int, concurrency: int) -> None:
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_RETRY_ATTEMPTS", "1")
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_RETRY_DELAY_SECONDS", "0")
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_CHUNK_THRESHOLD_SECONDS", "600")
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_CHUNK_SECONDS", "600")
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_CONCURRENCY", str(concurrency))
+    monkeypatch.setattr(
+        openai_whisper,
+        "_probe_audio_duration_seconds",
+        lambda audio_path: 600.0 * chunk_count,
+    )
+
+    def fake_write_audio_chunk(
+        *,
+        source_path: str | Path,
+        output_path: str | Path,
+        start_seconds: float,
+        duration_seconds: float,
+    ) -> None:
+        del source_path, start_seconds, duration_seconds
+        Path(output_path).write_bytes(b"fake chunk")
+
+    monkeypatch.setattr(openai_whisper, "_write_audio_chunk", fake_write_audio_chunk)
+
+
+def test_openai_whisper_concurrent_chunks_stitch_in_offset_order(tmp_path, monkeypatch):
+    audio_path = tmp_path / "meeting.mp3"
+    audio_path.write_bytes(b"fake audio")
+
+    # The first chunk is the slowest, so completion order differs from offset order.
+    transcriptions = _LatencyTranscriptions(
+        latency_seconds={
+            "chunk_0000": 0.30,
+            "chunk_0001": 0.05,
+            "chunk_0002": 0.10,
+            "chunk_0003": 0.05,
+            "chunk_0004": 0.05,
+            "chunk_0005": 0.05,
+        }
+    )
+    _patch_openai_client(monkeypatch, transcriptions)
+    _configure_long_audio(monkeypatch, chunk_count=6, concurrency=3)
+
+    transcriber = openai_whisper.OpenAIWhisperTranscriber()
+    started = time.perf_counter()
+    result = transcriber.transcribe(audio_path)
+    elapsed = time.perf_counter() - started
+
+    serial_seconds = sum(transcriptions.latency_seconds.values())
+    assert elapsed < serial_seconds
+    assert transcriptions.max_in_flight == 3
+    assert transcriptions.completed[0] != "chunk_0000"
+    assert [segment.start for segment in result.segments] == [
+        1.0 + 600.0 * index for index in range(6)
+    ]
+    assert result.text.split("\n\n") == [f"text for chunk_{index:04d}" for index in range(6)]
+    assert result.duration_seconds == 3600.0
+
+
+def test_openai_whisper_concurrency_one_keeps_serial_upload_order(tmp_path, monkeypatch):
+    audio_path = tmp_path / "meeting.mp3"
+    audio_path.write_bytes(b"fake audio")
+
+    transcriptions = _LatencyTranscriptions(latency_seconds={"chunk_0000": 0.05})
+    _patch_openai_client(monkeypatch, transcriptions)
+    _configure_long_audio(monkeypatch, chunk_count=3, concurrency=1)
+
+    transcriber = openai_whisper.OpenAIWhisperTranscriber()
+    transcriber.transcribe(audio_path)
+
+    assert transcriptions.max_in_flight == 1
+    assert transcriptions.calls == ["chunk_0000", "chunk_0001", "chunk_0002"]
+
+
+def test_openai_whisper_concurrent_chunk_failure_propagates(tmp_path, monkeypatch):
+    audio_path = tmp_path / "meeting.mp3"
+    audio_path.write_bytes(b"fake audio")
+
+    transcriptions = _LatencyTranscriptions(
+        latency_seconds={f"chunk_{index:04d}": 0.02 for index in range(8)},
+        failing_chunks={"chunk_0001"},
+    )
+    _patch_openai_client(monkeypatch, transcriptions)
+    _configure_long_audio(monkeypatch, chunk_count=8, concurrency=2)
+
+    transcriber = openai_whisper.OpenAIWhisperTranscriber()
+    with pytest.raises(RuntimeError, match="provider failure for chunk_0001"):
+        transcriber.transcribe(audio_path)
+
+    assert len(transcriptions.calls) < 8
+
+
+def _overlap_transcriber(monkeypatch, *, overlap: str) -> openai_whisper.OpenAIWhisperTranscriber:
+    _patch_openai_client(monkeypatch, _FakeTranscriptions())
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_CHUNK_SECONDS", "600")
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_CHUNK_OVERLAP_SECONDS", overlap)
+    return openai_whisper.OpenAIWhisperTranscriber()
+
+
+def _chunk(*segments: tuple[float, float, str]) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=" ".join(text for _, _, text in segments),
+        language="en",
+        duration_seconds=None,
+        segments=[TranscriptionSegment(start=s, end=e, text=t) for s, e, t in segments],
+        model_name="whisper-1",
+    )
+
+
+def test_openai_whisper_chunk_plan_extends_chunks_by_overlap(monkeypatch):
+    transcriber = _overlap_transcriber(monkeypatch, overlap="10")
+
+    assert transcriber._chunk_plan(1500.0) == [
+        (0, 0.0, 610.0),
+        (1, 600.0, 610.0),
+        (2, 1200.0, 300.0),
+    ]
+
+
+def test_openai_whisper_overlap_is_capped_at_half_a_chunk(monkeypatch):
+    transcriber = _overlap_transcriber(monkeypatch, overlap="900")
+
+    assert transcriber.chunk_overlap_seconds == 300.0
+
+
+def test_openai_whisper_overlap_stitching_drops_repeated_boundary_segments(monkeypatch):
+    transcriber = _overlap_transcriber(monkeypatch, overlap="10")
+
+    result = transcriber._combine_chunk_results(
+        [
+            (
+                0.0,
+                _chunk(
+                    (590.0, 598.0, "we agreed to ship on Friday"),
+                    (603.0, 607.0, "Dana owns the"),
+                ),
+            ),
+            (
+                600.0,
+                _chunk(
+                    (3.0, 7.0, "Dana owns the release notes"),
+                    (20.0, 25.0, "next topic is hiring"),
+                ),
+            ),
+        ],
+        duration_seconds=1200.0,
+    )
+
+    assert [segment.text for segment in result.segments] == [
+        "we agreed to ship on Friday",
+        "Dana owns the release notes",
+        "next topic is hiring",
+    ]
+    assert [segment.start for segment in result.segments] == [590.0, 603.0, 620.0]
+    assert result.text.count("Dana owns") == 1
+
+
+def test_openai_whisper_overlap_seam_keeps_fuller_copy_of_straddling_segment(monkeypatch):
+    transcriber = _overlap_transcriber(monkeypatch, overlap="10")
+
+    result = transcriber._combine_chunk_results(
+        [
+            (0.0, _chunk((596.0, 604.0, "the budget review moves to Thursday afternoon"))),
+            (600.0, _chunk((2.0, 9.0, "review moves to Thursday"), (8.0, 12.0, "thanks"))),
+        ],
+        duration_seconds=1200.0,
+    )
+
+    assert [segment.text for segment in result.segments] == [
+        "the budget review moves to Thursday afternoon",
+        "thanks",
+    ]
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.jobs import process_meeting as process_mod
+from app.models import Base
+from app.models.meeting import Meeting
+from app.models.meeting_notes import MeetingNotes
+from app.models.user import User
+from app.routers import meeting_notes_api
+from app.services.transcription.base import SegmentStream, Transcriber, stream_in_batches
+from app.services.transcription.partial_transcript import (
+    append_partial_transcript,
+    load_partial_transcript,
+    partial_transcript_count,
+)
+from app.services.transcription.schemas import TranscriptionResult, TranscriptionSegment
+
+
+@pytest.fixture()
+def db_session() -> Iterator[Session]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _segments(count: int) -> list[TranscriptionSegment]:
+    return [
+        TranscriptionSegment(start=float(index), end=float(index + 1), text=f"line {index}")
+        for index in range(count)
+    ]
+
+
+class _StreamingTranscriber(Transcriber):
+    def __init__(self, segments: list[TranscriptionSegment], on_yield=None) -> None:
+        self.segments = segments
+        self.on_yield = on_yield
+
+    def transcribe(self, audio_path: str | Path) -> TranscriptionResult:
+        raise AssertionError("process_meeting should stream")
+
+    def stream(self, audio_path: str | Path) -> SegmentStream:
+        for segment in self.segments:
+            if self.on_yield is not None:
+                self.on_yield()
+            yield segment
+
+        return TranscriptionResult(
+            text=" ".join(segment.text for segment in self.segments),
+            language="en",
+            duration_seconds=None,
+            segments=list(self.segments),
+            model_name="fake",
+        )
+
+
+class _BatchTranscriber(Transcriber):
+    def transcribe(self, audio_path: str | Path) -> TranscriptionResult:
+        return TranscriptionResult(
+            text="done",
+            language="en",
+            duration_seconds=None,
+            segments=_segments(3),
+            model_name="fake",
+        )
+
+
+def test_stream_in_batches_flushes_full_batches_then_remainder():
+    batches: list[list[str]] = []
+
+    result = stream_in_batches(
+        _StreamingTranscriber(_segments(5)).stream("meeting.ogg"),
+        lambda segments: batches.append([segment.text for segment in segments]),
+        batch_size=2,
+        flush_interval_seconds=3600,
+    )
+
+    assert batches == [["line 0", "line 1"], ["line 2", "line 3"], ["line 4"]]
+    assert len(result.segments) == 5
+
+
+def test_default_stream_yields_segments_after_transcribe():
+    batches: list[int] = []
+
+    result = stream_in_batches(
+        _BatchTranscriber().stream("meeting.ogg"),
+        lambda segments: batches.append(len(segments)),
+        batch_size=25,
+    )
+
+    assert batches == [3]
+    assert result.text == "done"
+
+
+def test_process_meeting_saves_partial_transcript_while_transcribing(
+    db_session: Session,
+    monkeypatch,
+):
+    meeting = Meeting(title="Streaming", status="PROCESSING")
+    db_session.add(meeting)
+    db_session.commit()
+
+    seen_counts: list[int] = []
+    added: list[int] = []
+    event.listen(db_session, "before_flush", lambda session, *_: added.append(len(session.new)))
+
+    def record_saved_count() -> None:
+        seen_counts.append(partial_transcript_count(db_session, meeting.id))
+
+    transcriber = _StreamingTranscriber(_segments(5), on_yield=record_saved_count)
+    monkeypatch.setattr(process_mod, "get_transcriber", lambda: transcriber)
+    monkeypatch.setattr(process_mod, "PARTIAL_TRANSCRIPT_BATCH_SIZE", 2)
+
+    result = process_mod._transcribe_with_partial_transcript(
+        db_session,
+        meeting,
+        Path("meeting.ogg"),
+        {},
+    )
+
+    assert seen_counts == [0, 0, 2, 2, 4]
+    assert len(result.segments) == 5
+    # Each flush inserts only its own batch.
+    assert [count for count in added if count] == [2, 2, 1]
+    assert [segment["text"] for segment in load_partial_transcript(db_session, meeting.id)] == [
+        f"line {index}" for index in range(5)
+    ]
+
+
+def _client(db_session: Session, user: User) -> TestClient:
+    app = FastAPI()
+    app.include_router(meeting_notes_api.router)
+
+    def override_get_db() -> Iterator[Session]:
+        yield db_session
+
+    app.dependency_overrides[meeting_notes_api._get_db] = override_get_db
+    app.dependency_overrides[meeting_notes_api.get_current_user] = lambda: user
+    return TestClient(app)
+
+
+def _create_user(db: Session) -> User:
+    user = User(
+        email="owner@example.com",
+        password_hash="not-used-in-test",
+        first_name="Test",
+        last_name="User",
+        organization_name="Test Org",
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_partial_transcript_endpoint_returns_segments_after_offset(db_session: Session):
+    user = _create_user(db_session)
+    meeting = Meeting(
+        title="Streaming",
+        user_id=user.id,
+        status="PROCESSING",
+        processing_stage="transcribing",
+    )
+    db_session.add(meeting)
+    db_session.commit()
+    append_partial_transcript(
+        db_session,
+        meeting.id,
+        0,
+        [
+            TranscriptionSegment(start=0.0, end=1.0, text="hello"),
+            TranscriptionSegment(start=1.0, end=2.0, text="world"),
+        ],
+    )
+    db_session.commit()
+
+    response = _client(db_session, user).get(
+        f"/v1/meetings/{meeting.id}/transcript/partial",
+        params={"after": 1},
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["complete"] is False
+    assert payload["segment_count"] == 2
+    assert payload["segments"] == [{"start": 1.0, "end": 2.0, "text": "world"}]
+    assert payload["processing_stage"] == "transcribing"
+
+
+def test_partial_transcript_endpoint_serves_final_transcript_once_notes_exist(
+    db_session: Session,
+):
+    user = _create_user(db_session)
+    meeting = Meeting(title="Done", user_id=user.id, status="DONE")
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.add(
+        MeetingNotes(
+            meeting_id=meeting.id,
+            raw_transcript={
+                "text": "hello",
+                "segments": [{"start": 0.0, "end": 1.0, "text": "hello"}],
+            },
+        )
+    )
+    db_session.commit()
+
+    payload = _client(db_session, user).get(f"/v1/meetings/{meeting.id}/transcript/partial").json()
+
+    assert payload["complete"] is True
+    assert payload["segments"] == [{"start": 0.0, "end": 1.0, "text": "hello"}]
+
+
+def test_partial_transcript_endpoint_hides_other_users_meetings(db_session: Session):
+    user = _create_user(db_session)
+    meeting = Meeting(title="Private", user_id=user.id + 1, status="PROCESSING")
+    db_session.add(meeting)
+    db_session.commit()
+
+    response = _client(db_session, user).get(f"/v1/meetings/{meeting.id}/transcript/partial")
+
+    assert response.status_code == 404
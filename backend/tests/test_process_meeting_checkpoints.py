@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.jobs import process_meeting as process_mod
+from app.models import Base
+from app.models.meeting import Meeting
+from app.models.meeting_notes import MeetingNotes
+from app.services.transcription.base import Transcriber
+from app.services.transcription.schemas import TranscriptionResult, TranscriptionSegment
+
+
+@pytest.fixture()
+def session_factory(monkeypatch) -> Iterator[sessionmaker]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(process_mod, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture()
+def calls(monkeypatch, tmp_path) -> Counter:
+    calls: Counter = Counter()
+
+    def prepare_audio(db, meeting, raw_media_path, log_extra) -> Path:
+        calls["audio"] += 1
+        path = tmp_path / f"audio-{calls['audio']}.ogg"
+        path.write_bytes(b"normalized")
+        return path
+
+    class FakeTranscriber(Transcriber):
+        def transcribe(self, audio_path: str | Path) -> TranscriptionResult:
+            calls["transcribe"] += 1
+            return TranscriptionResult(
+                text="Dana will send the budget by Friday.",
+                language="en",
+                duration_seconds=60.0,
+                segments=[TranscriptionSegment(0.0, 4.0, "Dana will send the budget by Friday.")],
+                model_name="fake",
+            )
+
+    def slide_text(*, db, meeting_id) -> str:
+        calls["slides"] += 1
+        return "Slide: budget"
+
+    def generate_notes(payload: dict) -> dict:
+        calls["notes"] += 1
+        assert payload["slide_text"] == "Slide: budget"
+        return {
+            "summary": "Budget review.",
+            "key_points": ["Budget is on track"],
+            "action_items": ["Dana - Send the budget (due: Friday)"],
+            "model_version": "test-model",
+        }
+
+    def quality_engine(notes, transcript_text, *, mode, document=None):
+        calls["quality_engine"] += 1
+        return {"notes": notes, "metadata": {"mode": mode, "applied": False}}
+
+    monkeypatch.setenv("MEETIQ_TRANSCRIPTION_CACHE", "0")
+    monkeypatch.setattr(process_mod, "_prepare_meeting_audio", prepare_audio)
+    monkeypatch.setattr(process_mod, "get_transcriber", lambda: FakeTranscriber())
+    monkeypatch.setattr(process_mod, "extract_slide_text_for_meeting", slide_text)
+    monkeypatch.setattr(process_mod.settings, "NOTES_STRATEGY", "local_rules", raising=False)
+    monkeypatch.setattr(process_mod, "generate_meeting_notes", generate_notes)
+    monkeypatch.setattr(process_mod, "_run_selected_quality_engine", quality_engine)
+    return calls
+
+
+def _create_meeting(factory: sessionmaker, *, media_sha256: str = "a" * 64) -> int:
+    with factory() as db:
+        meeting = Meeting(
+            title="Checkpoints",
+            raw_media_path="/tmp/meeting.mp4",
+            media_sha256=media_sha256,
+            status="PROCESSING",
+        )
+        db.add(meeting)
+        db.commit()
+        return meeting.id
+
+
+def _fail_once_at_finalize(monkeypatch) -> None:
+    original = process_mod._model_version_with_quality_engine_suffix
+    state = {"failed": False}
+
+    def flaky(*args, **kwargs):
+        if not state["failed"]:
+            state["failed"] = True
+            raise RuntimeError("database hiccup during finalize")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(process_mod, "_model_version_with_quality_engine_suffix", flaky)
+
+
+def test_retry_resumes_after_last_checkpointed_stage(session_factory, calls, monkeypatch):
+    meeting_id = _create_meeting(session_factory)
+    _fail_once_at_finalize(monkeypatch)
+
+    with pytest.raises(RuntimeError, match="database hiccup"):
+        process_mod.process_meeting(str(meeting_id))
+
+    with session_factory() as db:
+        meeting = db.get(Meeting, meeting_id)
+        assert meeting.status == "ERROR"
+        assert set(meeting.processing_checkpoints) == {
+            "media_sha256",
+            "transcribing",
+            "generating_notes",
+            "quality_engine",
+        }
+
+    process_mod.process_meeting(str(meeting_id))
+
+    assert calls == Counter(audio=1, transcribe=1, slides=1, notes=1, quality_engine=1)
+    with session_factory() as db:
+        meeting = db.get(Meeting, meeting_id)
+        assert meeting.status == "DONE"
+        assert meeting.processing_checkpoints is None
+        notes = db.query(MeetingNotes).filter(MeetingNotes.meeting_id == meeting_id).one()
+        assert notes.raw_transcript["text"] == "Dana will send the budget by Friday."
+        assert notes.raw_transcript["slide_text"] == "Slide: budget"
+        assert notes.summary
+
+
+def test_checkpoints_from_previous_upload_are_ignored(session_factory, calls, monkeypatch):
+    meeting_id = _create_meeting(session_factory)
+    _fail_once_at_finalize(monkeypatch)
+
+    with pytest.raises(RuntimeError):
+        process_mod.process_meeting(str(meeting_id))
+
+    with session_factory() as db:
+        meeting = db.get(Meeting, meeting_id)
+        meeting.media_sha256 = "b" * 64
+        db.commit()
+
+    process_mod.process_meeting(str(meeting_id))
+
+    assert calls == Counter(audio=2, transcribe=2, slides=2, notes=2, quality_engine=2)
+
+
+def test_staged_jobs_hand_off_through_checkpoints(session_factory, calls):
+    meeting_id = _create_meeting(session_factory)
+
+    process_mod.transcribe_meeting_stage(str(meeting_id))
+
+    with session_factory() as db:
+        meeting = db.get(Meeting, meeting_id)
+        assert meeting.status == "PROCESSING"
+        assert meeting.processing_stage == "transcribing"
+        assert set(meeting.processing_checkpoints) == {"media_sha256", "transcribing"}
+    assert calls == Counter(audio=1, transcribe=1)
+
+    process_mod.generate_notes_stage(str(meeting_id))
+
+    with session_factory() as db:
+        meeting = db.get(Meeting, meeting_id)
+        assert meeting.status == "PROCESSING"
+        assert "quality_engine" in meeting.processing_checkpoints
+        assert db.query(MeetingNotes).count() == 0
+
+    process_mod.finalize_notes_stage(str(meeting_id))
+
+    assert calls == Counter(audio=1, transcribe=1, slides=1, notes=1, quality_engine=1)
+    with session_factory() as db:
+        meeting = db.get(Meeting, meeting_id)
+        assert meeting.status == "DONE"
+        assert meeting.processing_attempts == 1
+        assert db.query(MeetingNotes).filter(MeetingNotes.meeting_id == meeting_id).count() == 1
+        # Each staged job profiles its own passes; the records are merged.
+        passes = meeting.processing_timings["notes_passes"]
+        assert {"generate_meeting_notes", "quality_engine", "align_action_items"} <= set(passes)
+        assert passes["quality_engine"]["calls"] == 1
+
+
+def test_finalize_stage_does_not_rerun_passes_before_quality_engine(
+    session_factory, calls, monkeypatch
+):
+    original = process_mod._finalize_persisted_action_contract
+    contract_calls: list[int] = []
+
+    def counted(**kwargs):
+        contract_calls.append(1)
+        return original(**kwargs)
+
+    monkeypatch.setattr(process_mod, "_finalize_persisted_action_contract", counted)
+    meeting_id = _create_meeting(session_factory)
+
+    process_mod.transcribe_meeting_stage(str(meeting_id))
+    process_mod.generate_notes_stage(str(meeting_id))
+    process_mod.finalize_notes_stage(str(meeting_id))
+
+    assert len(contract_calls) == 1
+    with session_factory() as db:
+        notes = db.query(MeetingNotes).filter(MeetingNotes.meeting_id == meeting_id).one()
+        assert notes.summary == "Budget review"
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from app.jobs import process_meeting as process_mod
+
+
+class _TrackingBody(io.BytesIO):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.read_sizes: list[int] = []
+        self.closed_by_caller = False
+
+    def read(self, size: int | None = -1) -> bytes:  # type: ignore[override]
+        self.read_sizes.append(-1 if size is None else size)
+        return super().read(size)
+
+    def close(self) -> None:
+        self.closed_by_caller = True
+        super().close()
+
+
+class _FakeS3Client:
+    def __init__(self, body: _TrackingBody) -> None:
+        self.body = body
+        self.calls: list[tuple[str, str]] = []
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict[str, object]:
+        self.calls.append((Bucket, Key))
+        return {"Body": self.body}
+
+
+def test_download_streams_s3_object_in_fixed_size_chunks(monkeypatch):
+    payload = b"a" * 25
+    body = _TrackingBody(payload)
+    client = _FakeS3Client(body)
+    monkeypatch.setattr(process_mod, "_s3_client", lambda: client)
+    monkeypatch.setattr(process_mod, "RAW_MEDIA_DOWNLOAD_CHUNK_BYTES", 10)
+
+    path = process_mod._download_raw_media_to_tempfile("s3://bucket/raw_media/meeting_7.m4a")
+    try:
+        assert client.calls == [("bucket", "raw_media/meeting_7.m4a")]
+        assert path.suffix == ".m4a"
+        assert path.read_bytes() == payload
+        assert body.read_sizes and set(body.read_sizes) == {10}
+        assert body.closed_by_caller
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def test_download_copies_local_media_to_separate_temp_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(process_mod, "RAW_MEDIA_DOWNLOAD_CHUNK_BYTES", 4)
+    source = tmp_path / "meeting_3.mp4"
+    source.write_bytes(b"fake mp4 payload")
+
+    path = process_mod._download_raw_media_to_tempfile(str(source))
+    try:
+        assert path != source
+        assert path.suffix == ".mp4"
+        assert path.read_bytes() == b"fake mp4 payload"
+    finally:
+        path.unlink(missing_ok=True)
+
+    assert source.exists()
+
+
+def test_download_rejects_missing_local_media(tmp_path):
+    with pytest.raises(RuntimeError, match="Raw media file not found"):
+        process_mod._download_raw_media_to_tempfile(str(tmp_path / "missing.mp4"))
+
+
+def test_download_rejects_invalid_s3_path():
+    with pytest.raises(RuntimeError, match="Invalid S3 raw_media_path"):
+        process_mod._download_raw_media_to_tempfile("s3://bucket-only")
@@ -18,6 +18,7 @@ def test_selected_quality_engine_routes_v3(monkeypatch: Any) -> None:
         transcript_text: str | None,
         *,
         mode: str,
+        document: Any = None,
     ) -> dict[str, Any]:
         calls["v3"] = {
             "notes": notes,
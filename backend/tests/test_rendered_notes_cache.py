@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base
+from app.models.meeting import Meeting
+from app.models.meeting_notes import MeetingNotes
+from app.models.user import User
+from app.routers import meeting_notes_api
+from app.services.rendered_notes_cache import RenderedNotesCache, rendered_notes_cache
+
+
+@pytest.fixture()
+def client() -> Iterator[tuple[TestClient, Session, Meeting]]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    user = User(
+        email="owner@example.com",
+        password_hash="not-used-in-test",
+        first_name="Test",
+        last_name="User",
+        organization_name="Test Org",
+    )
+    db.add(user)
+    db.commit()
+    meeting = Meeting(title="Budget review", user_id=user.id, status="DONE")
+    db.add(meeting)
+    db.commit()
+    db.add(
+        MeetingNotes(
+            meeting_id=meeting.id,
+            summary="Budget review.",
+            summary_slots={"purpose": "Review the budget", "next_steps": ["Send the deck."]},
+            key_points=["Budget is on track"],
+            action_items=["Dana - Send the deck"],
+            decisions=["Ship on Friday"],
+            model_version="local-summary-v3",
+        )
+    )
+    db.commit()
+
+    app = FastAPI()
+    app.include_router(meeting_notes_api.router)
+    app.dependency_overrides[meeting_notes_api._get_db] = lambda: db
+    app.dependency_overrides[meeting_notes_api.get_current_user] = lambda: user
+
+    rendered_notes_cache().clear()
+    try:
+        yield TestClient(app), db, meeting
+    finally:
+        rendered_notes_cache().clear()
+        db.close()
+
+
+def test_repeated_reads_are_served_from_cache(client):
+    test_client, _, meeting = client
+    cache = rendered_notes_cache()
+
+    first = test_client.get(f"/v1/meetings/{meeting.id}/notes/ai").json()
+    second = test_client.get(f"/v1/meetings/{meeting.id}/notes/ai").json()
+    first_md = test_client.get(f"/v1/meetings/{meeting.id}/notes.md").text
+    second_md = test_client.get(f"/v1/meetings/{meeting.id}/notes.md").text
+
+    assert second == first
+    assert second_md == first_md
+    assert first_md.startswith("# Budget review\n\n## Purpose\nReview the budget\n")
+    assert (cache.misses, cache.hits) == (2, 2)
+
+
+def test_edit_bumps_revision_and_replaces_cached_rendering(client):
+    test_client, db, meeting = client
+    test_client.get(f"/v1/meetings/{meeting.id}/notes/ai")
+    test_client.get(f"/v1/meetings/{meeting.id}/notes.md")
+
+    edited = test_client.patch(
+        f"/v1/meetings/{meeting.id}/notes/ai",
+        json={"section": "key_points", "value": ["Budget moved to Q3"]},
+    ).json()
+    markdown = test_client.get(f"/v1/meetings/{meeting.id}/notes.md").text
+
+    assert edited["key_points"] == ["Budget moved to Q3"]
+    assert "- Budget moved to Q3" in markdown
+    assert "Budget is on track" not in markdown
+    assert db.query(MeetingNotes).one().revision == 2
+    assert len(rendered_notes_cache()) == 2
+
+
+def test_markdown_title_is_not_cached(client):
+    test_client, db, meeting = client
+    test_client.get(f"/v1/meetings/{meeting.id}/notes.md")
+
+    meeting.title = "Renamed review"
+    db.commit()
+
+    assert test_client.get(f"/v1/meetings/{meeting.id}/notes.md").text.startswith(
+        "# Renamed review\n\n"
+    )
+
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = RenderedNotesCache(maxsize=2)
+
+    cache.get_or_render((1, "json"), lambda: "one")
+    cache.get_or_render((2, "json"), lambda: "two")
+    cache.get_or_render((1, "json"), lambda: "unused")
+    cache.get_or_render((3, "json"), lambda: "three")
+
+    assert cache.get_or_render((1, "json"), lambda: "again") == "one"
+    assert cache.get_or_render((2, "json"), lambda: "rendered") == "rendered"
+    cache.invalidate(1)
+    assert cache.get_or_render((1, "json"), lambda: "fresh") == "fresh"
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base
+from app.models.meeting import Meeting
+from app.models.upload_session import UploadSession, UploadSessionPart
+from app.models.user import User
+from app.routers import meeting_notes_api
+from app.services.resumable_upload import DEFAULT_UPLOAD_SESSION_TTL_SECONDS, expire_upload_sessions
+
+PAYLOAD = b"0123456789" * 2 + b"abcde"
+PART_BYTES = 10
+
+
+@pytest.fixture()
+def resumable(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> Iterator[tuple[TestClient, Session, Meeting]]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    user = User(
+        email="owner@example.com",
+        password_hash="not-used-in-test",
+        first_name="Test",
+        last_name="User",
+        organization_name="Test Org",
+    )
+    db.add(user)
+    db.commit()
+    meeting = Meeting(title="Resumable upload meeting", user_id=user.id, status="new")
+    db.add(meeting)
+    db.commit()
+    db.refresh(meeting)
+
+    monkeypatch.delenv("STORAGE_BACKEND", raising=False)
+    monkeypatch.setattr(meeting_notes_api, "UPLOAD_DIR", tmp_path / "uploads")
+    monkeypatch.setattr(meeting_notes_api, "UPLOAD_SESSION_PART_BYTES", PART_BYTES)
+    for name in ("enforce_free_trial_upload_limit", "enforce_free_trial_duration_limit"):
+        monkeypatch.setattr(meeting_notes_api, name, lambda **kwargs: None)
+    monkeypatch.setattr(meeting_notes_api, "record_upload_ledger_entry", lambda **kwargs: None)
+    monkeypatch.setattr(meeting_notes_api, "probe_media_file_duration_seconds", lambda path: 60.0)
+    monkeypatch.setattr(
+        meeting_notes_api,
+        "enqueue_process_meeting",
+        lambda meeting_id: SimpleNamespace(id=f"job-{meeting_id}"),
+    )
+
+    app = FastAPI()
+    app.include_router(meeting_notes_api.router)
+    app.dependency_overrides[meeting_notes_api._get_db] = lambda: db
+    app.dependency_overrides[meeting_notes_api.get_current_user] = lambda: user
+    try:
+        yield TestClient(app), db, meeting
+    finally:
+        db.close()
+
+
+def _part(number: int) -> bytes:
+    return PAYLOAD[(number - 1) * PART_BYTES : number * PART_BYTES]
+
+
+def _put_part(client: TestClient, base: str, number: int, data: bytes | None = None):
+    data = _part(number) if data is None else data
+    return client.put(
+        f"{base}/parts/{number}",
+        content=data,
+        headers={"X-Part-Sha256": hashlib.sha256(data).hexdigest()},
+    )
+
+
+def _start(client: TestClient, meeting: Meeting) -> str:
+    response = client.post(
+        f"/v1/meetings/{meeting.id}/upload-sessions",
+        json={"filename": "call.mp3", "content_type": "audio/mpeg", "size_bytes": len(PAYLOAD)},
+    )
+    assert response.status_code == 200
+    assert response.json()["part_count"] == 3
+    return f"/v1/meetings/{meeting.id}/upload-sessions/{response.json()['session_id']}"
+
+
+def test_resumable_upload_reports_offsets_and_stitches_parts(resumable, tmp_path: Path):
+    client, db, meeting = resumable
+    base = _start(client, meeting)
+
+    assert _put_part(client, base, 2).status_code == 200
+    assert _put_part(client, base, 1).status_code == 200
+    status = client.get(base).json()
+
+    assert [part["offset"] for part in status["received_parts"]] == [0, 10]
+    assert status["received_bytes"] == 20
+    assert status["missing_parts"] == [3]
+    assert status["next_offset"] == 20
+
+    assert _put_part(client, base, 3).status_code == 200
+    response = client.post(f"{base}/complete")
+
+    assert response.status_code == 200
+    stored = tmp_path / "uploads" / f"meeting_{meeting.id}.mp3"
+    assert stored.read_bytes() == PAYLOAD
+    staging = tmp_path / "uploads" / "staging" / str(meeting.id)
+    assert [path.name for path in staging.iterdir()] == [".sessions"]
+    assert list((staging / ".sessions").iterdir()) == []
+    db.refresh(meeting)
+    assert meeting.raw_media_path == str(stored)
+    assert meeting.media_size_bytes == len(PAYLOAD)
+    assert meeting.media_sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+    assert client.get(base).json()["status"] == "completed"
+
+
+def test_part_with_bad_checksum_or_size_is_not_recorded(resumable):
+    client, _, meeting = resumable
+    base = _start(client, meeting)
+
+    bad_checksum = client.put(
+        f"{base}/parts/1",
+        content=_part(1),
+        headers={"X-Part-Sha256": hashlib.sha256(b"other").hexdigest()},
+    )
+    short_part = _put_part(client, base, 1, data=b"01234")
+    out_of_range = _put_part(client, base, 4, data=b"x")
+
+    assert bad_checksum.status_code == 400
+    assert "checksum mismatch" in bad_checksum.json()["detail"]
+    assert short_part.status_code == 400
+    assert out_of_range.status_code == 400
+    assert client.get(base).json()["received_parts"] == []
+
+
+def test_complete_with_missing_parts_is_rejected(resumable):
+    client, db, meeting = resumable
+    base = _start(client, meeting)
+    _put_part(client, base, 1)
+
+    response = client.post(f"{base}/complete")
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["missing_parts"] == [2, 3]
+    db.refresh(meeting)
+    assert meeting.raw_media_path is None
+
+
+def test_resumable_upload_uses_s3_multipart(resumable, monkeypatch: pytest.MonkeyPatch):
+    client, db, meeting = resumable
+    calls: list[tuple[str, dict]] = []
+
+    class FakeS3:
+        def create_multipart_upload(self, **kwargs):
+            calls.append(("create", kwargs))
+            return {"UploadId": "upload-1"}
+
+        def upload_part(self, **kwargs):
+            calls.append(("part", {**kwargs, "Body": bytes(kwargs["Body"])}))
+            return {"ETag": f'"etag-{kwargs["PartNumber"]}"'}
+
+        def complete_multipart_upload(self, **kwargs):
+            calls.append(("complete", kwargs))
+
+        def copy(self, CopySource, Bucket, Key, Config=None):
+            calls.append(("copy", {"CopySource": CopySource, "Bucket": Bucket, "Key": Key}))
+
+        def delete_object(self, **kwargs):
+            calls.append(("delete", kwargs))
+
+    class FakeStorage:
+        def sign_url(self, key: str, expires: int = 3600) -> str:
+            return f"https://storage.test/{key}"
+
+    probed: list[str] = []
+    monkeypatch.setenv("STORAGE_BACKEND", "s3")
+    monkeypatch.setenv("S3_BUCKET", "test-bucket")
+    monkeypatch.setattr(meeting_notes_api, "_s3_client", lambda: FakeS3())
+    monkeypatch.setattr(meeting_notes_api, "S3Storage", FakeStorage)
+    monkeypatch.setattr(
+        meeting_notes_api,
+        "probe_media_file_duration_seconds",
+        lambda path: probed.append(path) or 60.0,
+    )
+
+    base = _start(client, meeting)
+    for number in (1, 3, 2, 3):
+        assert _put_part(client, base, number).status_code == 200
+    response = client.post(f"{base}/complete")
+
+    key = f"raw_media/meeting_{meeting.id}.mp3"
+    staged_key = f"raw_media/staging/{meeting.id}/{base.rsplit('/', 1)[-1]}.mp3"
+    assert response.status_code == 200
+    assert [name for name, _ in calls] == [
+        "create",
+        "part",
+        "part",
+        "part",
+        "complete",
+        "copy",
+        "delete",
+    ]
+    assert {kwargs["Key"] for name, kwargs in calls if name != "copy"} == {staged_key}
+    assert [kwargs["Body"] for name, kwargs in calls if name == "part"] == [
+        _part(1),
+        _part(3),
+        _part(2),
+    ]
+    assert calls[4][1]["MultipartUpload"]["Parts"] == [
+        {"ETag": '"etag-1"', "PartNumber": 1},
+        {"ETag": '"etag-2"', "PartNumber": 2},
+        {"ETag": '"etag-3"', "PartNumber": 3},
+    ]
+    assert calls[5][1] == {
+        "CopySource": {"Bucket": "test-bucket", "Key": staged_key},
+        "Bucket": "test-bucket",
+        "Key": key,
+    }
+    assert probed == [f"https://storage.test/{staged_key}"]
+    db.refresh(meeting)
+    assert meeting.raw_media_path == f"s3://test-bucket/{key}"
+    assert meeting.media_sha256 is None
+
+
+def test_rejected_session_deletes_only_its_staged_recording(
+    resumable,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    client, db, meeting = resumable
+    stored = tmp_path / "uploads" / f"meeting_{meeting.id}.mp3"
+    stored.parent.mkdir(parents=True)
+    stored.write_bytes(b"current recording")
+    meeting.raw_media_path = str(stored)
+    db.commit()
+
+    def reject(**kwargs):
+        raise HTTPException(status_code=400, detail="We couldn't detect the recording duration.")
+
+    monkeypatch.setattr(meeting_notes_api, "enforce_free_trial_duration_limit", reject)
+    first, second = _start(client, meeting), _start(client, meeting)
+    for number in (1, 2, 3):
+        _put_part(client, first, number)
+        _put_part(client, second, number)
+
+    response = client.post(f"{first}/complete")
+
+    staging = tmp_path / "uploads" / "staging" / str(meeting.id)
+    assert response.status_code == 400
+    assert client.get(first).json()["status"] == "rejected"
+    assert not (staging / f"{first.rsplit('/', 1)[-1]}.mp3").exists()
+    assert stored.read_bytes() == b"current recording"
+    db.refresh(meeting)
+    assert meeting.raw_media_path == str(stored)
+
+    monkeypatch.setattr(meeting_notes_api, "enforce_free_trial_duration_limit", lambda **k: None)
+    assert client.post(f"{second}/complete").status_code == 200
+    assert stored.read_bytes() == PAYLOAD
+
+
+def _backdate(db: Session, base: str, seconds: int) -> UploadSession:
+    upload_session = db.get(UploadSession, base.rsplit("/", 1)[-1])
+    upload_session.created_at = datetime.now(timezone.utc) - timedelta(seconds=seconds)
+    db.commit()
+    return upload_session
+
+
+def test_expired_session_stops_accepting_parts(resumable):
+    client, db, meeting = resumable
+    base = _start(client, meeting)
+    _backdate(db, base, DEFAULT_UPLOAD_SESSION_TTL_SECONDS + 60)
+
+    assert _put_part(client, base, 1).status_code == 410
+    assert client.post(f"{base}/complete").status_code == 410
+
+
+def test_sweep_releases_expired_sessions_and_deletes_their_rows(resumable, tmp_path: Path):
+    client, db, meeting = resumable
+    expired, fresh = _start(client, meeting), _start(client, meeting)
+    for base in (expired, fresh):
+        assert _put_part(client, base, 1).status_code == 200
+    expired_id = _backdate(db, expired, DEFAULT_UPLOAD_SESSION_TTL_SECONDS + 60).id
+
+    assert expire_upload_sessions(db) == 1
+
+    sessions_dir = tmp_path / "uploads" / "staging" / str(meeting.id) / ".sessions"
+    assert not (sessions_dir / expired_id).exists()
+    assert (sessions_dir / fresh.rsplit("/", 1)[-1]).exists()
+    assert db.get(UploadSession, expired_id) is None
+    assert db.query(UploadSessionPart).filter_by(session_id=expired_id).count() == 0
+    assert client.get(fresh).status_code == 200
+
+
+def test_sweep_aborts_expired_s3_multipart_uploads(resumable):
+    _, db, meeting = resumable
+    aborted: list[dict] = []
+    old = datetime.now(timezone.utc) - timedelta(seconds=DEFAULT_UPLOAD_SESSION_TTL_SECONDS + 60)
+
+    class FakeS3:
+        def abort_multipart_upload(self, **kwargs):
+            aborted.append(kwargs)
+
+    for session_id, status in (("open-1", "open"), ("done-1", "completed")):
+        db.add(
+            UploadSession(
+                id=session_id,
+                meeting_id=meeting.id,
+                original_filename="call.mp3",
+                total_size_bytes=len(PAYLOAD),
+                part_size_bytes=PART_BYTES,
+                storage_key=f"s3://test-bucket/raw_media/staging/{session_id}.mp3",
+                s3_upload_id=f"upload-{session_id}",
+                status=status,
+                created_at=old,
+            )
+        )
+    db.commit()
+
+    assert expire_upload_sessions(db, s3_client=FakeS3()) == 2
+    assert aborted == [
+        {
+            "Bucket": "test-bucket",
+            "Key": "raw_media/staging/open-1.mp3",
+            "UploadId": "upload-open-1",
+        }
+    ]
+    assert db.query(UploadSession).count() == 0
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from app.services import long_transcript_sections
+from app.services.long_transcript_sections import (
+    build_long_transcript_coverage_metadata,
+    build_long_transcript_section_metadata,
+    split_transcript_sections,
+)
+from app.services.notes_quality_pass import _extract_sentences
+from app.services.quality_engine_v3 import run_quality_engine_v3
+from app.services.transcript_document import TranscriptDocument, split_text
+
+SECTIONED_TRANSCRIPT = "\n".join(
+    f"Dana: Section {number}: Part {number}\nWe agreed to ship part {number}. Lee will test it."
+    for number in range(1, 6)
+)
+
+
+def test_document_computes_each_split_once():
+    calls: list[str] = []
+
+    def split(text: str) -> list[str]:
+        calls.append(text)
+        return text.split(". ")
+
+    text = "One. Two. Three"
+    document = TranscriptDocument(text)
+
+    first = split_text(text, split, document)
+    first.append("caller mutation")
+    second = split_text(text, split, document)
+
+    assert calls == [text]
+    assert second == ["One", "Two", "Three"]
+
+
+def test_other_texts_are_split_directly():
+    calls: list[str] = []
+
+    def split(text: str) -> list[str]:
+        calls.append(text)
+        return [text]
+
+    document = TranscriptDocument("whole transcript")
+    split_text("fragment", split, document)
+    split_text("fragment", split, None)
+
+    assert calls == ["fragment", "fragment"]
+
+
+def test_section_helpers_share_the_document_sections(monkeypatch):
+    calls: list[str | None] = []
+
+    def counting_split(text: str | None):
+        calls.append(text)
+        return split_transcript_sections(text)
+
+    monkeypatch.setattr(long_transcript_sections, "split_transcript_sections", counting_split)
+    document = TranscriptDocument(SECTIONED_TRANSCRIPT)
+
+    sections = build_long_transcript_section_metadata(SECTIONED_TRANSCRIPT, document=document)
+    coverage = build_long_transcript_coverage_metadata(SECTIONED_TRANSCRIPT, document=document)
+    run_quality_engine_v3({"summary_slots": {}}, SECTIONED_TRANSCRIPT, document=document)
+
+    assert sections["section_count"] == 5
+    assert coverage["coverage_section_indices"] == [1, 3, 5]
+    # Split once, by the document, for all three callers.
+    assert calls == [SECTIONED_TRANSCRIPT]
+
+
+def test_passes_give_the_same_results_with_the_document():
+    document = TranscriptDocument(SECTIONED_TRANSCRIPT)
+
+    assert split_text(SECTIONED_TRANSCRIPT, _extract_sentences, document) == _extract_sentences(
+        SECTIONED_TRANSCRIPT
+    )
+    assert run_quality_engine_v3(
+        {"summary_slots": {}}, SECTIONED_TRANSCRIPT, document=document
+    ) == run_quality_engine_v3({"summary_slots": {}}, SECTIONED_TRANSCRIPT)
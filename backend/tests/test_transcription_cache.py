@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.jobs import process_meeting as process_mod
+from app.models import Base
+from app.models.meeting import Meeting
+from app.models.transcription_cache import TranscriptionCacheEntry
+from app.services.transcription.base import Transcriber
+from app.services.transcription.cache import transcription_cache_key
+from app.services.transcription.factory import configured_transcriber_identity
+from app.services.transcription.schemas import TranscriptionResult, TranscriptionSegment
+
+
+@pytest.fixture()
+def db_session() -> Iterator[Session]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class _CountingTranscriber(Transcriber):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def transcribe(self, audio_path: str | Path) -> TranscriptionResult:
+        self.calls.append(str(audio_path))
+        return TranscriptionResult(
+            text="hello world",
+            language="en",
+            duration_seconds=12.0,
+            segments=[TranscriptionSegment(start=0.0, end=1.5, text="hello world")],
+            model_name="whisper-1",
+        )
+
+
+@pytest.fixture()
+def transcriber(monkeypatch) -> _CountingTranscriber:
+    fake = _CountingTranscriber()
+    monkeypatch.setattr(process_mod, "get_transcriber", lambda: fake)
+    monkeypatch.setenv("TRANSCRIPTION_PROVIDER", "openai")
+    for name in (
+        "OPENAI_TRANSCRIPTION_MODEL",
+        "OPENAI_TRANSCRIPTION_CHUNK_THRESHOLD_SECONDS",
+        "OPENAI_TRANSCRIPTION_CHUNK_SECONDS",
+        "OPENAI_TRANSCRIPTION_CHUNK_OVERLAP_SECONDS",
+        "TRANSCRIPTION_VAD_THRESHOLD_DB",
+        "TRANSCRIPTION_VAD_MIN_SILENCE_SECONDS",
+        "TRANSCRIPTION_VAD_PADDING_SECONDS",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.delenv("TRANSCRIPTION_VAD", raising=False)
+    monkeypatch.delenv("MEETIQ_TRANSCRIPTION_CACHE", raising=False)
+    return fake
+
+
+def _meeting(db: Session, **kwargs) -> Meeting:
+    meeting = Meeting(title="Cache", status="PROCESSING", **kwargs)
+    db.add(meeting)
+    db.commit()
+    return meeting
+
+
+def _audio(tmp_path: Path, payload: bytes = b"normalized audio") -> Path:
+    path = tmp_path / "meeting.ogg"
+    path.write_bytes(payload)
+    return path
+
+
+def test_retry_reuses_cached_transcription(db_session: Session, tmp_path, transcriber):
+    meeting = _meeting(db_session)
+    audio_path = _audio(tmp_path)
+
+    first = process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+    second = process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+
+    assert len(transcriber.calls) == 1
+    assert second.to_dict() == first.to_dict()
+    assert db_session.query(TranscriptionCacheEntry).count() == 1
+
+
+def test_cache_misses_for_different_audio_or_model(
+    db_session: Session,
+    tmp_path,
+    transcriber,
+    monkeypatch,
+):
+    meeting = _meeting(db_session)
+
+    process_mod._transcribe_meeting_audio(db_session, meeting, _audio(tmp_path, b"one"), {})
+    process_mod._transcribe_meeting_audio(db_session, meeting, _audio(tmp_path, b"two"), {})
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_MODEL", "gpt-4o-transcribe")
+    process_mod._transcribe_meeting_audio(db_session, meeting, _audio(tmp_path, b"two"), {})
+
+    assert len(transcriber.calls) == 3
+
+
+def test_cache_is_keyed_by_uploaded_media_not_normalized_bytes(
+    db_session: Session,
+    tmp_path,
+    transcriber,
+):
+    # ffmpeg output can differ between runs; the same upload must still hit.
+    first = _meeting(db_session, media_sha256="ab" * 32)
+    second = _meeting(db_session, media_sha256="ab" * 32)
+
+    process_mod._transcribe_meeting_audio(db_session, first, _audio(tmp_path, b"run one"), {})
+    process_mod._transcribe_meeting_audio(db_session, second, _audio(tmp_path, b"run two"), {})
+
+    assert len(transcriber.calls) == 1
+
+
+def test_cache_misses_when_chunking_changes(
+    db_session: Session,
+    tmp_path,
+    transcriber,
+    monkeypatch,
+):
+    meeting = _meeting(db_session)
+    audio_path = _audio(tmp_path)
+
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_CHUNK_SECONDS", "600")
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_CHUNK_OVERLAP_SECONDS", "5")
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+
+    assert len(transcriber.calls) == 3
+
+
+def test_cache_misses_when_vad_settings_change(
+    db_session: Session,
+    tmp_path,
+    transcriber,
+    monkeypatch,
+):
+    meeting = _meeting(db_session)
+    audio_path = _audio(tmp_path)
+    monkeypatch.setenv("TRANSCRIPTION_VAD", "1")
+
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+    monkeypatch.setenv("TRANSCRIPTION_VAD_THRESHOLD_DB", "-40")
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+    monkeypatch.setenv("TRANSCRIPTION_VAD_MIN_SILENCE_SECONDS", "1.5")
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+    monkeypatch.setenv("TRANSCRIPTION_VAD_PADDING_SECONDS", "0.5")
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+
+    assert len(transcriber.calls) == 4
+
+
+def test_local_identity_includes_vad_min_silence(monkeypatch):
+    monkeypatch.setenv("TRANSCRIPTION_PROVIDER", "local")
+    monkeypatch.setenv("TRANSCRIPTION_VAD", "1")
+    monkeypatch.setenv("TRANSCRIPTION_VAD_MIN_SILENCE_SECONDS", "2")
+    first, _ = configured_transcriber_identity()
+    monkeypatch.setenv("TRANSCRIPTION_VAD_MIN_SILENCE_SECONDS", "1.5")
+    second, _ = configured_transcriber_identity()
+
+    assert first.endswith("+vad-2")
+    assert second.endswith("+vad-1.5")
+
+
+def test_confidential_meetings_are_not_cached(db_session: Session, tmp_path, transcriber):
+    meeting = _meeting(db_session, confidential_mode=True)
+    audio_path = _audio(tmp_path)
+
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+
+    assert len(transcriber.calls) == 2
+    assert db_session.query(TranscriptionCacheEntry).count() == 0
+
+
+def test_cache_can_be_disabled(db_session: Session, tmp_path, transcriber, monkeypatch):
+    monkeypatch.setenv("MEETIQ_TRANSCRIPTION_CACHE", "0")
+    meeting = _meeting(db_session)
+    audio_path = _audio(tmp_path)
+
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+    process_mod._transcribe_meeting_audio(db_session, meeting, audio_path, {})
+
+    assert len(transcriber.calls) == 2
+
+
+def test_cache_key_depends_on_language():
+    sha = "ab" * 32
+
+    assert transcription_cache_key(sha, "openai:whisper-1", "en") != transcription_cache_key(
+        sha, "openai:whisper-1", None
+    )
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.services.transcription import local_whisper, openai_whisper, vad
+from app.services.transcription.schemas import TranscriptionResult, TranscriptionSegment
+
+
+def _levels(*spans: tuple[float, float], frames: int) -> np.ndarray:
+    levels = np.full(frames, -90.0)
+    for start, end in spans:
+        levels[int(start) : int(end)] = -20.0
+    return levels
+
+
+def test_speech_regions_skip_long_silence_and_keep_short_pauses():
+    # 0.1s frames: speech 10-30, short pause, speech 35-50, long silence, speech 200-220.
+    levels = _levels((10, 30), (35, 50), (200, 220), frames=300)
+
+    regions = vad.speech_regions_from_frame_levels(
+        levels,
+        frame_seconds=0.1,
+        threshold_db=-45.0,
+        min_silence_seconds=2.0,
+        padding_seconds=0.5,
+    )
+
+    assert [(round(start, 3), round(end, 3)) for start, end in regions] == [
+        (0.5, 5.5),
+        (19.5, 22.5),
+    ]
+
+
+def test_speech_regions_are_empty_for_silent_audio():
+    assert vad.speech_regions_from_frame_levels(np.full(100, -90.0)) == []
+
+
+def test_frame_levels_are_read_from_ffmpeg_in_blocks(tmp_path: Path, monkeypatch):
+    # 7 loud frames, 5 silent frames and half a frame that is dropped.
+    frame_samples = int(vad.VAD_SAMPLE_RATE * vad.VAD_FRAME_SECONDS)
+    pcm = tmp_path / "audio.pcm"
+    pcm.write_bytes(
+        np.concatenate(
+            (
+                np.full(7 * frame_samples, 3277, dtype="<i2"),
+                np.zeros(5 * frame_samples + frame_samples // 2, dtype="<i2"),
+            )
+        ).tobytes()
+    )
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    ffmpeg = bin_dir / "ffmpeg"
+    ffmpeg.write_text(
+        f"#!{sys.executable}\n"
+        "import shutil, sys\n"
+        f"shutil.copyfileobj(open({str(pcm)!r}, 'rb'), sys.stdout.buffer)\n",
+        encoding="utf-8",
+    )
+    ffmpeg.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setattr(vad, "VAD_READ_FRAMES", 5)
+
+    levels = vad._frame_levels_db("meeting.ogg")
+
+    assert levels.shape == (12,)
+    assert np.allclose(levels[:7], 20 * np.log10(3277 / 32768))
+    assert np.allclose(levels[7:], 20 * np.log10(1 / 32768))
+
+
+def test_frame_levels_raise_when_ffmpeg_fails(tmp_path: Path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    ffmpeg = bin_dir / "ffmpeg"
+    ffmpeg.write_text("#!/bin/sh\necho 'bad input' >&2\nexit 1\n", encoding="utf-8")
+    ffmpeg.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        vad._frame_levels_db("meeting.ogg")
+
+    assert "bad input" in excinfo.value.stderr
+
+
+def test_speech_timeline_maps_trimmed_times_back_to_original():
+    timeline = vad.SpeechTimeline([(5.0, 15.0), (100.0, 110.0)])
+
+    assert timeline.speech_seconds == 20.0
+    assert timeline.to_original(0.0) == 5.0
+    assert timeline.to_original(4.0) == 9.0
+    assert timeline.to_original(10.0) == 100.0
+    assert timeline.to_original(10.0, is_end=True) == 15.0
+    assert timeline.to_original(12.5) == 102.5
+
+
+def test_openai_whisper_transcribes_only_speech_when_vad_enabled(tmp_path, monkeypatch):
+    audio_path = tmp_path / "meeting.mp3"
+    audio_path.write_bytes(b"fake audio")
+    monkeypatch.setenv("TRANSCRIPTION_VAD", "1")
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_CHUNK_THRESHOLD_SECONDS", "999999")
+    monkeypatch.setattr(openai_whisper, "OpenAI", lambda api_key: object())
+    monkeypatch.setattr(
+        vad,
+        "detect_speech_regions",
+        lambda path: ([(60.0, 70.0), (300.0, 320.0)], 600.0),
+    )
+
+    written: list[list[tuple[float, float]]] = []
+
+    def fake_write_speech_audio(source_path, output_path, regions):
+        written.append(list(regions))
+        Path(output_path).write_bytes(b"speech only")
+
+    monkeypatch.setattr(vad, "write_speech_audio", fake_write_speech_audio)
+    monkeypatch.setattr(openai_whisper, "_probe_audio_duration_seconds", lambda path: 30.0)
+
+    transcribed: list[bytes] = []
+
+    def fake_transcribe_single_file(self, path: Path) -> TranscriptionResult:
+        transcribed.append(path.read_bytes())
+        return TranscriptionResult(
+            text="hello there",
+            language="en",
+            duration_seconds=30.0,
+            segments=[
+                TranscriptionSegment(start=1.0, end=10.0, text="hello"),
+                TranscriptionSegment(start=12.0, end=15.0, text="there"),
+            ],
+            model_name="whisper-1",
+        )
+
+    monkeypatch.setattr(
+        openai_whisper.OpenAIWhisperTranscriber,
+        "_transcribe_single_file",
+        fake_transcribe_single_file,
+    )
+
+    result = openai_whisper.OpenAIWhisperTranscriber().transcribe(audio_path)
+
+    assert written == [[(60.0, 70.0), (300.0, 320.0)]]
+    assert transcribed == [b"speech only"]
+    assert [(s.start, s.end) for s in result.segments] == [(61.0, 70.0), (302.0, 305.0)]
+    assert result.duration_seconds == 600.0
+    assert result.text == "hello there"
+
+
+def test_openai_whisper_keeps_full_audio_when_little_silence(tmp_path, monkeypatch):
+    audio_path = tmp_path / "meeting.mp3"
+    audio_path.write_bytes(b"fake audio")
+    monkeypatch.setenv("TRANSCRIPTION_VAD", "1")
+    monkeypatch.setenv("OPENAI_TRANSCRIPTION_CHUNK_THRESHOLD_SECONDS", "999999")
+    monkeypatch.setattr(openai_whisper, "OpenAI", lambda api_key: object())
+    monkeypatch.setattr(vad, "detect_speech_regions", lambda path: ([(1.0, 598.0)], 600.0))
+    monkeypatch.setattr(openai_whisper, "_probe_audio_duration_seconds", lambda path: 600.0)
+
+    def fail_write(*args, **kwargs):
+        raise AssertionError("speech-only audio should not be written")
+
+    monkeypatch.setattr(vad, "write_speech_audio", fail_write)
+    transcribed: list[Path] = []
+
+    def fake_transcribe_single_file(self, path: Path) -> TranscriptionResult:
+        transcribed.append(path)
+        return TranscriptionResult(
+            text="", language="en", duration_seconds=600.0, segments=[], model_name="whisper-1"
+        )
+
+    monkeypatch.setattr(
+        openai_whisper.OpenAIWhisperTranscriber,
+        "_transcribe_single_file",
+        fake_transcribe_single_file,
+    )
+
+    openai_whisper.OpenAIWhisperTranscriber().transcribe(audio_path)
+
+    assert transcribed == [audio_path]
+
+
+def test_local_whisper_uses_built_in_vad_filter_when_enabled(monkeypatch):
+    calls: list[dict[str, object]] = []
+
+    class FakeWhisperModel:
+        def transcribe(self, audio_path: str, **kwargs: object):
+            calls.append(kwargs)
+            return [], None
+
+    monkeypatch.setenv("TRANSCRIPTION_VAD", "true")
+    monkeypatch.setenv("TRANSCRIPTION_VAD_MIN_SILENCE_SECONDS", "1.5")
+    monkeypatch.setattr(local_whisper, "_models", {})
+    monkeypatch.setattr(local_whisper, "WhisperModel", lambda *args, **kwargs: FakeWhisperModel())
+
+    local_whisper.LocalWhisperTranscriber().transcribe("meeting.mp3")
+
+    assert calls[0]["vad_filter"] is True
+    assert calls[0]["vad_parameters"] == {"min_silence_duration_ms": 1500}
@@ -2,7 +2,9 @@
 import os
 
 from redis import Redis
-from rq import Queue, Worker
+from rq import Queue, SimpleWorker, Worker
+
+from app.services.transcription.factory import preload_transcription_model
 
 
 def get_redis() -> Redis:
@@ -21,11 +23,21 @@ def get_redis() -> Redis:
 
 
 def main() -> None:
-    redis_conn = get_redis()
-    queue_name = os.getenv("RQ_QUEUE", "default")
-    queue = Queue(queue_name, connection=redis_conn)
+    preloaded = preload_transcription_model()
 
-    worker = Worker([queue], connection=redis_conn)
+    redis_conn = get_redis()
+    # RQ_QUEUE may list several queues, e.g. "notes,polish", to let one
+    # worker pool serve the cheaper pipeline stages together.
+    queue_names = [
+        name.strip() for name in os.getenv("RQ_QUEUE", "default").split(",") if name.strip()
+    ]
+    queues = [Queue(name, connection=redis_conn) for name in queue_names or ["default"]]
+
+    # CTranslate2 starts the model's threads when it is built and they do not
+    # survive fork(), so a preloaded model must run jobs in this process
+    # rather than in RQ's forked work horses.
+    worker_class = SimpleWorker if preloaded else Worker
+    worker = worker_class(queues, connection=redis_conn)
     worker.work()
 
 
@@ -23,9 +23,9 @@ def test_e2e_meeting_flow_creates_notes(
 
     # --- Fakes / stubs -----------------------------------------------------
 
-    def fake_save_raw_media(meeting_id: str, file, data: bytes) -> str:
+    def fake_save_raw_media(meeting_id: str, file) -> str:
         path = tmp_path / f"{meeting_id}.mp4"
-        path.write_bytes(data)
+        path.write_bytes(file.file.read())
         return str(path)
 
     class FakeTranscription:
@@ -38,6 +38,11 @@ def test_e2e_meeting_flow_creates_notes(
         def transcribe(self, audio_path: str) -> FakeTranscription:
             return FakeTranscription()
 
+        def stream(self, audio_path: str):
+            # No segments to report; the whole transcript arrives at the end.
+            yield from ()
+            return self.transcribe(audio_path)
+
     def fake_generate_meeting_notes(transcript: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "summary": "This is a test summary.",
@@ -163,9 +168,14 @@ def test_e2e_meeting_flow_includes_slide_ocr_in_notes(
         def transcribe(self, audio_path: str) -> FakeTranscription:
             return FakeTranscription()
 
-    def fake_save_raw_media(meeting_id: str, file, data: bytes) -> str:
+        def stream(self, audio_path: str):
+            # No segments to report; the whole transcript arrives at the end.
+            yield from ()
+            return self.transcribe(audio_path)
+
+    def fake_save_raw_media(meeting_id: str, file) -> str:
         path = tmp_path / f"{meeting_id}.mp4"
-        path.write_bytes(data)
+        path.write_bytes(file.file.read())
         return str(path)
 
     def fake_extract_slide_text_for_meeting(db, meeting_id: int) -> str: